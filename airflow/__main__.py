@@ -21,6 +21,7 @@
 from __future__ import annotations
 
 import os
+import sys
 
 import argcomplete
 
@@ -33,8 +34,9 @@ import argcomplete
 # Therefore importing configuration early (as the first airflow import) avoids
 # any possible import cycles with settings downstream.
 from airflow import configuration
-from airflow.cli import cli_parser
+from airflow.cli.fast_path import get_parser_for_command
 from airflow.configuration import write_webserver_configuration_if_needed
+from airflow.task import startup_profiler
 
 
 def main():
@@ -42,9 +44,11 @@ def main():
     if conf.get("core", "security") == "kerberos":
         os.environ["KRB5CCNAME"] = conf.get("kerberos", "ccache")
         os.environ["KRB5_KTNAME"] = conf.get("kerberos", "keytab")
-    parser = cli_parser.get_parser()
-    argcomplete.autocomplete(parser)
-    args = parser.parse_args()
+    startup_profiler.record_process_start("airflow_import")
+    with startup_profiler.startup_phase("cli_parse"):
+        parser = get_parser_for_command(sys.argv[1:])
+        argcomplete.autocomplete(parser)
+        args = parser.parse_args()
     if args.subcommand not in ["lazy_loaded", "version"]:
         # Here we ensure that the default configuration is written if needed before running any command
         # that might need it. This used to be done during configuration initialization but having it
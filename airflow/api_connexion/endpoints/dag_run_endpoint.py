@@ -17,7 +17,7 @@
 from __future__ import annotations
 
 from http import HTTPStatus
-from typing import TYPE_CHECKING, Collection
+from typing import TYPE_CHECKING, Any, Collection
 
 import pendulum
 from connexion import NoContent
@@ -46,9 +46,11 @@ from airflow.api_connexion.schemas.dag_run_schema import (
     clear_dagrun_form_schema,
     dagrun_collection_schema,
     dagrun_schema,
+    dagrun_trigger_result_collection_schema,
     dagruns_batch_form_schema,
     set_dagrun_note_form_schema,
     set_dagrun_state_form_schema,
+    trigger_dagruns_form_schema,
 )
 from airflow.api_connexion.schemas.dataset_schema import (
     DatasetEventCollection,
@@ -59,6 +61,8 @@ from airflow.api_connexion.schemas.task_instance_schema import (
     task_instance_reference_collection_schema,
 )
 from airflow.auth.managers.models.resource_details import DagAccessEntity
+from airflow.configuration import conf
+from airflow.exceptions import AirflowException
 from airflow.models import DagModel, DagRun
 from airflow.timetables.base import DataInterval
 from airflow.utils.airflow_flask_app import get_airflow_app
@@ -70,10 +74,14 @@ from airflow.www.decorators import action_logging
 from airflow.www.extensions.init_auth_manager import get_auth_manager
 
 if TYPE_CHECKING:
+    from datetime import datetime
+
+    from pendulum import DateTime
     from sqlalchemy.orm import Session
     from sqlalchemy.sql import Select
 
     from airflow.api_connexion.types import APIResponse
+    from airflow.models.dag import DAG
 
 
 @security.requires_access_dag("DELETE", DagAccessEntity.RUN)
@@ -303,14 +311,7 @@ def get_dag_runs_batch(*, session: Session = NEW_SESSION) -> APIResponse:
 @provide_session
 def post_dag_run(*, dag_id: str, session: Session = NEW_SESSION) -> APIResponse:
     """Trigger a DAG."""
-    dm = session.scalar(select(DagModel).where(DagModel.is_active, DagModel.dag_id == dag_id).limit(1))
-    if not dm:
-        raise NotFound(title="DAG not found", detail=f"DAG with dag_id: '{dag_id}' not found")
-    if dm.has_import_errors:
-        raise BadRequest(
-            title="DAG cannot be triggered",
-            detail=f"DAG with dag_id: '{dag_id}' has import errors",
-        )
+    _check_dag_can_be_triggered(dag_id, session)
     try:
         post_body = dagrun_schema.load(get_json_request_dict(), session=session)
     except ValidationError as err:
@@ -329,22 +330,11 @@ def post_dag_run(*, dag_id: str, session: Session = NEW_SESSION) -> APIResponse:
     if not dagrun_instance:
         try:
             dag = get_airflow_app().dag_bag.get_dag(dag_id)
-
-            data_interval_start = post_body.get("data_interval_start")
-            data_interval_end = post_body.get("data_interval_end")
-            if data_interval_start and data_interval_end:
-                data_interval = DataInterval(
-                    start=pendulum.instance(data_interval_start),
-                    end=pendulum.instance(data_interval_end),
-                )
-            else:
-                data_interval = dag.timetable.infer_manual_data_interval(run_after=logical_date)
-
             dag_run = dag.create_dagrun(
                 run_type=DagRunType.MANUAL,
                 run_id=run_id,
                 execution_date=logical_date,
-                data_interval=data_interval,
+                data_interval=_get_data_interval(dag, post_body, logical_date),
                 state=DagRunState.QUEUED,
                 conf=post_body.get("conf"),
                 external_trigger=True,
@@ -370,6 +360,121 @@ def post_dag_run(*, dag_id: str, session: Session = NEW_SESSION) -> APIResponse:
     raise AlreadyExists(detail=f"DAGRun with DAG ID: '{dag_id}' and DAGRun ID: '{run_id}' already exists")
 
 
+@security.requires_access_dag("POST", DagAccessEntity.RUN)
+@provide_session
+@action_logging
+def post_dag_runs(*, dag_id: str, session: Session = NEW_SESSION) -> APIResponse:
+    """Trigger several runs of a DAG at once."""
+    _check_dag_can_be_triggered(dag_id, session)
+    try:
+        items = trigger_dagruns_form_schema.load(get_json_request_dict())["dag_runs"]
+    except ValidationError as err:
+        raise BadRequest(detail=str(err))
+    maximum_trigger_dag_runs = conf.getint("api", "maximum_trigger_dag_runs")
+    if len(items) > maximum_trigger_dag_runs:
+        raise BadRequest(
+            detail=f"At most {maximum_trigger_dag_runs} DAG runs can be triggered at once, got {len(items)}"
+        )
+
+    results: list[dict[str, Any]] = []
+    post_bodies: dict[int, dict[str, Any]] = {}
+    for index, item in enumerate(items):
+        try:
+            post_bodies[index] = dagrun_schema.load(item, session=session)
+        except ValidationError as err:
+            results.append({"status": HTTPStatus.BAD_REQUEST, "detail": str(err)})
+        except BadRequest as err:
+            results.append({"status": HTTPStatus.BAD_REQUEST, "detail": err.detail})
+        else:
+            results.append({})
+
+    # Check the DAG runs which already exist with a single query
+    run_ids = {post_body["run_id"] for post_body in post_bodies.values()}
+    logical_dates = {pendulum.instance(post_body["execution_date"]) for post_body in post_bodies.values()}
+    existing_run_ids: set[str] = set()
+    existing_logical_dates: set[datetime] = set()
+    if post_bodies:
+        for existing_run_id, existing_logical_date in session.execute(
+            select(DagRun.run_id, DagRun.execution_date).where(
+                DagRun.dag_id == dag_id,
+                or_(DagRun.run_id.in_(run_ids), DagRun.execution_date.in_(logical_dates)),
+            )
+        ):
+            existing_run_ids.add(existing_run_id)
+            existing_logical_dates.add(existing_logical_date)
+
+    dag = get_airflow_app().dag_bag.get_dag(dag_id)
+    dag_hash = get_airflow_app().dag_bag.dags_hash.get(dag_id)
+    current_user_id = get_auth_manager().get_user_id()
+    dag_runs: dict[int, DagRun] = {}
+    for index, post_body in post_bodies.items():
+        logical_date = pendulum.instance(post_body["execution_date"])
+        run_id = post_body["run_id"]
+        if run_id in existing_run_ids:
+            results[index] = {
+                "status": HTTPStatus.CONFLICT,
+                "detail": f"DAGRun with DAG ID: '{dag_id}' and DAGRun ID: '{run_id}' already exists",
+            }
+            continue
+        if logical_date in existing_logical_dates:
+            results[index] = {
+                "status": HTTPStatus.CONFLICT,
+                "detail": (
+                    f"DAGRun with DAG ID: '{dag_id}' and "
+                    f"DAGRun logical date: '{logical_date.isoformat(sep=' ')}' already exists"
+                ),
+            }
+            continue
+        try:
+            dag_run = dag.build_dagrun(
+                run_type=DagRunType.MANUAL,
+                run_id=run_id,
+                execution_date=logical_date,
+                data_interval=_get_data_interval(dag, post_body, logical_date),
+                state=DagRunState.QUEUED,
+                conf=post_body.get("conf"),
+                external_trigger=True,
+                dag_hash=dag_hash,
+            )
+        except (ValueError, AirflowException) as e:
+            results[index] = {"status": HTTPStatus.BAD_REQUEST, "detail": str(e)}
+            continue
+        dag_run_note = post_body.get("note")
+        if dag_run_note:
+            dag_run.note = (dag_run_note, current_user_id)
+        # The following DAG runs of the batch conflict with this one
+        existing_run_ids.add(run_id)
+        existing_logical_dates.add(logical_date)
+        dag_runs[index] = dag_run
+
+    dag.bulk_create_dagruns(list(dag_runs.values()), session=session)
+    for index, dag_run in dag_runs.items():
+        results[index] = {"status": HTTPStatus.OK, "dag_run": dag_run}
+    return dagrun_trigger_result_collection_schema.dump({"results": results})
+
+
+def _check_dag_can_be_triggered(dag_id: str, session: Session) -> None:
+    dm = session.scalar(select(DagModel).where(DagModel.is_active, DagModel.dag_id == dag_id).limit(1))
+    if not dm:
+        raise NotFound(title="DAG not found", detail=f"DAG with dag_id: '{dag_id}' not found")
+    if dm.has_import_errors:
+        raise BadRequest(
+            title="DAG cannot be triggered",
+            detail=f"DAG with dag_id: '{dag_id}' has import errors",
+        )
+
+
+def _get_data_interval(dag: DAG, post_body: dict[str, Any], logical_date: DateTime) -> DataInterval:
+    data_interval_start = post_body.get("data_interval_start")
+    data_interval_end = post_body.get("data_interval_end")
+    if data_interval_start and data_interval_end:
+        return DataInterval(
+            start=pendulum.instance(data_interval_start),
+            end=pendulum.instance(data_interval_end),
+        )
+    return dag.timetable.infer_manual_data_interval(run_after=logical_date)
+
+
 @security.requires_access_dag("PUT", DagAccessEntity.RUN)
 @provide_session
 @action_logging
@@ -16,9 +16,12 @@
 # under the License.
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Iterable, Sequence, TypeVar
+import base64
+import binascii
+import json
+from typing import TYPE_CHECKING, Any, Generator, Iterable, Sequence, TypeVar
 
-from flask import g
+from flask import Response, g, request
 from marshmallow import ValidationError
 from sqlalchemy import and_, or_, select
 from sqlalchemy.exc import MultipleResultsFound
@@ -30,6 +33,7 @@ from airflow.api_connexion.exceptions import BadRequest, NotFound, PermissionDen
 from airflow.api_connexion.parameters import format_datetime, format_parameters
 from airflow.api_connexion.schemas.task_instance_schema import (
     TaskInstanceCollection,
+    TaskInstancePage,
     TaskInstanceReferenceCollection,
     clear_task_instance_form,
     set_single_task_instance_state_form,
@@ -37,12 +41,14 @@ from airflow.api_connexion.schemas.task_instance_schema import (
     set_task_instance_state_form,
     task_instance_batch_form,
     task_instance_collection_schema,
+    task_instance_page_schema,
     task_instance_reference_collection_schema,
     task_instance_reference_schema,
     task_instance_schema,
 )
 from airflow.api_connexion.security import get_readable_dags
 from airflow.auth.managers.models.resource_details import DagAccessEntity, DagDetails
+from airflow.configuration import conf
 from airflow.exceptions import TaskNotFound
 from airflow.models import SlaMiss
 from airflow.models.dagrun import DagRun as DR
@@ -50,7 +56,7 @@ from airflow.models.operator import needs_expansion
 from airflow.models.taskinstance import TaskInstance as TI, clear_task_instances
 from airflow.utils.airflow_flask_app import get_airflow_app
 from airflow.utils.db import get_query_count
-from airflow.utils.session import NEW_SESSION, provide_session
+from airflow.utils.session import NEW_SESSION, create_session, provide_session
 from airflow.utils.state import DagRunState, TaskInstanceState
 from airflow.www.decorators import action_logging
 from airflow.www.extensions.init_auth_manager import get_auth_manager
@@ -141,6 +147,118 @@ def get_mapped_task_instance(
     return task_instance_schema.dump(task_instance)
 
 
+# Key of the cursor pagination of task instances, by field name in the API
+_KEYSET_FIELDS = ("dag_id", "dag_run_id", "task_id", "map_index")
+# Columns of the task instances exported as NDJSON, by field name in the API
+_EXPORT_COLUMNS: dict[str, Any] = {
+    "dag_id": TI.dag_id,
+    "dag_run_id": TI.run_id,
+    "task_id": TI.task_id,
+    "map_index": TI.map_index,
+    "execution_date": DR.execution_date,
+    "start_date": TI.start_date,
+    "end_date": TI.end_date,
+    "duration": TI.duration,
+    "state": TI.state,
+    "try_number": TI._try_number,
+    "max_tries": TI.max_tries,
+    "hostname": TI.hostname,
+    "unixname": TI.unixname,
+    "pool": TI.pool,
+    "pool_slots": TI.pool_slots,
+    "queue": TI.queue,
+    "priority_weight": TI.priority_weight,
+    "operator": TI.operator,
+    "queued_when": TI.queued_dttm,
+    "pid": TI.pid,
+    "rendered_map_index": TI.rendered_map_index,
+}
+NDJSON_MIMETYPE = "application/x-ndjson"
+
+
+def _encode_cursor(ti: TI) -> str:
+    key = [ti.dag_id, ti.run_id, ti.task_id, ti.map_index]
+    return base64.urlsafe_b64encode(json.dumps(key).encode()).decode()
+
+
+def _decode_cursor(cursor: str | None) -> tuple | None:
+    """Return the key of the last task instance of the previous page, None for the first page."""
+    if not cursor:
+        return None
+    try:
+        dag_id, run_id, task_id, map_index = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError):
+        raise BadRequest(detail=f"Invalid cursor: {cursor!r}")
+    return dag_id, run_id, task_id, map_index
+
+
+def _apply_keyset(query: Select, after: tuple | None) -> Select:
+    """Order a query by task instance key, starting after the given key."""
+    columns = [_EXPORT_COLUMNS[field] for field in _KEYSET_FIELDS]
+    if after is not None:
+        # Written out rather than as a tuple comparison, which not all databases support
+        query = query.where(
+            or_(
+                *(
+                    and_(*(c == v for c, v in zip(columns[:i], after[:i])), columns[i] > after[i])
+                    for i in range(len(columns))
+                )
+            )
+        )
+    return query.order_by(*columns)
+
+
+def _wants_ndjson() -> bool:
+    return request.accept_mimetypes.best_match(["application/json", NDJSON_MIMETYPE]) == NDJSON_MIMETYPE
+
+
+def _stream_task_instances(base_query: Select, cursor: str | None, fields: Iterable[str] | None) -> Response:
+    """
+    Stream task instances as NDJSON, one JSON object per line, ordered by key.
+
+    Only the requested fields are selected, no ORM object is built, and the rows are fetched in pages of
+    ``[api] maximum_page_limit`` task instances with keyset pagination, each in a short transaction.
+    The key fields are always included.
+    """
+    if fields:
+        unknown = set(fields).difference(_EXPORT_COLUMNS)
+        if unknown:
+            raise BadRequest(detail=f"Fields cannot be exported: {', '.join(sorted(unknown))}")
+        names = list(_KEYSET_FIELDS) + [f for f in fields if f not in _KEYSET_FIELDS]
+    else:
+        names = list(_EXPORT_COLUMNS)
+    query = base_query.with_only_columns(*(_EXPORT_COLUMNS[name].label(name) for name in names))
+    after = _decode_cursor(cursor)
+    page_size = conf.getint("api", "maximum_page_limit")
+
+    def _generate(after: tuple | None) -> Generator[str, None, None]:
+        while True:
+            with create_session() as session:
+                rows = session.execute(_apply_keyset(query, after).limit(page_size)).all()
+            for row in rows:
+                yield json.dumps(dict(zip(names, row)), default=_json_default) + "\n"
+            if len(rows) < page_size:
+                return
+            after = tuple(getattr(rows[-1], field) for field in _KEYSET_FIELDS)
+
+    return Response(_generate(after), mimetype=NDJSON_MIMETYPE)
+
+
+def _json_default(value: Any) -> Any:
+    # Dates are the only values not supported by JSON among the exported columns
+    return value.isoformat()
+
+
+def _get_task_instance_page(
+    entry_query: Select, cursor: str | None, limit: int, session: Session
+) -> APIResponse:
+    rows = session.execute(_apply_keyset(entry_query, _decode_cursor(cursor)).limit(limit + 1)).all()
+    next_cursor = _encode_cursor(rows[limit - 1][0]) if len(rows) > limit else None
+    return task_instance_page_schema.dump(
+        TaskInstancePage(task_instances=rows[:limit], next_cursor=next_cursor)
+    )
+
+
 @format_parameters(
     {
         "execution_date_gte": format_datetime,
@@ -313,6 +431,8 @@ def get_task_instances(
     pool: list[str] | None = None,
     queue: list[str] | None = None,
     offset: int | None = None,
+    cursor: str | None = None,
+    fields: list[str] | None = None,
     session: Session = NEW_SESSION,
 ) -> APIResponse:
     """Get list of task instances."""
@@ -344,8 +464,10 @@ def get_task_instances(
     base_query = _apply_array_filter(base_query, key=TI.pool, values=pool)
     base_query = _apply_array_filter(base_query, key=TI.queue, values=queue)
 
-    # Count elements before joining extra columns
-    total_entries = get_query_count(base_query, session=session)
+    if cursor is not None and offset:
+        raise BadRequest(detail="The offset and cursor parameters cannot be used together")
+    if _wants_ndjson():
+        return _stream_task_instances(base_query, cursor, fields)
 
     # Add join
     entry_query = (
@@ -359,9 +481,14 @@ def get_task_instances(
         )
         .add_columns(SlaMiss)
         .options(joinedload(TI.rendered_task_instance_fields))
-        .offset(offset)
-        .limit(limit)
     )
+    if cursor is not None:
+        # The total number of entries is not counted, it costs as much as walking through all the pages
+        return _get_task_instance_page(entry_query, cursor, limit, session)
+
+    # Count elements before joining extra columns
+    total_entries = get_query_count(base_query, session=session)
+    entry_query = entry_query.offset(offset).limit(limit)
     # using execute because we want the SlaMiss entity. Scalars don't return None for missing entities
     task_instances = session.execute(entry_query).all()
     return task_instance_collection_schema.dump(
@@ -418,8 +545,12 @@ def get_task_instances_batch(session: Session = NEW_SESSION) -> APIResponse:
     base_query = _apply_array_filter(base_query, key=TI.pool, values=data["pool"])
     base_query = _apply_array_filter(base_query, key=TI.queue, values=data["queue"])
 
-    # Count elements before joining extra columns
-    total_entries = get_query_count(base_query, session=session)
+    if _wants_ndjson():
+        return _stream_task_instances(base_query, data["page_cursor"], data["return_fields"])
+
+    if data["page_cursor"] is None:
+        # Count elements before joining extra columns
+        total_entries = get_query_count(base_query, session=session)
     # Add join
     base_query = base_query.join(
         SlaMiss,
@@ -431,6 +562,8 @@ def get_task_instances_batch(session: Session = NEW_SESSION) -> APIResponse:
         isouter=True,
     ).add_columns(SlaMiss)
     ti_query = base_query.options(joinedload(TI.rendered_task_instance_fields))
+    if data["page_cursor"] is not None:
+        return _get_task_instance_page(ti_query, data["page_cursor"], data["page_limit"], session)
     # using execute because we want the SlaMiss entity. Scalars don't return None for missing entities
     task_instances = session.execute(ti_query).all()
 
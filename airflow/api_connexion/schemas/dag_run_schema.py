@@ -186,6 +186,27 @@ class DagRunsBatchFormSchema(Schema):
     updated_at_lte = fields.DateTime(load_default=None, validate=validate_istimezone)
 
 
+class TriggerDAGRunsFormSchema(Schema):
+    """Schema for handling the request of triggering several DAG runs."""
+
+    # Every DAG run is loaded separately with DAGRunSchema, so that its errors are reported separately
+    dag_runs = fields.List(fields.Dict(), required=True, validate=validate.Length(min=1))
+
+
+class DAGRunTriggerResultSchema(Schema):
+    """Result of triggering one of several DAG runs."""
+
+    status = fields.Int()
+    detail = fields.String()
+    dag_run = fields.Nested(DAGRunSchema)
+
+
+class DAGRunTriggerResultCollectionSchema(Schema):
+    """Results of triggering several DAG runs."""
+
+    results = fields.List(fields.Nested(DAGRunTriggerResultSchema))
+
+
 class SetDagRunNoteFormSchema(Schema):
     """Schema for handling the request of clearing a DAG run."""
 
@@ -198,3 +219,5 @@ set_dagrun_state_form_schema = SetDagRunStateFormSchema()
 clear_dagrun_form_schema = ClearDagRunStateFormSchema()
 dagruns_batch_form_schema = DagRunsBatchFormSchema()
 set_dagrun_note_form_schema = SetDagRunNoteFormSchema()
+trigger_dagruns_form_schema = TriggerDAGRunsFormSchema()
+dagrun_trigger_result_collection_schema = DAGRunTriggerResultCollectionSchema()
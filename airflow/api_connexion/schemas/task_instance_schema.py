@@ -98,11 +98,27 @@ class TaskInstanceCollectionSchema(Schema):
     total_entries = fields.Int()
 
 
+class TaskInstancePage(NamedTuple):
+    """Page of task instances, with the cursor of the next page."""
+
+    task_instances: list[tuple[TaskInstance, SlaMiss | None]]
+    next_cursor: str | None
+
+
+class TaskInstancePageSchema(Schema):
+    """Task instance page schema."""
+
+    task_instances = fields.List(fields.Nested(TaskInstanceSchema))
+    next_cursor = fields.Str(allow_none=True)
+
+
 class TaskInstanceBatchFormSchema(Schema):
     """Schema for the request form passed to Task Instance Batch endpoint."""
 
     page_offset = fields.Int(load_default=0, validate=validate.Range(min=0))
     page_limit = fields.Int(load_default=100, validate=validate.Range(min=1))
+    page_cursor = fields.Str(load_default=None)
+    return_fields = fields.List(fields.Str(), data_key="fields", load_default=None)
     dag_ids = fields.List(fields.Str(), load_default=None)
     dag_run_ids = fields.List(fields.Str(), load_default=None)
     task_ids = fields.List(fields.Str(), load_default=None)
@@ -221,6 +237,7 @@ class SetTaskInstanceNoteFormSchema(Schema):
 
 task_instance_schema = TaskInstanceSchema()
 task_instance_collection_schema = TaskInstanceCollectionSchema()
+task_instance_page_schema = TaskInstancePageSchema()
 task_instance_batch_form = TaskInstanceBatchFormSchema()
 clear_task_instance_form = ClearTaskInstanceFormSchema()
 set_task_instance_state_form = SetTaskInstanceStateFormSchema()
@@ -98,15 +98,19 @@ class Arg:
     def add_to_parser(self, parser: argparse.ArgumentParser):
         """Add this argument to an ArgumentParser."""
         if "metavar" in self.kwargs and "type" not in self.kwargs:
-            if self.kwargs["metavar"] == "DIRPATH":
+            if self.kwargs["metavar"] in ("DIRPATH", "DIRPATH_OR_URL"):
+                allow_url = self.kwargs["metavar"] == "DIRPATH_OR_URL"
 
                 def type(x):
-                    return self._is_valid_directory(parser, x)
+                    return self._is_valid_directory(parser, x, allow_url=allow_url)
 
                 self.kwargs["type"] = type
         parser.add_argument(*self.flags, **self.kwargs)
 
-    def _is_valid_directory(self, parser, arg):
+    def _is_valid_directory(self, parser, arg, allow_url=False):
+        if allow_url and "://" in arg:
+            # Object storage URL, e.g. s3://bucket/path
+            return arg
         if not os.path.isdir(arg):
             parser.error(f"The directory '{arg}' does not exist!")
         return arg
@@ -267,6 +271,22 @@ ARG_NUM_EXECUTIONS = Arg(
     help="The number of next execution datetimes to show",
 )
 
+# report
+ARG_PROFILE = Arg(
+    ("--profile",),
+    help=(
+        "Profile the parsing of the DAG files, showing the time spent in each phase of the parsing, "
+        "the slowest statements, the peak memory allocated and the Variables and Connections looked up"
+    ),
+    action="store_true",
+)
+ARG_TOP_STATEMENTS = Arg(
+    ("--top-statements",),
+    default=3,
+    type=positive_int(allow_zero=False),
+    help="The number of slowest statements to show for each DAG file, with --profile",
+)
+
 # backfill
 ARG_MARK_SUCCESS = Arg(
     ("-m", "--mark-success"), help="Mark jobs as succeeded without running them", action="store_true"
@@ -482,16 +502,41 @@ ARG_DB_SKIP_ARCHIVE = Arg(
     help="Don't preserve purged records in an archive table.",
     action="store_true",
 )
+ARG_DB_BATCH_SIZE = Arg(
+    ("--batch-size",),
+    help="Archive and delete the rows of each table in batches of this many rows, one transaction per "
+    "batch, instead of all at once.",
+    type=positive_int(allow_zero=False),
+)
+ARG_DB_BATCH_SLEEP = Arg(
+    ("--batch-sleep",),
+    help="Seconds to wait between two batches, to throttle the load on the database.",
+    type=float,
+    default=0,
+)
+ARG_DB_CHECKPOINT_FILE = Arg(
+    ("--checkpoint-file",),
+    metavar="FILEPATH",
+    help="File recording the progress of a cleanup in batches, from which an interrupted cleanup with the "
+    "same timestamp is resumed. It is removed once the cleanup is complete.",
+)
 ARG_DB_EXPORT_FORMAT = Arg(
     ("--export-format",),
     help="The file format to export the cleaned data",
-    choices=("csv",),
+    choices=("csv", "ndjson", "parquet"),
     default="csv",
 )
+ARG_DB_EXPORT_COMPRESSION = Arg(
+    ("--export-compression",),
+    help="The compression of the exported files: gzip for the csv and ndjson formats, or any of them for the "
+    "parquet format, which is compressed with snappy by default.",
+    choices=("gzip", "snappy", "zstd"),
+)
 ARG_DB_OUTPUT_PATH = Arg(
     ("--output-path",),
-    metavar="DIRPATH",
-    help="The path to the output directory to export the cleaned data. This directory must exist.",
+    metavar="DIRPATH_OR_URL",
+    help="The path to the output directory to export the cleaned data. This directory must exist. "
+    "It can also be an object storage URL, e.g. s3://bucket/path.",
     required=True,
 )
 ARG_DB_DROP_ARCHIVES = Arg(
@@ -1051,7 +1096,7 @@ DAGS_COMMANDS = (
         name="report",
         help="Show DagBag loading report",
         func=lazy_load_command("airflow.cli.commands.dag_command.dag_report"),
-        args=(ARG_SUBDIR, ARG_OUTPUT, ARG_VERBOSE),
+        args=(ARG_SUBDIR, ARG_PROFILE, ARG_TOP_STATEMENTS, ARG_OUTPUT, ARG_VERBOSE),
     ),
     ActionCommand(
         name="list-runs",
@@ -1597,6 +1642,9 @@ DB_COMMANDS = (
             ARG_VERBOSE,
             ARG_YES,
             ARG_DB_SKIP_ARCHIVE,
+            ARG_DB_BATCH_SIZE,
+            ARG_DB_BATCH_SLEEP,
+            ARG_DB_CHECKPOINT_FILE,
         ),
     ),
     ActionCommand(
@@ -1605,6 +1653,7 @@ DB_COMMANDS = (
         func=lazy_load_command("airflow.cli.commands.db_command.export_archived"),
         args=(
             ARG_DB_EXPORT_FORMAT,
+            ARG_DB_EXPORT_COMPRESSION,
             ARG_DB_OUTPUT_PATH,
             ARG_DB_DROP_ARCHIVES,
             ARG_DB_TABLES,
@@ -1780,6 +1829,18 @@ PROVIDERS_COMMANDS = (
         func=lazy_load_command("airflow.cli.commands.provider_command.config_list"),
         args=(ARG_OUTPUT, ARG_VERBOSE),
     ),
+    ActionCommand(
+        name="rebuild-index",
+        help="Discover the providers again and write the providers index",
+        description=(
+            "Discover the installed providers again and write the providers index, from which Airflow "
+            "processes load the providers instead of discovering them. The index is written automatically "
+            "when provider distributions are installed, upgraded or removed. Run this command after "
+            "changing providers without changing their versions, e.g. when installed in editable mode."
+        ),
+        func=lazy_load_command("airflow.cli.commands.provider_command.rebuild_index"),
+        args=(ARG_VERBOSE,),
+    ),
     ActionCommand(
         name="lazy-loaded",
         help="Checks that provider configuration is lazy loaded",
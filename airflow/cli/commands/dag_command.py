@@ -26,6 +26,7 @@ import signal
 import subprocess
 import sys
 import warnings
+from contextlib import nullcontext
 from typing import TYPE_CHECKING
 
 from sqlalchemy import delete, select
@@ -35,6 +36,7 @@ from airflow.api.client import get_current_api_client
 from airflow.api_connexion.schemas.dag_schema import dag_schema
 from airflow.cli.simple_table import AirflowConsole
 from airflow.configuration import conf
+from airflow.dag_processing.parse_profiler import ParseProfiler, profile_file, profile_phase
 from airflow.exceptions import AirflowException, RemovedInAirflow3Warning
 from airflow.jobs.job import Job
 from airflow.models import DagBag, DagModel, DagRun, TaskInstance
@@ -52,6 +54,7 @@ if TYPE_CHECKING:
     from graphviz.dot import Dot
     from sqlalchemy.orm import Session
 
+    from airflow.models.dagbag import FileLoadStat
     from airflow.timetables.base import DataInterval
 
 log = logging.getLogger(__name__)
@@ -470,18 +473,47 @@ def dag_list_import_errors(args) -> None:
 @providers_configuration_loaded
 def dag_report(args) -> None:
     """Display dagbag stats at the command line."""
-    dagbag = DagBag(process_subdir(args.subdir))
-    AirflowConsole().print_as(
-        data=dagbag.dagbag_stats,
-        output=args.output,
-        mapper=lambda x: {
+    profiler = ParseProfiler() if args.profile else None
+    with profiler or nullcontext():
+        dagbag = DagBag(process_subdir(args.subdir))
+        if profiler:
+            for dag in dagbag.dags.values():
+                if not dag.is_subdag:
+                    with profile_file(dag.fileloc), profile_phase("serialization"):
+                        SerializedDagModel(dag)
+
+    # The files of the stats are relative to the DAGs folder, like in DagBag.collect_dags
+    profiles = {
+        file_path.replace(settings.DAGS_FOLDER, ""): profile
+        for file_path, profile in (profiler.profiles.items() if profiler else ())
+    }
+
+    def mapper(x: FileLoadStat) -> dict:
+        row = {
             "file": x.file,
             "duration": x.duration,
             "dag_num": x.dag_num,
             "task_num": x.task_num,
             "dags": sorted(ast.literal_eval(x.dags)),
-        },
-    )
+        }
+        profile = profiles.get(x.file)
+        if profile:
+            row.update(
+                {
+                    phase: round(profile.durations.get(phase, 0.0), 3)
+                    for phase in ("import", "top_level_code", "dag_construction", "serialization")
+                }
+            )
+            row["memory_peak"] = profile.memory_peak
+            row["variables"] = sorted(profile.variable_lookups)
+            row["connections"] = sorted(profile.connection_lookups)
+            row["slowest_statements"] = [
+                f"line {line} ({duration:.3f}s): {source}"
+                for line, duration, source in profile.slowest_statements(args.top_statements)
+            ]
+        return row
+
+    AirflowConsole().print_as(data=dagbag.dagbag_stats, output=args.output, mapper=mapper)
 
 
 @cli_utils.action_cli
@@ -263,6 +263,9 @@ def cleanup_tables(args):
         verbose=args.verbose,
         confirm=not args.yes,
         skip_archive=args.skip_archive,
+        batch_size=args.batch_size,
+        batch_sleep=args.batch_sleep,
+        checkpoint_file=args.checkpoint_file,
     )
 
 
@@ -276,6 +279,7 @@ def export_archived(args):
         table_names=args.tables,
         drop_archives=args.drop_archives,
         needs_confirm=not args.yes,
+        compression=args.export_compression,
     )
 
 
@@ -233,6 +233,15 @@ def config_list(args):
     )
 
 
+def rebuild_index(args):
+    """Discover the providers again and write the providers index."""
+    providers_manager = ProvidersManager()
+    path = providers_manager.rebuild_providers_index()
+    if path is None:
+        raise SystemExit("The providers index is disabled, set [core] providers_index_file to enable it.")
+    print(f"Wrote the providers index of {len(providers_manager.providers)} providers to {path}")
+
+
 @suppress_logs_and_warning
 def lazy_loaded(args):
     """Informs if providers manager has been initialized too early.
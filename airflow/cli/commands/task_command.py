@@ -48,6 +48,7 @@ from airflow.models.param import ParamsDict
 from airflow.models.taskinstance import TaskReturnCode
 from airflow.serialization.pydantic.taskinstance import TaskInstancePydantic
 from airflow.settings import IS_EXECUTOR_CONTAINER, IS_K8S_EXECUTOR_POD
+from airflow.task import startup_profiler
 from airflow.ti_deps.dep_context import DepContext
 from airflow.ti_deps.dependencies_deps import SCHEDULER_QUEUED_DEPS
 from airflow.typing_compat import Literal
@@ -406,18 +407,25 @@ def task_run(args, dag: DAG | None = None) -> TaskReturnCode | None:
         settings.configure_vars()
 
     settings.MASK_SECRETS_IN_LOGS = True
+    # Executor workers fork the task process, which must not report their uptime nor their phases
+    startup_profiler.reset_after_fork(keep_start_time=args.raw)
+    startup_profiler.start_profiling()
 
     get_listener_manager().hook.on_starting(component=TaskCommandMarker())
 
-    if args.pickle:
-        print(f"Loading pickle id: {args.pickle}")
-        _dag = get_dag_by_pickle(args.pickle)
-    elif not dag:
-        _dag = get_dag(args.subdir, args.dag_id, args.read_from_db)
-    else:
-        _dag = dag
+    with startup_profiler.startup_phase("dag_parse"):
+        if args.pickle:
+            print(f"Loading pickle id: {args.pickle}")
+            _dag = get_dag_by_pickle(args.pickle)
+        elif not dag:
+            _dag = get_dag(args.subdir, args.dag_id, args.read_from_db)
+        else:
+            _dag = dag
     task = _dag.get_task(task_id=args.task_id)
-    ti, _ = _get_ti(task, args.map_index, exec_date_or_run_id=args.execution_date_or_run_id, pool=args.pool)
+    with startup_profiler.startup_phase("get_ti"):
+        ti, _ = _get_ti(
+            task, args.map_index, exec_date_or_run_id=args.execution_date_or_run_id, pool=args.pool
+        )
     ti.init_run_context(raw=args.raw)
 
     hostname = get_hostname()
@@ -0,0 +1,84 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Fast path of the CLI for the commands Airflow runs for every task.
+
+Building the parser of all commands needs the CLI commands of the executor and of the auth manager, so
+:mod:`airflow.cli.cli_parser` imports both, with their dependencies, e.g. Flask App Builder for the
+default auth manager. ``airflow tasks run``, run for every task with ``--local`` then ``--raw``, is
+parsed by a parser of this command only instead, which does not need them. Executors and auth managers
+cannot redefine the core commands, so both parsers parse the command the same way.
+
+This module is imported very early by the CLI, so it must stay cheap to import.
+"""
+from __future__ import annotations
+
+import functools
+import os
+from typing import TYPE_CHECKING, Sequence
+
+if TYPE_CHECKING:
+    import argparse
+
+# Commands with a parser of their own, as the group and the command names
+FAST_PATH_COMMANDS = (("tasks", "run"),)
+
+
+def get_parser_for_command(args: Sequence[str]) -> argparse.ArgumentParser:
+    """
+    Return a parser for the given command line.
+
+    :param args: arguments of the command line, without the ``airflow`` program name
+    :return: the parser of the command for the commands of the fast path, the parser of all commands
+        otherwise
+    """
+    if _is_fast_path_command(args):
+        return _get_fast_path_parser(args[0], args[1])
+
+    from airflow.cli.cli_parser import get_parser
+
+    return get_parser()
+
+
+def _is_fast_path_command(args: Sequence[str]) -> bool:
+    if tuple(args[:2]) not in FAST_PATH_COMMANDS:
+        return False
+    # The help and the shell completion of a command are given by the parser of all commands, which shows
+    # them with the same formatting as for the other commands
+    return not ("-h" in args or "--help" in args or "_ARGCOMPLETE" in os.environ)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_fast_path_parser(group_name: str, command_name: str) -> argparse.ArgumentParser:
+    from airflow.cli.cli_config import DefaultHelpParser, GroupCommand, core_commands
+
+    group = next(command for command in core_commands if command.name == group_name)
+    if not isinstance(group, GroupCommand):
+        raise TypeError(f"{group_name} is not a group of commands")
+    command = next(command for command in group.subcommands if command.name == command_name)
+
+    parser = DefaultHelpParser(prog="airflow")
+    subparsers = parser.add_subparsers(dest="subcommand", metavar="GROUP_OR_COMMAND")
+    subparsers.required = True
+    group_subparsers = subparsers.add_parser(group.name).add_subparsers(dest="subcommand", metavar="COMMAND")
+    group_subparsers.required = True
+    command_parser = group_subparsers.add_parser(command.name, epilog=command.epilog)
+    for arg in command.args:
+        arg.add_to_parser(command_parser)
+    command_parser.set_defaults(func=command.func)
+    return parser
@@ -29,6 +29,7 @@ import shlex
 import stat
 import subprocess
 import sys
+import time
 import warnings
 from base64 import b64encode
 from configparser import ConfigParser, NoOptionError, NoSectionError
@@ -36,7 +37,7 @@ from contextlib import contextmanager
 from copy import deepcopy
 from io import StringIO
 from json.decoder import JSONDecodeError
-from typing import IO, TYPE_CHECKING, Any, Dict, Generator, Iterable, Pattern, Set, Tuple, Union
+from typing import IO, TYPE_CHECKING, Any, Dict, Generator, Iterable, NamedTuple, Pattern, Set, Tuple, Union
 from urllib.parse import urlsplit
 
 import re2
@@ -71,6 +72,17 @@ ConfigSourcesType = Dict[str, ConfigSectionSourcesType]
 
 ENV_VAR_PREFIX = "AIRFLOW__"
 
+# Part of the key of the values cached by AirflowConfigParser.get when no fallback is given
+_NO_FALLBACK = object()
+
+
+class ResolvedValuesCacheInfo(NamedTuple):
+    """Statistics of the cache of resolved values of a :class:`AirflowConfigParser`."""
+
+    hits: int
+    misses: int
+    currsize: int
+
 
 def _parse_sqlite_version(s: str) -> tuple[int, ...]:
     match = _SQLITE3_VERSION_PATTERN.match(s)
@@ -200,6 +212,10 @@ class AirflowConfigParser(ConfigParser):
         *args,
         **kwargs,
     ):
+        # (section, key, fallback) -> (value, environment variables, their values, expiry time)
+        self._resolved_values: dict[tuple[str, str, Any], tuple[str | None, tuple, tuple, float | None]] = {}
+        self._resolved_values_hits = 0
+        self._resolved_values_misses = 0
         super().__init__(*args, **kwargs)
         self.configuration_description = retrieve_configuration_description(include_providers=False)
         self.upgraded_values = {}
@@ -251,6 +267,7 @@ class AirflowConfigParser(ConfigParser):
         """
         parser = ConfigParser()
         parser.read_string(config_string)
+        self.invalidate_resolved_values_cache()
         for section in parser.sections():
             if section not in self._default_values.sections():
                 self._default_values.add_section(section)
@@ -466,7 +483,12 @@ class AirflowConfigParser(ConfigParser):
         ("core", "default_task_weight_rule"): sorted(WeightRule.all_weight_rules()),
         ("core", "dag_ignore_file_syntax"): ["regexp", "glob"],
         ("core", "mp_start_method"): multiprocessing.get_all_start_methods(),
-        ("scheduler", "file_parsing_sort_mode"): ["modified_time", "random_seeded_by_host", "alphabetical"],
+        ("scheduler", "file_parsing_sort_mode"): [
+            "modified_time",
+            "random_seeded_by_host",
+            "alphabetical",
+            "adaptive",
+        ],
         ("logging", "logging_level"): _available_logging_levels,
         ("logging", "fab_logging_level"): _available_logging_levels,
         # celery_logging_level can be empty, which uses logging_level as fallback
@@ -715,6 +737,7 @@ class AirflowConfigParser(ConfigParser):
         self.configuration_description = retrieve_configuration_description(include_providers=False)
         self._default_values = create_default_config_parser(self.configuration_description)
         self._providers_configuration_loaded = False
+        self.invalidate_resolved_values_cache()
 
     def validate(self):
         self._validate_sqlite3_version()
@@ -946,6 +969,100 @@ class AirflowConfigParser(ConfigParser):
     ) -> str | None:
         section = section.lower()
         key = key.lower()
+        cache_key: tuple[str, str, Any] | None = None
+        if not kwargs or (len(kwargs) == 1 and "fallback" in kwargs):
+            cache_key = (section, key, kwargs.get("fallback", _NO_FALLBACK))
+            try:
+                entry = self._resolved_values.get(cache_key)
+            except TypeError:
+                # Unhashable fallback
+                cache_key = entry = None
+            if entry is not None:
+                value, env_vars, env_values, expires_at = entry
+                if tuple(map(os.environ.get, env_vars)) == env_values and (
+                    expires_at is None or time.monotonic() < expires_at
+                ):
+                    self._resolved_values_hits += 1
+                    return value
+        self._resolved_values_misses += 1
+        value = self._resolve_value(
+            section,
+            key,
+            suppress_warnings=suppress_warnings,
+            _extra_stacklevel=_extra_stacklevel + 1,
+            **kwargs,
+        )
+        if cache_key is not None:
+            self._cache_resolved_value(cache_key, value)
+        return value
+
+    def _is_resolved_value_cacheable(self, section: str, key: str) -> bool:
+        # Deprecated options are not cached, so that a warning is emitted every time they are used
+        if self.configuration_description.get(section, {}).get(key, {}).get("deprecated"):
+            return False
+        return not (
+            section in self.inversed_deprecated_sections
+            or section in self.deprecated_sections
+            or (section, key) in self.inversed_deprecated_options
+            or (section, key) in self.deprecated_options
+        )
+
+    def _cache_resolved_value(self, cache_key: tuple[str, str, Any], value: str | None) -> None:
+        section, key, _ = cache_key
+        if not self._is_resolved_value_cacheable(section, key):
+            return
+        env_var = self._env_var_name(section, key)
+        # Only sensitive options can be read with a command or from a secrets backend
+        sensitive = (section, key) in self.sensitive_config_values
+        env_vars: tuple[str, ...] = (
+            (env_var, f"{env_var}_CMD", f"{env_var}_SECRET") if sensitive else (env_var,)
+        )
+        env_values = tuple(map(os.environ.get, env_vars))
+        expires_at = None
+        if (
+            sensitive
+            and env_values[0] is None
+            and (
+                env_values[1] is not None
+                or env_values[2] is not None
+                or super().has_option(section, f"{key}_cmd")
+                or super().has_option(section, f"{key}_secret")
+            )
+        ):
+            # The value may come from a command or a secrets backend, whose output can change over time
+            ttl = self.getint("core", "config_cmd_and_secret_cache_ttl", fallback=0)
+            if ttl <= 0:
+                return
+            expires_at = time.monotonic() + ttl
+        self._resolved_values[cache_key] = (value, env_vars, env_values, expires_at)
+
+    def invalidate_resolved_values_cache(self) -> None:
+        """
+        Forget the resolved values cached by ``get``.
+
+        The cache is invalidated whenever the configuration is changed through this parser, call this method
+        after changing it another way, e.g. by changing an environment variable used in a configuration value.
+        """
+        self._resolved_values.clear()
+
+    def resolved_values_cache_info(self) -> ResolvedValuesCacheInfo:
+        """
+        Return statistics of the cache of resolved values.
+
+        Hits are the lookups of configuration values avoided thanks to the cache.
+        """
+        return ResolvedValuesCacheInfo(
+            self._resolved_values_hits, self._resolved_values_misses, len(self._resolved_values)
+        )
+
+    def _resolve_value(
+        self,
+        section: str,
+        key: str,
+        suppress_warnings: bool = False,
+        _extra_stacklevel: int = 0,
+        **kwargs,
+    ) -> str | None:
         warning_emitted = False
         deprecated_section: str | None
         deprecated_key: str | None
@@ -1284,6 +1401,11 @@ class AirflowConfigParser(ConfigParser):
         encoding=None,
     ):
         super().read(filenames=filenames, encoding=encoding)
+        self.invalidate_resolved_values_cache()
+
+    def read_file(self, f: Iterable[str], source: str | None = None) -> None:
+        super().read_file(f, source=source)
+        self.invalidate_resolved_values_cache()
 
     def read_dict(  # type: ignore[override]
         self, dictionary: dict[str, dict[str, Any]], source: str = "<dict>"
@@ -1296,6 +1418,7 @@ class AirflowConfigParser(ConfigParser):
         :return:
         """
         super().read_dict(dictionary=dictionary, source=source)
+        self.invalidate_resolved_values_cache()
 
     def has_option(self, section: str, option: str) -> bool:
         """
@@ -1325,6 +1448,7 @@ class AirflowConfigParser(ConfigParser):
         section = section.lower()
         option = option.lower()
         super().set(section, option, value)
+        self.invalidate_resolved_values_cache()
 
     def remove_option(self, section: str, option: str, remove_default: bool = True):
         """
@@ -1340,6 +1464,12 @@ class AirflowConfigParser(ConfigParser):
 
         if self.get_default_value(section, option) is not None and remove_default:
             self._default_values.remove_option(section, option)
+        self.invalidate_resolved_values_cache()
+
+    def remove_section(self, section: str) -> bool:
+        removed = super().remove_section(section)
+        self.invalidate_resolved_values_cache()
+        return removed
 
     def getsection(self, section: str) -> ConfigOptionsDictType | None:
         """
@@ -1874,6 +2004,7 @@ class AirflowConfigParser(ConfigParser):
             # no problem if cache is not set yet
             pass
         self._providers_configuration_loaded = True
+        self.invalidate_resolved_values_cache()
 
     @staticmethod
     def _warn_deprecate(
@@ -1913,6 +2044,7 @@ class AirflowConfigParser(ConfigParser):
         config = state.pop("_sections")
         self.read_dict(config)
         self.__dict__.update(state)
+        self.invalidate_resolved_values_cache()
 
 
 def get_airflow_home() -> str:
@@ -20,16 +20,19 @@ from __future__ import annotations
 
 import enum
 import importlib
+import importlib.util
 import inspect
+import itertools
 import logging
 import multiprocessing
 import os
 import random
 import signal
+import statistics
 import sys
 import time
 import zipfile
-from collections import defaultdict, deque
+from collections import Counter, defaultdict, deque
 from datetime import datetime, timedelta
 from importlib import import_module
 from pathlib import Path
@@ -46,13 +49,14 @@ from airflow.configuration import conf
 from airflow.dag_processing.processor import DagFileProcessorProcess
 from airflow.models import errors
 from airflow.models.dag import DagModel
+from airflow.models.dagrun import DagRun
 from airflow.models.dagwarning import DagWarning
 from airflow.models.db_callback_request import DbCallbackRequest
 from airflow.models.serialized_dag import SerializedDagModel
 from airflow.secrets.cache import SecretCache
 from airflow.stats import Stats
 from airflow.utils import timezone
-from airflow.utils.file import list_py_file_paths, might_contain_dag
+from airflow.utils.file import iter_imported_modules, list_py_file_paths, might_contain_dag
 from airflow.utils.log.logging_mixin import LoggingMixin
 from airflow.utils.mixins import MultiprocessingStartMethodMixin
 from airflow.utils.net import get_hostname
@@ -64,6 +68,7 @@ from airflow.utils.process_utils import (
 from airflow.utils.retries import retry_db_transaction
 from airflow.utils.session import NEW_SESSION, provide_session
 from airflow.utils.sqlalchemy import prohibit_commit, with_row_locks
+from airflow.utils.state import DagRunState
 
 if TYPE_CHECKING:
     from multiprocessing.connection import Connection as MultiprocessingConnection
@@ -398,6 +403,10 @@ class DagFileProcessorManager(LoggingMixin):
 
         # Parse and schedule each file no faster than this interval.
         self._file_process_interval = conf.getint("scheduler", "min_file_process_interval")
+        # Parse each file at least this often in the adaptive parsing sort mode.
+        self._max_file_process_interval = max(
+            conf.getint("scheduler", "max_file_process_interval"), self._file_process_interval
+        )
         # How often to print out DAG file processing stats to the log. Default to
         # 30 seconds.
         self.print_stats_interval = conf.getint("scheduler", "print_stats_interval")
@@ -424,6 +433,20 @@ class DagFileProcessorManager(LoggingMixin):
         self._processor_timeout = processor_timeout
         # How often to scan the DAGs directory for new files. Default to 5 minutes.
         self.dag_dir_list_interval = conf.getint("scheduler", "dag_dir_list_interval")
+        # How many of the modules imported most often by the DAG files to import ahead of time
+        self._warmup_modules = conf.getint("scheduler", "parsing_warmup_modules")
+        # Map from file path to its modification time and the modules it imports
+        self._file_imports: dict[str, tuple[float, frozenset[str]]] = {}
+        # Map from module imported ahead of time to the seconds taken to import it
+        self._warmup_import_durations: dict[str, float] = {}
+        # Map from file path to its modification time when last parsed and the number of parses since
+        # it was last modified
+        self._file_parse_mtimes: dict[str, tuple[float | None, int]] = {}
+        # Files of the DAGs with active or upcoming runs, and when they were last fetched
+        self._active_dag_files: set[str] = set()
+        self._active_dag_files_refresh_time = timezone.make_aware(datetime.fromtimestamp(0))
+        # Map from file path to the time it was added to the queue
+        self._file_queued_times: dict[str, float] = {}
 
         # Mapping file name and callbacks requests
         self._callback_to_execute: dict[str, list[CallbackRequest]] = defaultdict(list)
@@ -538,6 +561,36 @@ class DagFileProcessorManager(LoggingMixin):
                 SerializedDagModel.remove_dag(dag_id)
                 cls.logger().info("Deleted DAG %s in serialized_dag table", dag_id)
 
+    @classmethod
+    @internal_api_call
+    @provide_session
+    def get_files_with_active_dags(
+        cls,
+        dag_directory: str,
+        horizon: int,
+        session: Session = NEW_SESSION,
+    ) -> set[str]:
+        """
+        Return the files of the DAGs with active or upcoming runs.
+
+        These are the DAGs with queued or running DAG runs, and the active and unpaused DAGs whose next DAG
+        run is to be created within ``horizon`` seconds.
+        """
+        active = (
+            select(DagModel.fileloc)
+            .join(DagRun, DagRun.dag_id == DagModel.dag_id)
+            .where(DagRun.state.in_((DagRunState.QUEUED, DagRunState.RUNNING)))
+        )
+        upcoming = select(DagModel.fileloc).where(
+            DagModel.is_active,
+            ~DagModel.is_paused,
+            DagModel.next_dagrun_create_after <= timezone.utcnow() + timedelta(seconds=horizon),
+        )
+        if conf.getboolean("scheduler", "standalone_dag_processor"):
+            active = active.where(DagModel.processor_subdir == dag_directory)
+            upcoming = upcoming.where(DagModel.processor_subdir == dag_directory)
+        return set(session.scalars(active.union(upcoming)))
+
     def _run_parsing_loop(self):
         # In sync mode we want timeout=None -- wait forever until a message is received
         if self._async_mode:
@@ -738,6 +791,7 @@ class DagFileProcessorManager(LoggingMixin):
             self.last_dag_dir_refresh_time = now
             self.log.info("There are %s files in %s", len(self._file_paths), self._dag_directory)
             self.set_file_paths(self._file_paths)
+            self._warm_up()
 
             try:
                 self.log.debug("Removing old import errors")
@@ -783,6 +837,86 @@ class DagFileProcessorManager(LoggingMixin):
             return True
         return False
 
+    def _warm_up(self) -> None:
+        """
+        Import the modules imported most often by the DAG files ahead of time.
+
+        The processes parsing the DAG files are forked from the manager, so they do not import these modules
+        again. Airflow modules are left to ``[scheduler] parsing_pre_import_modules``, and modules of the DAG
+        and plugins folders are never imported here, so that their changes are seen by the next parse.
+        """
+        if self._warmup_modules <= 0:
+            return
+        with Stats.timer("dag_processing.warmup_duration"):
+            file_imports = {file_path: self._get_file_imports(file_path) for file_path in self._file_paths}
+            self._file_imports = {path: self._file_imports[path] for path in file_imports}
+            counts = Counter(module for modules in file_imports.values() for module in modules)
+            candidates = (
+                module
+                for module, _ in counts.most_common()
+                if module.partition(".")[0] != "airflow" and self._is_outside_dag_folders(module)
+            )
+            for module in itertools.islice(candidates, self._warmup_modules):
+                if module in sys.modules:
+                    continue
+                start = time.monotonic()
+                try:
+                    importlib.import_module(module)
+                except Exception as e:
+                    # Not preventing anything from working, the error is raised again when parsing the files
+                    self.log.warning("Error when trying to import module '%s' ahead of time: %s", module, e)
+                    continue
+                self._warmup_import_durations[module] = time.monotonic() - start
+
+        Stats.gauge("dag_processing.warmup_modules", len(self._warmup_import_durations))
+        for file_path, modules in file_imports.items():
+            saved = sum(self._warmup_import_durations.get(module, 0) for module in modules)
+            if saved:
+                file_name = Path(file_path).stem
+                Stats.timing(f"dag_processing.warmup_time_saved.{file_name}", timedelta(seconds=saved))
+                Stats.timing(
+                    "dag_processing.warmup_time_saved",
+                    timedelta(seconds=saved),
+                    tags={"file_name": file_name},
+                )
+        self.log.info(
+            "Imported %s modules used by the DAG files ahead of time", len(self._warmup_import_durations)
+        )
+
+    def _get_file_imports(self, file_path: str) -> frozenset[str]:
+        """Return the modules imported at the top level of a file, which are only read again when it changes."""
+        try:
+            mtime = os.path.getmtime(file_path)
+        except OSError:
+            return frozenset()
+        cached = self._file_imports.get(file_path)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        modules = frozenset(iter_imported_modules(file_path))
+        self._file_imports[file_path] = (mtime, modules)
+        return modules
+
+    def _is_outside_dag_folders(self, module: str) -> bool:
+        """Whether the package of the module is found outside of the DAG and plugins folders."""
+        try:
+            spec = importlib.util.find_spec(module.partition(".")[0])
+        except (ImportError, ValueError):
+            return False
+        if spec is None:
+            return False
+        folders = [
+            os.path.join(os.path.realpath(folder), "")
+            for folder in (self.get_dag_directory(), airflow.settings.PLUGINS_FOLDER)
+            if folder
+        ]
+        locations = [spec.origin, *(spec.submodule_search_locations or [])]
+        return not any(
+            os.path.realpath(location).startswith(folder)
+            for location in locations
+            if location and os.path.isabs(location)
+            for folder in folders
+        )
+
     def _print_stat(self):
         """Occasionally print out stats about how fast the files are getting processed."""
         if 0 < self.print_stats_interval < time.monotonic() - self.last_stat_print_time:
@@ -995,6 +1129,9 @@ class DagFileProcessorManager(LoggingMixin):
         for key in to_remove:
             # Remove the stats for any dag files that don't exist anymore
             del self._file_stats[key]
+        for file_state in (self._file_parse_mtimes, self._file_queued_times):
+            for key in set(file_state).difference(self._file_paths):
+                del file_state[key]
 
         self._processors = filtered_processors
 
@@ -1027,10 +1164,23 @@ class DagFileProcessorManager(LoggingMixin):
             run_count=self.get_run_count(processor.file_path) + 1,
         )
         self._file_stats[processor.file_path] = stat
+        self._record_parse_mtime(processor.file_path)
         file_name = Path(processor.file_path).stem
         Stats.timing(f"dag_processing.last_duration.{file_name}", last_duration)
         Stats.timing("dag_processing.last_duration", last_duration, tags={"file_name": file_name})
 
+    def _record_parse_mtime(self, file_path: str) -> None:
+        """Count the parses of a file since it was last modified, to space out those of unchanged files."""
+        try:
+            mtime: float | None = os.path.getmtime(file_path)
+        except OSError:
+            mtime = None
+        last_mtime, unchanged_parses = self._file_parse_mtimes.get(file_path, (None, 0))
+        self._file_parse_mtimes[file_path] = (
+            mtime,
+            unchanged_parses + 1 if mtime is not None and mtime == last_mtime else 0,
+        )
+
     def collect_results(self) -> None:
         """Collect the result from any finished DAG processors."""
         ready = multiprocessing.connection.wait(
@@ -1071,6 +1221,13 @@ class DagFileProcessorManager(LoggingMixin):
             if file_path in self._processors:
                 continue
 
+            queued_time = self._file_queued_times.pop(file_path, None)
+            if queued_time is not None:
+                file_name = Path(file_path).stem
+                queue_age = timedelta(seconds=time.monotonic() - queued_time)
+                Stats.timing(f"dag_processing.file_queue_age.{file_name}", queue_age)
+                Stats.timing("dag_processing.file_queue_age", queue_age, tags={"file_name": file_name})
+
             callback_to_execute_for_file = self._callback_to_execute[file_path]
             processor = self._create_process(
                 file_path,
@@ -1097,6 +1254,7 @@ class DagFileProcessorManager(LoggingMixin):
                 self.log.info("Adding new file %s to parsing queue", file_path)
                 self._file_stats[file_path] = DagFileProcessorManager.DEFAULT_FILE_STAT
                 self._file_path_queue.appendleft(file_path)
+                self._file_queued_times.setdefault(file_path, time.monotonic())
 
     def prepare_file_path_queue(self):
         """
@@ -1116,11 +1274,15 @@ class DagFileProcessorManager(LoggingMixin):
         files_with_mtime = {}
         file_paths = []
         is_mtime_mode = list_mode == "modified_time"
+        is_adaptive_mode = list_mode == "adaptive"
+        reads_mtime = is_mtime_mode or is_adaptive_mode
+        if is_adaptive_mode:
+            process_intervals = self._get_adaptive_process_intervals()
 
         file_paths_recently_processed = []
         file_paths_to_stop_watching = set()
         for file_path in self._file_paths:
-            if is_mtime_mode:
+            if reads_mtime:
                 try:
                     files_with_mtime[file_path] = os.path.getmtime(file_path)
                 except FileNotFoundError:
@@ -1135,19 +1297,31 @@ class DagFileProcessorManager(LoggingMixin):
 
             # Find file paths that were recently processed to exclude them
             # from being added to file_path_queue
-            # unless they were modified recently and parsing mode is "modified_time"
+            # unless they were modified recently and parsing mode is "modified_time" or "adaptive"
             # in which case we don't honor "self._file_process_interval" (min_file_process_interval)
             last_finish_time = self.get_last_finish_time(file_path)
+            process_interval = (
+                process_intervals[file_path] if is_adaptive_mode else self._file_process_interval
+            )
             if (
                 last_finish_time is not None
-                and (now - last_finish_time).total_seconds() < self._file_process_interval
-                and not (is_mtime_mode and file_modified_time and (file_modified_time > last_finish_time))
+                and (now - last_finish_time).total_seconds() < process_interval
+                and not (reads_mtime and file_modified_time and (file_modified_time > last_finish_time))
             ):
                 file_paths_recently_processed.append(file_path)
 
         # Sort file paths via last modified time
         if is_mtime_mode:
             file_paths = sorted(files_with_mtime, key=files_with_mtime.get, reverse=True)
+        elif is_adaptive_mode:
+            # New and modified files first, then the files most overdue relative to their interval
+            def adaptive_priority(file_path: str) -> tuple[int, float]:
+                last_finish_time = self.get_last_finish_time(file_path)
+                if last_finish_time is None or files_with_mtime[file_path] > last_finish_time.timestamp():
+                    return 0, 0.0
+                return 1, -(now - last_finish_time).total_seconds() / process_intervals[file_path]
+
+            file_paths = sorted(files_with_mtime, key=adaptive_priority)
         elif list_mode == "alphabetical":
             file_paths.sort()
         elif list_mode == "random_seeded_by_host":
@@ -1189,9 +1363,46 @@ class DagFileProcessorManager(LoggingMixin):
 
         for file_path in files_paths_to_queue:
             self._file_stats.setdefault(file_path, DagFileProcessorManager.DEFAULT_FILE_STAT)
+            if is_adaptive_mode:
+                file_name = Path(file_path).stem
+                Stats.gauge(f"dag_processing.parse_interval.{file_name}", process_intervals[file_path])
+                Stats.gauge(
+                    "dag_processing.parse_interval",
+                    process_intervals[file_path],
+                    tags={"file_name": file_name},
+                )
         self._add_paths_to_queue(files_paths_to_queue, False)
         Stats.incr("dag_processing.file_path_queue_update_count")
 
+    def _get_adaptive_process_intervals(self) -> dict[str, float]:
+        """
+        Return the interval between two parses of each file in the adaptive parsing sort mode, in seconds.
+
+        Files of DAGs with active or upcoming runs are parsed every ``min_file_process_interval``. The
+        interval of the other files doubles with each parse not finding them modified, and is stretched for
+        the files slower to parse than the median, up to ``max_file_process_interval``.
+        """
+        now = timezone.utcnow()
+        if (now - self._active_dag_files_refresh_time).total_seconds() >= self._file_process_interval:
+            self._active_dag_files = self.get_files_with_active_dags(
+                dag_directory=self.get_dag_directory(), horizon=self._max_file_process_interval
+            )
+            self._active_dag_files_refresh_time = now
+        durations = [duration for duration in map(self.get_last_runtime, self._file_paths) if duration]
+        median_duration = statistics.median(durations) if durations else None
+
+        intervals = {}
+        for file_path in self._file_paths:
+            interval = float(self._file_process_interval)
+            if file_path not in self._active_dag_files:
+                _, unchanged_parses = self._file_parse_mtimes.get(file_path, (None, 0))
+                interval *= 2.0 ** min(unchanged_parses, 32)
+                last_duration = self.get_last_runtime(file_path)
+                if last_duration and median_duration:
+                    interval *= max(1.0, last_duration / median_duration)
+            intervals[file_path] = min(interval, self._max_file_process_interval)
+        return intervals
+
     def _kill_timed_out_processors(self):
         """Kill any file processors that timeout to defend against process hangs."""
         now = timezone.utcnow()
@@ -1231,6 +1442,9 @@ class DagFileProcessorManager(LoggingMixin):
     def _add_paths_to_queue(self, file_paths_to_enqueue: list[str], add_at_front: bool):
         """Add stuff to the back or front of the file queue, unless it's already present."""
         new_file_paths = list(p for p in file_paths_to_enqueue if p not in self._file_path_queue)
+        queued_time = time.monotonic()
+        for file_path in new_file_paths:
+            self._file_queued_times.setdefault(file_path, queued_time)
         if add_at_front:
             self._file_path_queue.extendleft(new_file_paths)
         else:
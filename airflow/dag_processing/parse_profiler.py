@@ -0,0 +1,299 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Profiling of the parsing of DAG files.
+
+While a :class:`ParseProfiler` is active, the DAG files parsed by the DagBags of the process are profiled:
+the time spent in each phase of the parsing, the slowest statements of the code of the file, the peak
+memory allocated and the Variables and Connections looked up. The DagBag and the serialization of the DAGs
+report their phases through the functions of this module, which do nothing when no profiler is active.
+
+The execution of the code of the file is split between the import, top-level code and DAG construction
+phases by sampling the stack of the thread parsing it: a sample is counted as import when the statement of
+the file being executed is an import, or when a module is being imported, as DAG construction when Airflow
+code called by the file is running, e.g. to create DAGs and operators or to set their dependencies, and as
+top-level code otherwise, including the lookups of Variables and Connections.
+"""
+from __future__ import annotations
+
+import ast
+import contextlib
+import linecache
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import timedelta
+from pathlib import Path
+from typing import Iterator
+
+import airflow
+from airflow.stats import Stats
+
+PHASES = ("import", "top_level_code", "dag_construction", "serialization", "db_write")
+
+# Phase of the execution of the code of DAG files, split between the phases executing it
+MODULE_EXECUTION = "module_execution"
+
+_AIRFLOW_FOLDER = os.path.dirname(airflow.__file__) + os.sep
+_LOOKUP_FUNCTIONS = frozenset({"get_variable_from_secrets", "get_connection_from_secrets"})
+
+_active_profiler: ParseProfiler | None = None
+
+
+@dataclass
+class FileParseProfile:
+    """
+    Profile of the parsing of a DAG file.
+
+    :param file_path: path of the DAG file
+    :param durations: time spent in each phase of the parsing, in seconds
+    :param line_durations: time spent executing each line of the code of the file, in seconds
+    :param memory_peak: peak memory allocated while parsing the file, in bytes, if traced
+    :param variable_lookups: number of lookups of each Variable
+    :param connection_lookups: number of lookups of each Connection
+    """
+
+    file_path: str
+    durations: dict[str, float] = field(default_factory=dict)
+    line_durations: dict[int, float] = field(default_factory=dict)
+    memory_peak: int | None = None
+    variable_lookups: Counter[str] = field(default_factory=Counter)
+    connection_lookups: Counter[str] = field(default_factory=Counter)
+
+    def slowest_statements(self, count: int) -> list[tuple[int, float, str]]:
+        """Return the line number, duration and source of the slowest statements of the file."""
+        return [
+            (line, duration, linecache.getline(self.file_path, line).strip())
+            for line, duration in sorted(self.line_durations.items(), key=lambda item: -item[1])[:count]
+        ]
+
+    def emit_metrics(self) -> None:
+        """Send the phase durations, peak memory and lookup counts as ``dag_processing`` metrics."""
+        file_name = Path(self.file_path).stem
+        tags = {"file_name": file_name}
+        for phase in PHASES:
+            if phase in self.durations:
+                duration = timedelta(seconds=self.durations[phase])
+                Stats.timing(f"dag_processing.{phase}_duration.{file_name}", duration)
+                Stats.timing(f"dag_processing.{phase}_duration", duration, tags=tags)
+        if self.memory_peak is not None:
+            Stats.gauge(f"dag_processing.memory_peak.{file_name}", self.memory_peak)
+            Stats.gauge("dag_processing.memory_peak", self.memory_peak, tags=tags)
+        for kind, lookups in (("variable", self.variable_lookups), ("connection", self.connection_lookups)):
+            Stats.gauge(f"dag_processing.{kind}_lookups.{file_name}", sum(lookups.values()))
+            Stats.gauge(f"dag_processing.{kind}_lookups", sum(lookups.values()), tags=tags)
+
+
+class _StatementSampler(threading.Thread):
+    """Thread sampling the statement of a DAG file executed by a thread, and the phase it is in."""
+
+    def __init__(self, file_path: str, interval: float):
+        super().__init__(name="parse-profiler", daemon=True)
+        self.file_path = file_path
+        self.interval = interval
+        self.thread_id = threading.get_ident()
+        self.import_lines = _get_import_lines(file_path)
+        # Time spent on each line of the file in each phase, as sampled
+        self.samples: dict[tuple[int, str], float] = {}
+        self._stop_event = threading.Event()
+
+    def run(self) -> None:
+        last_sample_time = time.monotonic()
+        while not self._stop_event.wait(self.interval):
+            sample = self._sample(sys._current_frames().get(self.thread_id))
+            # Samples are delayed while the thread executes Python code without releasing the GIL, so each
+            # of them accounts for the time since the previous one
+            sample_time = time.monotonic()
+            if sample is not None:
+                self.samples[sample] = self.samples.get(sample, 0.0) + sample_time - last_sample_time
+            last_sample_time = sample_time
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        self.join()
+
+    def _sample(self, frame) -> tuple[int, str] | None:
+        importing = looking_up = in_airflow = False
+        while frame is not None:
+            code = frame.f_code
+            if code.co_name == "<module>" and code.co_filename == self.file_path:
+                line = frame.f_lineno
+                if importing or line in self.import_lines:
+                    return line, "import"
+                if in_airflow and not looking_up:
+                    return line, "dag_construction"
+                return line, "top_level_code"
+            if code.co_filename.startswith("<frozen importlib"):
+                importing = True
+            elif code.co_name in _LOOKUP_FUNCTIONS:
+                looking_up = True
+            elif code.co_filename.startswith(_AIRFLOW_FOLDER):
+                in_airflow = True
+            frame = frame.f_back
+        return None
+
+
+def _get_import_lines(file_path: str) -> frozenset[int]:
+    """Return the line numbers of the import statements of a Python file."""
+    try:
+        tree = ast.parse(Path(file_path).read_bytes(), file_path)
+    except (OSError, SyntaxError, ValueError):
+        return frozenset()
+    return frozenset(
+        line
+        for node in ast.walk(tree)
+        if isinstance(node, (ast.Import, ast.ImportFrom))
+        for line in range(node.lineno, (node.end_lineno or node.lineno) + 1)
+    )
+
+
+def _split_module_execution(
+    profile: FileParseProfile, duration: float, samples: dict[tuple[int, str], float]
+) -> None:
+    """Split the time spent executing the code of a file between phases and lines, pro rata to samples."""
+    sampled_duration = sum(samples.values())
+    if not sampled_duration:
+        # Too short to be sampled
+        profile.durations["top_level_code"] = profile.durations.get("top_level_code", 0.0) + duration
+        return
+    for (line, phase), sample_duration in samples.items():
+        share = duration * sample_duration / sampled_duration
+        profile.line_durations[line] = profile.line_durations.get(line, 0.0) + share
+        profile.durations[phase] = profile.durations.get(phase, 0.0) + share
+
+
+class ParseProfiler:
+    """
+    Profiler of the parsing of the DAG files, while used as a context manager.
+
+    :param sampling_interval: time between two samples of the statement being executed, in seconds
+    :param trace_memory: whether to trace the memory allocated while parsing the files, which slows
+        down their parsing. It is not traced if :mod:`tracemalloc` is already tracing.
+    """
+
+    def __init__(self, sampling_interval: float = 0.001, trace_memory: bool = True):
+        self.sampling_interval = sampling_interval
+        self.trace_memory = trace_memory
+        self.profiles: dict[str, FileParseProfile] = {}
+        self.current: FileParseProfile | None = None
+        # Start time of the phases in progress, and time spent in the phases nested in them
+        self._phase_stack: list[list[float]] = []
+
+    def __enter__(self) -> ParseProfiler:
+        """Activate the profiler."""
+        global _active_profiler
+        if _active_profiler is not None:
+            raise RuntimeError("A parse profiler is already active")
+        _active_profiler = self
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Deactivate the profiler."""
+        global _active_profiler
+        _active_profiler = None
+
+    @contextlib.contextmanager
+    def profile_file(self, file_path: str) -> Iterator[FileParseProfile]:
+        """Profile the parsing of a file, continuing its profile if it was already profiled."""
+        profile = self.profiles.setdefault(file_path, FileParseProfile(file_path))
+        previous, self.current = self.current, profile
+        trace_memory = self.trace_memory and not tracemalloc.is_tracing()
+        if trace_memory:
+            tracemalloc.start()
+        try:
+            yield profile
+        finally:
+            if trace_memory:
+                memory_peak = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+                profile.memory_peak = max(profile.memory_peak or 0, memory_peak)
+            self.current = previous
+
+    @contextlib.contextmanager
+    def profile_phase(self, phase: str) -> Iterator[None]:
+        """Add the time spent in a phase, without the phases nested in it, to the current profile."""
+        entry = [time.monotonic(), 0.0]
+        self._phase_stack.append(entry)
+        try:
+            yield
+        finally:
+            self._phase_stack.pop()
+            duration = time.monotonic() - entry[0]
+            if self._phase_stack:
+                self._phase_stack[-1][1] += duration
+            if self.current is not None:
+                durations = self.current.durations
+                durations[phase] = durations.get(phase, 0.0) + duration - entry[1]
+
+    @contextlib.contextmanager
+    def profile_module_execution(self, file_path: str) -> Iterator[None]:
+        """Profile the execution of the code of a file, sampling the statements it executes."""
+        sampler = _StatementSampler(file_path, self.sampling_interval)
+        # The sampling thread can only sample as often as the executing thread releases the GIL
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(min(switch_interval, self.sampling_interval))
+        sampler.start()
+        try:
+            with self.profile_phase(MODULE_EXECUTION):
+                yield
+        finally:
+            sampler.stop()
+            sys.setswitchinterval(switch_interval)
+            if self.current is not None:
+                duration = self.current.durations.pop(MODULE_EXECUTION, 0.0)
+                _split_module_execution(self.current, duration, sampler.samples)
+
+    def record_lookup(self, kind: str, key: str) -> None:
+        """Record the lookup of a Variable or a Connection in the current profile."""
+        if self.current is None:
+            return
+        if kind == "variable":
+            self.current.variable_lookups[key] += 1
+        else:
+            self.current.connection_lookups[key] += 1
+
+
+def profile_file(file_path: str) -> contextlib.AbstractContextManager:
+    """Profile the parsing of a file if a profiler is active."""
+    if _active_profiler is None:
+        return contextlib.nullcontext()
+    return _active_profiler.profile_file(file_path)
+
+
+def profile_phase(phase: str) -> contextlib.AbstractContextManager:
+    """Add the time spent in a phase to the profile of the file being parsed, if a profiler is active."""
+    if _active_profiler is None:
+        return contextlib.nullcontext()
+    return _active_profiler.profile_phase(phase)
+
+
+def profile_module_execution(file_path: str) -> contextlib.AbstractContextManager:
+    """Profile the execution of the code of a file, if a profiler is active."""
+    if _active_profiler is None:
+        return contextlib.nullcontext()
+    return _active_profiler.profile_module_execution(file_path)
+
+
+def record_lookup(kind: str, key: str) -> None:
+    """Record the lookup of a Variable or a Connection, ``kind`` being ``variable`` or ``connection``."""
+    if _active_profiler is not None:
+        _active_profiler.record_lookup(kind, key)
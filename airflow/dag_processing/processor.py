@@ -23,7 +23,7 @@ import signal
 import threading
 import time
 import zipfile
-from contextlib import redirect_stderr, redirect_stdout, suppress
+from contextlib import nullcontext, redirect_stderr, redirect_stdout, suppress
 from datetime import timedelta
 from typing import TYPE_CHECKING, Iterable, Iterator
 
@@ -38,6 +38,7 @@ from airflow.callbacks.callback_requests import (
     TaskCallbackRequest,
 )
 from airflow.configuration import conf
+from airflow.dag_processing.parse_profiler import ParseProfiler, profile_file, profile_phase
 from airflow.exceptions import AirflowException, TaskNotFound
 from airflow.models import SlaMiss, errors
 from airflow.models.dag import DAG, DagModel
@@ -160,12 +161,25 @@ class DagFileProcessorProcess(LoggingMixin, MultiprocessingStartMethodMixin):
 
             log.info("Started process (PID=%s) to work on %s", os.getpid(), file_path)
             dag_file_processor = DagFileProcessor(dag_ids=dag_ids, dag_directory=dag_directory, log=log)
-            result: tuple[int, int] = dag_file_processor.process_file(
-                file_path=file_path,
-                pickle_dags=pickle_dags,
-                callback_requests=callback_requests,
-            )
+            profiler = ParseProfiler() if conf.getboolean("scheduler", "parsing_profiling") else None
+            with profiler or nullcontext():
+                result: tuple[int, int] = dag_file_processor.process_file(
+                    file_path=file_path,
+                    pickle_dags=pickle_dags,
+                    callback_requests=callback_requests,
+                )
             result_channel.send(result)
+            if profiler:
+                for profile in profiler.profiles.values():
+                    profile.emit_metrics()
+                    log.info(
+                        "Slowest statements of %s: %s",
+                        profile.file_path,
+                        "; ".join(
+                            f"line {line} ({duration:.3f}s): {source}"
+                            for line, duration, source in profile.slowest_statements(5)
+                        ),
+                    )
 
         try:
             DAG_PROCESSOR_LOG_TARGET = conf.get_mandatory_value("logging", "DAG_PROCESSOR_LOG_TARGET")
@@ -856,11 +870,12 @@ class DagFileProcessor(LoggingMixin):
         self.execute_callbacks(dagbag, callback_requests, session)
         session.commit()
 
-        serialize_errors = DagFileProcessor.save_dag_to_db(
-            dags=dagbag.dags,
-            dag_directory=self._dag_directory,
-            pickle_dags=pickle_dags,
-        )
+        with profile_file(file_path), profile_phase("db_write"):
+            serialize_errors = DagFileProcessor.save_dag_to_db(
+                dags=dagbag.dags,
+                dag_directory=self._dag_directory,
+                pickle_dags=pickle_dags,
+            )
 
         dagbag.import_errors.update(dict(serialize_errors))
 
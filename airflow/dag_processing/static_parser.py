@@ -0,0 +1,338 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Static parsing of declarative DAG files.
+
+Many DAG files only create a DAG and operators with literal arguments, and set their dependencies. Such
+files are read from their syntax tree instead of being executed: only the statements of a safe, static
+subset of Python are accepted, and the DAGs, task groups and operators they declare are created directly.
+Any other statement, e.g. a loop, a function or a class definition, or a call to anything else than an
+operator, a DAG, a task group or a few value constructors, makes the file dynamic, and it is then imported
+as usual. No code of the DAG file runs, only the Airflow modules it imports are imported.
+"""
+from __future__ import annotations
+
+import ast
+import contextlib
+import enum
+import importlib
+import inspect
+import types
+from pathlib import Path
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, Iterable
+
+if TYPE_CHECKING:
+    from airflow.models.dag import DAG
+
+# Modules the DAG files may import names from
+STATIC_MODULES = ("airflow", "datetime", "pendulum")
+
+# Callables returning values, which may be called with static arguments
+STATIC_CALLABLES = frozenset(
+    {
+        "datetime.date",
+        "datetime.datetime",
+        "datetime.timedelta",
+        "pendulum.datetime",
+        "pendulum.duration",
+        "airflow.datasets.Dataset",
+        "airflow.models.baseoperator.chain",
+        "airflow.models.baseoperator.cross_downstream",
+        "airflow.models.param.Param",
+        "airflow.utils.edgemodifier.Label",
+    }
+)
+
+# Attributes of the declared DAGs, task groups and tasks which may be read or called
+DECLARED_ATTRIBUTES = frozenset(
+    {"dag_id", "task_id", "group_id", "as_setup", "as_teardown", "set_downstream", "set_upstream"}
+)
+
+
+class DynamicDagFileError(Exception):
+    """Raised when a DAG file uses anything outside of the static subset."""
+
+
+def parse_static_dags(file_path: str) -> list[DAG] | None:
+    """
+    Create the DAGs declared by a DAG file without executing it.
+
+    :param file_path: path of the DAG file
+    :return: the DAGs declared by the file, or None if the file is dynamic and must be imported
+    """
+    try:
+        tree = ast.parse(Path(file_path).read_bytes(), filename=file_path)
+    except (OSError, SyntaxError, ValueError):
+        # Reported by the import of the file
+        return None
+    if not _has_static_syntax(tree):
+        return None
+    parser = _StaticParser(tree, file_path)
+    try:
+        parser.run(tree.body)
+    except Exception:
+        # Dynamic files, and the errors of static files, are handled by the import of the file
+        return None
+    return parser.dags
+
+
+class _StaticParser:
+    """Interpreter of the static subset, which creates the DAGs declared by the statements it runs."""
+
+    def __init__(self, tree: ast.Module, file_path: str):
+        self.namespace: dict[str, Any] = {"__doc__": ast.get_docstring(tree, clean=False)}
+        # Calls are made from a frame of the DAG file, like when it is imported, so that the DAGs take it as
+        # their fileloc before rendering their doc_md or searching their templates
+        self._call_from_file = types.FunctionType(_call.__code__.replace(co_filename=file_path), {})
+        # DAGs registered by their context manager, like when the file is imported
+        self.context_managed_dags: list[DAG] = []
+
+    @property
+    def dags(self) -> list[DAG]:
+        """The DAGs found when the file is imported: the top-level ones and the registered ones."""
+        from airflow.models.dag import DAG
+
+        dags = [value for value in self.namespace.values() if isinstance(value, DAG)]
+        dags.extend(dag for dag in self.context_managed_dags if dag.auto_register and dag not in dags)
+        return dags
+
+    def run(self, statements: Iterable[ast.stmt]) -> None:
+        for statement in statements:
+            self._run_statement(statement)
+
+    def _run_statement(self, statement: ast.stmt) -> None:
+        if isinstance(statement, ast.Expr):
+            if not isinstance(statement.value, ast.Constant):
+                # Dependencies set with >> or chain(), or a task created without a name
+                self._evaluate(statement.value)
+        elif isinstance(statement, ast.Import):
+            for alias in statement.names:
+                if alias.asname:
+                    self.namespace[alias.asname] = self._import(alias.name)
+                else:
+                    name = alias.name.partition(".")[0]
+                    self._import(alias.name)
+                    self.namespace[name] = self._import(name)
+        elif isinstance(statement, ast.ImportFrom):
+            if statement.level or not statement.module:
+                raise DynamicDagFileError("Relative imports may import modules of the DAG folder")
+            if statement.module == "__future__":
+                return
+            module = self._import(statement.module)
+            for alias in statement.names:
+                if alias.name == "*":
+                    raise DynamicDagFileError("Star imports are not supported")
+                try:
+                    value = getattr(module, alias.name)
+                except AttributeError:
+                    value = self._import(f"{statement.module}.{alias.name}")
+                self.namespace[alias.asname or alias.name] = value
+        elif isinstance(statement, ast.Assign) and len(statement.targets) == 1:
+            self._assign(statement.targets[0], self._evaluate(statement.value))
+        elif isinstance(statement, ast.AnnAssign) and statement.value is not None:
+            self._assign(statement.target, self._evaluate(statement.value))
+        elif isinstance(statement, ast.With):
+            self._run_with(statement)
+        elif isinstance(statement, ast.If) and _is_main_check(statement):
+            # Only run when the file is run as a script
+            return
+        else:
+            raise DynamicDagFileError(f"{type(statement).__name__} statements are not supported")
+
+    def _run_with(self, statement: ast.With) -> None:
+        from airflow.models.dag import DAG
+        from airflow.utils.task_group import TaskGroup
+
+        with contextlib.ExitStack() as stack:
+            for item in statement.items:
+                value = self._evaluate(item.context_expr)
+                if not isinstance(value, (DAG, TaskGroup)):
+                    raise DynamicDagFileError("Only DAGs and task groups may be used as context managers")
+                stack.enter_context(value)
+                if isinstance(value, DAG):
+                    self.context_managed_dags.append(value)
+                if item.optional_vars is not None:
+                    self._assign(item.optional_vars, value)
+            self.run(statement.body)
+
+    def _assign(self, target: ast.expr, value: Any) -> None:
+        if isinstance(target, ast.Name):
+            self.namespace[target.id] = value
+        elif isinstance(target, ast.Attribute):
+            # Like dag.doc_md = __doc__
+            obj = self._evaluate(target.value)
+            if not self._is_declared(obj):
+                raise DynamicDagFileError("Only attributes of DAGs, task groups and tasks may be set")
+            setattr(obj, target.attr, value)
+        else:
+            raise DynamicDagFileError(f"Assignments to {type(target).__name__} are not supported")
+
+    def _evaluate(self, node: ast.expr) -> Any:
+        if isinstance(node, ast.Constant):
+            return node.value
+        if isinstance(node, ast.Name):
+            try:
+                return self.namespace[node.id]
+            except KeyError:
+                raise DynamicDagFileError(f"{node.id} is not defined") from None
+        if isinstance(node, ast.Attribute):
+            value = self._evaluate(node.value)
+            if isinstance(value, ModuleType) or (isinstance(value, type) and issubclass(value, enum.Enum)):
+                return getattr(value, node.attr)
+            if self._is_declared(value) and node.attr in DECLARED_ATTRIBUTES:
+                return getattr(value, node.attr)
+            raise DynamicDagFileError(f"Attribute {node.attr} may not be read")
+        if isinstance(node, (ast.List, ast.Tuple, ast.Set)):
+            items = [self._evaluate(item) for item in node.elts]
+            return {ast.List: list, ast.Tuple: tuple, ast.Set: set}[type(node)](items)
+        if isinstance(node, ast.Dict):
+            if any(key is None for key in node.keys):
+                raise DynamicDagFileError("Dictionary unpacking is not supported")
+            return {
+                self._evaluate(key): self._evaluate(value)  # type: ignore[arg-type]
+                for key, value in zip(node.keys, node.values)
+            }
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub):
+            return -self._evaluate(node.operand)
+        if isinstance(node, ast.BinOp) and isinstance(node.op, (ast.RShift, ast.LShift)):
+            left, right = self._evaluate(node.left), self._evaluate(node.right)
+            if not all(self._is_dependency_operand(operand) for operand in (left, right)):
+                raise DynamicDagFileError("Only dependencies between tasks may be set with >> and <<")
+            return left >> right if isinstance(node.op, ast.RShift) else left << right
+        if isinstance(node, ast.Call):
+            return self._call(node)
+        raise DynamicDagFileError(f"{type(node).__name__} expressions are not supported")
+
+    def _call(self, node: ast.Call) -> Any:
+        from airflow.models.baseoperator import BaseOperator
+        from airflow.models.dag import DAG
+        from airflow.utils.task_group import TaskGroup
+
+        func = self._evaluate(node.func)
+        is_declaration = (isinstance(func, type) and issubclass(func, (BaseOperator, DAG, TaskGroup))) or (
+            inspect.ismethod(func) and self._is_declared(func.__self__)
+        )
+        qualified_name = f"{getattr(func, '__module__', None)}.{getattr(func, '__qualname__', None)}"
+        if not is_declaration and qualified_name not in STATIC_CALLABLES:
+            raise DynamicDagFileError(f"Calls to {func!r} are not supported")
+        args = []
+        for arg in node.args:
+            if isinstance(arg, ast.Starred):
+                raise DynamicDagFileError("Argument unpacking is not supported")
+            args.append(self._evaluate(arg))
+        kwargs = {}
+        for keyword in node.keywords:
+            if keyword.arg is None:
+                raise DynamicDagFileError("Argument unpacking is not supported")
+            kwargs[keyword.arg] = self._evaluate(keyword.value)
+        return self._call_from_file(func, args, kwargs)
+
+    def _is_declared(self, value: Any) -> bool:
+        from airflow.models.dag import DAG
+        from airflow.models.taskmixin import DAGNode
+
+        return isinstance(value, (DAG, DAGNode))
+
+    def _is_dependency_operand(self, value: Any) -> bool:
+        from airflow.models.taskmixin import DependencyMixin
+
+        if isinstance(value, (list, tuple)):
+            return all(isinstance(item, DependencyMixin) for item in value)
+        return isinstance(value, DependencyMixin)
+
+    @staticmethod
+    def _import(name: str) -> ModuleType:
+        if name.partition(".")[0] not in STATIC_MODULES:
+            raise DynamicDagFileError(f"Module {name} may not be imported by static DAG files")
+        try:
+            return importlib.import_module(name)
+        except ImportError as e:
+            raise DynamicDagFileError(str(e)) from None
+
+
+def _call(func, args, kwargs):
+    return func(*args, **kwargs)
+
+
+# Syntax of the static subset, checked before creating anything so that most dynamic files are imported
+# without running their first statements
+_STATIC_STATEMENTS = (ast.Expr, ast.Import, ast.ImportFrom, ast.Assign, ast.AnnAssign, ast.With)
+_STATIC_NODES = (
+    ast.expr_context,
+    ast.alias,
+    ast.keyword,
+    ast.withitem,
+    ast.Constant,
+    ast.Name,
+    ast.Attribute,
+    ast.List,
+    ast.Tuple,
+    ast.Set,
+    ast.Dict,
+    ast.UnaryOp,
+    ast.USub,
+    ast.BinOp,
+    ast.RShift,
+    ast.LShift,
+    ast.Call,
+)
+
+
+def _has_static_syntax(tree: ast.Module) -> bool:
+    statements = [
+        statement
+        for statement in tree.body
+        if not (isinstance(statement, ast.If) and _is_main_check(statement))
+    ]
+    while statements:
+        statement = statements.pop()
+        if not isinstance(statement, _STATIC_STATEMENTS):
+            return False
+        if isinstance(statement, (ast.Import, ast.ImportFrom)):
+            modules = [alias.name for alias in statement.names] if isinstance(statement, ast.Import) else []
+            if isinstance(statement, ast.ImportFrom):
+                modules.append(statement.module or "")
+            if any(module.partition(".")[0] not in (*STATIC_MODULES, "__future__") for module in modules):
+                return False
+            continue
+        nodes: list[ast.AST] = [statement]
+        if isinstance(statement, ast.With):
+            # The statements of the body are checked on their own
+            statements.extend(statement.body)
+            nodes = list(statement.items)
+        for node in nodes:
+            for child in ast.walk(node):
+                if child is not statement and not isinstance(child, _STATIC_NODES):
+                    return False
+    return True
+
+
+def _is_main_check(statement: ast.If) -> bool:
+    """Whether the statement is ``if __name__ == "__main__":`` without an else branch."""
+    test = statement.test
+    return (
+        not statement.orelse
+        and isinstance(test, ast.Compare)
+        and isinstance(test.left, ast.Name)
+        and test.left.id == "__name__"
+        and len(test.ops) == 1
+        and isinstance(test.ops[0], ast.Eq)
+        and isinstance(test.comparators[0], ast.Constant)
+        and test.comparators[0].value == "__main__"
+    )
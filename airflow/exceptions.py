@@ -386,7 +386,7 @@ class TaskDeferralError(AirflowException):
     """Raised when a task failed during deferral for some reason."""
 
 
-# The try/except handling is needed after we moved all k8s classes to cncf.kubernetes provider
+# The lazy import is needed after we moved all k8s classes to cncf.kubernetes provider
 # These two exceptions are used internally by Kubernetes Executor but also by PodGenerator, so we need
 # to leave them here in case older version of cncf.kubernetes provider is used to run KubernetesPodOperator
 # and it raises one of those exceptions. The code should be backwards compatible even if you import
@@ -394,20 +394,29 @@ class TaskDeferralError(AirflowException):
 # 1) if you have old provider, both provider and pod generator will throw the "airflow.exceptions" exception.
 # 2) if you have new provider, both provider and pod generator will throw the
 #    "airflow.providers.cncf.kubernetes" as it will be imported here from the provider.
-try:
-    from airflow.providers.cncf.kubernetes.pod_generator import PodMutationHookException
-except ImportError:
-
-    class PodMutationHookException(AirflowException):  # type: ignore[no-redef]
-        """Raised when exception happens during Pod Mutation Hook execution."""
-
-
-try:
-    from airflow.providers.cncf.kubernetes.pod_generator import PodReconciliationError
-except ImportError:
-
-    class PodReconciliationError(AirflowException):  # type: ignore[no-redef]
-        """Raised when an error is encountered while trying to merge pod configs."""
+# They are only imported when used, as importing the provider imports the Kubernetes client, which takes
+# longer than importing the rest of Airflow.
+__kubernetes_exceptions = {
+    "PodMutationHookException": "Raised when exception happens during Pod Mutation Hook execution.",
+    "PodReconciliationError": "Raised when an error is encountered while trying to merge pod configs.",
+}
+
+
+def __getattr__(name: str):
+    # PEP-562: Lazy loaded attributes on python modules
+    if name not in __kubernetes_exceptions:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    try:
+        from airflow.providers.cncf.kubernetes import pod_generator
+
+        val = getattr(pod_generator, name)
+    except (ImportError, AttributeError):
+        val = type(
+            name, (AirflowException,), {"__doc__": __kubernetes_exceptions[name], "__module__": __name__}
+        )
+    # Store for next time
+    globals()[name] = val
+    return val
 
 
 class RemovedInAirflow3Warning(DeprecationWarning):
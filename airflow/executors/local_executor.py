@@ -28,16 +28,21 @@ import contextlib
 import logging
 import os
 import subprocess
+import sys
+import time
 from abc import abstractmethod
+from collections import OrderedDict
 from multiprocessing import Manager, Process
 from queue import Empty
-from typing import TYPE_CHECKING, Any, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Iterable, Optional, Tuple
 
 from setproctitle import getproctitle, setproctitle
 
 from airflow import settings
+from airflow.configuration import conf
 from airflow.exceptions import AirflowException
 from airflow.executors.base_executor import PARALLELISM, BaseExecutor
+from airflow.stats import Stats
 from airflow.utils.log.logging_mixin import LoggingMixin
 from airflow.utils.state import TaskInstanceState
 
@@ -46,6 +51,7 @@ if TYPE_CHECKING:
     from queue import Queue
 
     from airflow.executors.base_executor import CommandType
+    from airflow.models.dag import DAG
     from airflow.models.taskinstance import TaskInstanceStateType
     from airflow.models.taskinstancekey import TaskInstanceKey
 
@@ -62,20 +68,136 @@ class LocalWorkerBase(Process, LoggingMixin):
     Executes the given command and puts the result into a result queue when done, terminating execution.
 
     :param result_queue: the queue to store result state
+    :param warm: whether to pre-initialize the worker and keep the DAGs it parsed, so that tasks forked
+        from it don't need to do it again
     """
 
-    def __init__(self, result_queue: Queue[TaskInstanceStateType]):
+    # Maximum number of parsed DAGs kept by a warm worker
+    warm_dag_cache_size: int = 32
+
+    def __init__(self, result_queue: Queue[TaskInstanceStateType], warm: bool = False):
         super().__init__(target=self.do_work)
         self.daemon: bool = True
         self.result_queue: Queue[TaskInstanceStateType] = result_queue
+        self.warm: bool = warm
+        # (file path, dag_id) -> (modification time of the DAG file and of the modules it loaded, DAG)
+        self._warm_dags: OrderedDict[tuple[str, str], tuple[dict[str, float], DAG]] = OrderedDict()
 
     def run(self):
         # We know we've just started a new process, so lets disconnect from the metadata db now
         settings.engine.pool.dispose()
         settings.engine.dispose()
         setproctitle("airflow worker -- LocalExecutor")
+        if self.warm and not settings.EXECUTE_TASKS_NEW_PYTHON_INTERPRETER:
+            self._warm_up()
         return super().run()
 
+    def _warm_up(self) -> None:
+        """
+        Pre-initialize the worker process, so that every task forked from it starts faster.
+
+        Builds the CLI parser, discovers providers, loads plugins and imports the modules used to run a task.
+        """
+        start = time.monotonic()
+        try:
+            import airflow.cli.commands.task_command
+            import airflow.jobs.local_task_job_runner
+            import airflow.task.task_runner.standard_task_runner  # noqa: F401
+            from airflow import plugins_manager
+            from airflow.cli.fast_path import get_parser_for_command
+            from airflow.providers_manager import ProvidersManager
+
+            get_parser_for_command(["tasks", "run"])
+            ProvidersManager().initialize_providers_hooks()
+            plugins_manager.integrate_macros_plugins()
+        except Exception:
+            self.log.exception("Failed to warm up %s, tasks will initialize themselves", self.name)
+        finally:
+            # Warming up may have used the metadata db, tasks forked from here must not share connections
+            settings.engine.dispose()
+        duration = time.monotonic() - start
+        Stats.timing("local_executor.warm_up_duration", duration * 1000)
+        self.log.debug("Warmed up %s in %.2f seconds", self.name, duration)
+
+    def _get_warm_dag(self, command: CommandType) -> DAG | None:
+        """
+        Return the DAG of the task the command runs, parsed at most once per version of its file.
+
+        :param command: the ``airflow tasks run`` command to execute
+        :return: the DAG, or None if the task should load the DAG by itself
+        """
+        from airflow.cli.fast_path import get_parser_for_command
+        from airflow.models.dagbag import DagBag
+        from airflow.utils.cli import process_subdir
+
+        try:
+            # [1:] - remove "airflow" from the start of the command
+            args = get_parser_for_command(command[1:]).parse_args(command[1:])
+        except (Exception, SystemExit):
+            return None
+        if args.pickle or args.read_from_db:
+            return None
+        path = process_subdir(args.subdir)
+        if not path or not os.path.isfile(path):
+            return None
+
+        key = (path, args.dag_id)
+        cached = self._warm_dags.get(key)
+        if cached and self._get_mtimes(cached[0]) == cached[0]:
+            self._warm_dags.move_to_end(key)
+            Stats.incr("local_executor.warm_dag_cache.hit")
+            return cached[1]
+
+        Stats.incr("local_executor.warm_dag_cache.miss")
+        modules_before = set(sys.modules)
+        try:
+            dag = DagBag(path, include_examples=False).dags.get(args.dag_id)
+        except BaseException:
+            # Also catches DAG files calling sys.exit(), which must not stop the worker
+            self.log.exception("Failed to load %s in %s", args.dag_id, self.name)
+            dag = None
+        finally:
+            # DAG files may use the metadata db, tasks forked from here must not share connections
+            settings.engine.dispose()
+            loaded_files = self._unload_dag_folder_modules(modules_before, path)
+        if dag is None:
+            self._warm_dags.pop(key, None)
+            return None
+        self._warm_dags[key] = (self._get_mtimes([path, *loaded_files]), dag)
+        while len(self._warm_dags) > self.warm_dag_cache_size:
+            self._warm_dags.popitem(last=False)
+        return dag
+
+    @staticmethod
+    def _unload_dag_folder_modules(modules_before: set[str], dag_file: str) -> list[str]:
+        """
+        Forget the modules of the DAGs folder loaded while parsing a DAG file.
+
+        They are imported again the next time a DAG file using them is parsed, so that changes to them are
+        picked up. Installed packages are kept loaded, so the workers must be restarted when upgraded.
+
+        :return: the files of the unloaded modules
+        """
+        folders = {os.path.realpath(settings.DAGS_FOLDER), os.path.realpath(os.path.dirname(dag_file))}
+        files = []
+        for name in set(sys.modules) - modules_before:
+            module_file = getattr(sys.modules[name], "__file__", None)
+            if not module_file:
+                continue
+            module_file = os.path.realpath(module_file)
+            if any(os.path.commonpath([folder, module_file]) == folder for folder in folders):
+                del sys.modules[name]
+                files.append(module_file)
+        return files
+
+    @staticmethod
+    def _get_mtimes(paths: Iterable[str]) -> dict[str, float]:
+        mtimes = {}
+        for path in paths:
+            with contextlib.suppress(OSError):
+                mtimes[path] = os.path.getmtime(path)
+        return mtimes
+
     def execute_work(self, key: TaskInstanceKey, command: CommandType) -> None:
         """
         Execute command received and stores result state in queue.
@@ -106,6 +228,7 @@ class LocalWorkerBase(Process, LoggingMixin):
             return TaskInstanceState.FAILED
 
     def _execute_work_in_fork(self, command: CommandType) -> TaskInstanceState:
+        dag = self._get_warm_dag(command) if self.warm else None
         pid = os.fork()
         if pid:
             # In parent, wait for the child
@@ -118,20 +241,23 @@ class LocalWorkerBase(Process, LoggingMixin):
         try:
             import signal
 
-            from airflow.cli.cli_parser import get_parser
+            from airflow.cli.fast_path import get_parser_for_command
 
             signal.signal(signal.SIGINT, signal.SIG_DFL)
             signal.signal(signal.SIGTERM, signal.SIG_DFL)
             signal.signal(signal.SIGUSR2, signal.SIG_DFL)
 
-            parser = get_parser()
             # [1:] - remove "airflow" from the start of the command
+            parser = get_parser_for_command(command[1:])
             args = parser.parse_args(command[1:])
             args.shut_down_logging = False
 
             setproctitle(f"airflow task supervisor: {command}")
 
-            args.func(args)
+            if dag is not None:
+                args.func(args, dag=dag)
+            else:
+                args.func(args)
             ret = 0
             return TaskInstanceState.SUCCESS
         except Exception as e:
@@ -177,10 +303,16 @@ class QueuedLocalWorker(LocalWorkerBase):
 
     :param task_queue: queue from which worker reads tasks
     :param result_queue: queue where worker puts results after finishing tasks
+    :param warm: whether to pre-initialize the worker and keep the DAGs it parsed
     """
 
-    def __init__(self, task_queue: Queue[ExecutorWorkType], result_queue: Queue[TaskInstanceStateType]):
-        super().__init__(result_queue=result_queue)
+    def __init__(
+        self,
+        task_queue: Queue[ExecutorWorkType],
+        result_queue: Queue[TaskInstanceStateType],
+        warm: bool = False,
+    ):
+        super().__init__(result_queue=result_queue, warm=warm)
         self.task_queue = task_queue
 
     def do_work(self) -> None:
@@ -227,6 +359,10 @@ class LocalExecutor(BaseExecutor):
         self.workers_used: int = 0
         self.workers_active: int = 0
         self.impl: None | (LocalExecutor.UnlimitedParallelism | LocalExecutor.LimitedParallelism) = None
+        # Workers only live longer than a single task when parallelism is limited
+        self.warm_workers: bool = self.parallelism > 0 and conf.getboolean(
+            "core", "local_executor_warm_workers"
+        )
 
     class UnlimitedParallelism:
         """
@@ -301,7 +437,7 @@ class LocalExecutor(BaseExecutor):
 
             self.queue = self.executor.manager.Queue()
             self.executor.workers = [
-                QueuedLocalWorker(self.queue, self.executor.result_queue)
+                QueuedLocalWorker(self.queue, self.executor.result_queue, warm=self.executor.warm_workers)
                 for _ in range(self.executor.parallelism)
             ]
 
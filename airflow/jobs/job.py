@@ -32,7 +32,6 @@ from airflow.exceptions import AirflowException
 from airflow.executors.executor_loader import ExecutorLoader
 from airflow.listeners.listener import get_listener_manager
 from airflow.models.base import ID_LEN, Base
-from airflow.serialization.pydantic.job import JobPydantic
 from airflow.stats import Stats
 from airflow.utils import timezone
 from airflow.utils.helpers import convert_camel_to_snake
@@ -49,6 +48,8 @@ if TYPE_CHECKING:
 
     from sqlalchemy.orm.session import Session
 
+    from airflow.serialization.pydantic.job import JobPydantic
+
 
 def _resolve_dagrun_model():
     from airflow.models.dagrun import DagRun
@@ -318,6 +319,8 @@ class Job(Base, LoggingMixin):
     @internal_api_call
     @provide_session
     def _add_to_db(job: Job | JobPydantic, session: Session = NEW_SESSION) -> Job | JobPydantic:
+        from airflow.serialization.pydantic.job import JobPydantic
+
         if isinstance(job, JobPydantic):
             orm_job = Job()
             orm_job._merge_from(job)
@@ -28,6 +28,7 @@ from airflow.jobs.base_job_runner import BaseJobRunner
 from airflow.jobs.job import perform_heartbeat
 from airflow.models.taskinstance import TaskReturnCode
 from airflow.stats import Stats
+from airflow.task import startup_profiler
 from airflow.utils import timezone
 from airflow.utils.log.file_task_handler import _set_task_deferred_context_var
 from airflow.utils.log.logging_mixin import LoggingMixin
@@ -149,23 +150,29 @@ class LocalTaskJobRunner(BaseJobRunner, LoggingMixin):
             # This is not supported on Windows systems
             signal.signal(signal.SIGUSR2, sigusr2_debug_handler)
 
-        if not self.task_instance.check_and_change_state_before_execution(
-            mark_success=self.mark_success,
-            ignore_all_deps=self.ignore_all_deps,
-            ignore_depends_on_past=self.ignore_depends_on_past,
-            wait_for_past_depends_before_skipping=self.wait_for_past_depends_before_skipping,
-            ignore_task_deps=self.ignore_task_deps,
-            ignore_ti_state=self.ignore_ti_state,
-            job_id=str(self.job.id),
-            pool=self.pool,
-            external_executor_id=self.external_executor_id,
-        ):
+        with startup_profiler.startup_phase("check_and_change_state"):
+            can_run = self.task_instance.check_and_change_state_before_execution(
+                mark_success=self.mark_success,
+                ignore_all_deps=self.ignore_all_deps,
+                ignore_depends_on_past=self.ignore_depends_on_past,
+                wait_for_past_depends_before_skipping=self.wait_for_past_depends_before_skipping,
+                ignore_task_deps=self.ignore_task_deps,
+                ignore_ti_state=self.ignore_ti_state,
+                job_id=str(self.job.id),
+                pool=self.pool,
+                external_executor_id=self.external_executor_id,
+            )
+        if not can_run:
             self.log.info("Task is not able to be run")
+            startup_profiler.stop_profiling(self.task_instance, "supervisor")
             return None
 
         return_code = None
         try:
-            self.task_runner.start()
+            with startup_profiler.startup_phase("task_runner_start"):
+                self.task_runner.start()
+            startup_profiler.emit_startup_metrics(self.task_instance, include_total=False)
+            startup_profiler.stop_profiling(self.task_instance, "supervisor")
             local_task_job_heartbeat_sec = conf.getint("scheduler", "local_task_job_heartbeat_sec")
             if local_task_job_heartbeat_sec < 1:
                 heartbeat_time_limit = conf.getint("scheduler", "scheduler_zombie_task_threshold")
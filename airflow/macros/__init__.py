@@ -89,3 +89,13 @@ def datetime_diff_for_humans(dt: Any, since: DateTime | None = None) -> str:
     import pendulum
 
     return pendulum.instance(dt).diff_for_humans(since)
+
+
+def __getattr__(name: str):
+    # The macros of plugins imported lazily are only integrated when first used in a template
+    from airflow.plugins_manager import import_macros_plugin
+
+    macros_module = import_macros_plugin(name)
+    if macros_module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return macros_module
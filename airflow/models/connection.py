@@ -29,6 +29,7 @@ from sqlalchemy import Boolean, Column, Integer, String, Text
 from sqlalchemy.orm import declared_attr, reconstructor, synonym
 
 from airflow.configuration import ensure_secrets_loaded
+from airflow.dag_processing.parse_profiler import record_lookup
 from airflow.exceptions import AirflowException, AirflowNotFoundException, RemovedInAirflow3Warning
 from airflow.models.base import ID_LEN, Base
 from airflow.models.crypto import get_fernet
@@ -494,6 +495,7 @@ class Connection(Base, LoggingMixin):
         :param conn_id: connection id
         :return: connection
         """
+        record_lookup("connection", conn_id)
         # check cache first
         # enabled only if SecretCache.init() has been called first
         try:
@@ -124,6 +124,7 @@ from airflow.timetables.simple import (
 from airflow.timetables.trigger import CronTriggerTimetable
 from airflow.utils import timezone
 from airflow.utils.dag_cycle_tester import check_cycle
+from airflow.utils.dag_integrity import DagGraphIndex, check_dag_integrity
 from airflow.utils.dates import cron_presets, date_range as utils_date_range
 from airflow.utils.decorators import fixup_decorator_warning_stack
 from airflow.utils.helpers import at_most_one, exactly_one, validate_key
@@ -137,7 +138,6 @@ from airflow.utils.sqlalchemy import (
     with_row_locks,
 )
 from airflow.utils.state import DagRunState, State, TaskInstanceState
-from airflow.utils.trigger_rule import TriggerRule
 from airflow.utils.types import NOTSET, ArgNotSet, DagRunType, EdgeInfoType
 
 if TYPE_CHECKING:
@@ -762,7 +762,8 @@ class DAG(LoggingMixin):
             )
         self.validate_schedule_and_params()
         self.timetable.validate()
-        self.validate_setup_teardown()
+        # Setup and teardown tasks, task groups and cycles
+        check_dag_integrity(self)
 
     def validate_setup_teardown(self):
         """
@@ -770,15 +771,7 @@ class DAG(LoggingMixin):
 
         :meta private:
         """
-        for task in self.tasks:
-            if task.is_setup:
-                for down_task in task.downstream_list:
-                    if not down_task.is_teardown and down_task.trigger_rule != TriggerRule.ALL_SUCCESS:
-                        # todo: we can relax this to allow out-of-scope tasks to have other trigger rules
-                        # this is required to ensure consistent behavior of dag
-                        # when clearing an indirect setup
-                        raise ValueError("Setup tasks must be followed with trigger rule ALL_SUCCESS.")
-            FailStopDagInvalidTriggerRule.check(dag=self, trigger_rule=task.trigger_rule)
+        DagGraphIndex(self).check_setup_teardown()
 
     def __repr__(self):
         return f"<DAG: {self.dag_id}>"
@@ -2953,9 +2946,6 @@ class DAG(LoggingMixin):
         """
         logical_date = timezone.coerce_datetime(execution_date)
 
-        if data_interval and not isinstance(data_interval, DataInterval):
-            data_interval = DataInterval(*map(timezone.coerce_datetime, data_interval))
-
         if data_interval is None and logical_date is not None:
             warnings.warn(
                 "Calling `DAG.create_dagrun()` without an explicit data interval is deprecated",
@@ -2967,6 +2957,54 @@ class DAG(LoggingMixin):
             else:
                 data_interval = self.infer_automated_data_interval(logical_date)
 
+        run = self.build_dagrun(
+            state=state,
+            execution_date=logical_date,
+            run_id=run_id,
+            start_date=start_date,
+            external_trigger=external_trigger,
+            conf=conf,
+            run_type=run_type,
+            dag_hash=dag_hash,
+            creating_job_id=creating_job_id,
+            data_interval=data_interval,
+        )
+        session.add(run)
+        session.flush()
+
+        # create the associated task instances
+        # state is None at the moment of creation
+        run.verify_integrity(session=session)
+
+        return run
+
+    def build_dagrun(
+        self,
+        state: DagRunState,
+        execution_date: datetime | None = None,
+        run_id: str | None = None,
+        start_date: datetime | None = None,
+        external_trigger: bool | None = False,
+        conf: dict | None = None,
+        run_type: DagRunType | None = None,
+        dag_hash: str | None = None,
+        creating_job_id: int | None = None,
+        data_interval: tuple[datetime, datetime] | None = None,
+    ) -> DagRun:
+        """
+        Validate the arguments of a dag run of this dag and return it, without adding it to the database.
+
+        The arguments are the same as the ones of ``create_dagrun``, which this is the first step of.
+
+        :raises ValueError: if the run type or the run ID is not valid
+        :raises AirflowException: if the run ID cannot be generated or does not match the allowed patterns,
+            or if the conf does not match the params of the dag
+        """
+        logical_date = timezone.coerce_datetime(execution_date)
+
+        if data_interval and not isinstance(data_interval, DataInterval):
+            data_interval = DataInterval(*map(timezone.coerce_datetime, data_interval))
+
         if run_type is None or isinstance(run_type, DagRunType):
             pass
         elif isinstance(run_type, str):  # Compatibility: run_type used to be a str.
@@ -3023,16 +3061,23 @@ class DAG(LoggingMixin):
             creating_job_id=creating_job_id,
             data_interval=data_interval,
         )
-        session.add(run)
-        session.flush()
-
         run.dag = self
+        return run
 
-        # create the associated task instances
-        # state is None at the moment of creation
-        run.verify_integrity(session=session)
+    @provide_session
+    def bulk_create_dagruns(self, dag_runs: Collection[DagRun], session: Session = NEW_SESSION) -> None:
+        """
+        Add new dag runs of this dag built with ``build_dagrun`` to the database with their task instances.
 
-        return run
+        This is the same as creating each dag run with ``create_dagrun``, but the dag runs and their task
+        instances are inserted with bulk statements.
+
+        :param dag_runs: dag runs which are not in the database yet
+        :param session: database session
+        """
+        session.add_all(dag_runs)
+        session.flush()
+        DagRun.bulk_create_task_instances(self, dag_runs, session=session)
 
     @classmethod
     @provide_session
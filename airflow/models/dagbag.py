@@ -35,6 +35,8 @@ from tabulate import tabulate
 
 from airflow import settings
 from airflow.configuration import conf
+from airflow.dag_processing.parse_profiler import profile_file, profile_module_execution, profile_phase
+from airflow.dag_processing.static_parser import parse_static_dags
 from airflow.exceptions import (
     AirflowClusterPolicyError,
     AirflowClusterPolicySkipDag,
@@ -142,6 +144,7 @@ class DagBag(LoggingMixin):
         self.dags_hash: dict[str, str] = {}
 
         self.dagbag_import_error_tracebacks = conf.getboolean("core", "dagbag_import_error_tracebacks")
+        self.static_dag_parsing = conf.getboolean("core", "static_dag_parsing")
         self.dagbag_import_error_traceback_depth = conf.getint("core", "dagbag_import_error_traceback_depth")
         if collect_dags:
             self.collect_dags(
@@ -309,12 +312,21 @@ class DagBag(LoggingMixin):
         # Ensure we don't pick up anything else we didn't mean to
         DagContext.autoregistered_dags.clear()
 
+        static_dags = None
         if filepath.endswith(".py") or not zipfile.is_zipfile(filepath):
-            mods = self._load_modules_from_file(filepath, safe_mode)
+            if self.static_dag_parsing and might_contain_dag(filepath, safe_mode):
+                with profile_phase("dag_construction"):
+                    static_dags = parse_static_dags(filepath)
+            if static_dags is None:
+                mods = self._load_modules_from_file(filepath, safe_mode)
         else:
             mods = self._load_modules_from_zip(filepath, safe_mode)
 
-        found_dags = self._process_modules(filepath, mods, file_last_changed_on_disk)
+        if static_dags is None:
+            found_dags = self._process_modules(filepath, mods, file_last_changed_on_disk)
+        else:
+            self.log.debug("Parsed %s statically", filepath)
+            found_dags = self._process_dags({dag: filepath for dag in static_dags}, file_last_changed_on_disk)
 
         self.file_last_changed[filepath] = file_last_changed_on_disk
         return found_dags
@@ -343,7 +355,8 @@ class DagBag(LoggingMixin):
                 spec = importlib.util.spec_from_loader(mod_name, loader)
                 new_module = importlib.util.module_from_spec(spec)
                 sys.modules[spec.name] = new_module
-                loader.exec_module(new_module)
+                with profile_module_execution(filepath):
+                    loader.exec_module(new_module)
                 return [new_module]
             except Exception as e:
                 DagContext.autoregistered_dags.clear()
@@ -405,13 +418,14 @@ class DagBag(LoggingMixin):
                     del sys.modules[mod_name]
 
                 DagContext.current_autoregister_module_name = mod_name
+                fileloc = os.path.join(filepath, zip_info.filename)
                 try:
                     sys.path.insert(0, filepath)
-                    current_module = importlib.import_module(mod_name)
+                    with profile_module_execution(fileloc):
+                        current_module = importlib.import_module(mod_name)
                     mods.append(current_module)
                 except Exception as e:
                     DagContext.autoregistered_dags.clear()
-                    fileloc = os.path.join(filepath, zip_info.filename)
                     self.log.exception("Failed to import: %s", fileloc)
                     if self.dagbag_import_error_tracebacks:
                         self.import_errors[fileloc] = traceback.format_exc(
@@ -434,22 +448,30 @@ class DagBag(LoggingMixin):
         DagContext.current_autoregister_module_name = None
         DagContext.autoregistered_dags.clear()
 
+        return self._process_dags(
+            {dag: mod.__file__ for dag, mod in top_level_dags}, file_last_changed_on_disk
+        )
+
+    def _process_dags(self, dag_filelocs: dict[DAG, str], file_last_changed_on_disk: datetime) -> list[DAG]:
+        """Validate and bag the DAGs found in a file, given with the file they were defined in."""
         found_dags = []
 
-        for dag, mod in top_level_dags:
-            dag.fileloc = mod.__file__
-            try:
-                dag.validate()
-                self.bag_dag(dag=dag, root_dag=dag)
-            except AirflowClusterPolicySkipDag:
-                pass
-            except Exception as e:
-                self.log.exception("Failed to bag_dag: %s", dag.fileloc)
-                self.import_errors[dag.fileloc] = f"{type(e).__name__}: {e}"
-                self.file_last_changed[dag.fileloc] = file_last_changed_on_disk
-            else:
-                found_dags.append(dag)
-                found_dags += dag.subdags
+        with profile_phase("dag_construction"):
+            for dag, fileloc in dag_filelocs.items():
+                dag.fileloc = fileloc
+                try:
+                    dag.validate()
+                    # The cycles of the DAG are checked by its validation
+                    self._bag_dag(dag=dag, root_dag=dag, recursive=True, check_cycles=False)
+                except AirflowClusterPolicySkipDag:
+                    pass
+                except Exception as e:
+                    self.log.exception("Failed to bag_dag: %s", dag.fileloc)
+                    self.import_errors[dag.fileloc] = f"{type(e).__name__}: {e}"
+                    self.file_last_changed[dag.fileloc] = file_last_changed_on_disk
+                else:
+                    found_dags.append(dag)
+                    found_dags += dag.subdags
         return found_dags
 
     def bag_dag(self, dag, root_dag):
@@ -461,13 +483,15 @@ class DagBag(LoggingMixin):
         """
         self._bag_dag(dag=dag, root_dag=root_dag, recursive=True)
 
-    def _bag_dag(self, *, dag, root_dag, recursive):
+    def _bag_dag(self, *, dag, root_dag, recursive, check_cycles=True):
         """Actual implementation of bagging a dag.
 
         The only purpose of this is to avoid exposing ``recursive`` in ``bag_dag()``,
-        intended to only be used by the ``_bag_dag()`` implementation.
+        intended to only be used by the ``_bag_dag()`` implementation, and ``check_cycles``,
+        disabled for the DAGs already validated.
         """
-        check_cycle(dag)  # throws if a task cycle is found
+        if check_cycles:
+            check_cycle(dag)  # throws if a task cycle is found
 
         dag.resolve_template_files()
         dag.last_loaded = timezone.utcnow()
@@ -551,7 +575,10 @@ class DagBag(LoggingMixin):
         ):
             try:
                 file_parse_start_dttm = timezone.utcnow()
-                found_dags = self.process_file(filepath, only_if_updated=only_if_updated, safe_mode=safe_mode)
+                with profile_file(filepath):
+                    found_dags = self.process_file(
+                        filepath, only_if_updated=only_if_updated, safe_mode=safe_mode
+                    )
 
                 file_parse_end_dttm = timezone.utcnow()
                 stats.append(
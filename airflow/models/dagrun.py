@@ -1177,11 +1177,7 @@ class DagRun(Base, LoggingMixin):
         )
 
         def task_filter(task: Operator) -> bool:
-            return task.task_id not in task_ids and (
-                self.is_backfill
-                or (task.start_date is None or task.start_date <= self.execution_date)
-                and (task.end_date is None or self.execution_date <= task.end_date)
-            )
+            return task.task_id not in task_ids and self._is_task_in_run(task)
 
         created_counts: dict[str, int] = defaultdict(int)
         task_creator = self._get_task_creator(created_counts, task_instance_mutation_hook, hook_is_noop)
@@ -1191,6 +1187,64 @@ class DagRun(Base, LoggingMixin):
         tis_to_create = self._create_tasks(tasks_to_create, task_creator, session=session)
         self._create_task_instances(self.dag_id, tis_to_create, created_counts, hook_is_noop, session=session)
 
+    @classmethod
+    def bulk_create_task_instances(cls, dag: DAG, dag_runs: Iterable[DagRun], *, session: Session) -> None:
+        """
+        Create the task instances of new dag runs of a dag with a single bulk insert.
+
+        This is what ``verify_integrity`` does for dag runs which do not have any task instance yet. The
+        length of the tasks mapped over the results of upstream tasks cannot be known before these run, so
+        the mapped task instances to create are the same for all the dag runs and only resolved once.
+
+        :param dag: DAG object corresponding to the dag runs
+        :param dag_runs: dag runs of the dag, flushed to the database but without task instances
+        :param session: Sqlalchemy ORM Session
+        """
+        from airflow.settings import task_instance_mutation_hook
+
+        hook_is_noop: Literal[True, False] = getattr(task_instance_mutation_hook, "is_noop", False)
+
+        map_indexes: dict[str, Sequence[int]] = {}
+        for task in dag.task_dict.values():
+            try:
+                count = task.get_parse_time_mapped_ti_count()
+            except (NotMapped, NotFullyPopulated):
+                map_indexes[task.task_id] = (-1,)
+            else:
+                # Make sure to always create at least one ti; this will be
+                # marked as REMOVED later at runtime.
+                map_indexes[task.task_id] = range(count) if count else (-1,)
+
+        tis: list[Any] = []
+        for dag_run in dag_runs:
+            dag_run.dag = dag
+            created_counts: dict[str, int] = defaultdict(int)
+            task_creator = dag_run._get_task_creator(
+                created_counts, task_instance_mutation_hook, hook_is_noop
+            )
+            for task in dag.task_dict.values():
+                if dag_run._is_task_in_run(task):
+                    tis.extend(task_creator(task, map_indexes[task.task_id]))
+            for task_type, count in created_counts.items():
+                Stats.incr(f"task_instance_created_{task_type}", count, tags=dag_run.stats_tags)
+                # Same metric with tagging
+                Stats.incr(
+                    "task_instance_created", count, tags={**dag_run.stats_tags, "task_type": task_type}
+                )
+
+        if hook_is_noop:
+            session.bulk_insert_mappings(TI, tis)
+        else:
+            session.bulk_save_objects(tis)
+        session.flush()
+
+    def _is_task_in_run(self, task: Operator) -> bool:
+        """Whether the task has a task instance in this dag run, according to its start and end dates."""
+        return self.is_backfill or (
+            (task.start_date is None or task.start_date <= self.execution_date)
+            and (task.end_date is None or self.execution_date <= task.end_date)
+        )
+
     def _check_for_removed_or_restored_tasks(
         self, dag: DAG, ti_mutation_hook, *, session: Session
     ) -> set[str]:
@@ -29,6 +29,7 @@ from sqlalchemy.orm import backref, foreign, relationship
 from sqlalchemy.sql.expression import func, literal
 
 from airflow.api_internal.internal_api_call import internal_api_call
+from airflow.dag_processing.parse_profiler import profile_phase
 from airflow.exceptions import TaskNotFound
 from airflow.models.base import ID_LEN, Base
 from airflow.models.dag import DagModel
@@ -163,7 +164,8 @@ class SerializedDagModel(Base):
                 return False
 
         log.debug("Checking if DAG (%s) changed", dag.dag_id)
-        new_serialized_dag = cls(dag, processor_subdir)
+        with profile_phase("serialization"):
+            new_serialized_dag = cls(dag, processor_subdir)
         serialized_dag_db = session.execute(
             select(cls.dag_hash, cls.processor_subdir).where(cls.dag_id == dag.dag_id)
         ).first()
@@ -26,6 +26,7 @@ import math
 import operator
 import os
 import signal
+import time
 import warnings
 from collections import defaultdict
 from datetime import timedelta
@@ -99,11 +100,20 @@ from airflow.models.xcom import LazyXComAccess, XCom
 from airflow.plugins_manager import integrate_macros_plugins
 from airflow.sentry import Sentry
 from airflow.stats import Stats
+from airflow.task import startup_profiler
 from airflow.templates import SandboxedEnvironment
 from airflow.ti_deps.dep_context import DepContext
 from airflow.ti_deps.dependencies_deps import REQUEUEABLE_DEPS, RUNNING_DEPS
 from airflow.utils import timezone
-from airflow.utils.context import ConnectionAccessor, Context, VariableAccessor, context_merge
+from airflow.utils.context import (
+    ConnectionAccessor,
+    Context,
+    LazyContextValue,
+    VariableAccessor,
+    context_merge,
+    context_resolve,
+)
+from airflow.utils.db import exists_query
 from airflow.utils.email import send_email
 from airflow.utils.helpers import prune_dict, render_template_to_string
 from airflow.utils.log.logging_mixin import LoggingMixin
@@ -597,6 +607,8 @@ def _get_template_context(
     from airflow import macros
     from airflow.models.abstractoperator import NotMapped
 
+    start_time = time.monotonic()
+
     integrate_macros_plugins()
 
     task = task_instance.task
@@ -735,14 +747,19 @@ def _get_template_context(
 
         return triggering_events
 
-    try:
-        expanded_ti_count: int | None = task.get_mapped_ti_count(task_instance.run_id, session=session)
-    except NotMapped:
-        expanded_ti_count = None
+    def get_expanded_ti_count() -> int | None:
+        try:
+            return task.get_mapped_ti_count(task_instance.run_id, session=session)
+        except NotMapped:
+            return None
+
+    def get_prev_execution_date_success() -> pendulum.DateTime | None:
+        return task_instance.get_previous_execution_date(state=DagRunState.SUCCESS, session=session)
 
     # NOTE: If you add anything to this dict, make sure to also update the
     # definition in airflow/utils/context.pyi, and KNOWN_CONTEXT_KEYS in
     # airflow/utils/context.py!
+    # The values needing database queries or schedule computations are only computed when accessed.
     context = {
         "conf": conf,
         "dag": dag,
@@ -752,35 +769,32 @@ def _get_template_context(
         "ds": ds,
         "ds_nodash": ds_nodash,
         "execution_date": logical_date,
-        "expanded_ti_count": expanded_ti_count,
+        "expanded_ti_count": LazyContextValue(get_expanded_ti_count),
         "inlets": task.inlets,
         "logical_date": logical_date,
         "macros": macros,
         "map_index_template": task.map_index_template,
-        "next_ds": get_next_ds(),
-        "next_ds_nodash": get_next_ds_nodash(),
-        "next_execution_date": get_next_execution_date(),
+        "next_ds": LazyContextValue(get_next_ds),
+        "next_ds_nodash": LazyContextValue(get_next_ds_nodash),
+        "next_execution_date": LazyContextValue(get_next_execution_date),
         "outlets": task.outlets,
         "params": validated_params,
-        "prev_data_interval_start_success": get_prev_data_interval_start_success(),
-        "prev_data_interval_end_success": get_prev_data_interval_end_success(),
-        "prev_ds": get_prev_ds(),
-        "prev_ds_nodash": get_prev_ds_nodash(),
-        "prev_execution_date": get_prev_execution_date(),
-        "prev_execution_date_success": task_instance.get_previous_execution_date(
-            state=DagRunState.SUCCESS,
-            session=session,
-        ),
-        "prev_start_date_success": get_prev_start_date_success(),
-        "prev_end_date_success": get_prev_end_date_success(),
+        "prev_data_interval_start_success": LazyContextValue(get_prev_data_interval_start_success),
+        "prev_data_interval_end_success": LazyContextValue(get_prev_data_interval_end_success),
+        "prev_ds": LazyContextValue(get_prev_ds),
+        "prev_ds_nodash": LazyContextValue(get_prev_ds_nodash),
+        "prev_execution_date": LazyContextValue(get_prev_execution_date),
+        "prev_execution_date_success": LazyContextValue(get_prev_execution_date_success),
+        "prev_start_date_success": LazyContextValue(get_prev_start_date_success),
+        "prev_end_date_success": LazyContextValue(get_prev_end_date_success),
         "run_id": task_instance.run_id,
         "task": task,
         "task_instance": task_instance,
         "task_instance_key_str": f"{task.dag_id}__{task.task_id}__{ds_nodash}",
         "test_mode": task_instance.test_mode,
         "ti": task_instance,
-        "tomorrow_ds": get_tomorrow_ds(),
-        "tomorrow_ds_nodash": get_tomorrow_ds_nodash(),
+        "tomorrow_ds": LazyContextValue(get_tomorrow_ds),
+        "tomorrow_ds_nodash": LazyContextValue(get_tomorrow_ds_nodash),
         "triggering_dataset_events": lazy_object_proxy.Proxy(get_triggering_events),
         "ts": ts,
         "ts_nodash": ts_nodash,
@@ -790,12 +804,26 @@ def _get_template_context(
             "value": VariableAccessor(deserialize_json=False),
         },
         "conn": ConnectionAccessor(),
-        "yesterday_ds": get_yesterday_ds(),
-        "yesterday_ds_nodash": get_yesterday_ds_nodash(),
+        "yesterday_ds": LazyContextValue(get_yesterday_ds),
+        "yesterday_ds_nodash": LazyContextValue(get_yesterday_ds_nodash),
     }
     # Mypy doesn't like turning existing dicts in to a TypeDict -- and we "lie" in the type stub to say it
     # is one, but in practice it isn't. See https://github.com/python/mypy/issues/8890
-    return Context(context)  # type: ignore
+    template_context = Context(context)  # type: ignore
+
+    # The values referenced by the templates of the task are computed now, with the session given here,
+    # rather than in the middle of their rendering. The others are computed if a callable accesses them.
+    template_context_keys = task.get_template_context_keys()
+    context_resolve(template_context, template_context_keys)
+    duration = time.monotonic() - start_time
+    Stats.timing("task.template_context_build", timedelta(seconds=duration), tags=task_instance.stats_tags)
+    log.debug(
+        "Built the template context of %s in %.3f seconds, the templates of the task reference %s",
+        task_instance,
+        duration,
+        ", ".join(sorted(template_context_keys)) or "no context keys",
+    )
+    return template_context
 
 
 def _is_eligible_to_retry(*, task_instance: TaskInstance | TaskInstancePydantic):
@@ -1444,6 +1472,8 @@ class TaskInstance(Base, LoggingMixin):
     def init_on_load(self) -> None:
         """Initialize the attributes that aren't stored in the DB."""
         self.test_mode = False  # can be changed when calling 'run'
+        # XComs pulled from mapped tasks, see xcom_pull
+        self._mapped_xcom_pull_cache: dict[tuple[str, str, str], LazyXComAccess] = {}
 
     @hybrid_property
     def try_number(self):
@@ -2350,14 +2380,16 @@ class TaskInstance(Base, LoggingMixin):
         :param session: SQLAlchemy ORM Session
         """
         self.test_mode = test_mode
-        self.refresh_from_task(self.task, pool_override=pool)
-        self.refresh_from_db(session=session)
-        self.job_id = job_id
-        self.hostname = get_hostname()
-        self.pid = os.getpid()
-        if not test_mode:
-            session.merge(self)
-            session.commit()
+        self._mapped_xcom_pull_cache.clear()
+        with startup_profiler.startup_phase("refresh_from_db"):
+            self.refresh_from_task(self.task, pool_override=pool)
+            self.refresh_from_db(session=session)
+            self.job_id = job_id
+            self.hostname = get_hostname()
+            self.pid = os.getpid()
+            if not test_mode:
+                session.merge(self)
+                session.commit()
         actual_start_date = timezone.utcnow()
         Stats.incr(f"ti.start.{self.task.dag_id}.{self.task.task_id}", tags=self.stats_tags)
         # Same metric with tagging
@@ -2377,7 +2409,8 @@ class TaskInstance(Base, LoggingMixin):
             )
         with set_current_task_instance_session(session=session):
             self.task = self.task.prepare_for_execution()
-            context = self.get_template_context(ignore_param_exceptions=False)
+            with startup_profiler.startup_phase("template_context"):
+                context = self.get_template_context(ignore_param_exceptions=False)
 
             try:
                 if not mark_success:
@@ -2528,12 +2561,14 @@ class TaskInstance(Base, LoggingMixin):
                     jinja_env = dag.get_template_env()
                 else:
                     jinja_env = None
-                task_orig = self.render_templates(context=context, jinja_env=jinja_env)
+                with startup_profiler.startup_phase("render_templates"):
+                    task_orig = self.render_templates(context=context, jinja_env=jinja_env)
 
             if not test_mode:
-                rtif = RenderedTaskInstanceFields(ti=self, render_templates=False)
-                RenderedTaskInstanceFields.write(rtif)
-                RenderedTaskInstanceFields.delete_old_records(self.task_id, self.dag_id)
+                with startup_profiler.startup_phase("write_rendered_fields"):
+                    rtif = RenderedTaskInstanceFields(ti=self, render_templates=False)
+                    RenderedTaskInstanceFields.write(rtif)
+                    RenderedTaskInstanceFields.delete_old_records(self.task_id, self.dag_id)
 
             # Export context to make it available for operators to use.
             airflow_context_vars = context_to_airflow_vars(context, in_env_var_format=True)
@@ -2548,6 +2583,10 @@ class TaskInstance(Base, LoggingMixin):
                     " ".join(f"{k}={v!r}" for k, v in airflow_context_vars.items()),
                 )
 
+            # Everything before is the start-up of the task, user code starts running from here
+            startup_profiler.emit_startup_metrics(self)
+            startup_profiler.stop_profiling(self, "task")
+
             # Run pre_execute callback
             # Is never MappedOperator at this point
             self.task.pre_execute(context=context)  # type: ignore[union-attr]
@@ -3115,10 +3154,26 @@ class TaskInstance(Base, LoggingMixin):
         When pulling multiple tasks (i.e. either ``task_id`` or ``map_index`` is
         a non-str iterable), a list of matching XComs is returned. Elements in
         the list is ordered by item ordering in ``task_id`` and ``map_index``.
+
+        The iterator returned when pulling another mapped task whose task
+        instances are all finished is kept for the rest of the task run, so its
+        XComs are only fetched once however many times they are pulled.
         """
         if dag_id is None:
             dag_id = self.dag_id
 
+        cache_key = None
+        if (
+            isinstance(task_ids, str)
+            and map_indexes is None
+            and not include_prior_dates
+            and key is not None
+            and (dag_id, task_ids) != (self.dag_id, self.task_id)
+        ):
+            cache_key = (dag_id, task_ids, key)
+            if cache_key in self._mapped_xcom_pull_cache:
+                return self._mapped_xcom_pull_cache[cache_key]
+
         query = XCom.get_many(
             key=key,
             run_id=self.run_id,
@@ -3143,7 +3198,17 @@ class TaskInstance(Base, LoggingMixin):
             if map_indexes is not None or first.map_index < 0:
                 return XCom.deserialize_value(first)
             query = query.order_by(None).order_by(XCom.map_index.asc())
-            return LazyXComAccess.build_from_xcom_query(query)
+            lazy_xcoms = LazyXComAccess.build_from_xcom_query(query)
+            # The XComs of a mapped task can only change while some of its task instances are unfinished
+            if cache_key is not None and not exists_query(
+                TaskInstance.dag_id == dag_id,
+                TaskInstance.run_id == self.run_id,
+                TaskInstance.task_id == task_ids,
+                or_(TaskInstance.state.is_(None), TaskInstance.state.in_(State.unfinished)),
+                session=session,
+            ):
+                self._mapped_xcom_pull_cache[cache_key] = lazy_xcoms
+            return lazy_xcoms
 
         # At this point either task_ids or map_indexes is explicitly multi-value.
         # Order return values to match task_ids and map_indexes ordering.
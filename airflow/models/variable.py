@@ -27,6 +27,7 @@ from sqlalchemy.orm import declared_attr, reconstructor, synonym
 
 from airflow.api_internal.internal_api_call import internal_api_call
 from airflow.configuration import ensure_secrets_loaded
+from airflow.dag_processing.parse_profiler import record_lookup
 from airflow.models.base import ID_LEN, Base
 from airflow.models.crypto import get_fernet
 from airflow.secrets.cache import SecretCache
@@ -269,6 +270,7 @@ class Variable(Base, LoggingMixin):
         :param key: Variable Key
         :return: Variable Value
         """
+        record_lookup("variable", key)
         # check cache first
         # enabled only if SecretCache.init() has been called first
         try:
@@ -24,8 +24,9 @@ import itertools
 import json
 import logging
 import pickle
+import threading
 import warnings
-from functools import cached_property, wraps
+from functools import wraps
 from typing import TYPE_CHECKING, Any, Generator, Iterable, cast, overload
 
 import attr
@@ -50,6 +51,7 @@ from airflow.api_internal.internal_api_call import internal_api_call
 from airflow.configuration import conf
 from airflow.exceptions import RemovedInAirflow3Warning
 from airflow.models.base import COLLATION_ARGS, ID_LEN, TaskInstanceDependencies
+from airflow.serialization import xcom_codecs
 from airflow.utils import timezone
 from airflow.utils.helpers import exactly_one, is_container
 from airflow.utils.json import XComDecoder, XComEncoder
@@ -667,9 +669,14 @@ class BaseXCom(TaskInstanceDependencies, LoggingMixin):
         run_id: str | None = None,
         map_index: int | None = None,
     ) -> Any:
-        """Serialize XCom value to str or pickled object."""
+        """Serialize XCom value to str or pickled object, or encode it with the configured XCom codecs."""
         if conf.getboolean("core", "enable_xcom_pickling"):
             return pickle.dumps(value)
+        codecs = xcom_codecs.get_configured_codecs()
+        if codecs:
+            encoded = xcom_codecs.encode_value(value, codecs)
+            if encoded is not None:
+                return encoded
         try:
             return json.dumps(value, cls=XComEncoder).encode("UTF-8")
         except (ValueError, TypeError) as ex:
@@ -691,6 +698,8 @@ class BaseXCom(TaskInstanceDependencies, LoggingMixin):
 
         if result.value is None:
             return None
+        if xcom_codecs.is_encoded(result.value):
+            return xcom_codecs.decode_value(result.value, orm=orm)
         if conf.getboolean("core", "enable_xcom_pickling"):
             try:
                 return pickle.loads(result.value)
@@ -717,25 +726,12 @@ class BaseXCom(TaskInstanceDependencies, LoggingMixin):
         return BaseXCom._deserialize_value(self, True)
 
 
-class _LazyXComAccessIterator(collections.abc.Iterator):
-    def __init__(self, cm: contextlib.AbstractContextManager[Query]) -> None:
-        self._cm = cm
-        self._entered = False
+# Number of XCom rows fetched from the database at once when streaming them
+XCOM_BULK_FETCH_BATCH_SIZE = 1000
 
-    def __del__(self) -> None:
-        if self._entered:
-            self._cm.__exit__(None, None, None)
 
-    def __iter__(self) -> collections.abc.Iterator:
-        return self
-
-    def __next__(self) -> Any:
-        return XCom.deserialize_value(next(self._it))
-
-    @cached_property
-    def _it(self) -> collections.abc.Iterator:
-        self._entered = True
-        return iter(self._cm.__enter__())
+def _deserialize_rows(rows: list) -> list:
+    return [XCom.deserialize_value(row) for row in rows]
 
 
 @attr.define(slots=True)
@@ -746,11 +742,18 @@ class LazyXComAccess(collections.abc.Sequence):
     actually access the sequence's content, we must create a new session
     for every function call with ``with_session()``.
 
+    The first iteration fetches all the stored values with one streamed query
+    and releases the session right away, the values are then deserialized one
+    by one as they are iterated over. The fetched rows are kept, so iterating
+    again or accessing items by index doesn't query the database anymore.
+
     :meta private:
     """
 
     _query: Query
     _len: int | None = attr.ib(init=False, default=None)
+    _rows: list | None = attr.ib(init=False, default=None)
+    _lock: threading.Lock = attr.ib(init=False, factory=threading.Lock)
 
     @classmethod
     def build_from_xcom_query(cls, query: Query) -> LazyXComAccess:
@@ -787,19 +790,30 @@ class LazyXComAccess(collections.abc.Sequence):
     def __setstate__(self, state: Any) -> None:
         statement, self._len = state
         self._query = Query(XCom.value).from_statement(text(statement))
+        self._rows = None
+        self._lock = threading.Lock()
 
     def __len__(self):
         if self._len is None:
-            with self._get_bound_query() as query:
-                self._len = query.count()
+            if self._rows is not None:
+                self._len = len(self._rows)
+            else:
+                with self._get_bound_query() as query:
+                    self._len = query.count()
         return self._len
 
     def __iter__(self):
-        return _LazyXComAccessIterator(self._get_bound_query())
+        rows = self._fetch_rows()
+        parallelism = conf.getint("core", "xcom_deserialize_parallelism", fallback=1)
+        if parallelism > 1 and len(rows) > XCOM_BULK_FETCH_BATCH_SIZE:
+            return self._iter_deserialized_in_threads(rows, parallelism)
+        return (XCom.deserialize_value(row) for row in rows)
 
     def __getitem__(self, key):
         if not isinstance(key, int):
             raise ValueError("only support index access for now")
+        if self._rows is not None:
+            return XCom.deserialize_value(self._rows[key])
         try:
             with self._get_bound_query() as query:
                 r = query.offset(key).limit(1).one()
@@ -807,6 +821,35 @@ class LazyXComAccess(collections.abc.Sequence):
             raise IndexError(key) from None
         return XCom.deserialize_value(r)
 
+    def _fetch_rows(self) -> list:
+        """
+        Fetch all the stored values with a single query, without deserializing them.
+
+        The rows are streamed in batches of ``XCOM_BULK_FETCH_BATCH_SIZE`` with a server-side cursor
+        where the database supports it, and the session is released as soon as they are all fetched.
+        """
+        with self._lock:
+            if self._rows is None:
+                with self._get_bound_query() as query:
+                    self._rows = query.yield_per(XCOM_BULK_FETCH_BATCH_SIZE).all()
+                self._len = len(self._rows)
+            return self._rows
+
+    @staticmethod
+    def _iter_deserialized_in_threads(rows: list, parallelism: int) -> Generator[Any, None, None]:
+        """
+        Deserialize values in batches in a thread pool, ahead of the iteration.
+
+        This is useful with XCom backends reading the values from external storage.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        batch_size = XCOM_BULK_FETCH_BATCH_SIZE
+        batches = [rows[i : i + batch_size] for i in range(0, len(rows), batch_size)]
+        with ThreadPoolExecutor(max_workers=parallelism) as executor:
+            for values in executor.map(_deserialize_rows, batches):
+                yield from values
+
     @contextlib.contextmanager
     def _get_bound_query(self) -> Generator[Query, None, None]:
         # Do we have a valid session already?
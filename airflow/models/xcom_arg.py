@@ -19,6 +19,7 @@ from __future__ import annotations
 
 import contextlib
 import inspect
+import itertools
 from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, Mapping, Sequence, Union, overload
 
 from sqlalchemy import func, or_, select
@@ -455,8 +456,16 @@ class _MapResult(Sequence):
         self.callables = callables
 
     def __getitem__(self, index: Any) -> Any:
-        value = self.value[index]
+        return self._apply(self.value[index])
 
+    def __iter__(self) -> Iterator[Any]:
+        # Iterate over the values instead of accessing them one by one, which runs one query per value
+        # when mapping over the XComs of a mapped task.
+        if isinstance(self.value, dict):
+            return super().__iter__()
+        return (self._apply(value) for value in self.value)
+
+    def _apply(self, value: Any) -> Any:
         # In the worker, we can access all actual callables. Call them.
         callables = [f for f in self.callables if callable(f)]
         if len(callables) == len(self.callables):
@@ -542,6 +551,15 @@ class _ZipResult(Sequence):
             raise IndexError(index)
         return tuple(self._get_or_fill(value, index, self.fillvalue) for value in self.values)
 
+    def __iter__(self) -> Iterator[tuple]:
+        # Iterate over the values instead of accessing them one by one, which runs one query per value
+        # when zipping the XComs of a mapped task.
+        if any(isinstance(value, dict) for value in self.values):
+            return super().__iter__()
+        if isinstance(self.fillvalue, ArgNotSet):
+            return zip(*self.values)
+        return itertools.zip_longest(*self.values, fillvalue=self.fillvalue)
+
     def __len__(self) -> int:
         lengths = (len(v) for v in self.values)
         if isinstance(self.fillvalue, ArgNotSet):
@@ -18,18 +18,23 @@
 """Manages all plugins."""
 from __future__ import annotations
 
+import contextlib
+import datetime
 import importlib
 import importlib.machinery
 import importlib.util
 import inspect
+import json
 import logging
 import os
 import sys
+import time
 import types
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Iterable
+from typing import TYPE_CHECKING, Any, Iterable, Iterator
 
 from airflow import settings
+from airflow.configuration import conf
 from airflow.utils.entry_points import entry_points_with_dist
 from airflow.utils.file import find_path_from_directory
 from airflow.utils.module_loading import import_string, qualname
@@ -52,6 +57,12 @@ import_errors: dict[str, str] = {}
 plugins: list[AirflowPlugin] | None = None
 loaded_plugins: set[str] = set()
 
+# Plugins described by the plugins manifest, when they are imported lazily
+plugins_manifest: list[dict[str, Any]] | None = None
+# Plugins imported from the plugins manifest, by name, and the plugin modules they come from, by path
+_manifest_plugins: dict[str, AirflowPlugin | None] = {}
+_manifest_plugin_modules: dict[str, ModuleType] = {}
+
 # Plugin components to integrate as modules
 registered_hooks: list[BaseHook] | None = None
 macros_modules: list[Any] | None = None
@@ -91,6 +102,32 @@ PLUGINS_ATTRIBUTES_TO_DUMP = {
     "listeners",
 }
 
+PLUGINS_MANIFEST_FORMAT_VERSION = 1
+# Attributes of the plugins listed in the plugins manifest, a plugin is imported lazily when one of the
+# attributes it defines is needed
+PLUGINS_MANIFEST_COMPONENTS = (
+    "hooks",
+    "executors",
+    "macros",
+    "admin_views",
+    "flask_blueprints",
+    "menu_links",
+    "appbuilder_views",
+    "appbuilder_menu_items",
+    "global_operator_extra_links",
+    "operator_extra_links",
+    "ti_deps",
+    "timetables",
+    "listeners",
+)
+WEB_UI_COMPONENTS = (
+    "admin_views",
+    "flask_blueprints",
+    "menu_links",
+    "appbuilder_views",
+    "appbuilder_menu_items",
+)
+
 
 class AirflowPluginSource:
     """Class used to define an AirflowPluginSource."""
@@ -236,6 +273,7 @@ def load_entrypoint_plugins():
     for entry_point, dist in entry_points_with_dist("airflow.plugins"):
         log.debug("Importing entry_point plugin %s", entry_point.name)
         try:
+            start = time.monotonic()
             plugin_class = entry_point.load()
             if not is_valid_plugin(plugin_class):
                 continue
@@ -243,6 +281,7 @@ def load_entrypoint_plugins():
             plugin_instance = plugin_class()
             plugin_instance.source = EntryPointSource(entry_point, dist)
             register_plugin(plugin_instance)
+            _emit_import_duration(plugin_instance.name, time.monotonic() - start)
         except Exception as e:
             log.exception("Failed to import plugin %s", entry_point.name)
             import_errors[entry_point.module] = str(e)
@@ -253,29 +292,52 @@ def load_plugins_from_plugin_directory():
     global import_errors
     log.debug("Loading plugins from directory: %s", settings.PLUGINS_FOLDER)
 
-    for file_path in find_path_from_directory(settings.PLUGINS_FOLDER, ".airflowignore"):
-        path = Path(file_path)
-        if not path.is_file() or path.suffix != ".py":
-            continue
-        mod_name = path.stem
-
+    for file_path in _find_plugin_files():
         try:
-            loader = importlib.machinery.SourceFileLoader(mod_name, file_path)
-            spec = importlib.util.spec_from_loader(mod_name, loader)
-            mod = importlib.util.module_from_spec(spec)
-            sys.modules[spec.name] = mod
-            loader.exec_module(mod)
+            start = time.monotonic()
+            mod = _import_plugin_module(file_path)
+            duration = time.monotonic() - start
             log.debug("Importing plugin module %s", file_path)
 
             for mod_attr_value in (m for m in mod.__dict__.values() if is_valid_plugin(m)):
                 plugin_instance = mod_attr_value()
                 plugin_instance.source = PluginsDirectorySource(file_path)
                 register_plugin(plugin_instance)
+                _emit_import_duration(plugin_instance.name, duration)
         except Exception as e:
             log.exception("Failed to import plugin %s", file_path)
             import_errors[file_path] = str(e)
 
 
+def _find_plugin_files() -> Iterator[str]:
+    """Find the Python files of the plugins directory, ignoring the files matched by ``.airflowignore``."""
+    if not settings.PLUGINS_FOLDER:
+        return
+    for file_path in find_path_from_directory(settings.PLUGINS_FOLDER, ".airflowignore"):
+        path = Path(file_path)
+        if path.is_file() and path.suffix == ".py":
+            yield file_path
+
+
+def _import_plugin_module(file_path: str) -> ModuleType:
+    mod_name = Path(file_path).stem
+    loader = importlib.machinery.SourceFileLoader(mod_name, file_path)
+    spec = importlib.util.spec_from_loader(mod_name, loader)
+    mod = importlib.util.module_from_spec(spec)  # type: ignore[arg-type]
+    sys.modules[mod_name] = mod
+    loader.exec_module(mod)
+    return mod
+
+
+def _emit_import_duration(plugin_name: str | None, duration: float) -> None:
+    """Emit the time taken to import a plugin, in seconds, as a timer."""
+    from airflow.stats import Stats
+
+    delta = datetime.timedelta(seconds=duration)
+    Stats.timing(f"plugins.import_duration.{plugin_name}", delta)
+    Stats.timing("plugins.import_duration", delta, tags={"plugin_name": plugin_name})
+
+
 def load_providers_plugins():
     from airflow.providers_manager import ProvidersManager
 
@@ -328,14 +390,18 @@ def ensure_plugins_loaded():
     log.debug("Loading plugins")
 
     with Stats.timer() as timer:
-        plugins = []
         registered_hooks = []
-
-        load_plugins_from_plugin_directory()
-        load_entrypoint_plugins()
-
-        if not settings.LAZY_LOAD_PROVIDERS:
-            load_providers_plugins()
+        manifest_entries = _load_plugins_manifest()
+        if manifest_entries is not None:
+            plugins = [p for p in map(_import_plugin_from_manifest, manifest_entries) if p is not None]
+        else:
+            plugins = []
+            load_plugins_from_plugin_directory()
+            load_entrypoint_plugins()
+
+            if not settings.LAZY_LOAD_PROVIDERS:
+                load_providers_plugins()
+            _write_plugins_manifest()
 
         # We don't do anything with these for now, but we want to keep track of
         # them so we can integrate them in to the UI's Connection screens
@@ -346,6 +412,188 @@ def ensure_plugins_loaded():
         log.debug("Loading %d plugin(s) took %.2f seconds", len(plugins), timer.duration)
 
 
+def _get_plugins_manifest_path() -> str | None:
+    """Return the path of the plugins manifest if plugins are imported lazily from it, ``None`` otherwise."""
+    path = conf.get("core", "plugins_manifest_file", fallback="")
+    # The plugins of providers are not listed in the manifest, they are loaded with the others when
+    # providers are not discovered lazily
+    if not path or not settings.LAZY_LOAD_PROVIDERS:
+        return None
+    return os.path.expanduser(path)
+
+
+def _get_plugins_manifest_key() -> list:
+    """
+    Return what the plugins manifest describes: the plugin files and the plugin entry points.
+
+    The manifest is only used if it was written for the same key, it is written again otherwise.
+    """
+    from airflow import __version__ as airflow_version
+
+    key: list = [PLUGINS_MANIFEST_FORMAT_VERSION, airflow_version, settings.PLUGINS_FOLDER]
+    for file_path in _find_plugin_files():
+        stat = os.stat(file_path)
+        key.append(["file", file_path, stat.st_mtime_ns, stat.st_size])
+    for entry_point, dist in entry_points_with_dist("airflow.plugins"):
+        key.append(["entrypoint", dist.metadata["Name"], dist.version, str(entry_point)])
+    return key
+
+
+def _load_plugins_manifest() -> list[dict[str, Any]] | None:
+    """
+    Load the plugins manifest if plugins are imported lazily and the manifest describes the current plugins.
+
+    :return: the plugins described by the manifest, or ``None`` if they cannot be imported from it
+    """
+    global plugins_manifest
+
+    if plugins_manifest is not None:
+        return plugins_manifest
+    path = _get_plugins_manifest_path()
+    if not path:
+        return None
+    if not settings.PLUGINS_FOLDER:
+        raise ValueError("Plugins folder is not set")
+    try:
+        with open(path) as manifest_file:
+            manifest = json.load(manifest_file)
+        if manifest["key"] != _get_plugins_manifest_key():
+            log.debug("The plugins changed since the plugins manifest %s was written", path)
+            return None
+        entries, errors = manifest["plugins"], manifest["import_errors"]
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        log.warning("Error when loading the plugins manifest %s, loading all plugins: %s", path, e)
+        return None
+    plugins_manifest = entries
+    import_errors.update(errors)
+    return plugins_manifest
+
+
+def _write_plugins_manifest() -> None:
+    """Write the plugins manifest from the loaded plugins, if plugins are imported lazily."""
+    path = _get_plugins_manifest_path()
+    if not path or plugins is None:
+        return
+    entries = []
+    for plugin in plugins:
+        if isinstance(plugin.source, PluginsDirectorySource):
+            source = {"type": "file", "path": os.path.join(str(settings.PLUGINS_FOLDER), plugin.source.path)}
+        elif isinstance(plugin.source, EntryPointSource):
+            source = {"type": "entrypoint", "entrypoint": plugin.source.entrypoint}
+        else:
+            continue
+        entries.append(
+            {
+                "name": plugin.name,
+                "class_name": type(plugin).__name__,
+                "source": source,
+                "components": [attr for attr in PLUGINS_MANIFEST_COMPONENTS if getattr(plugin, attr)],
+            }
+        )
+    # Written to a temporary file first, so that other processes never read a partially written manifest
+    temporary_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        # The plugin files may be removed or renamed since they were loaded
+        manifest = {"key": _get_plugins_manifest_key(), "import_errors": import_errors, "plugins": entries}
+        with open(temporary_path, "w") as manifest_file:
+            json.dump(manifest, manifest_file)
+        os.replace(temporary_path, path)
+    except Exception as e:
+        log.warning("Error when writing the plugins manifest %s: %s", path, e)
+        with contextlib.suppress(OSError):
+            os.remove(temporary_path)
+
+
+def _import_plugin_from_manifest(entry: dict[str, Any]) -> AirflowPlugin | None:
+    """
+    Import a plugin described by the plugins manifest, unless it was already imported.
+
+    :return: the plugin, or ``None`` if it could not be imported
+    """
+    name = entry["name"]
+    if name in _manifest_plugins:
+        return _manifest_plugins[name]
+
+    source = entry["source"]
+    log.debug("Importing plugin %s from the plugins manifest", name)
+    plugin_instance = None
+    start = time.monotonic()
+    try:
+        if source["type"] == "file":
+            file_path = source["path"]
+            if file_path not in _manifest_plugin_modules:
+                _manifest_plugin_modules[file_path] = _import_plugin_module(file_path)
+            plugin_class = next(
+                value
+                for value in vars(_manifest_plugin_modules[file_path]).values()
+                if inspect.isclass(value)
+                and issubclass(value, AirflowPlugin)
+                and value.__name__ == entry["class_name"]
+            )
+            plugin_source: AirflowPluginSource = PluginsDirectorySource(file_path)
+        else:
+            entry_point, dist = next(
+                (entry_point, dist)
+                for entry_point, dist in entry_points_with_dist("airflow.plugins")
+                if str(entry_point) == source["entrypoint"]
+            )
+            plugin_class = entry_point.load()
+            plugin_source = EntryPointSource(entry_point, dist)
+        plugin_instance = plugin_class()
+        plugin_instance.source = plugin_source
+        loaded_plugins.add(name)
+        plugin_instance.on_load()
+    except Exception as e:
+        log.exception("Failed to import plugin %s", name)
+        import_errors[source.get("path") or source["entrypoint"]] = str(e)
+        plugin_instance = None
+    else:
+        _emit_import_duration(name, time.monotonic() - start)
+    _manifest_plugins[name] = plugin_instance
+    return plugin_instance
+
+
+def _get_plugins(*components: str) -> list[AirflowPlugin]:
+    """
+    Return the plugins to integrate the given components of.
+
+    When plugins are imported lazily, only the plugins defining one of these components are imported,
+    otherwise all plugins are loaded.
+    """
+    manifest_entries = _load_plugins_manifest() if plugins is None else None
+    if manifest_entries is not None:
+        entries = (entry for entry in manifest_entries if not set(components).isdisjoint(entry["components"]))
+        return [p for p in map(_import_plugin_from_manifest, entries) if p is not None]
+
+    ensure_plugins_loaded()
+
+    if plugins is None:
+        raise AirflowPluginException("Can't load plugins.")
+    return plugins
+
+
+def import_macros_plugin(name: str) -> ModuleType | None:
+    """
+    Import the macros of a plugin which are integrated lazily, on first access of ``airflow.macros.<name>``.
+
+    :return: the module of the macros of the plugin, or ``None`` if there is no such plugin
+    """
+    from airflow import macros
+
+    if plugins_manifest is None or macros_modules is None:
+        return None
+    entry = next((e for e in plugins_manifest if e["name"] == name and "macros" in e["components"]), None)
+    plugin = _import_plugin_from_manifest(entry) if entry else None
+    if plugin is None:
+        return None
+    macros_module = _integrate_plugin_macros(plugin, macros)
+    if macros_module:
+        macros_modules.append(macros_module)
+    return macros_module
+
+
 def initialize_web_ui_plugins():
     """Collect extension points for WEB UI."""
     global plugins
@@ -360,10 +608,7 @@ def initialize_web_ui_plugins():
     ):
         return
 
-    ensure_plugins_loaded()
-
-    if plugins is None:
-        raise AirflowPluginException("Can't load plugins.")
+    web_ui_plugins = _get_plugins(*WEB_UI_COMPONENTS)
 
     log.debug("Initialize Web UI plugin")
 
@@ -371,7 +616,7 @@ def initialize_web_ui_plugins():
     flask_appbuilder_views = []
     flask_appbuilder_menu_links = []
 
-    for plugin in plugins:
+    for plugin in web_ui_plugins:
         flask_appbuilder_views.extend(plugin.appbuilder_views)
         flask_appbuilder_menu_links.extend(plugin.appbuilder_menu_items)
         flask_blueprints.extend([{"name": plugin.name, "blueprint": bp} for bp in plugin.flask_blueprints])
@@ -392,16 +637,13 @@ def initialize_ti_deps_plugins():
     if registered_ti_dep_classes is not None:
         return
 
-    ensure_plugins_loaded()
-
-    if plugins is None:
-        raise AirflowPluginException("Can't load plugins.")
+    ti_deps_plugins = _get_plugins("ti_deps")
 
     log.debug("Initialize custom taskinstance deps plugins")
 
     registered_ti_dep_classes = {}
 
-    for plugin in plugins:
+    for plugin in ti_deps_plugins:
         registered_ti_dep_classes.update(
             {qualname(ti_dep.__class__): ti_dep.__class__ for ti_dep in plugin.ti_deps}
         )
@@ -420,10 +662,7 @@ def initialize_extra_operators_links_plugins():
     ):
         return
 
-    ensure_plugins_loaded()
-
-    if plugins is None:
-        raise AirflowPluginException("Can't load plugins.")
+    extra_links_plugins = _get_plugins("global_operator_extra_links", "operator_extra_links")
 
     log.debug("Initialize extra operators links plugins")
 
@@ -431,7 +670,7 @@ def initialize_extra_operators_links_plugins():
     operator_extra_links = []
     registered_operator_link_classes = {}
 
-    for plugin in plugins:
+    for plugin in extra_links_plugins:
         global_operator_extra_links.extend(plugin.global_operator_extra_links)
         operator_extra_links.extend(list(plugin.operator_extra_links))
 
@@ -447,16 +686,13 @@ def initialize_timetables_plugins():
     if timetable_classes is not None:
         return
 
-    ensure_plugins_loaded()
-
-    if plugins is None:
-        raise AirflowPluginException("Can't load plugins.")
+    timetables_plugins = _get_plugins("timetables")
 
     log.debug("Initialize extra timetables plugins")
 
     timetable_classes = {
         qualname(timetable_class): timetable_class
-        for plugin in plugins
+        for plugin in timetables_plugins
         for timetable_class in plugin.timetables
     }
 
@@ -469,15 +705,12 @@ def integrate_executor_plugins() -> None:
     if executors_modules is not None:
         return
 
-    ensure_plugins_loaded()
-
-    if plugins is None:
-        raise AirflowPluginException("Can't load plugins.")
+    executors_plugins = _get_plugins("executors")
 
     log.debug("Integrate executor plugins")
 
     executors_modules = []
-    for plugin in plugins:
+    for plugin in executors_plugins:
         if plugin.name is None:
             raise AirflowPluginException("Invalid plugin name")
         plugin_name: str = plugin.name
@@ -498,42 +731,46 @@ def integrate_macros_plugins() -> None:
     if macros_modules is not None:
         return
 
-    ensure_plugins_loaded()
+    if plugins is None and _load_plugins_manifest() is not None:
+        # The macros of a plugin are imported on first access, see import_macros_plugin
+        log.debug("Integrate DAG plugins lazily")
+        macros_modules = []
+        return
 
-    if plugins is None:
-        raise AirflowPluginException("Can't load plugins.")
+    macros_plugins = _get_plugins("macros")
 
     log.debug("Integrate DAG plugins")
 
     macros_modules = []
 
-    for plugin in plugins:
-        if plugin.name is None:
-            raise AirflowPluginException("Invalid plugin name")
-
-        macros_module = make_module(f"airflow.macros.{plugin.name}", plugin.macros)
-
+    for plugin in macros_plugins:
+        macros_module = _integrate_plugin_macros(plugin, macros)
         if macros_module:
             macros_modules.append(macros_module)
-            sys.modules[macros_module.__name__] = macros_module
-            # Register the newly created module on airflow.macros such that it
-            # can be accessed when rendering templates.
-            setattr(macros, plugin.name, macros_module)
 
 
-def integrate_listener_plugins(listener_manager: ListenerManager) -> None:
-    """Add listeners from plugins."""
-    global plugins
+def _integrate_plugin_macros(plugin: AirflowPlugin, macros: ModuleType) -> ModuleType | None:
+    if plugin.name is None:
+        raise AirflowPluginException("Invalid plugin name")
 
-    ensure_plugins_loaded()
+    macros_module = make_module(f"airflow.macros.{plugin.name}", plugin.macros)
 
-    if plugins:
-        for plugin in plugins:
-            if plugin.name is None:
-                raise AirflowPluginException("Invalid plugin name")
+    if macros_module:
+        sys.modules[macros_module.__name__] = macros_module
+        # Register the newly created module on airflow.macros such that it
+        # can be accessed when rendering templates.
+        setattr(macros, plugin.name, macros_module)
+    return macros_module
+
+
+def integrate_listener_plugins(listener_manager: ListenerManager) -> None:
+    """Add listeners from plugins."""
+    for plugin in _get_plugins("listeners"):
+        if plugin.name is None:
+            raise AirflowPluginException("Invalid plugin name")
 
-            for listener in plugin.listeners:
-                listener_manager.add_listener(listener)
+        for listener in plugin.listeners:
+            listener_manager.add_listener(listener)
 
 
 def get_plugin_info(attrs_to_dump: Iterable[str] | None = None) -> list[dict[str, Any]]:
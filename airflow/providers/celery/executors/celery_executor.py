@@ -28,7 +28,13 @@ import math
 import operator
 import time
 from collections import Counter
-from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import (
+    BrokenExecutor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    TimeoutError as FutureTimeoutError,
+)
 from multiprocessing import cpu_count
 from typing import TYPE_CHECKING, Any, Optional, Sequence, Tuple
 
@@ -70,7 +76,7 @@ except ImportError:
     raise
 
 from airflow.configuration import conf
-from airflow.exceptions import AirflowTaskTimeout
+from airflow.exceptions import AirflowConfigException, AirflowTaskTimeout
 from airflow.executors.base_executor import BaseExecutor
 from airflow.stats import Stats
 from airflow.utils.state import TaskInstanceState
@@ -83,12 +89,14 @@ CELERY_SEND_ERR_MSG_HEADER = "Error sending Celery task"
 
 if TYPE_CHECKING:
     import argparse
+    from concurrent.futures import Executor
 
     from celery import Task
 
     from airflow.executors.base_executor import CommandType, TaskTuple
     from airflow.models.taskinstance import TaskInstance
     from airflow.models.taskinstancekey import TaskInstanceKey
+    from airflow.providers.celery.executors.celery_executor_utils import CeleryEventStateTracker
 
     # Task instance that is sent over Celery queues
     # TaskInstanceKey, Command, queue_name, CallableTask
@@ -256,9 +264,34 @@ class CeleryExecutor(BaseExecutor):
         self.tasks = {}
         self.task_publish_retries: Counter[TaskInstanceKey] = Counter()
         self.task_publish_max_retries = conf.getint("celery", "task_publish_max_retries")
+        self._send_pool_type = conf.get("celery", "send_pool_type").lower()
+        if self._send_pool_type not in ("process", "thread"):
+            raise AirflowConfigException(
+                f"The celery.send_pool_type option must be either 'process' or 'thread', "
+                f"got {self._send_pool_type!r}"
+            )
+        self._persistent_send_pool = conf.getboolean("celery", "persistent_send_pool")
+        self._send_pool: Executor | None = None
+        # Sends which timed out while running, with the tasks they are sending
+        self._inflight_sends: dict[Future, list[TaskInstanceInCelery]] = {}
+        self.event_state_tracker: CeleryEventStateTracker | None = None
+        if conf.getboolean("celery", "task_state_events"):
+            from airflow.providers.celery.executors.celery_executor_utils import CeleryEventStateTracker
+
+            self.event_state_tracker = CeleryEventStateTracker(
+                conf.getfloat("celery", "task_state_events_fallback_timeout")
+            )
 
     def start(self) -> None:
         self.log.debug("Starting Celery Executor using %s processes for syncing", self._sync_parallelism)
+        self.log.debug(
+            "Sending tasks to Celery using a %s%s pool",
+            "persistent " if self._persistent_send_pool else "",
+            self._send_pool_type,
+        )
+        if self.event_state_tracker:
+            self.log.debug("Tracking Celery task states using task events")
+            self.event_state_tracker.start()
 
     def _num_tasks_per_send_process(self, to_send_count: int) -> int:
         """
@@ -271,15 +304,22 @@ class CeleryExecutor(BaseExecutor):
     def _process_tasks(self, task_tuples: list[TaskTuple]) -> None:
         from airflow.providers.celery.executors.celery_executor_utils import execute_command
 
-        task_tuples_to_send = [task_tuple[:3] + (execute_command,) for task_tuple in task_tuples]
-        first_task = next(t[3] for t in task_tuples_to_send)
-
         # Celery state queries will stuck if we do not use one same backend
         # for all tasks.
-        cached_celery_backend = first_task.backend
-
-        key_and_async_results = self._send_tasks_to_celery(task_tuples_to_send)
-        self.log.debug("Sent all tasks.")
+        cached_celery_backend = execute_command.backend
+
+        # Results of the sends which were still in flight when they timed out in a previous call
+        key_and_async_results = self._collect_inflight_sends()
+        inflight_send_keys = self._inflight_send_keys
+        task_tuples_to_send = [
+            task_tuple[:3] + (execute_command,)
+            for task_tuple in task_tuples
+            if task_tuple[0] not in inflight_send_keys
+        ]
+        if task_tuples_to_send:
+            with Stats.timer("celery.send_tasks_duration"):
+                key_and_async_results.extend(self._send_tasks_to_celery(task_tuples_to_send))
+            self.log.debug("Sent all tasks.")
         from airflow.providers.celery.executors.celery_executor_utils import ExceptionWithTraceback
 
         for key, _, result in key_and_async_results:
@@ -316,21 +356,116 @@ class CeleryExecutor(BaseExecutor):
                 self.update_task_state(key, result.state, getattr(result, "info", None))
 
     def _send_tasks_to_celery(self, task_tuples_to_send: list[TaskInstanceInCelery]):
-        from airflow.providers.celery.executors.celery_executor_utils import send_task_to_executor
+        from airflow.providers.celery.executors.celery_executor_utils import (
+            send_task_to_executor,
+            send_tasks_batch_to_executor,
+        )
 
-        if len(task_tuples_to_send) == 1 or self._sync_parallelism == 1:
-            # One tuple, or max one process -> send it in the main thread.
+        if len(task_tuples_to_send) == 1:
+            # One tuple -> send it in the main thread.
             return list(map(send_task_to_executor, task_tuples_to_send))
+        if self._sync_parallelism == 1:
+            # Max one process -> send all of them in the main thread, sharing one broker producer.
+            return send_tasks_batch_to_executor(task_tuples_to_send)
 
         # Use chunks instead of a work queue to reduce context switching
         # since tasks are roughly uniform in size
         chunksize = self._num_tasks_per_send_process(len(task_tuples_to_send))
+        batches = [
+            task_tuples_to_send[i : i + chunksize] for i in range(0, len(task_tuples_to_send), chunksize)
+        ]
+
+        if self._persistent_send_pool:
+            return self._send_batches(self._get_send_pool(), batches)
+
         num_processes = min(len(task_tuples_to_send), self._sync_parallelism)
+        send_pool = self._create_send_pool(num_processes)
+        try:
+            return self._send_batches(send_pool, batches)
+        finally:
+            # Don't wait for the sends which timed out, they are collected by the next calls
+            send_pool.shutdown(wait=False)
+
+    def _create_send_pool(self, max_workers: int) -> Executor:
+        if self._send_pool_type == "thread":
+            return ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="celery-send")
+        return ProcessPoolExecutor(max_workers=max_workers)
+
+    def _get_send_pool(self) -> Executor:
+        """Return the persistent send pool, creating it on first use or after it broke."""
+        if self._send_pool is None:
+            self._send_pool = self._create_send_pool(self._sync_parallelism)
+        return self._send_pool
+
+    def _shutdown_send_pool(self, wait: bool = True) -> None:
+        if self._send_pool is not None:
+            self._send_pool.shutdown(wait=wait)
+            self._send_pool = None
+
+    def _send_batches(self, send_pool: Executor, batches: list[list[TaskInstanceInCelery]]):
+        from airflow.providers.celery.executors.celery_executor_utils import (
+            OPERATION_TIMEOUT,
+            ExceptionWithTraceback,
+            send_tasks_batch_to_executor,
+        )
 
-        with ProcessPoolExecutor(max_workers=num_processes) as send_pool:
-            key_and_async_results = list(
-                send_pool.map(send_task_to_executor, task_tuples_to_send, chunksize=chunksize)
-            )
+        futures = [send_pool.submit(send_tasks_batch_to_executor, batch) for batch in batches]
+        # Worker processes time out every single task themselves, threads can't use the signal based
+        # timeout so the batches are bounded here instead. There are about as many batches as workers in
+        # the pool, so they are sent in parallel and all bounded from the time they were submitted.
+        deadline = time.monotonic() + OPERATION_TIMEOUT * max(len(batch) for batch in batches)
+        key_and_async_results = []
+        for batch, future in zip(batches, futures):
+            try:
+                key_and_async_results.extend(future.result(timeout=max(0, deadline - time.monotonic())))
+            except FutureTimeoutError:
+                if not future.cancel():
+                    # The tasks may still be published, they must not be sent again until we know
+                    self.log.warning(
+                        "Sending a batch of %s task(s) to Celery is taking longer than %ss, "
+                        "waiting for it to complete before retrying them",
+                        len(batch),
+                        OPERATION_TIMEOUT * len(batch),
+                    )
+                    self._inflight_sends[future] = batch
+                    continue
+                error: BaseException = AirflowTaskTimeout(
+                    f"Sending a batch of {len(batch)} task(s) to Celery timed out"
+                )
+                key_and_async_results.extend(
+                    (key, command, ExceptionWithTraceback(error, f"Celery Task ID: {key}"))
+                    for key, command, *_ in batch
+                )
+            except BrokenExecutor as e:
+                # A worker of the pool died, the pool can't be used anymore. It will be recreated on the
+                # next call.
+                self.log.error("The pool used to send tasks to Celery is broken: %s", e)
+                if send_pool is self._send_pool:
+                    self._shutdown_send_pool(wait=False)
+                key_and_async_results.extend(
+                    (key, command, ExceptionWithTraceback(e, f"Celery Task ID: {key}"))
+                    for key, command, *_ in batch
+                )
+        return key_and_async_results
+
+    @property
+    def _inflight_send_keys(self) -> set[TaskInstanceKey]:
+        return {key for batch in self._inflight_sends.values() for key, *_ in batch}
+
+    def _collect_inflight_sends(self) -> list:
+        """Return the results of the sends which timed out but have completed since."""
+        from airflow.providers.celery.executors.celery_executor_utils import ExceptionWithTraceback
+
+        key_and_async_results = []
+        for future in [future for future in self._inflight_sends if future.done()]:
+            batch = self._inflight_sends.pop(future)
+            try:
+                key_and_async_results.extend(future.result())
+            except Exception as e:
+                key_and_async_results.extend(
+                    (key, command, ExceptionWithTraceback(e, f"Celery Task ID: {key}"))
+                    for key, command, *_ in batch
+                )
         return key_and_async_results
 
     def sync(self) -> None:
@@ -349,11 +484,20 @@ class CeleryExecutor(BaseExecutor):
     def update_all_task_states(self) -> None:
         """Update states of the tasks."""
         self.log.debug("Inquiring about %s celery task(s)", len(self.tasks))
-        state_and_info_by_celery_task_id = self.bulk_state_fetcher.get_many(self.tasks.values())
+        if self.event_state_tracker:
+            state_and_info_by_celery_task_id, to_poll = self.event_state_tracker.get_many(self.tasks.values())
+            if to_poll:
+                Stats.incr("celery.task_state_events.fallback_polls", len(to_poll))
+                state_and_info_by_celery_task_id = {
+                    **state_and_info_by_celery_task_id,
+                    **self.bulk_state_fetcher.get_many(to_poll),
+                }
+        else:
+            state_and_info_by_celery_task_id = self.bulk_state_fetcher.get_many(self.tasks.values())
 
         self.log.debug("Inquiries completed.")
         for key, async_result in list(self.tasks.items()):
-            state, info = state_and_info_by_celery_task_id.get(async_result.task_id)
+            state, info = state_and_info_by_celery_task_id.get(async_result.task_id, (None, None))
             if state:
                 self.update_task_state(key, state, info)
 
@@ -380,9 +524,14 @@ class CeleryExecutor(BaseExecutor):
             while any(task.state not in celery_states.READY_STATES for task in self.tasks.values()):
                 time.sleep(5)
         self.sync()
+        self._shutdown_send_pool()
+        if self.event_state_tracker:
+            self.event_state_tracker.stop()
 
     def terminate(self):
-        pass
+        self._shutdown_send_pool(wait=False)
+        if self.event_state_tracker:
+            self.event_state_tracker.stop()
 
     def try_adopt_task_instances(self, tis: Sequence[TaskInstance]) -> Sequence[TaskInstance]:
         # See which of the TIs are still alive (or have finished even!)
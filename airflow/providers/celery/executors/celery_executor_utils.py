@@ -27,10 +27,12 @@ import logging
 import math
 import os
 import subprocess
+import threading
+import time
 import traceback
 import warnings
 from concurrent.futures import ProcessPoolExecutor
-from typing import TYPE_CHECKING, Any, Mapping, MutableMapping, Optional, Tuple
+from typing import TYPE_CHECKING, Any, ContextManager, Mapping, MutableMapping, Optional, Tuple
 
 from celery import Celery, Task, states as celery_states
 from celery.backends.base import BaseKeyValueStoreBackend
@@ -207,10 +209,21 @@ def send_task_to_executor(
     task_tuple: TaskInstanceInCelery,
 ) -> tuple[TaskInstanceKey, CommandType, AsyncResult | ExceptionWithTraceback]:
     """Send task to executor."""
+    return _send_task_to_executor(task_tuple)
+
+
+def _send_task_to_executor(
+    task_tuple: TaskInstanceInCelery, producer: Any = None, use_timeout: bool = True
+) -> tuple[TaskInstanceKey, CommandType, AsyncResult | ExceptionWithTraceback]:
     key, command, queue, task_to_run = task_tuple
+    options: dict[str, Any] = {"queue": queue}
+    if producer is not None:
+        options["producer"] = producer
     try:
-        with timeout(seconds=OPERATION_TIMEOUT):
-            result = task_to_run.apply_async(args=[command], queue=queue)
+        # The signal based timeout can only be set from the main thread of a process. When sending from a
+        # thread pool, the executor bounds the whole batch instead.
+        with timeout(seconds=OPERATION_TIMEOUT) if use_timeout else contextlib.nullcontext():
+            result = task_to_run.apply_async(args=[command], **options)
     except (Exception, AirflowTaskTimeout) as e:
         exception_traceback = f"Celery Task ID: {key}\n{traceback.format_exc()}"
         result = ExceptionWithTraceback(e, exception_traceback)
@@ -218,6 +231,42 @@ def send_task_to_executor(
     return key, command, result
 
 
+def send_tasks_batch_to_executor(
+    task_tuples: list[TaskInstanceInCelery],
+) -> list[tuple[TaskInstanceKey, CommandType, AsyncResult | ExceptionWithTraceback]]:
+    """
+    Send a batch of tasks to executor, reusing a single broker producer for the whole batch.
+
+    Acquiring a producer (and so a broker connection) from the Celery app pool once per batch, rather than
+    once per message, removes most of the per-task publishing overhead. When called repeatedly from a
+    long-lived process or thread, the connection stays in the app's pool and is reused across batches.
+
+    :param task_tuples: the tasks to send, all of them are expected to use the same Celery app
+    :return: a list of (key, command, result) tuples, in the same order as ``task_tuples``
+    """
+    if not task_tuples:
+        return []
+    use_timeout = threading.current_thread() is threading.main_thread()
+    start = time.monotonic()
+    first_task = task_tuples[0][3]
+    # Only real Celery tasks carry an app with a producer pool
+    if isinstance(first_task, Task):
+        producer_context: ContextManager[Any] = first_task.app.producer_or_acquire()
+    else:
+        producer_context = contextlib.nullcontext()
+    try:
+        with producer_context as producer:
+            results = [_send_task_to_executor(t, producer, use_timeout) for t in task_tuples]
+    except Exception as e:
+        # Failing to acquire the producer fails the whole batch
+        exception_traceback = traceback.format_exc()
+        results = [
+            (key, command, ExceptionWithTraceback(e, exception_traceback)) for key, command, *_ in task_tuples
+        ]
+    Stats.timing("celery.send_batch_duration", (time.monotonic() - start) * 1000)
+    return results
+
+
 def fetch_celery_task_state(async_result: AsyncResult) -> tuple[str, str | ExceptionWithTraceback, Any]:
     """
     Fetch and return the state of the given celery task.
@@ -329,3 +378,149 @@ class BulkStateFetcher(LoggingMixin):
                 else:
                     states_and_info_by_task_id[task_id] = state_or_exception, info
         return states_and_info_by_task_id
+
+
+class CeleryEventStateTracker(LoggingMixin):
+    """
+    Keeps track of Celery task states by consuming task events sent by the workers.
+
+    Events are received from the broker in a background thread and kept in an in-memory map, so asking for
+    the state of many running tasks does not require querying the result backend. Tasks that did not
+    report any event for ``fallback_timeout`` seconds, for example because events were lost while the
+    scheduler was restarting, are returned separately so that their state can be polled from the result
+    backend instead.
+
+    :param fallback_timeout: number of seconds without an event after which a task is polled
+    :param celery_app: the Celery app to receive events from, defaults to the Airflow Celery app
+    """
+
+    TASK_EVENT_STATES = {
+        "task-started": celery_states.STARTED,
+        "task-succeeded": celery_states.SUCCESS,
+        "task-failed": celery_states.FAILURE,
+        "task-revoked": celery_states.REVOKED,
+    }
+
+    def __init__(self, fallback_timeout: float, celery_app: Celery | None = None):
+        super().__init__()
+        self._fallback_timeout = fallback_timeout
+        self._app = celery_app or app
+        self._lock = threading.Lock()
+        self._states: dict[str, EventBufferValueType] = {}
+        # Monotonic time of the last event received for, or the last poll of, every tracked task
+        self._last_seen: dict[str, float] = {}
+        self._receiver: Any = None
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+        # Monotonic time of the last event received for any task (or of the creation of the tracker), and
+        # of the last warning about not receiving any
+        self._last_event = time.monotonic()
+        self._last_no_event_warning: float | None = None
+
+    def start(self) -> None:
+        """Start receiving task events in a background thread."""
+        if not self._app.conf.worker_send_task_events:
+            self.log.warning(
+                "worker_send_task_events is disabled in the Celery configuration. Unless the Celery workers "
+                "use a configuration enabling it, they send no task events, and the state of every task is "
+                "only polled after %ss",
+                self._fallback_timeout,
+            )
+        self._thread = threading.Thread(target=self._run, name="celery-event-receiver", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop receiving task events."""
+        self._stopped.set()
+        if self._receiver is not None:
+            self._receiver.should_stop = True
+        if self._thread is not None:
+            self._thread.join(timeout=OPERATION_TIMEOUT)
+            self._thread = None
+
+    def _run(self) -> None:
+        handlers = {event_type: self.on_task_event for event_type in self.TASK_EVENT_STATES}
+        while not self._stopped.is_set():
+            try:
+                with self._app.connection_for_read() as connection:
+                    self._receiver = self._app.events.Receiver(connection, handlers=handlers)
+                    if self._stopped.is_set():
+                        return
+                    # Reconnects on connection errors until should_stop is set
+                    self._receiver.run()
+            except Exception:
+                self.log.exception("Error while receiving Celery task events, retrying")
+                self._stopped.wait(OPERATION_TIMEOUT)
+
+    def on_task_event(self, event: dict[str, Any]) -> None:
+        """Record the state carried by a single Celery task event."""
+        task_id = event.get("uuid")
+        state = self.TASK_EVENT_STATES.get(event.get("type", ""))
+        if not task_id or not state:
+            return
+        info = event.get("exception") if state == celery_states.FAILURE else None
+        with self._lock:
+            self._last_event = time.monotonic()
+            current = self._states.get(task_id)
+            # Events are not guaranteed to be delivered in order, never go back from a final state
+            if current is None or current[0] not in celery_states.READY_STATES:
+                self._states[task_id] = state, info
+            self._last_seen[task_id] = time.monotonic()
+
+    def get_many(self, async_results) -> tuple[Mapping[str, EventBufferValueType], list[AsyncResult]]:
+        """
+        Get the state of many Celery tasks from the received events.
+
+        Tracking of tasks which are not part of ``async_results`` is dropped, since the executor always
+        asks for all the tasks it is still waiting for.
+
+        :param async_results: the results of all the tasks the executor is tracking
+        :return: a tuple of the states known from events by task id, and the results of the tasks which
+            should be polled from the result backend
+        """
+        now = time.monotonic()
+        state_info: MutableMapping[str, EventBufferValueType] = {}
+        to_poll = []
+        with self._lock:
+            task_ids = set()
+            for async_result in async_results:
+                task_id = async_result.task_id
+                task_ids.add(task_id)
+                state, info = self._states.get(task_id, (None, None))
+                if state in celery_states.READY_STATES:
+                    state_info[task_id] = state, info
+                    continue
+                last_seen = self._last_seen.setdefault(task_id, now)
+                if now - last_seen >= self._fallback_timeout:
+                    to_poll.append(async_result)
+                    self._last_seen[task_id] = now
+                elif state:
+                    state_info[task_id] = state, info
+            for tracked in (self._states, self._last_seen):
+                for task_id in tracked.keys() - task_ids:
+                    del tracked[task_id]
+            last_event = self._last_event
+        if (
+            to_poll
+            and now - last_event >= self._fallback_timeout
+            and (
+                self._last_no_event_warning is None
+                or now - self._last_no_event_warning >= self._fallback_timeout
+            )
+        ):
+            self._last_no_event_warning = now
+            self.log.warning(
+                "No Celery task event received for %ss while %d task(s) are running, their states are only "
+                "polled from the result backend every %ss. Make sure that the Celery workers send task "
+                "events (worker_send_task_events) or disable [celery] task_state_events",
+                self._fallback_timeout,
+                len(task_ids),
+                self._fallback_timeout,
+            )
+        self.log.debug(
+            "Got %d state(s) from events for %d task(s), %d task(s) to poll",
+            len(state_info),
+            len(task_ids),
+            len(to_poll),
+        )
+        return state_info, to_poll
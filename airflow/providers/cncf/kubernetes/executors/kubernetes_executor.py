@@ -77,7 +77,9 @@ from airflow.configuration import conf
 from airflow.executors.base_executor import BaseExecutor
 from airflow.providers.cncf.kubernetes.executors.kubernetes_executor_types import (
     ADOPTED,
+    ALL_NAMESPACES,
     POD_EXECUTOR_DONE_KEY,
+    WATCHER_SHARD_LABEL,
 )
 from airflow.providers.cncf.kubernetes.kube_config import KubeConfig
 from airflow.providers.cncf.kubernetes.kubernetes_helper_functions import annotations_to_key
@@ -102,6 +104,7 @@ if TYPE_CHECKING:
     )
     from airflow.providers.cncf.kubernetes.executors.kubernetes_executor_utils import (
         AirflowKubernetesScheduler,
+        KubernetesPodCache,
     )
 
 
@@ -163,24 +166,30 @@ class KubernetesExecutor(BaseExecutor):
         self.kubernetes_queue: str | None = None
         self.task_publish_retries: Counter[TaskInstanceKey] = Counter()
         self.task_publish_max_retries = conf.getint("kubernetes", "task_publish_max_retries", fallback=0)
+        self.pod_cache: KubernetesPodCache | None = None
         super().__init__(parallelism=self.kube_config.parallelism)
 
+    def _get_namespaces(self) -> list[str | None]:
+        if self.kube_config.multi_namespace_mode:
+            if self.kube_config.multi_namespace_mode_namespace_list:
+                return self.kube_config.multi_namespace_mode_namespace_list
+            return [None]
+        return [self.kube_config.kube_namespace]
+
     def _list_pods(self, query_kwargs):
+        if self.pod_cache and self.pod_cache.has_synced:
+            return self.pod_cache.list_pods(
+                label_selector=query_kwargs.get("label_selector"),
+                field_selector=query_kwargs.get("field_selector"),
+            )
         query_kwargs["header_params"] = {
             "Accept": "application/json;as=PartialObjectMetadataList;v=v1;g=meta.k8s.io"
         }
         dynamic_client = DynamicClient(self.kube_client.api_client)
         pod_resource = dynamic_client.resources.get(api_version="v1", kind="Pod")
-        if self.kube_config.multi_namespace_mode:
-            if self.kube_config.multi_namespace_mode_namespace_list:
-                namespaces = self.kube_config.multi_namespace_mode_namespace_list
-            else:
-                namespaces = [None]
-        else:
-            namespaces = [self.kube_config.kube_namespace]
 
         pods = []
-        for namespace in namespaces:
+        for namespace in self._get_namespaces():
             # Dynamic Client list pods is throwing TypeError when there are no matching pods to return
             # This bug was fixed in MR https://github.com/kubernetes-client/python/pull/2155
             # TODO: Remove the try-except clause once we upgrade the K8 Python client version which
@@ -320,10 +329,17 @@ class KubernetesExecutor(BaseExecutor):
         self.log.debug("Start with scheduler_job_id: %s", self.scheduler_job_id)
         from airflow.providers.cncf.kubernetes.executors.kubernetes_executor_utils import (
             AirflowKubernetesScheduler,
+            KubernetesPodCache,
         )
         from airflow.providers.cncf.kubernetes.kube_client import get_kube_client
 
         self.kube_client = get_kube_client()
+        if self.kube_config.enable_pod_cache:
+            self.pod_cache = KubernetesPodCache(
+                kube_config=self.kube_config,
+                namespaces=[namespace or ALL_NAMESPACES for namespace in self._get_namespaces()],
+            )
+            self.pod_cache.start()
         self.kube_scheduler = AirflowKubernetesScheduler(
             kube_config=self.kube_config,
             result_queue=self.result_queue,
@@ -422,54 +438,87 @@ class KubernetesExecutor(BaseExecutor):
 
         from kubernetes.client.rest import ApiException
 
-        with contextlib.suppress(Empty):
-            for _ in range(self.kube_config.worker_pods_creation_batch_size):
-                task = self.task_queue.get_nowait()
+        from airflow.providers.cncf.kubernetes.executors.kubernetes_executor_utils import (
+            PodCreationDeferredException,
+        )
 
-                try:
-                    key, command, kube_executor_config, pod_template_file = task
-                    self.kube_scheduler.run_next(task)
-                    self.task_publish_retries.pop(key, None)
-                except PodReconciliationError as e:
-                    self.log.exception(
-                        "Pod reconciliation failed, likely due to kubernetes library upgrade. "
-                        "Try clearing the task to re-run.",
-                    )
-                    self.fail(task[0], e)
-                except ApiException as e:
-                    body = json.loads(e.body)
-                    retries = self.task_publish_retries[key]
-                    # In case of exceeded quota errors, requeue the task as per the task_publish_max_retries
-                    if (
-                        str(e.status) == "403"
-                        and "exceeded quota" in body["message"]
-                        and (self.task_publish_max_retries == -1 or retries < self.task_publish_max_retries)
-                    ):
+        tasks: list[KubernetesJobType] = []
+        throttle_delay = self.kube_scheduler.get_throttle_delay()
+        if throttle_delay > 0:
+            # Do not wait for the Kubernetes API to accept pod creations again, go on scheduling instead
+            self.log.debug("Pod creations paused for %.2fs after being throttled", throttle_delay)
+        else:
+            with contextlib.suppress(Empty):
+                for _ in range(self.kube_config.worker_pods_creation_batch_size):
+                    tasks.append(self.task_queue.get_nowait())
+
+        pod_creation_errors = self.kube_scheduler.run_next_batch(tasks) if tasks else []
+        for task, error in zip(tasks, pod_creation_errors):
+            key = task[0]
+            try:
+                if error is not None:
+                    raise error
+                self.task_publish_retries.pop(key, None)
+            except PodReconciliationError as e:
+                self.log.exception(
+                    "Pod reconciliation failed, likely due to kubernetes library upgrade. "
+                    "Try clearing the task to re-run.",
+                )
+                self.fail(task[0], e)
+            except PodCreationDeferredException:
+                # Not attempted because the pod creations are paused, this does not count as a retry
+                self.task_queue.put(task)
+            except ApiException as e:
+                retries = self.task_publish_retries[key]
+                if str(e.status) == "429":
+                    max_retries = self.kube_config.worker_pods_creation_throttle_retries
+                    if retries < max_retries:
                         self.log.warning(
-                            "[Try %s of %s] Kube ApiException for Task: (%s). Reason: %r. Message: %s",
-                            self.task_publish_retries[key] + 1,
-                            self.task_publish_max_retries,
+                            "[Try %s of %s] Pod creation for Task %s throttled by the Kubernetes API, "
+                            "re-queueing.",
+                            retries + 1,
+                            max_retries,
                             key,
-                            e.reason,
-                            body["message"],
                         )
                         self.task_queue.put(task)
                         self.task_publish_retries[key] = retries + 1
                     else:
-                        self.log.error("Pod creation failed with reason %r. Failing task", e.reason)
-                        key, _, _, _ = task
+                        self.log.error("Pod creation throttled by the Kubernetes API. Failing task %s", key)
                         self.fail(key, e)
                         self.task_publish_retries.pop(key, None)
-                except PodMutationHookException as e:
-                    key, _, _, _ = task
-                    self.log.error(
-                        "Pod Mutation Hook failed for the task %s. Failing task. Details: %s",
+                    continue
+                body = json.loads(e.body)
+                # In case of exceeded quota errors, requeue the task as per the task_publish_max_retries
+                if (
+                    str(e.status) == "403"
+                    and "exceeded quota" in body["message"]
+                    and (self.task_publish_max_retries == -1 or retries < self.task_publish_max_retries)
+                ):
+                    self.log.warning(
+                        "[Try %s of %s] Kube ApiException for Task: (%s). Reason: %r. Message: %s",
+                        self.task_publish_retries[key] + 1,
+                        self.task_publish_max_retries,
                         key,
-                        e.__cause__,
+                        e.reason,
+                        body["message"],
                     )
+                    self.task_queue.put(task)
+                    self.task_publish_retries[key] = retries + 1
+                else:
+                    self.log.error("Pod creation failed with reason %r. Failing task", e.reason)
+                    key, _, _, _ = task
                     self.fail(key, e)
-                finally:
-                    self.task_queue.task_done()
+                    self.task_publish_retries.pop(key, None)
+            except PodMutationHookException as e:
+                key, _, _, _ = task
+                self.log.error(
+                    "Pod Mutation Hook failed for the task %s. Failing task. Details: %s",
+                    key,
+                    e.__cause__,
+                )
+                self.fail(key, e)
+            finally:
+                self.task_queue.task_done()
 
         # Run any pending timed events
         next_event = self.event_scheduler.run(blocking=False)
@@ -628,10 +677,13 @@ class KubernetesExecutor(BaseExecutor):
                 airflow_worker=ti.queued_by_job_id,
             )
             namespace = self._get_pod_namespace(ti)
-            pod_list = self.kube_client.list_namespaced_pod(
-                namespace=namespace,
-                label_selector=selector,
-            ).items
+            if self.pod_cache and self.pod_cache.has_synced:
+                pod_list = self.pod_cache.list_pods(label_selector=selector, namespace=namespace)
+            else:
+                pod_list = self.kube_client.list_namespaced_pod(
+                    namespace=namespace,
+                    label_selector=selector,
+                ).items
             if not pod_list:
                 self.log.warning("Cannot find pod for ti %s", ti)
                 continue
@@ -642,6 +694,21 @@ class KubernetesExecutor(BaseExecutor):
             self.kube_scheduler.delete_pod(pod_name=pod_list[0].metadata.name, namespace=namespace)
         return readable_tis
 
+    def _get_adoption_labels(self, pod: k8s.V1Pod) -> dict[str, str]:
+        """Return the labels to patch a pod with, so that the KubernetesJobWatchers can monitor it."""
+        if TYPE_CHECKING:
+            assert self.scheduler_job_id
+
+        labels = {"airflow-worker": self._make_safe_label_value(self.scheduler_job_id)}
+        if self.kube_config.watcher_shards > 1:
+            from airflow.providers.cncf.kubernetes.executors.kubernetes_executor_utils import (
+                get_watcher_shard,
+            )
+
+            num_shards = self.kube_config.watcher_shards
+            labels[WATCHER_SHARD_LABEL] = get_watcher_shard(pod.metadata.name, num_shards)
+        return labels
+
     def adopt_launched_task(
         self,
         kube_client: client.CoreV1Api,
@@ -664,14 +731,13 @@ class KubernetesExecutor(BaseExecutor):
             self.log.error("attempting to adopt taskinstance which was not specified by database: %s", ti_key)
             return
 
-        new_worker_id_label = self._make_safe_label_value(self.scheduler_job_id)
         from kubernetes.client.rest import ApiException
 
         try:
             kube_client.patch_namespaced_pod(
                 name=pod.metadata.name,
                 namespace=pod.metadata.namespace,
-                body={"metadata": {"labels": {"airflow-worker": new_worker_id_label}}},
+                body={"metadata": {"labels": self._get_adoption_labels(pod)}},
             )
         except ApiException as e:
             self.log.info("Failed to adopt pod %s. Reason: %s", pod.metadata.name, e)
@@ -706,7 +772,7 @@ class KubernetesExecutor(BaseExecutor):
                 kube_client.patch_namespaced_pod(
                     name=pod.metadata.name,
                     namespace=pod.metadata.namespace,
-                    body={"metadata": {"labels": {"airflow-worker": new_worker_id_label}}},
+                    body={"metadata": {"labels": self._get_adoption_labels(pod)}},
                 )
             except ApiException as e:
                 self.log.info("Failed to adopt pod %s. Reason: %s", pod.metadata.name, e)
@@ -769,6 +835,8 @@ class KubernetesExecutor(BaseExecutor):
             self.result_queue.join()
         except ConnectionResetError:
             self.log.exception("Connection Reset error while flushing task_queue and result_queue.")
+        if self.pod_cache:
+            self.pod_cache.stop()
         if self.kube_scheduler:
             self.kube_scheduler.terminate()
         self._manager.shutdown()
@@ -35,3 +35,5 @@ if TYPE_CHECKING:
 
 ALL_NAMESPACES = "ALL_NAMESPACES"
 POD_EXECUTOR_DONE_KEY = "airflow_executor_done"
+# Label of the pods splitting them between the KubernetesJobWatcher shards
+WATCHER_SHARD_LABEL = "airflow-watcher-shard"
@@ -19,7 +19,10 @@ from __future__ import annotations
 import contextlib
 import json
 import multiprocessing
+import threading
 import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from queue import Empty, Queue
 from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
@@ -35,6 +38,7 @@ from airflow.providers.cncf.kubernetes.kubernetes_helper_functions import (
     create_pod_id,
 )
 from airflow.providers.cncf.kubernetes.pod_generator import PodGenerator
+from airflow.stats import Stats
 from airflow.utils.log.logging_mixin import LoggingMixin
 from airflow.utils.state import TaskInstanceState
 
@@ -43,6 +47,7 @@ try:
         ADOPTED,
         ALL_NAMESPACES,
         POD_EXECUTOR_DONE_KEY,
+        WATCHER_SHARD_LABEL,
     )
 except ImportError:
     # avoid failing import when Airflow pre 2.7 is installed
@@ -65,6 +70,13 @@ if TYPE_CHECKING:
 
 T = TypeVar("T")
 
+# Upper bound, in seconds, of the pause of the pod creations when throttled by the API
+MAX_POD_CREATION_THROTTLE_BACKOFF = 60.0
+
+
+class PodCreationDeferredException(AirflowException):
+    """Raised when a pod is not created because the pod creations are paused after being throttled."""
+
 
 class Singleton(type, Generic[T]):
     """Metaclass that allows to implement singleton pattern."""
@@ -93,9 +105,11 @@ class KubernetesJobWatcher(multiprocessing.Process, LoggingMixin):
         resource_version: str | None,
         scheduler_job_id: str,
         kube_config: Configuration,
+        shard: int | None = None,
     ):
         super().__init__()
         self.namespace = namespace
+        self.shard = shard
         self.scheduler_job_id = scheduler_job_id
         self.watcher_queue = watcher_queue
         self.resource_version = resource_version
@@ -157,6 +171,8 @@ class KubernetesJobWatcher(multiprocessing.Process, LoggingMixin):
         self.log.info("Event: and now my watch begins starting at resource_version: %s", resource_version)
 
         kwargs = {"label_selector": f"airflow-worker={scheduler_job_id}"}
+        if self.shard is not None:
+            kwargs["label_selector"] += f",{WATCHER_SHARD_LABEL}={self.shard}"
         if resource_version:
             kwargs["resource_version"] = resource_version
         if kube_config.kube_client_request_args:
@@ -335,6 +351,11 @@ class AirflowKubernetesScheduler(LoggingMixin):
         self.watcher_queue = self._manager.Queue()
         self.scheduler_job_id = scheduler_job_id
         self.kube_watchers = self._make_kube_watchers()
+        self._pod_launcher: ThreadPoolExecutor | None = None
+        # Pods are not created before this time (time.monotonic) when throttled by the Kubernetes API
+        self._throttled_until = 0.0
+        self._consecutive_throttles = 0
+        self._throttle_lock = threading.Lock()
 
     def run_pod_async(self, pod: k8s.V1Pod, **kwargs):
         """Run POD asynchronously."""
@@ -343,16 +364,61 @@ class AirflowKubernetesScheduler(LoggingMixin):
 
         self.log.debug("Pod Creation Request: \n%s", json_pod)
         try:
-            resp = self.kube_client.create_namespaced_pod(
-                body=sanitized_pod, namespace=pod.metadata.namespace, **kwargs
-            )
+            resp = self._create_namespaced_pod(sanitized_pod, pod.metadata.namespace, **kwargs)
             self.log.debug("Pod Creation Response: %s", resp)
+        except PodCreationDeferredException:
+            raise
         except Exception as e:
             self.log.exception("Exception when attempting to create Namespaced Pod: %s", json_pod)
             raise e
         return resp
 
-    def _make_kube_watcher(self, namespace) -> KubernetesJobWatcher:
+    def _create_namespaced_pod(self, body: dict, namespace: str, **kwargs):
+        """
+        Create a pod, pausing the pod creations when throttled by the Kubernetes API.
+
+        Nothing waits for the end of the pause: the pods which are not created are left to the executor,
+        which creates them in a later scheduler loop.
+        """
+        if self.get_throttle_delay() > 0:
+            raise PodCreationDeferredException("Pod creations are paused after being throttled")
+        try:
+            resp = self.kube_client.create_namespaced_pod(body=body, namespace=namespace, **kwargs)
+        except ApiException as e:
+            if str(e.status) == "429":
+                self._pause_pod_creations(e)
+            raise
+        with self._throttle_lock:
+            self._consecutive_throttles = 0
+        return resp
+
+    def get_throttle_delay(self) -> float:
+        """Return the number of seconds left before pods can be created after being throttled."""
+        with self._throttle_lock:
+            return max(self._throttled_until - time.monotonic(), 0.0)
+
+    def _pause_pod_creations(self, e: ApiException) -> None:
+        Stats.incr("kubernetes_executor.pod_creation.throttled")
+        with self._throttle_lock:
+            delay = self._get_throttle_backoff(e, self._consecutive_throttles)
+            self._consecutive_throttles += 1
+            self._throttled_until = max(self._throttled_until, time.monotonic() + delay)
+        self.log.warning(
+            "Pod creation throttled by the Kubernetes API, pausing pod creations for %.2fs", delay
+        )
+
+    def _get_throttle_backoff(self, e: ApiException, attempt: int) -> float:
+        """Return the pause of the pod creations, honoring the ``Retry-After`` header if set."""
+        retry_after = e.headers.get("Retry-After") if e.headers else None
+        if retry_after:
+            with contextlib.suppress(ValueError):
+                return min(float(retry_after), MAX_POD_CREATION_THROTTLE_BACKOFF)
+        return min(
+            self.kube_config.worker_pods_creation_throttle_backoff * 2**attempt,
+            MAX_POD_CREATION_THROTTLE_BACKOFF,
+        )
+
+    def _make_kube_watcher(self, namespace, shard: int | None = None) -> KubernetesJobWatcher:
         resource_version = ResourceVersion().resource_version.get(namespace, "0")
         watcher = KubernetesJobWatcher(
             watcher_queue=self.watcher_queue,
@@ -360,6 +426,7 @@ class AirflowKubernetesScheduler(LoggingMixin):
             resource_version=resource_version,
             scheduler_job_id=self.scheduler_job_id,
             kube_config=self.kube_config,
+            shard=shard,
         )
         watcher.start()
         return watcher
@@ -375,24 +442,29 @@ class AirflowKubernetesScheduler(LoggingMixin):
         else:
             namespaces_to_watch = [self.kube_config.kube_namespace]
 
+        num_shards = self.kube_config.watcher_shards
         for namespace in namespaces_to_watch:
-            watchers[namespace] = self._make_kube_watcher(namespace)
+            if num_shards <= 1:
+                watchers[namespace] = self._make_kube_watcher(namespace)
+                continue
+            for shard in range(num_shards):
+                watchers[f"{namespace}/shard-{shard}"] = self._make_kube_watcher(namespace, shard)
         return watchers
 
     def _health_check_kube_watchers(self):
-        for namespace, kube_watcher in self.kube_watchers.items():
+        for name, kube_watcher in self.kube_watchers.items():
             if kube_watcher.is_alive():
-                self.log.debug("KubeJobWatcher for namespace %s alive, continuing", namespace)
+                self.log.debug("KubeJobWatcher for namespace %s alive, continuing", name)
             else:
                 self.log.error(
                     (
                         "Error while health checking kube watcher process for namespace %s. "
                         "Process died for unknown reasons"
                     ),
-                    namespace,
+                    name,
                 )
-                ResourceVersion().resource_version[namespace] = "0"
-                self.kube_watchers[namespace] = self._make_kube_watcher(namespace)
+                ResourceVersion().resource_version[kube_watcher.namespace] = "0"
+                self.kube_watchers[name] = self._make_kube_watcher(kube_watcher.namespace, kube_watcher.shard)
 
     def run_next(self, next_job: KubernetesJobType) -> None:
         """Receives the next job to run, builds the pod, and creates it."""
@@ -437,10 +509,43 @@ class AirflowKubernetesScheduler(LoggingMixin):
         self.log.debug("Kubernetes running for command %s", command)
         self.log.debug("Kubernetes launching image %s", pod.spec.containers[0].image)
 
+        if self.kube_config.watcher_shards > 1:
+            pod.metadata.labels[WATCHER_SHARD_LABEL] = get_watcher_shard(
+                pod.metadata.name, self.kube_config.watcher_shards
+            )
+
         # the watcher will monitor pods, so we do not block.
         self.run_pod_async(pod, **self.kube_config.kube_client_request_args)
         self.log.debug("Kubernetes Job created!")
 
+    def run_next_batch(self, next_jobs: list[KubernetesJobType]) -> list[Exception | None]:
+        """
+        Build and create the pods of several jobs concurrently.
+
+        Up to ``[kubernetes_executor] worker_pods_creation_parallelism`` pods are created at the same time.
+
+        :param next_jobs: the jobs to run
+        :return: for every job, in order, the exception raised when creating its pod, or None on success
+        """
+
+        def _run_next(next_job: KubernetesJobType) -> Exception | None:
+            try:
+                self.run_next(next_job)
+            except Exception as e:
+                return e
+            return None
+
+        Stats.gauge("kubernetes_executor.pod_creation_batch.size", len(next_jobs))
+        with Stats.timer("kubernetes_executor.pod_creation_batch.duration"):
+            parallelism = self.kube_config.worker_pods_creation_parallelism
+            if parallelism <= 1 or len(next_jobs) <= 1:
+                return [_run_next(next_job) for next_job in next_jobs]
+            if self._pod_launcher is None:
+                self._pod_launcher = ThreadPoolExecutor(
+                    max_workers=parallelism, thread_name_prefix="kubernetes-pod-launcher"
+                )
+            return list(self._pod_launcher.map(_run_next, next_jobs))
+
     def delete_pod(self, pod_name: str, namespace: str) -> None:
         """Delete Pod from a namespace; does not raise if it does not exist."""
         try:
@@ -510,6 +615,10 @@ class AirflowKubernetesScheduler(LoggingMixin):
 
     def terminate(self) -> None:
         """Terminates the watcher."""
+        if self._pod_launcher is not None:
+            self.log.debug("Shutting down pod launcher...")
+            self._pod_launcher.shutdown()
+            self._pod_launcher = None
         self.log.debug("Terminating kube_watchers...")
         for kube_watcher in self.kube_watchers.values():
             kube_watcher.terminate()
@@ -538,3 +647,241 @@ def get_base_pod_from_template(pod_template_file: str | None, kube_config: Any)
         return PodGenerator.deserialize_model_file(pod_template_file)
     else:
         return PodGenerator.deserialize_model_file(kube_config.pod_template_file)
+
+
+def get_watcher_shard(pod_name: str, num_shards: int) -> str:
+    """
+    Get the shard of the KubernetesJobWatcher watching a pod, used as value of its shard label.
+
+    :param pod_name: name of the pod
+    :param num_shards: number of KubernetesJobWatcher shards per namespace
+    :return: the shard number, as a string
+    """
+    return str(zlib.crc32(pod_name.encode()) % num_shards)
+
+
+def _parse_selector(selector: str | None) -> list[tuple[str, str, str | None]]:
+    """Parse an equality-based label or field selector into a list of ``(key, operator, value)``."""
+    requirements: list[tuple[str, str, str | None]] = []
+    for requirement in (selector or "").split(","):
+        requirement = requirement.strip()
+        if not requirement:
+            continue
+        for operator in ("!=", "==", "="):
+            if operator in requirement:
+                key, value = requirement.split(operator, 1)
+                requirements.append((key.strip(), "!=" if operator == "!=" else "=", value.strip()))
+                break
+        else:
+            if requirement.startswith("!"):
+                requirements.append((requirement[1:], "!", None))
+            else:
+                requirements.append((requirement, "", None))
+    return requirements
+
+
+def _matches(values: dict[str, str], requirements: list[tuple[str, str, str | None]]) -> bool:
+    for key, operator, value in requirements:
+        if operator == "=" and values.get(key) != value:
+            return False
+        if operator == "!=" and values.get(key) == value:
+            return False
+        if operator == "" and key not in values:
+            return False
+        if operator == "!" and key in values:
+            return False
+    return True
+
+
+class KubernetesPodCache(LoggingMixin):
+    """
+    Informer-style local cache of the pods of the Kubernetes executors.
+
+    The pods labelled with ``kubernetes_executor=True`` are listed once per namespace, then kept up to
+    date by watching them from the last seen resource version, with bookmarks, so that the pods only have
+    to be listed again when the resource version expires. Only the metadata and the phase of the pods are
+    kept.
+
+    The executor reads the pods from the cache instead of listing them from the Kubernetes API when
+    adopting pods and cleaning up queued tasks, unless the cache is not synced: before the first list,
+    while relisting after an error, or when the API has not been heard from for ``max_staleness_seconds``.
+
+    :param kube_config: The KubeConfig class generated by airflow that contains all kube metadata
+    :param namespaces: the namespaces to cache the pods of, or ``ALL_NAMESPACES``
+    """
+
+    label_selector = "kubernetes_executor=True"
+    watch_timeout_seconds = 60
+    max_staleness_seconds = 2 * watch_timeout_seconds
+
+    def __init__(self, kube_config: Any, namespaces: list[str]):
+        super().__init__()
+        self.kube_config = kube_config
+        self.namespaces = namespaces
+        # (namespace, pod name) -> pod
+        self._pods: dict[tuple[str, str], k8s.V1Pod] = {}
+        self._lock = threading.Lock()
+        self._synced = {namespace: threading.Event() for namespace in namespaces}
+        # namespace -> last time (time.monotonic) the pods were listed or watched without error
+        self._last_contact = {namespace: 0.0 for namespace in namespaces}
+        self._stopped = threading.Event()
+        self._threads: list[threading.Thread] = []
+
+    def start(self) -> None:
+        """Start listing and watching the pods, in a background thread per namespace."""
+        for namespace in self.namespaces:
+            thread = threading.Thread(
+                target=self._run, args=(namespace,), name=f"kubernetes-pod-cache-{namespace}", daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self) -> None:
+        """Stop watching the pods; the watches are stopped after their next event or timeout."""
+        self._stopped.set()
+
+    @property
+    def has_synced(self) -> bool:
+        """Whether the pods of all the namespaces are listed and watched without error nor delay."""
+        now = time.monotonic()
+        return all(
+            synced.is_set() and now - self._last_contact[namespace] <= self.max_staleness_seconds
+            for namespace, synced in self._synced.items()
+        )
+
+    def wait_for_sync(self, timeout: float | None = None) -> bool:
+        """Wait until the pods of all the namespaces have been listed, return whether they have been."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for synced in self._synced.values():
+            if not synced.wait(None if deadline is None else max(deadline - time.monotonic(), 0)):
+                return False
+        return True
+
+    def list_pods(
+        self,
+        label_selector: str | None = None,
+        field_selector: str | None = None,
+        namespace: str | None = None,
+    ) -> list[k8s.V1Pod]:
+        """
+        List the cached pods matching equality-based label and field selectors.
+
+        Supported fields are ``metadata.name``, ``metadata.namespace`` and ``status.phase``.
+
+        :param label_selector: label selector, as passed to the Kubernetes API
+        :param field_selector: field selector, as passed to the Kubernetes API
+        :param namespace: only list the pods of this namespace
+        :return: the matching pods, with only their metadata and phase set
+        """
+        label_requirements = _parse_selector(label_selector)
+        field_requirements = _parse_selector(field_selector)
+        for field, _, _ in field_requirements:
+            if field not in ("metadata.name", "metadata.namespace", "status.phase"):
+                raise ValueError(f"Field selector on {field} is not supported by the pod cache")
+        with self._lock:
+            pods = list(self._pods.values())
+        return [
+            pod
+            for pod in pods
+            if (namespace is None or pod.metadata.namespace == namespace)
+            and _matches(pod.metadata.labels or {}, label_requirements)
+            and _matches(
+                {
+                    "metadata.name": pod.metadata.name,
+                    "metadata.namespace": pod.metadata.namespace,
+                    "status.phase": pod.status.phase,
+                },
+                field_requirements,
+            )
+        ]
+
+    def _run(self, namespace: str) -> None:
+        kube_client: client.CoreV1Api = get_kube_client()
+        resource_version: str | None = None
+        while not self._stopped.is_set():
+            try:
+                if resource_version is None:
+                    resource_version = self._list(kube_client, namespace)
+                    self._last_contact[namespace] = time.monotonic()
+                    self._synced[namespace].set()
+                resource_version = self._watch(kube_client, namespace, resource_version)
+                if resource_version is None:
+                    self._synced[namespace].clear()
+                else:
+                    # The watch ended without error after at most watch_timeout_seconds
+                    self._last_contact[namespace] = time.monotonic()
+            except Exception as e:
+                # Events may have been missed, the pods are listed from the API until the cache is relisted
+                self._synced[namespace].clear()
+                resource_version = None
+                if isinstance(e, ApiException) and str(e.status) == "410":
+                    self.log.info("Pod cache resource version for namespace %s expired, relisting", namespace)
+                else:
+                    self.log.exception("Error while watching the pods of namespace %s", namespace)
+                    time.sleep(1)
+
+    def _request_kwargs(self) -> dict[str, Any]:
+        kwargs = {"label_selector": self.label_selector}
+        kwargs.update(self.kube_config.kube_client_request_args or {})
+        return kwargs
+
+    def _list(self, kube_client: client.CoreV1Api, namespace: str) -> str:
+        if namespace == ALL_NAMESPACES:
+            pod_list = kube_client.list_pod_for_all_namespaces(**self._request_kwargs())
+        else:
+            pod_list = kube_client.list_namespaced_pod(namespace, **self._request_kwargs())
+        pods = {(pod.metadata.namespace, pod.metadata.name): self._compact(pod) for pod in pod_list.items}
+        with self._lock:
+            for key in list(self._pods):
+                if namespace == ALL_NAMESPACES or key[0] == namespace:
+                    del self._pods[key]
+            self._pods.update(pods)
+        self.log.debug("Listed %d pods in namespace %s", len(pods), namespace)
+        return pod_list.metadata.resource_version
+
+    def _watch(self, kube_client: client.CoreV1Api, namespace: str, resource_version: str) -> str | None:
+        """Apply the pod events to the cache, return the last seen resource version, None to relist."""
+        kwargs = {
+            **self._request_kwargs(),
+            "resource_version": resource_version,
+            "allow_watch_bookmarks": True,
+            "timeout_seconds": self.watch_timeout_seconds,
+        }
+        watcher = watch.Watch()
+        if namespace == ALL_NAMESPACES:
+            events = watcher.stream(kube_client.list_pod_for_all_namespaces, **kwargs)
+        else:
+            events = watcher.stream(kube_client.list_namespaced_pod, namespace, **kwargs)
+        for event in events:
+            if event["type"] == "ERROR":
+                if event["raw_object"].get("code") == 410:
+                    self.log.info("Pod cache resource version for namespace %s expired, relisting", namespace)
+                    return None
+                raise AirflowException(f"Kubernetes failure while watching pods: {event['raw_object']}")
+            pod = event["object"]
+            resource_version = pod.metadata.resource_version
+            if event["type"] == "BOOKMARK":
+                continue
+            key = (pod.metadata.namespace, pod.metadata.name)
+            with self._lock:
+                if event["type"] == "DELETED":
+                    self._pods.pop(key, None)
+                else:
+                    self._pods[key] = self._compact(pod)
+            if self._stopped.is_set():
+                watcher.stop()
+        return resource_version
+
+    @staticmethod
+    def _compact(pod: k8s.V1Pod) -> k8s.V1Pod:
+        return client.V1Pod(
+            metadata=client.V1ObjectMeta(
+                name=pod.metadata.name,
+                namespace=pod.metadata.namespace,
+                labels=pod.metadata.labels,
+                annotations=pod.metadata.annotations,
+                resource_version=pod.metadata.resource_version,
+                deletion_timestamp=pod.metadata.deletion_timestamp,
+            ),
+            status=client.V1PodStatus(phase=pod.status.phase if pod.status else None),
+        )
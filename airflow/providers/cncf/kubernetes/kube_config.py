@@ -49,6 +49,17 @@ class KubeConfig:
         self.worker_pods_creation_batch_size = conf.getint(
             self.kubernetes_section, "worker_pods_creation_batch_size"
         )
+        self.worker_pods_creation_parallelism = conf.getint(
+            self.kubernetes_section, "worker_pods_creation_parallelism", fallback=1
+        )
+        self.worker_pods_creation_throttle_retries = conf.getint(
+            self.kubernetes_section, "worker_pods_creation_throttle_retries", fallback=3
+        )
+        self.worker_pods_creation_throttle_backoff = conf.getfloat(
+            self.kubernetes_section, "worker_pods_creation_throttle_backoff", fallback=1.0
+        )
+        self.watcher_shards = conf.getint(self.kubernetes_section, "watcher_shards", fallback=1)
+        self.enable_pod_cache = conf.getboolean(self.kubernetes_section, "enable_pod_cache", fallback=False)
         self.worker_container_repository = conf.get(self.kubernetes_section, "worker_container_repository")
         self.worker_container_tag = conf.get(self.kubernetes_section, "worker_container_tag")
         if self.worker_container_repository and self.worker_container_tag:
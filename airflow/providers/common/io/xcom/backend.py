@@ -16,9 +16,12 @@
 # under the License.
 from __future__ import annotations
 
+import bisect
+import collections.abc
+import itertools
 import json
 import uuid
-from typing import TYPE_CHECKING, Any, TypeVar
+from typing import TYPE_CHECKING, Any, Iterator, TypeVar
 from urllib.parse import urlsplit
 
 import fsspec.utils
@@ -37,6 +40,9 @@ T = TypeVar("T")
 
 SECTION = "common.io"
 
+# Key of the reference to a chunked value stored in the database
+CHUNKS_KEY = "__xcom_chunks__"
+
 
 def _is_relative_to(o: ObjectStoragePath, other: ObjectStoragePath) -> bool:
     """Return whether or not this path is relative to the other path.
@@ -65,6 +71,83 @@ def _get_compression_suffix(compression: str) -> str:
     raise ValueError(f"Compression {compression} is not supported. Make sure it is installed.")
 
 
+class ChunkedXComValue(collections.abc.Sequence):
+    """Lazy, read-only sequence over a list XCom value stored in chunks in object storage.
+
+    The chunks are only read when the items they hold are accessed, and only the last chunk read is kept
+    in memory, so that large values can be iterated over, indexed or sliced without loading them entirely.
+
+    This is not a ``list``: it cannot be modified nor passed to ``json.dumps``, and ``isinstance(value,
+    list)`` is false. Use ``list(value)`` to load it entirely when a list is needed.
+
+    :param reference: reference to the chunks of the value, as stored in the database
+    """
+
+    def __init__(self, reference: dict[str, Any]) -> None:
+        self.reference = reference
+        self._chunk_index: int | None = None
+        self._chunk: list[Any] = []
+
+    @property
+    def chunks(self) -> list[str]:
+        """Paths of the chunks of the value."""
+        return self.reference["chunks"]
+
+    def __repr__(self) -> str:
+        """Show the length of the value without reading it."""
+        return f"ChunkedXComValue([{len(self)} items in {len(self.chunks)} chunks])"
+
+    def __len__(self) -> int:
+        """Return the number of items, without reading the chunks."""
+        return self.reference["length"]
+
+    def __eq__(self, other: Any) -> bool:
+        """Compare the items with those of a list or another chunked value."""
+        if isinstance(other, (list, ChunkedXComValue)):
+            z = itertools.zip_longest(iter(self), iter(other), fillvalue=object())
+            return all(x == y for x, y in z)
+        return NotImplemented
+
+    def __getstate__(self) -> Any:
+        """Pickle the reference to the chunks only."""
+        return self.reference
+
+    def __setstate__(self, state: Any) -> None:
+        """Restore the value from the reference to its chunks."""
+        self.__init__(state)  # type: ignore[misc]
+
+    @staticmethod
+    def _read_chunk(path: str) -> list[Any]:
+        with ObjectStoragePath(path).open(mode="rb", compression="infer") as f:
+            return json.load(f, cls=XComDecoder)
+
+    def _get_chunk(self, index: int) -> list[Any]:
+        if index != self._chunk_index:
+            self._chunk = self._read_chunk(self.chunks[index])
+            self._chunk_index = index
+        return self._chunk
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over the items, reading one chunk at a time."""
+        for path in self.chunks:
+            yield from self._read_chunk(path)
+
+    def __getitem__(self, key):
+        """Return an item or a list of items, only reading the chunks holding them."""
+        if isinstance(key, slice):
+            return [self[i] for i in range(*key.indices(len(self)))]
+        if not isinstance(key, int):
+            raise TypeError(f"ChunkedXComValue indices must be integers or slices, not {type(key).__name__}")
+        if key < 0:
+            key += len(self)
+        if not 0 <= key < len(self):
+            raise IndexError(key)
+        # Index of the first item of every chunk
+        offsets = self.reference["offsets"]
+        index = bisect.bisect_right(offsets, key) - 1
+        return self._get_chunk(index)[key - offsets[index]]
+
+
 class XComObjectStoreBackend(BaseXCom):
     """XCom backend that stores data in an object store or database depending on the size of the data.
 
@@ -112,9 +195,6 @@ class XComObjectStoreBackend(BaseXCom):
         run_id: str | None = None,
         map_index: int | None = None,
     ) -> bytes | str:
-        # we will always serialize ourselves and not by BaseXCom as the deserialize method
-        # from BaseXCom accepts only XCom objects and not the value directly
-        s_val = json.dumps(value, cls=XComEncoder).encode("utf-8")
         path = conf.get(SECTION, "xcom_objectstore_path", fallback="")
         compression = conf.get(SECTION, "xcom_objectstore_compression", fallback=None)
 
@@ -125,6 +205,26 @@ class XComObjectStoreBackend(BaseXCom):
             compression = None
 
         threshold = conf.getint(SECTION, "xcom_objectstore_threshold", fallback=-1)
+        chunk_size = conf.getint(SECTION, "xcom_objectstore_chunk_size", fallback=0)
+
+        # Only lists are chunked, tuples and other sequences would come back as a ChunkedXComValue too
+        if path and threshold > -1 and chunk_size > 0 and isinstance(value, (list, ChunkedXComValue)):
+            reference = XComObjectStoreBackend._write_chunks(
+                value,
+                ObjectStoragePath(path) / f"{dag_id}/{run_id}/{task_id}/{str(uuid.uuid4())}",
+                threshold=threshold,
+                chunk_size=chunk_size,
+                suffix=suffix,
+                compression=compression,
+            )
+            if reference is not None:
+                return BaseXCom.serialize_value(reference)
+
+        # we will always serialize ourselves and not by BaseXCom as the deserialize method
+        # from BaseXCom accepts only XCom objects and not the value directly
+        s_val = json.dumps(
+            list(value) if isinstance(value, ChunkedXComValue) else value, cls=XComEncoder
+        ).encode("utf-8")
 
         if path and -1 < threshold < len(s_val):
             # safeguard against collisions
@@ -143,17 +243,85 @@ class XComObjectStoreBackend(BaseXCom):
         else:
             return s_val
 
+    @staticmethod
+    def _write_chunks(
+        value: collections.abc.Sequence,
+        directory: ObjectStoragePath,
+        *,
+        threshold: int,
+        chunk_size: int,
+        suffix: str,
+        compression: str | None,
+    ) -> dict[str, Any] | None:
+        """Write a sequence to object storage in chunks of about ``chunk_size`` bytes.
+
+        The items are serialized one by one, nothing is written until the size of the serialized items
+        exceeds the threshold.
+
+        :return: the reference to the chunks, or None if the value is smaller than the threshold
+        """
+        chunks: list[str] = []
+        offsets: list[int] = []
+        # Serialized items not written yet
+        buffer: list[bytes] = []
+        buffer_size = 0
+        total_size = 0
+        length = 0
+        written = 0
+
+        def write_chunk(items: list[bytes]) -> None:
+            nonlocal written
+            if not chunks:
+                directory.mkdir(parents=True, exist_ok=True)
+            p = directory / f"{len(chunks)}{suffix}"
+            with p.open(mode="wb", compression=compression) as f:
+                f.write(b"[" + b",".join(items) + b"]")
+            chunks.append(str(p))
+            offsets.append(written)
+            written += len(items)
+
+        for item in value:
+            s_item = json.dumps(item, cls=XComEncoder).encode("utf-8")
+            buffer.append(s_item)
+            buffer_size += len(s_item)
+            total_size += len(s_item)
+            length += 1
+            if total_size <= threshold or buffer_size < chunk_size:
+                continue
+            # Write the full chunks of the buffer, several at once when the threshold is first exceeded
+            start = size = 0
+            for i, s_item in enumerate(buffer):
+                size += len(s_item)
+                if size >= chunk_size:
+                    write_chunk(buffer[start : i + 1])
+                    start, size = i + 1, 0
+            buffer, buffer_size = buffer[start:], size
+        if total_size <= threshold:
+            return None
+        if buffer or not chunks:
+            write_chunk(buffer)
+        return {CHUNKS_KEY: 1, "length": length, "offsets": offsets, "chunks": chunks}
+
     @staticmethod
     def deserialize_value(
         result: XCom,
     ) -> Any:
         """Deserializes the value from the database or object storage.
 
-        Compression is inferred from the file extension.
+        Compression is inferred from the file extension. Values stored in chunks are returned as a lazy
+        :class:`ChunkedXComValue`.
         """
         data = BaseXCom.deserialize_value(result)
         path = conf.get(SECTION, "xcom_objectstore_path", fallback="")
 
+        if isinstance(data, dict) and CHUNKS_KEY in data:
+            try:
+                for chunk in data["chunks"]:
+                    XComObjectStoreBackend._get_key(chunk)
+            except (TypeError, ValueError):
+                return data
+            return ChunkedXComValue(data)
+
         try:
             p = ObjectStoragePath(path) / XComObjectStoreBackend._get_key(data)
             return json.load(p.open(mode="rb", compression="infer"), cls=XComDecoder)
@@ -165,6 +333,15 @@ class XComObjectStoreBackend(BaseXCom):
     @staticmethod
     def purge(xcom: XCom, session: Session) -> None:
         path = conf.get(SECTION, "xcom_objectstore_path", fallback="")
+        if isinstance(xcom.value, dict) and CHUNKS_KEY in xcom.value:
+            for chunk in xcom.value["chunks"]:
+                try:
+                    p = ObjectStoragePath(path) / XComObjectStoreBackend._get_key(chunk)
+                    p.unlink(missing_ok=True)
+                except TypeError:
+                    pass
+                except ValueError:
+                    pass
         if isinstance(xcom.value, str):
             try:
                 p = ObjectStoragePath(path) / XComObjectStoreBackend._get_key(xcom.value)
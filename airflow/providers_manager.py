@@ -18,6 +18,7 @@
 """Manages all providers."""
 from __future__ import annotations
 
+import contextlib
 import fnmatch
 import functools
 import inspect
@@ -30,13 +31,14 @@ import warnings
 from dataclasses import dataclass
 from functools import wraps
 from time import perf_counter
-from typing import TYPE_CHECKING, Any, Callable, MutableMapping, NamedTuple, TypeVar, cast
+from typing import TYPE_CHECKING, Any, Callable, Iterator, MutableMapping, NamedTuple, TypeVar, cast
 
 from packaging.utils import canonicalize_name
 
 from airflow.exceptions import AirflowOptionalProviderFeatureException
 from airflow.hooks.filesystem import FSHook
 from airflow.hooks.package_index import PackageIndexHook
+from airflow.task import startup_profiler
 from airflow.utils import yaml
 from airflow.utils.entry_points import entry_points_with_dist
 from airflow.utils.log.logging_mixin import LoggingMixin
@@ -54,6 +56,9 @@ MIN_PROVIDER_VERSIONS = {
     "apache-airflow-providers-celery": "2.1.0",
 }
 
+# Version of the format of the providers index, part of its key so that indexes in other formats are ignored
+PROVIDERS_INDEX_FORMAT_VERSION = 1
+
 
 def _ensure_prefix_for_placeholders(field_behaviors: dict[str, Any], conn_type: str):
     """
@@ -167,6 +172,28 @@ def _create_customized_form_field_behaviours_schema_validator():
     return validator
 
 
+def _get_providers_index_path() -> str | None:
+    """Return the path of the providers index, None if the providers index is disabled."""
+    from airflow.configuration import conf
+
+    path = conf.get("core", "providers_index_file", fallback="")
+    return os.path.expanduser(path) if path else None
+
+
+def _find_provider_yaml_files(path: str) -> Iterator[tuple[str, str]]:
+    """
+    Find the provider.yaml files in the directory specified.
+
+    :param path: path where to look for provider.yaml files
+    :return: generator of the paths of the provider.yaml files and the names of their packages
+    """
+    for folder, subdirs, files in os.walk(path, topdown=True):
+        for filename in fnmatch.filter(files, "provider.yaml"):
+            package_name = "apache-airflow-providers" + folder[len(path) :].replace(os.sep, "-")
+            yield os.path.join(folder, filename), package_name
+            subdirs[:] = []
+
+
 def _check_builtin_provider_prefix(provider_package: str, class_name: str) -> bool:
     if provider_package.startswith("apache-airflow"):
         provider_path = provider_package[len("apache-") :].replace("-", ".")
@@ -437,14 +464,19 @@ class ProvidersManager(LoggingMixin, metaclass=Singleton):
         self._api_auth_backend_module_names: set[str] = set()
         self._trigger_info_set: set[TriggerInfo] = set()
         self._notification_info_set: set[NotificationInfo] = set()
-        self._provider_schema_validator = _create_provider_info_schema_validator()
-        self._customized_form_fields_schema_validator = (
-            _create_customized_form_field_behaviours_schema_validator()
-        )
         # Set of plugins contained in providers
         self._plugins_set: set[PluginInfo] = set()
         self._init_airflow_core_hooks()
 
+    @functools.cached_property
+    def _provider_schema_validator(self):
+        # Only needed when providers are not loaded from the providers index
+        return _create_provider_info_schema_validator()
+
+    @functools.cached_property
+    def _customized_form_fields_schema_validator(self):
+        return _create_customized_form_field_behaviours_schema_validator()
+
     def _init_airflow_core_hooks(self):
         """Initialize the hooks dict with default hooks from Airflow core."""
         core_dummy_hooks = {
@@ -463,16 +495,14 @@ class ProvidersManager(LoggingMixin, metaclass=Singleton):
         for cls in [FSHook, PackageIndexHook]:
             package_name = cls.__module__
             hook_class_name = f"{cls.__module__}.{cls.__name__}"
-            hook_info = self._import_hook(
-                connection_type=None,
-                provider_info=None,
-                hook_class_name=hook_class_name,
-                package_name=package_name,
-            )
-            self._hook_provider_dict[hook_info.connection_type] = HookClassProvider(
+            self._hook_provider_dict[cls.conn_type] = HookClassProvider(
                 hook_class_name=hook_class_name, package_name=package_name
             )
-            self._hooks_lazy_dict[hook_info.connection_type] = hook_info
+            # Imported when used, like the hooks of the providers, as their connection form widgets import
+            # Flask App Builder
+            self._hooks_lazy_dict[cls.conn_type] = functools.partial(
+                self._import_hook, connection_type=cls.conn_type, provider_info=None
+            )
 
     @provider_info_cache("list")
     def initialize_providers_list(self):
@@ -481,11 +511,107 @@ class ProvidersManager(LoggingMixin, metaclass=Singleton):
         # Development purpose. In production provider.yaml files are not present in the 'airflow" directory
         # So there is no risk we are going to override package provider accidentally. This can only happen
         # in case of local development
-        self._discover_all_airflow_builtin_providers_from_local_sources()
-        self._discover_all_providers_from_packages()
+        with startup_profiler.startup_phase("providers_discovery"):
+            self._discover_providers()
+
+    def rebuild_providers_index(self) -> str | None:
+        """
+        Discover the providers again without using the providers index, then write a new index.
+
+        :return: the path of the providers index, None if ``[core] providers_index_file`` is not set
+        """
+        self._provider_dict = {}
+        self._discover_providers(use_index=False)
+        self._initialized_cache["list"] = True
+        return _get_providers_index_path()
+
+    def _discover_providers(self, use_index: bool = True) -> None:
+        """
+        Discover the providers, or load them from the providers index if the providers are unchanged.
+
+        :param use_index: whether to load the providers from the index. The index is written in any case
+            if the providers are discovered.
+        """
+        index_path = _get_providers_index_path()
+        index_key = self._get_providers_index_key() if index_path else []
+        if index_path and use_index and self._load_providers_index(index_path, index_key):
+            log.debug("Loaded %d providers from the providers index %s", len(self._provider_dict), index_path)
+        else:
+            self._discover_all_airflow_builtin_providers_from_local_sources()
+            self._discover_all_providers_from_packages()
+            if index_path:
+                self._write_providers_index(index_path, index_key)
         self._verify_all_providers_all_compatible()
         self._provider_dict = dict(sorted(self._provider_dict.items()))
 
+    def _get_providers_index_key(self) -> list:
+        """
+        Return the key of the providers index for the providers currently installed.
+
+        The key identifies the provider.yaml files in the Airflow sources, by modification time and size,
+        and the provider distributions installed, by name, version and entry point.
+        """
+        from airflow import __version__ as airflow_version
+
+        key: list = [PROVIDERS_INDEX_FORMAT_VERSION, airflow_version]
+        for path in self._get_local_providers_paths():
+            for provider_yaml_path, package_name in _find_provider_yaml_files(path):
+                try:
+                    stat = os.stat(provider_yaml_path)
+                except OSError:
+                    continue
+                key.append(["source", package_name, provider_yaml_path, stat.st_mtime_ns, stat.st_size])
+        for entry_point, dist in entry_points_with_dist("apache_airflow_provider"):
+            key.append(["package", dist.metadata["name"], dist.version, entry_point.value])
+        return key
+
+    def _load_providers_index(self, path: str, key: list) -> bool:
+        """
+        Load the providers from the providers index if the index was written for the same providers.
+
+        :return: whether the providers were loaded
+        """
+        try:
+            with open(path) as index_file:
+                index = json.load(index_file)
+            if index["key"] != key:
+                log.debug("The providers changed since the providers index %s was written", path)
+                return False
+            providers = {
+                package_name: ProviderInfo(info["version"], info["data"], info["package_or_source"])
+                for package_name, info in index["providers"].items()
+            }
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            log.warning("Error when loading the providers index %s, discovering providers: %s", path, e)
+            return False
+        self._provider_dict.update(providers)
+        return True
+
+    def _write_providers_index(self, path: str, key: list) -> None:
+        index = {
+            "key": key,
+            "providers": {
+                package_name: {
+                    "version": info.version,
+                    "data": info.data,
+                    "package_or_source": info.package_or_source,
+                }
+                for package_name, info in self._provider_dict.items()
+            },
+        }
+        # Written to a temporary file first, so that other processes never read a partially written index
+        temporary_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(temporary_path, "w") as index_file:
+                json.dump(index, index_file)
+            os.replace(temporary_path, path)
+        except Exception as e:
+            log.warning("Error when writing the providers index %s: %s", path, e)
+            with contextlib.suppress(OSError):
+                os.remove(temporary_path)
+
     def _verify_all_providers_all_compatible(self):
         from packaging import version as packaging_version
 
@@ -641,23 +767,29 @@ class ProvidersManager(LoggingMixin, metaclass=Singleton):
         in case you have both sources and packages installed, the providers will be loaded from
         the "airflow" sources rather than from the packages.
         """
+        for path in self._get_local_providers_paths():
+            try:
+                self._add_provider_info_from_local_source_files_on_path(path)
+            except Exception as e:
+                log.warning("Error when loading 'provider.yaml' files from %s airflow sources: %s", path, e)
+
+    @staticmethod
+    def _get_local_providers_paths() -> list[str]:
+        """Return the paths of the ``airflow.providers`` package, where the providers sources are."""
         try:
             import airflow.providers
         except ImportError:
             log.info("You have no providers installed.")
-            return
+            return []
 
-        seen = set()
+        paths: list[str] = []
         for path in airflow.providers.__path__:  # type: ignore[attr-defined]
-            try:
-                # The same path can appear in the __path__ twice, under non-normalized paths (ie.
-                # /path/to/repo/airflow/providers and /path/to/repo/./airflow/providers)
-                path = os.path.realpath(path)
-                if path not in seen:
-                    seen.add(path)
-                    self._add_provider_info_from_local_source_files_on_path(path)
-            except Exception as e:
-                log.warning("Error when loading 'provider.yaml' files from %s airflow sources: %s", path, e)
+            # The same path can appear in the __path__ twice, under non-normalized paths (ie.
+            # /path/to/repo/airflow/providers and /path/to/repo/./airflow/providers)
+            path = os.path.realpath(path)
+            if path not in paths:
+                paths.append(path)
+        return paths
 
     def _add_provider_info_from_local_source_files_on_path(self, path) -> None:
         """
@@ -665,17 +797,15 @@ class ProvidersManager(LoggingMixin, metaclass=Singleton):
 
         :param path: path where to look for provider.yaml files
         """
-        root_path = path
-        for folder, subdirs, files in os.walk(path, topdown=True):
-            for filename in fnmatch.filter(files, "provider.yaml"):
-                try:
-                    package_name = "apache-airflow-providers" + folder[len(root_path) :].replace(os.sep, "-")
-                    self._add_provider_info_from_local_source_file(
-                        os.path.join(folder, filename), package_name
-                    )
-                    subdirs[:] = []
-                except Exception as e:
-                    log.warning("Error when loading 'provider.yaml' file from %s %e", folder, e)
+        for provider_yaml_path, package_name in _find_provider_yaml_files(path):
+            try:
+                self._add_provider_info_from_local_source_file(provider_yaml_path, package_name)
+            except Exception as e:
+                log.warning(
+                    "Error when loading 'provider.yaml' file from %s %e",
+                    os.path.dirname(provider_yaml_path),
+                    e,
+                )
 
     def _add_provider_info_from_local_source_file(self, path, package_name) -> None:
         """
@@ -14,3 +14,56 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
+"""
+Pydantic models of the ORM models, used to send them through the Internal API.
+
+Building the models with Pydantic takes long, so they are only imported when first used, which only the
+Internal API does.
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+__all__ = [
+    "DagModelPydantic",
+    "DagRunPydantic",
+    "DatasetEventPydantic",
+    "DatasetPydantic",
+    "JobPydantic",
+    "LogTemplatePydantic",
+    "TaskInstancePydantic",
+]
+
+
+def __getattr__(name):
+    # PEP-562: Lazy loaded attributes on python modules
+    path = __lazy_imports.get(name)
+    if not path:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from airflow.utils.module_loading import import_string
+
+    val = import_string(f"{path}.{name}")
+    # Store for next time
+    globals()[name] = val
+    return val
+
+
+__lazy_imports = {
+    "DagModelPydantic": "airflow.serialization.pydantic.dag",
+    "DagRunPydantic": "airflow.serialization.pydantic.dag_run",
+    "DatasetEventPydantic": "airflow.serialization.pydantic.dataset",
+    "DatasetPydantic": "airflow.serialization.pydantic.dataset",
+    "JobPydantic": "airflow.serialization.pydantic.job",
+    "LogTemplatePydantic": "airflow.serialization.pydantic.tasklog",
+    "TaskInstancePydantic": "airflow.serialization.pydantic.taskinstance",
+}
+
+if TYPE_CHECKING:
+    # Type checkers do not follow the lazy imports
+    from airflow.serialization.pydantic.dag import DagModelPydantic
+    from airflow.serialization.pydantic.dag_run import DagRunPydantic
+    from airflow.serialization.pydantic.dataset import DatasetEventPydantic, DatasetPydantic
+    from airflow.serialization.pydantic.job import JobPydantic
+    from airflow.serialization.pydantic.taskinstance import TaskInstancePydantic
+    from airflow.serialization.pydantic.tasklog import LogTemplatePydantic
@@ -53,12 +53,6 @@ from airflow.providers_manager import ProvidersManager
 from airflow.serialization.enums import DagAttributeTypes as DAT, Encoding
 from airflow.serialization.helpers import serialize_template_field
 from airflow.serialization.json_schema import load_dag_schema
-from airflow.serialization.pydantic.dag import DagModelPydantic
-from airflow.serialization.pydantic.dag_run import DagRunPydantic
-from airflow.serialization.pydantic.dataset import DatasetPydantic
-from airflow.serialization.pydantic.job import JobPydantic
-from airflow.serialization.pydantic.taskinstance import TaskInstancePydantic
-from airflow.serialization.pydantic.tasklog import LogTemplatePydantic
 from airflow.settings import _ENABLE_AIP_44, DAGS_FOLDER, json
 from airflow.utils.code_utils import get_python_source
 from airflow.utils.docs import get_docs_url
@@ -300,21 +294,38 @@ class _ExpandInputRef(NamedTuple):
         return create_expand_input(self.key, value)
 
 
-_orm_to_model = {
-    Job: JobPydantic,
-    TaskInstance: TaskInstancePydantic,
-    DagRun: DagRunPydantic,
-    DagModel: DagModelPydantic,
-    LogTemplate: LogTemplatePydantic,
-}
-_type_to_class = {
-    DAT.BASE_JOB: [JobPydantic, Job],
-    DAT.TASK_INSTANCE: [TaskInstancePydantic, TaskInstance],
-    DAT.DAG_RUN: [DagRunPydantic, DagRun],
-    DAT.DAG_MODEL: [DagModelPydantic, DagModel],
-    DAT.LOG_TEMPLATE: [LogTemplatePydantic, LogTemplate],
-}
-_class_to_type = {cls_: type_ for type_, classes in _type_to_class.items() for cls_ in classes}
+@cache
+def _get_pydantic_mappings() -> tuple[dict[type, Any], dict[type, DAT]]:
+    """
+    Return the Pydantic models of the ORM classes, and the types of the ORM classes and of their models.
+
+    The Pydantic models are only imported when the Internal API serializes objects, as building them takes
+    long.
+    """
+    from airflow.serialization.pydantic import (
+        DagModelPydantic,
+        DagRunPydantic,
+        JobPydantic,
+        LogTemplatePydantic,
+        TaskInstancePydantic,
+    )
+
+    orm_to_model: dict[type, Any] = {
+        Job: JobPydantic,
+        TaskInstance: TaskInstancePydantic,
+        DagRun: DagRunPydantic,
+        DagModel: DagModelPydantic,
+        LogTemplate: LogTemplatePydantic,
+    }
+    type_to_class: dict[DAT, list[type]] = {
+        DAT.BASE_JOB: [JobPydantic, Job],
+        DAT.TASK_INSTANCE: [TaskInstancePydantic, TaskInstance],
+        DAT.DAG_RUN: [DagRunPydantic, DagRun],
+        DAT.DAG_MODEL: [DagModelPydantic, DagModel],
+        DAT.LOG_TEMPLATE: [LogTemplatePydantic, LogTemplate],
+    }
+    class_to_type = {cls_: type_ for type_, classes in type_to_class.items() for cls_ in classes}
+    return orm_to_model, class_to_type
 
 
 class BaseSerialization:
@@ -545,10 +556,11 @@ class BaseSerialization:
             def _pydantic_model_dump(model_cls: type[BaseModel], var: Any) -> dict[str, Any]:
                 return model_cls.model_validate(var).model_dump(mode="json")  # type: ignore[attr-defined]
 
-            if var.__class__ in _class_to_type:
-                pyd_mod = _orm_to_model.get(var.__class__, var)
+            orm_to_model, class_to_type = _get_pydantic_mappings()
+            if var.__class__ in class_to_type:
+                pyd_mod = orm_to_model.get(var.__class__, var)
                 mod = _pydantic_model_dump(pyd_mod, var)
-                type_ = _class_to_type[var.__class__]
+                type_ = class_to_type[var.__class__]
                 return cls._encode(mod, type_=type_)
             else:
                 return cls.default_serialization(strict, var)
@@ -625,6 +637,15 @@ class BaseSerialization:
         elif type_ == DAT.CONNECTION:
             return Connection(**var)
         elif use_pydantic_models and _ENABLE_AIP_44:
+            from airflow.serialization.pydantic import (
+                DagModelPydantic,
+                DagRunPydantic,
+                DatasetPydantic,
+                JobPydantic,
+                LogTemplatePydantic,
+                TaskInstancePydantic,
+            )
+
             if type_ == DAT.BASE_JOB:
                 return JobPydantic.parse_obj(var)
             elif type_ == DAT.TASK_INSTANCE:
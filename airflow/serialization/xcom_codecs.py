@@ -0,0 +1,256 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Binary codecs for XCom values, used instead of JSON for the values they support.
+
+The codecs to use are set in ``[core] xcom_codecs``, in order of preference: every value is encoded with the
+first codec supporting it, or as JSON if none does. Encoded values start with a header naming their codec,
+so that they are decoded with the right codec regardless of the current configuration.
+"""
+from __future__ import annotations
+
+import functools
+import logging
+from typing import Any
+
+from airflow.exceptions import AirflowConfigException
+from airflow.serialization.serializers import pandas as pandas_serializer
+from airflow.utils.module_loading import qualname
+
+log = logging.getLogger(__name__)
+
+# Never the first byte of a JSON document nor of a pickle (protocol 2 and above)
+HEADER_MAGIC = b"\x00XC"
+
+
+class XComCodec:
+    """
+    Base class of the XCom codecs.
+
+    :meta private:
+    """
+
+    #: Name of the codec, in ``[core] xcom_codecs`` and in the header of the encoded values
+    name: str
+    #: Modules needed by the codec
+    required_modules: tuple[str, ...] = ()
+
+    def check_available(self) -> None:
+        """Raise an AirflowConfigException if the modules needed by the codec are not installed."""
+        import importlib.util
+
+        missing = [module for module in self.required_modules if importlib.util.find_spec(module) is None]
+        if missing:
+            raise AirflowConfigException(
+                f"The {self.name} XCom codec set in [core] xcom_codecs needs the "
+                f"{', '.join(missing)} package(s), which are not installed"
+            )
+
+    def can_encode(self, value: Any) -> bool:
+        """Whether the codec can encode the value."""
+        raise NotImplementedError()
+
+    def encode(self, value: Any) -> bytes:
+        """Encode a value."""
+        raise NotImplementedError()
+
+    def decode(self, data: bytes | memoryview, orm: bool = False) -> Any:
+        """
+        Decode a value.
+
+        :param data: the encoded value, without the header
+        :param orm: only return a readable representation of the value, e.g. for the web UI
+        """
+        raise NotImplementedError()
+
+
+class MsgpackZstdCodec(XComCodec):
+    """
+    Encode values with msgpack and compress them with zstd.
+
+    Objects other than the built-in types are reduced by ``serde``, as for JSON, so any value supported by the
+    JSON encoding is supported, and numbers are stored in binary rather than as text.
+    """
+
+    name = "msgpack_zstd"
+    required_modules = ("msgpack", "zstandard")
+    compression_level = 3
+
+    def can_encode(self, value: Any) -> bool:
+        return True
+
+    def encode(self, value: Any) -> bytes:
+        import msgpack
+        import zstandard
+
+        from airflow.serialization.serde import CLASSNAME, SCHEMA_ID, serialize
+
+        # Same as XComEncoder: built-in types are packed natively and only other objects go through serde
+        if isinstance(value, dict) and (CLASSNAME in value or SCHEMA_ID in value):
+            raise AttributeError(f"reserved key {CLASSNAME} found in dict to serialize")
+        if isinstance(value, tuple):
+            value = serialize(value)
+        packed = msgpack.packb(value, default=serialize, use_bin_type=True)
+        return zstandard.ZstdCompressor(level=self.compression_level).compress(packed)
+
+    def decode(self, data: bytes | memoryview, orm: bool = False) -> Any:
+        import msgpack
+        import zstandard
+
+        from airflow.serialization.serde import deserialize
+
+        return msgpack.unpackb(
+            zstandard.ZstdDecompressor().decompress(data),
+            raw=False,
+            strict_map_key=False,
+            object_hook=lambda dct: deserialize(dct, full=not orm),
+        )
+
+
+class ArrowCodec(XComCodec):
+    """
+    Encode pandas DataFrames and numpy arrays in the Arrow IPC format, compressed with zstd.
+
+    Columns are stored in binary and can be decoded without copies, which is much faster and more compact
+    than the Parquet document embedded in JSON used for DataFrames otherwise.
+    """
+
+    name = "arrow"
+    required_modules = ("pyarrow",)
+    dataframe_classes = tuple(pandas_serializer.serializers)
+    array_classes = ("numpy.ndarray",)
+
+    def can_encode(self, value: Any) -> bool:
+        # Look at the class name only, to not import pandas or numpy for other values
+        name = qualname(value)
+        if name in self.dataframe_classes:
+            return True
+        return name in self.array_classes and not value.dtype.hasobject
+
+    def encode(self, value: Any) -> bytes:
+        import pyarrow as pa
+
+        sink = pa.BufferOutputStream()
+        if qualname(value) in self.array_classes:
+            sink.write(b"T")
+            pa.ipc.write_tensor(pa.Tensor.from_numpy(value), sink)
+        else:
+            sink.write(b"D")
+            table = pa.Table.from_pandas(value)
+            options = pa.ipc.IpcWriteOptions(compression="zstd")
+            with pa.ipc.new_stream(sink, table.schema, options=options) as writer:
+                writer.write_table(table)
+        return sink.getvalue().to_pybytes()
+
+    def decode(self, data: bytes | memoryview, orm: bool = False) -> Any:
+        import pyarrow as pa
+
+        kind, buffer = data[:1], pa.py_buffer(data[1:])
+        if kind == b"T":
+            if orm:
+                return f"numpy.ndarray {pa.ipc.read_tensor(buffer).shape}"
+            return pa.ipc.read_tensor(buffer).to_numpy()
+        with pa.ipc.open_stream(buffer) as reader:
+            if orm:
+                return f"pandas.DataFrame ({', '.join(reader.schema.names)})"
+            return reader.read_pandas()
+
+
+_codecs: dict[str, XComCodec] = {}
+
+
+def register_codec(codec: XComCodec) -> None:
+    """Register an XCom codec, so that it can be set in ``[core] xcom_codecs``."""
+    if len(codec.name.encode()) > 255:
+        raise ValueError(f"The name of the XCom codec {codec.name!r} is too long")
+    _codecs[codec.name] = codec
+
+
+def get_codec(name: str) -> XComCodec:
+    """Get a registered XCom codec by name."""
+    try:
+        return _codecs[name]
+    except KeyError:
+        raise AirflowConfigException(
+            f"Unknown XCom codec {name!r}, the available codecs are: {', '.join(sorted(_codecs))}"
+        ) from None
+
+
+register_codec(MsgpackZstdCodec())
+register_codec(ArrowCodec())
+
+
+def get_configured_codecs() -> list[XComCodec]:
+    """Get the codecs set in ``[core] xcom_codecs``, in order of preference."""
+    from airflow.configuration import conf
+
+    return list(_get_codecs(conf.get("core", "xcom_codecs", fallback="")))
+
+
+@functools.lru_cache(maxsize=None)
+def _get_codecs(setting: str) -> tuple[XComCodec, ...]:
+    # Cached so that the option is not parsed nor the modules looked up every time an XCom is pushed
+    codecs = tuple(get_codec(name.strip()) for name in setting.split(",") if name.strip())
+    for codec in codecs:
+        codec.check_available()
+    return codecs
+
+
+def encode_value(value: Any, codecs: list[XComCodec]) -> bytes | None:
+    """
+    Encode a value with the first codec which can encode it.
+
+    A codec failing to encode the value, e.g. an integer too large for msgpack or a DataFrame column of
+    mixed types for Arrow, is skipped for the next one.
+
+    :param value: the value to encode
+    :param codecs: the codecs to try, in order of preference
+    :return: the encoded value with its header, or None if none of the codecs can encode the value
+    """
+    for codec in codecs:
+        if not codec.can_encode(value):
+            continue
+        try:
+            data = codec.encode(value)
+        except Exception:
+            log.debug(
+                "The %s XCom codec failed to encode the value, trying the next one", codec.name, exc_info=True
+            )
+            continue
+        name = codec.name.encode()
+        return HEADER_MAGIC + bytes([len(name)]) + name + data
+    return None
+
+
+def is_encoded(data: bytes) -> bool:
+    """Whether a stored XCom value was encoded by an XCom codec."""
+    return data[: len(HEADER_MAGIC)] == HEADER_MAGIC
+
+
+def decode_value(data: bytes, orm: bool = False) -> Any:
+    """
+    Decode a value encoded by :func:`encode_value`, with the codec named in its header.
+
+    :param data: the encoded value, with its header
+    :param orm: only return a readable representation of the value, e.g. for the web UI
+    """
+    view = memoryview(data)
+    start = len(HEADER_MAGIC) + 1
+    end = start + view[len(HEADER_MAGIC)]
+    # The payload is not copied
+    return get_codec(bytes(view[start:end]).decode()).decode(view[end:], orm=orm)
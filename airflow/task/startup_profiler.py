@@ -0,0 +1,215 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Instrumentation of the start-up of a task, from the ``airflow tasks run`` command to the task execution.
+
+The duration of every start-up phase is recorded in the process and emitted as ``task.startup.<phase>``
+timers: the ``LocalTaskJob`` supervisor emits its phases once it has started the raw task process, and
+the raw task process emits its own phases right before the task is executed.
+
+Optionally, the whole start-up of each process can be profiled with ``cProfile`` or ``pyinstrument`` by
+setting ``[core] task_startup_profiler``, the profiles are then written to
+``[core] task_startup_profile_folder``.
+
+This module is imported very early by the CLI, so it must stay cheap to import.
+"""
+from __future__ import annotations
+
+import contextlib
+import datetime
+import os
+import re
+import time
+from typing import TYPE_CHECKING, Any, Generator
+
+if TYPE_CHECKING:
+    from airflow.models.taskinstance import TaskInstance
+    from airflow.serialization.pydantic.taskinstance import TaskInstancePydantic
+
+SUPPORTED_PROFILERS = ("cprofile", "pyinstrument")
+
+# Phase name -> duration in seconds
+_phases: dict[str, float] = {}
+_profiler: Any = None
+_profiler_type: str | None = None
+
+
+def _get_process_start_time() -> float:
+    try:
+        import psutil
+
+        return psutil.Process().create_time()
+    except Exception:
+        return time.time()
+
+
+# Forked processes inherit the start time of their parent, so the total start-up time of a raw task forked
+# from its supervisor covers the start-up of the supervisor as well.
+_process_start_time = _get_process_start_time()
+_process_pid = os.getpid()
+
+
+def reset_after_fork(keep_start_time: bool) -> None:
+    """
+    Forget the phases inherited from the parent process if the current process is a fork.
+
+    :param keep_start_time: whether to keep the start time of the parent process, which is the case for a
+        raw task forked from its supervisor. A task forked by a long-lived executor worker counts its
+        start-up from the fork instead.
+    """
+    global _process_pid, _process_start_time
+
+    if os.getpid() == _process_pid:
+        return
+    _process_pid = os.getpid()
+    _phases.clear()
+    if not keep_start_time:
+        _process_start_time = _get_process_start_time()
+
+
+@contextlib.contextmanager
+def startup_phase(name: str) -> Generator[None, None, None]:
+    """
+    Time a phase of the task start-up.
+
+    Durations of a phase entered several times are added up.
+
+    :param name: name of the phase, used in the ``task.startup.<name>`` metric
+    """
+    start = time.monotonic()
+    try:
+        yield
+    finally:
+        record_phase(name, time.monotonic() - start)
+
+
+def record_phase(name: str, duration: float) -> None:
+    """Record the duration, in seconds, of a phase of the task start-up."""
+    _phases[name] = _phases.get(name, 0.0) + duration
+
+
+def record_process_start(name: str = "process_start") -> None:
+    """Record the time elapsed since the start of the current process as a phase."""
+    record_phase(name, time.time() - _process_start_time)
+
+
+def get_phases() -> dict[str, float]:
+    """Return the durations, in seconds, of the phases recorded so far."""
+    return dict(_phases)
+
+
+def emit_startup_metrics(ti: TaskInstance | TaskInstancePydantic, include_total: bool = True) -> None:
+    """
+    Emit the recorded phases and the total start-up time as timers, then forget the recorded phases.
+
+    :param ti: the task instance which is about to be executed
+    :param include_total: whether to emit the total start-up time as well, which only the process
+        executing the task does
+    """
+    from airflow.stats import Stats
+
+    tags = ti.stats_tags
+    for name, duration in _phases.items():
+        Stats.timing(f"task.startup.{name}", datetime.timedelta(seconds=duration), tags=tags)
+    if include_total:
+        Stats.timing(
+            "task.startup.total", datetime.timedelta(seconds=time.time() - _process_start_time), tags=tags
+        )
+    _phases.clear()
+
+
+def start_profiling() -> None:
+    """Start profiling the current process if ``[core] task_startup_profiler`` is set."""
+    global _profiler, _profiler_type
+
+    from airflow.configuration import conf
+
+    if _profiler is not None:
+        # Inherited from the parent process when forked, which writes its own profile
+        _stop_profiler()
+    profiler_type = conf.get("core", "task_startup_profiler", fallback="").lower()
+    if not profiler_type:
+        return
+    if profiler_type not in SUPPORTED_PROFILERS:
+        from airflow.exceptions import AirflowConfigException
+
+        raise AirflowConfigException(
+            f"The core.task_startup_profiler option must be one of {', '.join(SUPPORTED_PROFILERS)}, "
+            f"got {profiler_type!r}"
+        )
+    if profiler_type == "pyinstrument":
+        try:
+            from pyinstrument import Profiler
+        except ImportError:
+            from airflow.exceptions import AirflowOptionalProviderFeatureException
+
+            raise AirflowOptionalProviderFeatureException(
+                "The pyinstrument package is needed to profile the task start-up with pyinstrument"
+            )
+        _profiler = Profiler()
+        _profiler.start()
+    else:
+        import cProfile
+
+        _profiler = cProfile.Profile()
+        _profiler.enable()
+    _profiler_type = profiler_type
+
+
+def _stop_profiler() -> None:
+    global _profiler, _profiler_type
+
+    if _profiler_type == "pyinstrument":
+        _profiler.stop()
+    else:
+        _profiler.disable()
+    _profiler = _profiler_type = None
+
+
+def stop_profiling(ti: TaskInstance | TaskInstancePydantic, process_name: str) -> str | None:
+    """
+    Stop profiling the current process and write the profile to ``[core] task_startup_profile_folder``.
+
+    :param ti: the task instance being started
+    :param process_name: name of the process in the file name of the profile, e.g. ``supervisor``
+    :return: the path of the written profile, if any
+    """
+    from airflow.configuration import conf
+
+    if _profiler is None:
+        return None
+    profiler, profiler_type = _profiler, _profiler_type
+    _stop_profiler()
+
+    folder = os.path.expanduser(conf.get("core", "task_startup_profile_folder", fallback=""))
+    if not folder:
+        folder = os.path.join(os.path.expanduser(conf.get("logging", "base_log_folder")), "startup_profiles")
+    os.makedirs(folder, exist_ok=True)
+    name = ".".join(
+        str(part)
+        for part in (ti.dag_id, ti.task_id, ti.run_id, ti.map_index, ti.try_number, process_name, os.getpid())
+    )
+    name = re.sub(r"[^\w.-]", "_", name)
+    if profiler_type == "pyinstrument":
+        path = os.path.join(folder, f"{name}.html")
+        with open(path, "w") as profile_file:
+            profile_file.write(profiler.output_html())
+    else:
+        path = os.path.join(folder, f"{name}.prof")
+        profiler.dump_stats(path)
+    return path
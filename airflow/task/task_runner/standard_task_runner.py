@@ -68,7 +68,7 @@ class StandardTaskRunner(BaseTaskRunner):
             signal.signal(signal.SIGTERM, signal.SIG_DFL)
 
             from airflow import settings
-            from airflow.cli.cli_parser import get_parser
+            from airflow.cli.fast_path import get_parser_for_command
             from airflow.sentry import Sentry
 
             # Force a new SQLAlchemy session. We can't share open DB handles
@@ -77,8 +77,8 @@ class StandardTaskRunner(BaseTaskRunner):
             settings.engine.pool.dispose()
             settings.engine.dispose()
 
-            parser = get_parser()
             # [1:] - remove "airflow" from the start of the command
+            parser = get_parser_for_command(self._command[1:])
             args = parser.parse_args(self._command[1:])
 
             # We prefer the job_id passed on the command-line because at this time, the
@@ -101,6 +101,56 @@ class Templater(LoggingMixin):
                                 self.log.exception("Failed to get source %s", item)
         self.prepare_template()
 
+    def get_template_context_keys(self, jinja_env: jinja2.Environment | None = None) -> set[str]:
+        """
+        Find the context keys referenced by the templates of the template fields, by parsing them.
+
+        Templates which cannot be loaded or parsed are ignored, they fail when rendered. The keys referenced
+        by the templates they include are not found.
+
+        :param jinja_env: Jinja environment the templates are rendered with
+        """
+        import jinja2.meta
+
+        if not jinja_env:
+            jinja_env = self.get_template_env()
+        find_undeclared_variables = getattr(jinja_env, "find_undeclared_variables", None)
+        if find_undeclared_variables is None:
+
+            def find_undeclared_variables(source: str) -> set[str]:
+                return jinja2.meta.find_undeclared_variables(jinja_env.parse(source))
+
+        keys: set[str] = set()
+        seen_oids: set[int] = set()
+
+        def visit(value: Any) -> None:
+            if id(value) in seen_oids:
+                return
+            if isinstance(value, str):
+                if value.endswith(tuple(self.template_ext)):
+                    try:
+                        value = jinja_env.loader.get_source(jinja_env, value)[0]  # type: ignore[union-attr]
+                    except Exception:
+                        return
+                try:
+                    keys.update(find_undeclared_variables(value))
+                except jinja2.TemplateSyntaxError:
+                    pass
+            elif isinstance(value, (tuple, list, set)):
+                for element in value:
+                    visit(element)
+            elif isinstance(value, dict):
+                for element in value.values():
+                    visit(element)
+            elif not isinstance(value, ResolveMixin):
+                seen_oids.add(id(value))
+                for attr_name in getattr(value, "template_fields", ()):
+                    visit(getattr(value, attr_name, None))
+
+        for attr_name in self.template_fields:
+            visit(getattr(self, attr_name, None))
+        return keys
+
     def _do_render_template_fields(
         self,
         parent: Any,
@@ -17,21 +17,102 @@
 # under the License.
 from __future__ import annotations
 
+import functools
 from typing import TYPE_CHECKING
 
 import jinja2.nativetypes
 import jinja2.sandbox
+from jinja2.utils import LRUCache
 
 if TYPE_CHECKING:
     import datetime
 
 
+@functools.lru_cache(maxsize=None)
+def _get_compiled_template_cache() -> LRUCache | None:
+    """Return the cache of compiled templates shared by every environment of the process, if enabled."""
+    from airflow.configuration import conf
+
+    size = conf.getint("core", "compiled_template_cache_size", fallback=1000)
+    return LRUCache(size) if size > 0 else None
+
+
 class _AirflowEnvironmentMixin:
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
         self.filters.update(FILTERS)
 
+    def _get_compile_key(self):
+        """
+        Return what the code compiled from a template depends on, besides the template itself.
+
+        The filters and tests are part of it since Jinja looks them up when compiling a template. The
+        globals are not, since they are only bound to the compiled code when a template is created.
+        """
+        return (
+            type(self),
+            self.block_start_string,
+            self.block_end_string,
+            self.variable_start_string,
+            self.variable_end_string,
+            self.comment_start_string,
+            self.comment_end_string,
+            self.line_statement_prefix,
+            self.line_comment_prefix,
+            self.trim_blocks,
+            self.lstrip_blocks,
+            self.newline_sequence,
+            self.keep_trailing_newline,
+            self.optimized,
+            self.finalize,
+            self.autoescape,
+            self.is_async,
+            tuple(self.extensions),
+            tuple(self.filters.items()),
+            tuple(self.tests.items()),
+        )
+
+    def find_undeclared_variables(self, source):
+        """
+        Return the names of the variables a template takes from its context, found by parsing it.
+
+        The names are cached like the compiled templates.
+        """
+        import jinja2.meta
+
+        cache = _get_compiled_template_cache()
+        if cache is None:
+            return frozenset(jinja2.meta.find_undeclared_variables(self.parse(source)))
+        try:
+            key = ("undeclared_variables", self._get_compile_key(), source)
+            names = cache.get(key)
+        except TypeError:  # An unhashable filter or option.
+            return frozenset(jinja2.meta.find_undeclared_variables(self.parse(source)))
+        if names is None:
+            names = cache[key] = frozenset(jinja2.meta.find_undeclared_variables(self.parse(source)))
+        return names
+
+    def compile(self, source, name=None, filename=None, raw=False, defer_init=False):
+        """
+        Compile a template, or reuse the code compiled from the same template by an equivalent environment.
+
+        A new environment is created to render the templates of every task instance, so the code compiled
+        from templates is cached for the whole process rather than by the environment, which Jinja does.
+        The cache size is set by ``[core] compiled_template_cache_size``.
+        """
+        cache = _get_compiled_template_cache()
+        if cache is None or raw or defer_init or not isinstance(source, str):
+            return super().compile(source, name, filename, raw, defer_init)
+        try:
+            key = (self._get_compile_key(), source, name, filename)
+            code = cache.get(key)
+        except TypeError:  # An unhashable filter or option.
+            return super().compile(source, name, filename, raw, defer_init)
+        if code is None:
+            code = cache[key] = super().compile(source, name, filename, raw, defer_init)
+        return code
+
     def is_safe_attribute(self, obj, attr, value):
         """
         Allow access to ``_`` prefix vars (but not ``__``).
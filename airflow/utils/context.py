@@ -25,8 +25,10 @@ import warnings
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
     Container,
     ItemsView,
+    Iterable,
     Iterator,
     KeysView,
     Mapping,
@@ -142,6 +144,37 @@ class ConnectionAccessor:
             return default_conn
 
 
+class LazyContextValue:
+    """
+    A value of the context only computed when it is accessed.
+
+    The value is computed once and shared by the copies of the context.
+
+    :meta private:
+    """
+
+    __slots__ = ("_func", "_value")
+
+    def __init__(self, func: Callable[[], Any]) -> None:
+        self._func = func
+        self._value: Any = NOTSET
+
+    def __repr__(self) -> str:
+        if self._value is NOTSET:
+            return f"<lazy value of {self._func.__name__}>"
+        return repr(self._value)
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is LazyContextValue:
+            other = other.resolve()
+        return self.resolve() == other
+
+    def resolve(self) -> Any:
+        if self._value is NOTSET:
+            self._value = self._func()
+        return self._value
+
+
 class AirflowContextDeprecationWarning(RemovedInAirflow3Warning):
     """Warn for usage of deprecated context variables in a task."""
 
@@ -162,7 +195,9 @@ class Context(MutableMapping[str, Any]):
     """Jinja2 template context for task rendering.
 
     This is a mapping (dict-like) class that can lazily emit warnings when
-    (and only when) deprecated context keys are accessed.
+    (and only when) deprecated context keys are accessed. Values which are
+    expensive to compute can be stored as ``LazyContextValue`` to only be
+    computed when they are accessed.
     """
 
     _DEPRECATION_REPLACEMENTS: dict[str, list[str]] = {
@@ -207,9 +242,20 @@ class Context(MutableMapping[str, Any]):
         with contextlib.suppress(KeyError):
             warnings.warn(_create_deprecation_warning(key, self._deprecation_replacements[key]))
         with contextlib.suppress(KeyError):
-            return self._context[key]
+            return self._resolve(key)
         raise KeyError(key)
 
+    def _resolve(self, key: str) -> Any:
+        value = self._context[key]
+        # Not isinstance, which would evaluate the lazy object proxies of the context
+        if type(value) is LazyContextValue:
+            value = self._context[key] = value.resolve()
+        return value
+
+    def _resolve_all(self) -> None:
+        for key in self._context:
+            self._resolve(key)
+
     def __setitem__(self, key: str, value: Any) -> None:
         self._deprecation_replacements.pop(key, None)
         self._context[key] = value
@@ -241,9 +287,11 @@ class Context(MutableMapping[str, Any]):
         return self._context.keys()
 
     def items(self):
+        self._resolve_all()
         return ItemsView(self._context)
 
     def values(self):
+        self._resolve_all()
         return ValuesView(self._context)
 
 
@@ -277,6 +325,20 @@ def context_update_for_unmapped(context: Context, task: BaseOperator) -> None:
     context["params"] = process_params(context["dag"], task, context["dag_run"], suppress_exception=False)
 
 
+def context_resolve(context: Context, keys: Iterable[str]) -> None:
+    """Compute the lazy values of the context under the given keys, without emitting deprecation warnings.
+
+    This is implemented as a free function because the ``Context`` type is
+    "faked" as a ``TypedDict`` in ``context.pyi``, which cannot have custom
+    functions.
+
+    :meta private:
+    """
+    for key in keys:
+        if key in context._context:
+            context._resolve(key)
+
+
 def context_copy_partial(source: Context, keys: Container[str]) -> Context:
     """Create a context by copying items under selected keys in ``source``.
 
@@ -314,10 +376,14 @@ def lazy_mapping_from_context(source: Context) -> Mapping[str, Any]:
     def _deprecated_proxy_factory(k: str, v: Any) -> Any:
         replacements = source._deprecation_replacements[k]
         warnings.warn(_create_deprecation_warning(k, replacements))
+        if type(v) is LazyContextValue:
+            return v.resolve()
         return v
 
     def _create_value(k: str, v: Any) -> Any:
         if k not in source._deprecation_replacements:
+            if type(v) is LazyContextValue:
+                return lazy_object_proxy.Proxy(v.resolve)
             return v
         factory = functools.partial(_deprecated_proxy_factory, k, v)
         return lazy_object_proxy.Proxy(factory)
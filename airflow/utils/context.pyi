@@ -26,7 +26,7 @@
 # declare "these are defined, but don't error if others are accessed" someday.
 from __future__ import annotations
 
-from typing import Any, Collection, Container, Iterable, Mapping, overload
+from typing import Any, Callable, Collection, Container, Iterable, Mapping, overload
 
 from pendulum import DateTime
 
@@ -55,6 +55,10 @@ class VariableAccessor:
 class ConnectionAccessor:
     def get(self, key: str, default_conn: Any = None) -> Any: ...
 
+class LazyContextValue:
+    def __init__(self, func: Callable[[], Any]) -> None: ...
+    def resolve(self) -> Any: ...
+
 # NOTE: Please keep this in sync with KNOWN_CONTEXT_KEYS in airflow/utils/context.py.
 class Context(TypedDict, total=False):
     conf: AirflowConfigParser
@@ -113,5 +117,6 @@ def context_merge(context: Context, additions: Iterable[tuple[str, Any]], **kwar
 @overload
 def context_merge(context: Context, **kwargs: Any) -> None: ...
 def context_update_for_unmapped(context: Context, task: BaseOperator) -> None: ...
+def context_resolve(context: Context, keys: Iterable[str]) -> None: ...
 def context_copy_partial(source: Context, keys: Container[str]) -> Context: ...
 def lazy_mapping_from_context(source: Context) -> Mapping[str, Any]: ...
@@ -0,0 +1,136 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Integrity checks of the task graph of a DAG."""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from airflow.exceptions import AirflowDagCycleException, AirflowDagInconsistent, FailStopDagInvalidTriggerRule
+from airflow.utils.dag_cycle_tester import CYCLE_DONE, CYCLE_IN_PROGRESS, CYCLE_NEW
+from airflow.utils.trigger_rule import TriggerRule
+
+if TYPE_CHECKING:
+    from airflow.models.dag import DAG
+
+
+class DagGraphIndex:
+    """
+    Task graph of a DAG, with the tasks numbered in the order of ``dag.task_dict``.
+
+    The edges are looked up once, as lists of task numbers, so that the checks walking the graph do not
+    look up the tasks by id for every edge.
+
+    :param dag: the DAG
+    :raises AirflowDagInconsistent: if a task has a downstream task which is not in the DAG
+    """
+
+    __slots__ = ("dag", "tasks", "downstream")
+
+    def __init__(self, dag: DAG):
+        self.dag = dag
+        self.tasks = list(dag.task_dict.values())
+        numbers = {task_id: number for number, task_id in enumerate(dag.task_dict)}
+        self.downstream: list[list[int]] = []
+        for task in self.tasks:
+            try:
+                self.downstream.append(list(map(numbers.__getitem__, task.downstream_task_ids)))
+            except KeyError as e:
+                raise AirflowDagInconsistent(
+                    f"Task {task.task_id} of DAG {dag.dag_id} has a downstream task {e.args[0]} "
+                    "which is not in the DAG"
+                ) from None
+
+    def check_cycle(self) -> None:
+        """
+        Check that there is no cycle in the graph.
+
+        :raises AirflowDagCycleException: if a cycle is found
+        """
+        state = [CYCLE_NEW] * len(self.tasks)
+        for root in range(len(state)):
+            if state[root] == CYCLE_DONE:
+                continue
+            state[root] = CYCLE_IN_PROGRESS
+            # The iterators keep the position of the next downstream task to check of the tasks of the path
+            path_stack = [(root, iter(self.downstream[root]))]
+            while path_stack:
+                current, downstream = path_stack[-1]
+                for down_number in downstream:
+                    down_state = state[down_number]
+                    if down_state == CYCLE_NEW:
+                        state[down_number] = CYCLE_IN_PROGRESS
+                        path_stack.append((down_number, iter(self.downstream[down_number])))
+                        break
+                    if down_state == CYCLE_IN_PROGRESS:
+                        task_id = self.tasks[current].task_id
+                        raise AirflowDagCycleException(
+                            f"Cycle detected in DAG: {self.dag.dag_id}. Faulty task: {task_id}"
+                        )
+                else:
+                    state[current] = CYCLE_DONE
+                    path_stack.pop()
+
+    def check_task_groups(self) -> None:
+        """
+        Check that every task is a child of its task group, and that the group is in the DAG.
+
+        :raises AirflowDagInconsistent: if a task is not in its task group
+        """
+        task_groups = self.dag.task_group.get_task_group_dict()
+        for task in self.tasks:
+            if task.task_group is None:
+                continue
+            group_id = task.task_group.group_id
+            if group_id not in task_groups or task.task_id not in task_groups[group_id].children:
+                raise AirflowDagInconsistent(
+                    f"Task {task.task_id} of DAG {self.dag.dag_id} is not in its task group {group_id}"
+                )
+
+    def check_setup_teardown(self) -> None:
+        """
+        Check that setup and teardown tasks, and the tasks of fail-stop DAGs, have valid trigger rules.
+
+        :raises ValueError: if a setup task is followed by a normal task without ALL_SUCCESS trigger rule
+        :raises FailStopDagInvalidTriggerRule: if a task of a fail-stop DAG has an invalid trigger rule
+        """
+        for task, downstream in zip(self.tasks, self.downstream):
+            if task.is_setup:
+                for down_task in (self.tasks[number] for number in downstream):
+                    if not down_task.is_teardown and down_task.trigger_rule != TriggerRule.ALL_SUCCESS:
+                        # todo: we can relax this to allow out-of-scope tasks to have other trigger rules
+                        # this is required to ensure consistent behavior of dag
+                        # when clearing an indirect setup
+                        raise ValueError("Setup tasks must be followed with trigger rule ALL_SUCCESS.")
+            FailStopDagInvalidTriggerRule.check(dag=self.dag, trigger_rule=task.trigger_rule)
+
+
+def check_dag_integrity(dag: DAG) -> None:
+    """
+    Check the task graph of a DAG, indexing it once for all the checks.
+
+    The setup and teardown rules, the task groups then the cycles are checked.
+
+    :raises ValueError: if a setup task is followed by a normal task without ALL_SUCCESS trigger rule
+    :raises FailStopDagInvalidTriggerRule: if a task of a fail-stop DAG has an invalid trigger rule
+    :raises AirflowDagInconsistent: if an edge or a task group is inconsistent
+    :raises AirflowDagCycleException: if a cycle is found
+    """
+    index = DagGraphIndex(dag)
+    index.check_setup_teardown()
+    index.check_task_groups()
+    index.check_cycle()
@@ -23,21 +23,28 @@ See:
 from __future__ import annotations
 
 import csv
+import gzip
+import io
+import json
 import logging
 import os
+import time
 from contextlib import contextmanager
-from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Generator, Sequence
 
-from sqlalchemy import and_, column, false, func, inspect, select, table, text
+from sqlalchemy import and_, column, false, func, inspect, literal, literal_column, select, table, text
 from sqlalchemy.exc import OperationalError, ProgrammingError
 from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import aliased
 from sqlalchemy.sql.expression import ClauseElement, Executable, tuple_
+from sqlalchemy.types import Boolean, DateTime as SQLADateTime, Integer, LargeBinary, Numeric
 
 from airflow.cli.simple_table import AirflowConsole
 from airflow.configuration import conf
 from airflow.exceptions import AirflowException
+from airflow.stats import Stats
 from airflow.utils import timezone
 from airflow.utils.db import reflect_tables
 from airflow.utils.helpers import ask_yesno
@@ -45,13 +52,16 @@ from airflow.utils.session import NEW_SESSION, provide_session
 
 if TYPE_CHECKING:
     from pendulum import DateTime
+    from sqlalchemy import Column
     from sqlalchemy.orm import Query, Session
 
+    from airflow.io.path import ObjectStoragePath
     from airflow.models import Base
 
 logger = logging.getLogger(__name__)
 
 ARCHIVE_TABLE_PREFIX = "_airflow_deleted__"
+BASE_TABLE_ALIAS = "base"
 
 
 @dataclass
@@ -127,6 +137,44 @@ if conf.get("webserver", "session_backend") == "database":
 config_dict: dict[str, _TableConfig] = {x.orm_model.name: x for x in sorted(config_list)}
 
 
+@dataclass
+class _CleanupCheckpoint:
+    """
+    Progress of a batched cleanup, saved to a file so that an interrupted cleanup can be resumed.
+
+    :param path: path of the checkpoint file
+    :param clean_before_timestamp: the timestamp before which data is purged, in ISO format
+    :param tables: the progress of every table: its archive table, the key of the last deleted row,
+        the number of deleted rows and whether it is done
+    """
+
+    path: str
+    clean_before_timestamp: str
+    tables: dict[str, dict[str, Any]] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, path: str, clean_before_timestamp: DateTime) -> _CleanupCheckpoint:
+        timestamp = clean_before_timestamp.isoformat()
+        if not os.path.exists(path):
+            return cls(path=path, clean_before_timestamp=timestamp)
+        with open(path) as f:
+            data = json.load(f)
+        if data["clean_before_timestamp"] != timestamp:
+            raise SystemExit(
+                f"The checkpoint file {path} is for purging the data prior to "
+                f"{data['clean_before_timestamp']}, not {timestamp}. Remove it to start a new cleanup."
+            )
+        print(f"Resuming the cleanup from the checkpoint file {path}")
+        return cls(path=path, clean_before_timestamp=timestamp, tables=data["tables"])
+
+    def save(self) -> None:
+        # Replace the file at once so that it is never left incomplete
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"clean_before_timestamp": self.clean_before_timestamp, "tables": self.tables}, f)
+        os.replace(tmp_path, self.path)
+
+
 def _check_for_rows(*, query: Query, print_rows=False):
     num_entities = query.count()
     print(f"Found {num_entities} rows meeting deletion criteria.")
@@ -140,15 +188,120 @@ def _check_for_rows(*, query: Query, print_rows=False):
     return num_entities
 
 
-def _dump_table_to_file(*, target_table, file_path, export_format, session):
-    if export_format == "csv":
-        with open(file_path, "w") as f:
-            csv_writer = csv.writer(f)
-            cursor = session.execute(text(f"SELECT * FROM {target_table}"))
-            csv_writer.writerow(cursor.keys())
-            csv_writer.writerows(cursor.fetchall())
-    else:
+@contextmanager
+def _open_export_file(file_path, mode, compression) -> Generator[Any, None, None]:
+    """Open a local or object storage file for writing, compressed on the fly with gzip if requested."""
+    if compression is None:
+        with open(file_path, mode) if isinstance(file_path, str) else file_path.open(mode) as f:
+            yield f
+        return
+    with open(file_path, "wb") if isinstance(file_path, str) else file_path.open("wb") as raw_file:
+        with gzip.GzipFile(fileobj=raw_file, mode="wb") as gzip_file:
+            if "b" in mode:
+                yield gzip_file
+            else:
+                with io.TextIOWrapper(gzip_file, encoding="utf-8") as f:
+                    yield f
+
+
+def _arrow_type(sql_type):
+    import pyarrow as pa
+
+    if isinstance(sql_type, Boolean):
+        return pa.bool_()
+    if isinstance(sql_type, Integer):
+        return pa.int64()
+    if isinstance(sql_type, Numeric):
+        return pa.float64()
+    if isinstance(sql_type, SQLADateTime):
+        return pa.timestamp("us", tz="UTC")
+    if isinstance(sql_type, LargeBinary):
+        return pa.binary()
+    return pa.string()
+
+
+def _arrow_value(value, arrow_type):
+    import pyarrow as pa
+
+    if value is None:
+        return None
+    if arrow_type == pa.float64():
+        return float(value)
+    if arrow_type == pa.string() and not isinstance(value, str):
+        return json.dumps(value, default=str)
+    return value
+
+
+def _dump_table_to_parquet(*, target_table, file_path, compression, batch_size, session):
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise AirflowException("The pyarrow package is needed to export archived tables to Parquet.")
+
+    # The values are converted to the types of the columns, which have to be the same in every batch. The
+    # types are taken from the archived table when it still exists, since some databases do not keep the
+    # declared types of the columns of a table created from a query.
+    source_table_name = target_table[len(ARCHIVE_TABLE_PREFIX) :].rsplit("__", 1)[0]
+    metadata = reflect_tables([target_table, source_table_name], session)
+    source_types = {}
+    if source_table_name in metadata.tables:
+        source_types = {col.name: col.type for col in metadata.tables[source_table_name].columns}
+    columns = [
+        column(col.name, source_types.get(col.name, col.type))
+        for col in metadata.tables[target_table].columns
+    ]
+    schema = pa.schema([(col.name, _arrow_type(col.type)) for col in columns])
+    result = session.execute(
+        select(*columns).select_from(table(target_table)).execution_options(stream_results=True)
+    )
+    with _open_export_file(file_path, "wb", None) as f, pq.ParquetWriter(
+        f, schema, compression=compression or "snappy"
+    ) as writer:
+        for rows in result.partitions(batch_size):
+            arrays = [
+                pa.array([_arrow_value(row[i], field.type) for row in rows], type=field.type)
+                for i, field in enumerate(schema)
+            ]
+            writer.write_table(pa.Table.from_arrays(arrays, schema=schema))
+
+
+def _dump_table_to_file(
+    *, target_table, file_path, export_format, session, compression=None, batch_size=10000
+):
+    """
+    Write the rows of a table to a local or object storage file, streamed in batches of ``batch_size`` rows.
+
+    The rows are read with a server-side cursor where the database supports it, so that tables of any size
+    can be exported in bounded memory.
+    """
+    if export_format == "parquet":
+        _dump_table_to_parquet(
+            target_table=target_table,
+            file_path=file_path,
+            compression=compression,
+            batch_size=batch_size,
+            session=session,
+        )
+        return
+    if export_format not in ("csv", "ndjson"):
         raise AirflowException(f"Export format {export_format} is not supported.")
+    if compression not in (None, "gzip"):
+        raise AirflowException(f"Compression {compression} is not supported for the {export_format} format.")
+
+    result = session.execute(
+        text(f"SELECT * FROM {target_table}").execution_options(stream_results=True)
+    ).yield_per(batch_size)
+    with _open_export_file(file_path, "w", compression) as f:
+        if export_format == "csv":
+            csv_writer = csv.writer(f)
+            csv_writer.writerow(result.keys())
+            csv_writer.writerows(result)
+        else:
+            keys = list(result.keys())
+            for row in result:
+                f.write(json.dumps(dict(zip(keys, row)), default=str))
+                f.write("\n")
 
 
 def _do_delete(*, query, orm_model, skip_archive, session):
@@ -203,6 +356,102 @@ def _do_delete(*, query, orm_model, skip_archive, session):
     print("Finished Performing Delete")
 
 
+def _encode_key(key: Sequence[Any]) -> list[Any]:
+    return [value.isoformat() if isinstance(value, datetime) else value for value in key]
+
+
+def _decode_key(key: Sequence[Any], key_columns: Sequence[Column]) -> list[Any]:
+    return [
+        datetime.fromisoformat(value)
+        if value is not None and isinstance(key_column.type, SQLADateTime)
+        else value
+        for value, key_column in zip(key, key_columns)
+    ]
+
+
+def _do_delete_batched(
+    *, query, orm_model, recency_column, skip_archive, batch_size, batch_sleep, checkpoint, session
+):
+    """
+    Archive and delete the rows matched by the query in batches, one transaction per batch.
+
+    The rows are deleted in the order of the recency column then of the primary key, every batch starting
+    after the last row deleted by the previous one, which is recorded in the checkpoint if any.
+    """
+    import re2
+
+    print(f"Performing Delete in batches of {batch_size} rows...")
+    table_name = orm_model.name
+    progress = checkpoint.tables.setdefault(table_name, {}) if checkpoint else {}
+    dialect_name = session.get_bind().dialect.name
+    target_table_name = None
+    if not skip_archive:
+        target_table_name = progress.get("archive_table")
+        if target_table_name is None:
+            timestamp_str = re2.sub(r"[^\d]", "", timezone.utcnow().isoformat())[:14]
+            target_table_name = f"{ARCHIVE_TABLE_PREFIX}{table_name}__{timestamp_str}"
+            if dialect_name == "mysql":
+                session.execute(text(f"CREATE TABLE {target_table_name} LIKE {table_name}"))
+            else:
+                session.execute(CreateTableAs(target_table_name, query.limit(0).selectable))
+            session.commit()
+            progress["archive_table"] = target_table_name
+            if checkpoint:
+                checkpoint.save()
+        print(f"Moving data to table {target_table_name}")
+
+    metadata = reflect_tables([table_name, target_table_name] if target_table_name else [table_name], session)
+    source_table = metadata.tables[table_name]
+    pk_columns = list(source_table.primary_key.columns)
+    key_columns = [source_table.c[recency_column.name]]
+    key_columns.extend(col for col in pk_columns if col.name != recency_column.name)
+    pk_positions = [key_columns.index(col) for col in pk_columns]
+    base_key = tuple_(
+        *(literal_column(f"{BASE_TABLE_ALIAS}.{col.name}", type_=col.type) for col in key_columns)
+    )
+
+    last_key = _decode_key(progress["last_key"], key_columns) if "last_key" in progress else None
+    while True:
+        start = time.monotonic()
+        batch_query = query.with_entities(*base_key.clauses)
+        if last_key is not None:
+            batch_query = batch_query.filter(
+                base_key > tuple_(*(literal(value, col.type) for value, col in zip(last_key, key_columns)))
+            )
+        keys = batch_query.order_by(*base_key.clauses).limit(batch_size).all()
+        if not keys:
+            break
+        pk_condition = tuple_(*pk_columns).in_([tuple(key[i] for i in pk_positions) for key in keys])
+        if target_table_name:
+            target_table = metadata.tables[target_table_name]
+            session.execute(
+                target_table.insert().from_select(target_table.c, select(source_table).where(pk_condition))
+            )
+        session.execute(source_table.delete().where(pk_condition))
+        session.commit()
+
+        last_key = list(keys[-1])
+        progress["last_key"] = _encode_key(last_key)
+        progress["rows"] = progress.get("rows", 0) + len(keys)
+        if checkpoint:
+            checkpoint.save()
+        rows_per_second = len(keys) / max(time.monotonic() - start, 1e-6)
+        Stats.incr(f"db_clean.deleted_rows.{table_name}", len(keys))
+        Stats.incr("db_clean.deleted_rows", len(keys), tags={"table": table_name})
+        Stats.gauge(f"db_clean.rows_per_second.{table_name}", rows_per_second)
+        Stats.gauge("db_clean.rows_per_second", rows_per_second, tags={"table": table_name})
+        print(f"Deleted {progress['rows']} rows so far ({rows_per_second:.0f} rows/s)")
+        if len(keys) < batch_size:
+            break
+        if batch_sleep:
+            time.sleep(batch_sleep)
+
+    progress["done"] = True
+    if checkpoint:
+        checkpoint.save()
+    print("Finished Performing Delete")
+
+
 def _subquery_keep_last(*, recency_column, keep_last_filters, group_by_columns, max_date_colname, session):
     subquery = select(*group_by_columns, func.max(recency_column).label(max_date_colname))
 
@@ -240,9 +489,8 @@ def _build_query(
     session,
     **kwargs,
 ):
-    base_table_alias = "base"
-    base_table = aliased(orm_model, name=base_table_alias)
-    query = session.query(base_table).with_entities(text(f"{base_table_alias}.*"))
+    base_table = aliased(orm_model, name=BASE_TABLE_ALIAS)
+    query = session.query(base_table).with_entities(text(f"{BASE_TABLE_ALIAS}.*"))
     base_table_recency_col = base_table.c[recency_column.name]
     conditions = [base_table_recency_col < clean_before_timestamp]
     if keep_last:
@@ -278,12 +526,18 @@ def _cleanup_table(
     dry_run=True,
     verbose=False,
     skip_archive=False,
+    batch_size=None,
+    batch_sleep=0,
+    checkpoint=None,
     session,
     **kwargs,
 ):
     print()
     if dry_run:
         print(f"Performing dry run for table {orm_model.name}")
+    elif checkpoint and checkpoint.tables.get(orm_model.name, {}).get("done"):
+        print(f"Table {orm_model.name} was already cleaned up according to the checkpoint")
+        return
     query = _build_query(
         orm_model=orm_model,
         recency_column=recency_column,
@@ -294,6 +548,21 @@ def _cleanup_table(
         session=session,
     )
     logger.debug("old rows query:\n%s", query.selectable.compile())
+    if batch_size and not dry_run:
+        # Counting the rows to delete would take as long as a batch of a big table
+        print(f"Cleaning table {orm_model.name}")
+        _do_delete_batched(
+            query=query,
+            orm_model=orm_model,
+            recency_column=recency_column,
+            skip_archive=skip_archive,
+            batch_size=batch_size,
+            batch_sleep=batch_sleep,
+            checkpoint=checkpoint,
+            session=session,
+        )
+        session.commit()
+        return
     print(f"Checking table {orm_model.name}")
     num_rows = _check_for_rows(query=query, print_rows=False)
 
@@ -395,6 +664,9 @@ def run_cleanup(
     verbose: bool = False,
     confirm: bool = True,
     skip_archive: bool = False,
+    batch_size: int | None = None,
+    batch_sleep: float = 0,
+    checkpoint_file: str | None = None,
     session: Session = NEW_SESSION,
 ):
     """
@@ -414,6 +686,11 @@ def run_cleanup(
     :param verbose: If true, may provide more detailed output.
     :param confirm: Require user input to confirm before processing deletions.
     :param skip_archive: Set to True if you don't want the purged rows preservied in an archive table.
+    :param batch_size: Optional. Maximum number of rows archived and deleted per transaction. If not
+        provided, all the rows of a table are archived then deleted at once.
+    :param batch_sleep: Seconds to wait between two batches, to throttle the load on the database.
+    :param checkpoint_file: Optional. File recording the progress of a batched cleanup, from which an
+        interrupted cleanup with the same timestamp resumes. It is removed once the cleanup is complete.
     :param session: Session representing connection to the metadata database.
     """
     clean_before_timestamp = timezone.coerce_datetime(clean_before_timestamp)
@@ -427,6 +704,9 @@ def run_cleanup(
         _print_config(configs=effective_config_dict)
     if not dry_run and confirm:
         _confirm_delete(date=clean_before_timestamp, tables=sorted(effective_table_names))
+    checkpoint = None
+    if batch_size and checkpoint_file and not dry_run:
+        checkpoint = _CleanupCheckpoint.load(checkpoint_file, clean_before_timestamp)
     existing_tables = reflect_tables(tables=None, session=session).tables
     for table_name, table_config in effective_config_dict.items():
         if table_name in existing_tables:
@@ -437,11 +717,20 @@ def run_cleanup(
                     verbose=verbose,
                     **table_config.__dict__,
                     skip_archive=skip_archive,
+                    batch_size=batch_size,
+                    batch_sleep=batch_sleep,
+                    checkpoint=checkpoint,
                     session=session,
                 )
                 session.commit()
         else:
             logger.warning("Table %s not found.  Skipping.", table_name)
+    if checkpoint:
+        cleaned_table_names = existing_tables.keys() & effective_table_names
+        if any(not checkpoint.tables.get(table_name, {}).get("done") for table_name in cleaned_table_names):
+            print(f"The cleanup is not complete, run it again to resume it from {checkpoint.path}")
+        elif os.path.exists(checkpoint.path):
+            os.remove(checkpoint.path)
 
 
 @provide_session
@@ -451,9 +740,16 @@ def export_archived_records(
     table_names=None,
     drop_archives=False,
     needs_confirm=True,
+    compression=None,
     session: Session = NEW_SESSION,
 ):
-    """Export archived data to the given output path in the given format."""
+    """
+    Export archived data to the given output path in the given format.
+
+    The output path is either a local directory or an object storage URL such as ``s3://bucket/path``.
+    Parquet files are compressed with the given codec, snappy by default, and CSV and NDJSON files are
+    compressed with gzip if requested.
+    """
     archived_table_names = _get_archived_table_names(table_names, session)
     # If user chose to drop archives, check there are archive tables that exists
     # before asking for confirmation
@@ -461,13 +757,22 @@ def export_archived_records(
         _confirm_drop_archives(tables=sorted(archived_table_names))
     export_count = 0
     dropped_count = 0
+    extension = f".{export_format}.gz" if compression and export_format != "parquet" else f".{export_format}"
     for table_name in archived_table_names:
         logger.info("Exporting table %s", table_name)
+        file_path: str | ObjectStoragePath
+        if "://" in output_path:
+            from airflow.io.path import ObjectStoragePath
+
+            file_path = ObjectStoragePath(output_path) / f"{table_name}{extension}"
+        else:
+            file_path = os.path.join(output_path, f"{table_name}{extension}")
         _dump_table_to_file(
             target_table=table_name,
-            file_path=os.path.join(output_path, f"{table_name}.{export_format}"),
+            file_path=file_path,
             export_format=export_format,
             session=session,
+            compression=compression,
         )
         export_count += 1
         if drop_archives:
@@ -373,13 +373,18 @@ def _find_imported_modules(module: ast.Module) -> Generator[str, None, None]:
             yield st.module
 
 
-def iter_airflow_imports(file_path: str) -> Generator[str, None, None]:
-    """Find Airflow modules imported in the given file."""
+def iter_imported_modules(file_path: str) -> Generator[str, None, None]:
+    """Find modules imported at the top level of the given file."""
     try:
         parsed = ast.parse(Path(file_path).read_bytes())
     except Exception:
         return
-    for m in _find_imported_modules(parsed):
+    yield from _find_imported_modules(parsed)
+
+
+def iter_airflow_imports(file_path: str) -> Generator[str, None, None]:
+    """Find Airflow modules imported in the given file."""
+    for m in iter_imported_modules(file_path):
         if m.startswith("airflow."):
             yield m
 
@@ -22,27 +22,10 @@ from datetime import date, datetime
 from decimal import Decimal
 from typing import Any
 
-from flask.json.provider import JSONProvider
-
 from airflow.serialization.serde import CLASSNAME, DATA, SCHEMA_ID, deserialize, serialize
 from airflow.utils.timezone import convert_to_utc, is_naive
 
 
-class AirflowJsonProvider(JSONProvider):
-    """JSON Provider for Flask app to use WebEncoder."""
-
-    ensure_ascii: bool = True
-    sort_keys: bool = True
-
-    def dumps(self, obj, **kwargs):
-        kwargs.setdefault("ensure_ascii", self.ensure_ascii)
-        kwargs.setdefault("sort_keys", self.sort_keys)
-        return json.dumps(obj, **kwargs, cls=WebEncoder)
-
-    def loads(self, s: str | bytes, **kwargs):
-        return json.loads(s, **kwargs)
-
-
 class WebEncoder(json.JSONEncoder):
     """This encodes values into a web understandable format. There is no deserializer.
 
@@ -124,3 +107,13 @@ class XComDecoder(json.JSONDecoder):
 
 # backwards compatibility
 AirflowJsonEncoder = WebEncoder
+
+
+def __getattr__(name: str):
+    # PEP-562: The JSON provider of the webserver is only imported when used, as it imports Flask
+    if name != "AirflowJsonProvider":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from airflow.www.json_provider import AirflowJsonProvider
+
+    return AirflowJsonProvider
@@ -161,6 +161,20 @@ export interface paths {
       };
     };
   };
+  "/dags/{dag_id}/triggerDagRuns": {
+    /**
+     * Trigger several runs of a DAG at once, which is faster than triggering them one by one. The DAG runs are validated one by one, and the valid ones are created together. The result of every DAG run is returned in the order of the request, with the DAG run if it was created, or with the error which prevented its creation otherwise. If DAG is paused then dagrun state will remain queued, and the task won't run.
+     * At most `[api] maximum_trigger_dag_runs` DAG runs can be triggered at once.
+     * *New in version 2.9.0*
+     */
+    post: operations["post_dag_runs"];
+    parameters: {
+      path: {
+        /** The DAG ID. */
+        dag_id: components["parameters"]["DAGID"];
+      };
+    };
+  };
   "/dags/~/dagRuns/list": {
     /** This endpoint is a POST to allow filtering across a large number of DAG IDs, where as a GET it would run in to maximum HTTP request URL length limit. */
     post: operations["get_dag_runs_batch"];
@@ -1166,6 +1180,37 @@ export interface components {
     DAGRunCollection: {
       dag_runs?: components["schemas"]["DAGRun"][];
     } & components["schemas"]["CollectionInfo"];
+    /**
+     * @description DAG runs to trigger.
+     *
+     * *New in version 2.9.0*
+     */
+    TriggerDAGRuns: {
+      dag_runs: components["schemas"]["DAGRun"][];
+    };
+    /**
+     * @description Result of triggering one of several DAG runs.
+     *
+     * *New in version 2.9.0*
+     */
+    DAGRunTriggerResult: {
+      /**
+       * @description The status of the DAG run: 200 if it was created, 400 if it is not valid, or 409 if a DAG run
+       * with the same ID or logical date already exists, including earlier in the same request.
+       */
+      status?: number;
+      /** @description The reason why the DAG run was not created. */
+      detail?: string;
+      dag_run?: components["schemas"]["DAGRun"];
+    };
+    /**
+     * @description Results of triggering several DAG runs, in the order of the request.
+     *
+     * *New in version 2.9.0*
+     */
+    DAGRunTriggerResultCollection: {
+      results?: components["schemas"]["DAGRunTriggerResult"][];
+    };
     DagWarning: {
       /** @description The dag_id. */
       dag_id?: string;
@@ -1450,7 +1495,26 @@ export interface components {
      */
     TaskInstanceCollection: {
       task_instances?: components["schemas"]["TaskInstance"][];
+      /**
+       * @description Cursor of the next page, null on the last page. Only set, instead of `total_entries`,
+       * when the page is requested with a cursor.
+       *
+       * *New in version 2.9.0*
+       */
+      next_cursor?: string | null;
     } & components["schemas"]["CollectionInfo"];
+    /**
+     * @description Task instances as newline-delimited JSON (NDJSON), one JSON object per line, returned when
+     * `application/x-ndjson` is accepted. All the task instances matching the filters are streamed,
+     * starting after the cursor if given, ordered by DAG ID, DAG run ID, task ID and map index,
+     * regardless of the page limit and offset. Every object holds the requested fields of the
+     * task instance, or all the fields of its database row if none is requested, and always its
+     * `dag_id`, `dag_run_id`, `task_id` and `map_index`. The task instances are read from the
+     * database without loading their related objects.
+     *
+     * *New in version 2.9.0*
+     */
+    TaskInstanceExport: unknown;
     TaskInstanceReference: {
       /** @description The task ID. */
       task_id?: string;
@@ -2155,6 +2219,28 @@ export interface components {
       pool?: string[];
       /** @description The value can be repeated to retrieve multiple matching values (OR condition). */
       queue?: string[];
+      /**
+       * @description The numbers of items to return when `page_cursor` is set.
+       *
+       * *New in version 2.9.0*
+       *
+       * @default 100
+       */
+      page_limit?: number;
+      /**
+       * @description Cursor of the page to return, from the `next_cursor` of the previous page, or an empty
+       * string for the first page. Pages are ordered by DAG ID, DAG run ID, task ID and map index,
+       * and their total number of entries is not counted.
+       *
+       * *New in version 2.9.0*
+       */
+      page_cursor?: string;
+      /**
+       * @description Fields of the task instances exported as newline-delimited JSON.
+       *
+       * *New in version 2.9.0*
+       */
+      fields?: string[];
     };
     /**
      * @description Schedule interval. Defines how often DAG runs, this object gets added to your latest task instance's
@@ -2379,6 +2465,15 @@ export interface components {
     PageOffset: number;
     /** @description The numbers of items to return. */
     PageLimit: number;
+    /**
+     * @description Cursor of the page to return, from the `next_cursor` of the previous page, or an empty value
+     * for the first page. Pages are then ordered by DAG ID, DAG run ID, task ID and map index, so
+     * that every page is as fast to fetch as the first one, and their total number of entries is
+     * not counted. Cannot be used with `offset`.
+     *
+     * *New in version 2.9.0*
+     */
+    PageCursor: string;
     /**
      * @description The username of the user.
      *
@@ -2557,6 +2652,12 @@ export interface components {
     UpdateMask: string[];
     /** @description List of field for return. */
     ReturnFields: string[];
+    /**
+     * @description List of fields of the task instances exported as newline-delimited JSON.
+     *
+     * *New in version 2.9.0*
+     */
+    ExportFields: string[];
   };
   requestBodies: {};
   headers: {};
@@ -3129,6 +3230,36 @@ export interface operations {
       };
     };
   };
+  /**
+   * Trigger several runs of a DAG at once, which is faster than triggering them one by one. The DAG runs are validated one by one, and the valid ones are created together. The result of every DAG run is returned in the order of the request, with the DAG run if it was created, or with the error which prevented its creation otherwise. If DAG is paused then dagrun state will remain queued, and the task won't run.
+   * At most `[api] maximum_trigger_dag_runs` DAG runs can be triggered at once.
+   * *New in version 2.9.0*
+   */
+  post_dag_runs: {
+    parameters: {
+      path: {
+        /** The DAG ID. */
+        dag_id: components["parameters"]["DAGID"];
+      };
+    };
+    responses: {
+      /** Success. */
+      200: {
+        content: {
+          "application/json": components["schemas"]["DAGRunTriggerResultCollection"];
+        };
+      };
+      400: components["responses"]["BadRequest"];
+      401: components["responses"]["Unauthenticated"];
+      403: components["responses"]["PermissionDenied"];
+      404: components["responses"]["NotFound"];
+    };
+    requestBody: {
+      content: {
+        "application/json": components["schemas"]["TriggerDAGRuns"];
+      };
+    };
+  };
   /** This endpoint is a POST to allow filtering across a large number of DAG IDs, where as a GET it would run in to maximum HTTP request URL length limit. */
   get_dag_runs_batch: {
     responses: {
@@ -3810,6 +3941,21 @@ export interface operations {
         limit?: components["parameters"]["PageLimit"];
         /** The number of items to skip before starting to collect the result set. */
         offset?: components["parameters"]["PageOffset"];
+        /**
+         * Cursor of the page to return, from the `next_cursor` of the previous page, or an empty value
+         * for the first page. Pages are then ordered by DAG ID, DAG run ID, task ID and map index, so
+         * that every page is as fast to fetch as the first one, and their total number of entries is
+         * not counted. Cannot be used with `offset`.
+         *
+         * *New in version 2.9.0*
+         */
+        cursor?: components["parameters"]["PageCursor"];
+        /**
+         * List of fields of the task instances exported as newline-delimited JSON.
+         *
+         * *New in version 2.9.0*
+         */
+        fields?: components["parameters"]["ExportFields"];
       };
     };
     responses: {
@@ -3817,6 +3963,7 @@ export interface operations {
       200: {
         content: {
           "application/json": components["schemas"]["TaskInstanceCollection"];
+          "application/x-ndjson": components["schemas"]["TaskInstanceExport"];
         };
       };
       401: components["responses"]["Unauthenticated"];
@@ -4065,6 +4212,7 @@ export interface operations {
       200: {
         content: {
           "application/json": components["schemas"]["TaskInstanceCollection"];
+          "application/x-ndjson": components["schemas"]["TaskInstanceExport"];
         };
       };
       401: components["responses"]["Unauthenticated"];
@@ -5049,6 +5197,15 @@ export type UpdateDagRunState = CamelCasedPropertiesDeep<
 export type DAGRunCollection = CamelCasedPropertiesDeep<
   components["schemas"]["DAGRunCollection"]
 >;
+export type TriggerDAGRuns = CamelCasedPropertiesDeep<
+  components["schemas"]["TriggerDAGRuns"]
+>;
+export type DAGRunTriggerResult = CamelCasedPropertiesDeep<
+  components["schemas"]["DAGRunTriggerResult"]
+>;
+export type DAGRunTriggerResultCollection = CamelCasedPropertiesDeep<
+  components["schemas"]["DAGRunTriggerResultCollection"]
+>;
 export type DagWarning = CamelCasedPropertiesDeep<
   components["schemas"]["DagWarning"]
 >;
@@ -5108,6 +5265,9 @@ export type TaskInstance = CamelCasedPropertiesDeep<
 export type TaskInstanceCollection = CamelCasedPropertiesDeep<
   components["schemas"]["TaskInstanceCollection"]
 >;
+export type TaskInstanceExport = CamelCasedPropertiesDeep<
+  components["schemas"]["TaskInstanceExport"]
+>;
 export type TaskInstanceReference = CamelCasedPropertiesDeep<
   components["schemas"]["TaskInstanceReference"]
 >;
@@ -5334,6 +5494,10 @@ export type PostDagRunVariables = CamelCasedPropertiesDeep<
   operations["post_dag_run"]["parameters"]["path"] &
     operations["post_dag_run"]["requestBody"]["content"]["application/json"]
 >;
+export type PostDagRunsVariables = CamelCasedPropertiesDeep<
+  operations["post_dag_runs"]["parameters"]["path"] &
+    operations["post_dag_runs"]["requestBody"]["content"]["application/json"]
+>;
 export type GetDagRunsBatchVariables = CamelCasedPropertiesDeep<
   operations["get_dag_runs_batch"]["requestBody"]["content"]["application/json"]
 >;
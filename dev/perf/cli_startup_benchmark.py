@@ -0,0 +1,85 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import statistics
+import subprocess
+import sys
+import time
+
+import rich_click as click
+
+COMMAND = ["tasks", "run", "dag_id", "task_id", "manual_run", "--raw", "--job-id", "1"]
+
+# Parses the command like "airflow tasks run" does, in a new interpreter every time
+PARSE_SCRIPT = """
+import airflow
+from airflow.cli.fast_path import get_parser_for_command
+from airflow.cli.cli_parser import get_parser
+
+command = {command!r}
+parser = get_parser_for_command(command) if {fast_path!r} else get_parser()
+parser.parse_args(command)
+"""
+
+
+def _parse(fast_path: bool) -> tuple[float, float, int]:
+    """Return the total time, the time spent importing after airflow and the number of imported modules."""
+    script = PARSE_SCRIPT.format(command=COMMAND, fast_path=fast_path)
+    if fast_path:
+        # Only imported to parse all commands
+        script = script.replace("from airflow.cli.cli_parser import get_parser\n", "")
+    start = time.monotonic()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", script], check=True, text=True, capture_output=True
+    )
+    duration = time.monotonic() - start
+    import_lines = [line for line in result.stderr.splitlines() if line.startswith("import time:")][1:]
+    # Top-level imports are not indented, their cumulative time includes the modules they import
+    top_level_imports = {
+        name.strip(): int(cumulative)
+        for _, cumulative, name in (line.split("|") for line in import_lines)
+        if not name.startswith("  ")
+    }
+    import_time = sum(us for name, us in top_level_imports.items() if name != "airflow") / 1e6
+    return duration, import_time, len(import_lines)
+
+
+@click.command()
+@click.option("--repeat", default=5, help="number of processes started for each case")
+def main(repeat):
+    """
+    This script measures how long starting the ``airflow tasks run`` command run for every task takes.
+
+    New interpreters import Airflow then parse an ``airflow tasks run --raw`` command, either with the
+    parser of all commands or with the parser of the fast path. The time spent importing modules after
+    Airflow itself is measured with ``python -X importtime``.
+    """
+    for name, fast_path in (("parser of all commands", False), ("fast path parser", True)):
+        durations, import_times = [], []
+        for _ in range(repeat):
+            duration, import_time, modules = _parse(fast_path)
+            durations.append(duration)
+            import_times.append(import_time)
+        print(
+            f"{name}: {statistics.median(durations):.3f}s in total, {statistics.median(import_times):.3f}s "
+            f"importing modules after airflow (median), {modules} modules imported"
+        )
+
+
+if __name__ == "__main__":
+    main()
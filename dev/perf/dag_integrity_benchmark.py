@@ -0,0 +1,76 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import statistics
+import time
+
+import pendulum
+import rich_click as click
+
+
+def _build_dag(shape: str, tasks: int):
+    """Return a DAG with a root task, then the tasks in parallel or in a chain, then a sink task."""
+    from airflow.models.baseoperator import chain
+    from airflow.models.dag import DAG
+    from airflow.operators.empty import EmptyOperator
+
+    with DAG(f"{shape}_{tasks}", schedule=None, start_date=pendulum.datetime(2024, 1, 1, tz="UTC")) as dag:
+        root = EmptyOperator(task_id="root")
+        middle = [EmptyOperator(task_id=f"task_{i}") for i in range(tasks)]
+        sink = EmptyOperator(task_id="sink")
+        if shape == "wide":
+            chain(root, middle, sink)
+        else:
+            chain(root, *middle, sink)
+    return dag
+
+
+def _measure(function, repeat: int) -> float:
+    """Return the median time taken by the function."""
+    durations = []
+    for _ in range(repeat):
+        start = time.monotonic()
+        function()
+        durations.append(time.monotonic() - start)
+    return statistics.median(durations)
+
+
+@click.command()
+@click.option("--tasks", default=10000, help="number of tasks of the DAGs")
+@click.option("--repeat", default=10, help="number of times the DAGs are checked")
+def main(tasks, repeat):
+    """
+    This script measures how long checking the task graph of large DAGs takes.
+
+    A wide DAG, with all the tasks between a root and a sink task, and a deep DAG, with all the tasks in a
+    chain, are checked for cycles and validated, which also checks the setup and teardown tasks.
+    """
+    from airflow.utils.dag_cycle_tester import check_cycle
+
+    for shape in ("wide", "deep"):
+        dag = _build_dag(shape, tasks)
+        cycle_duration = _measure(lambda: check_cycle(dag), repeat)
+        validate_duration = _measure(dag.validate, repeat)
+        print(
+            f"{shape} DAG of {tasks} tasks: check_cycle {cycle_duration * 1000:.1f}ms, "
+            f"validate {validate_duration * 1000:.1f}ms (median)"
+        )
+
+
+if __name__ == "__main__":
+    main()
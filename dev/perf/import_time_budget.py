@@ -0,0 +1,86 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import statistics
+import subprocess
+import sys
+
+import rich_click as click
+
+# What the processes import before doing any work
+SCENARIOS = {
+    "scheduler": "import airflow.jobs.scheduler_job_runner",
+    "task runner": "import airflow.cli.commands.task_command",
+    "DAG file parse": "from airflow.models.dag import DAG; from airflow.operators.bash import BashOperator",
+}
+
+# Imported lazily, reported when imported anyway
+HEAVY_MODULES = ("kubernetes", "flask", "flask_appbuilder", "pydantic")
+
+
+def _import(script: str) -> tuple[float, int, set[str]]:
+    """Return the import time, the number of imported modules and the heavy modules imported."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", script], check=True, text=True, capture_output=True
+    )
+    import_lines = [line for line in result.stderr.splitlines() if line.startswith("import time:")][1:]
+    imports = [(int(cumulative), name) for _, cumulative, name in (line.split("|") for line in import_lines)]
+    # Top-level imports are not indented, their cumulative time includes the modules they import
+    import_time = sum(us for us, name in imports if not name.startswith("  ")) / 1e6
+    heavy_modules = {name.strip() for _, name in imports}.intersection(HEAVY_MODULES)
+    return import_time, len(imports), heavy_modules
+
+
+@click.command()
+@click.option("--repeat", default=5, help="number of processes started for each scenario")
+@click.option("--scheduler-budget", default=1.75, help="maximum import time of the scheduler, in seconds")
+@click.option("--task-runner-budget", default=2.0, help="maximum import time of the task runner, in seconds")
+@click.option("--dag-parse-budget", default=1.5, help="maximum import time of a DAG file, in seconds")
+def main(repeat, scheduler_budget, task_runner_budget, dag_parse_budget):
+    """
+    This script checks how long the Airflow processes take to import their modules against budgets.
+
+    For every scenario, new interpreters import what the scheduler, the task runner or a DAG file
+    importing a DAG and an operator import, measured with ``python -X importtime``. The median import
+    time is compared to the budget of the scenario, and the script exits with an error when a budget is
+    exceeded, so that it can be run before and after a change.
+    """
+    budgets = {
+        "scheduler": scheduler_budget,
+        "task runner": task_runner_budget,
+        "DAG file parse": dag_parse_budget,
+    }
+    exceeded = []
+    for name, script in SCENARIOS.items():
+        import_times = []
+        for _ in range(repeat):
+            import_time, modules, heavy_modules = _import(script)
+            import_times.append(import_time)
+        median = statistics.median(import_times)
+        print(
+            f"{name}: {median:.3f}s (median) for a budget of {budgets[name]:.3f}s, {modules} modules imported, "
+            f"heavy modules imported: {', '.join(sorted(heavy_modules)) or 'none'}"
+        )
+        if median > budgets[name]:
+            exceeded.append(name)
+    if exceeded:
+        sys.exit(f"Import time budget exceeded for: {', '.join(exceeded)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+import rich_click as click
+
+# Run in a new interpreter every time, like a CLI command, a task or a DAG file processor would
+DISCOVERY_SCRIPT = """
+import time
+
+start = time.perf_counter()
+from airflow.providers_manager import ProvidersManager
+
+imported = time.perf_counter()
+providers_manager = ProvidersManager()
+providers_manager.initialize_providers_list()
+print(imported - start, time.perf_counter() - imported, len(providers_manager.providers))
+"""
+
+
+def _discover(index_file: str) -> tuple[float, float, int]:
+    env = {**os.environ, "AIRFLOW__CORE__PROVIDERS_INDEX_FILE": index_file}
+    output = subprocess.check_output([sys.executable, "-c", DISCOVERY_SCRIPT], env=env, text=True)
+    import_time, discovery_time, providers = output.split()[-3:]
+    return float(import_time), float(discovery_time), int(providers)
+
+
+@click.command()
+@click.option("--repeat", default=5, help="number of processes started for each case")
+def main(repeat):
+    """
+    This script measures how long discovering the providers takes in a new Airflow process.
+
+    New interpreters import the providers manager then discover the providers, first without the providers
+    index, then with an index written by a previous process. The import time of the providers manager is
+    given separately, as it does not depend on the index.
+    """
+    with tempfile.TemporaryDirectory() as folder:
+        index_file = os.path.join(folder, "providers_index.json")
+        # Writes the index used by the "with index" case
+        _discover(index_file)
+        for name, path in (("without index", ""), ("with index", index_file)):
+            import_times, discovery_times = [], []
+            for _ in range(repeat):
+                import_time, discovery_time, providers = _discover(path)
+                import_times.append(import_time)
+                discovery_times.append(discovery_time)
+            print(
+                f"{name}: import {statistics.median(import_times):.3f}s, "
+                f"discovery of {providers} providers {statistics.median(discovery_times):.3f}s (median)"
+            )
+
+
+if __name__ == "__main__":
+    main()
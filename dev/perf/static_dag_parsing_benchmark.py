@@ -0,0 +1,74 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import os
+import statistics
+import time
+from pathlib import Path
+
+import rich_click as click
+
+
+def _parse(file_paths: list[str], static_dag_parsing: bool, repeat: int) -> tuple[float, int]:
+    """Return the median time taken to parse all files and the number of files parsed statically."""
+    from airflow.dag_processing.static_parser import parse_static_dags
+    from airflow.models.dagbag import DagBag
+
+    os.environ["AIRFLOW__CORE__STATIC_DAG_PARSING"] = str(static_dag_parsing)
+    durations = []
+    for _ in range(repeat):
+        dagbag = DagBag(dag_folder=os.devnull, include_examples=False, collect_dags=False)
+        start = time.monotonic()
+        for file_path in file_paths:
+            dagbag.process_file(file_path, only_if_updated=False)
+        durations.append(time.monotonic() - start)
+    static_files = sum(parse_static_dags(file_path) is not None for file_path in file_paths)
+    return statistics.median(durations), static_files
+
+
+@click.command()
+@click.option(
+    "--dag-folder", default=None, help="folder of the DAG files to parse, the example DAGs by default"
+)
+@click.option("--repeat", default=20, help="number of times all the files are parsed")
+def main(dag_folder, repeat):
+    """
+    This script measures how long parsing DAG files takes with and without static DAG parsing.
+
+    All the Python files of the folder are parsed by a DagBag, importing them, then with
+    ``[core] static_dag_parsing`` enabled, which reads the static files from their syntax tree and imports
+    the others. The modules imported by the files are imported before measuring, like in a DAG file
+    processor forked after pre-importing them.
+    """
+    if dag_folder is None:
+        import airflow.example_dags
+
+        dag_folder = airflow.example_dags.__path__[0]
+    file_paths = sorted(str(path) for path in Path(dag_folder).glob("*.py") if path.name != "__init__.py")
+    # Imports the modules used by the files
+    _parse(file_paths, static_dag_parsing=False, repeat=1)
+    for static_dag_parsing in (False, True):
+        duration, static_files = _parse(file_paths, static_dag_parsing, repeat)
+        print(
+            f"static_dag_parsing={static_dag_parsing}: {duration:.3f}s to parse {len(file_paths)} files "
+            f"(median), {static_files} static files"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import textwrap
+import time
+
+import rich_click as click
+
+DAG_ID = "task_startup_timing"
+TASK_ID = "record_start"
+
+DAG_FILE_CONTENT = textwrap.dedent(
+    f"""
+    import datetime
+    import os
+    import time
+
+    from airflow.models.dag import DAG
+    from airflow.operators.python import PythonOperator
+
+
+    def record_start():
+        with open(os.environ["TASK_STARTUP_TIMING_FILE"], "w") as timing_file:
+            timing_file.write(repr(time.time()))
+
+
+    with DAG("{DAG_ID}", schedule=None, start_date=datetime.datetime(2024, 1, 1), catchup=False):
+        PythonOperator(task_id="{TASK_ID}", python_callable=record_start)
+    """
+)
+
+
+def _print_stats(name: str, values: list[float]) -> None:
+    print(f"{name}: ", end="")
+    if len(values) > 1:
+        print(
+            f"{statistics.mean(values):.4f}s (±{statistics.stdev(values):.3f}s), "
+            f"median {statistics.median(values):.4f}s, min {min(values):.4f}s, max {max(values):.4f}s"
+        )
+    else:
+        print(f"{values[0]:.4f}s")
+
+
+@click.command()
+@click.option("--repeat", default=10, help="number of times to start the task, to reduce variance")
+@click.option(
+    "--raw",
+    is_flag=True,
+    default=False,
+    help="Start the task with `--raw`, without the LocalTaskJob supervisor, instead of `--local`.",
+)
+@click.option(
+    "--profiler",
+    type=click.Choice(["", "cprofile", "pyinstrument"]),
+    default="",
+    help="Also profile the start-up of the task processes with the given profiler.",
+)
+def main(repeat, raw, profiler):
+    """
+    This script can be used to measure the end-to-end start-up latency of ``airflow tasks run``.
+
+    It creates a DAG with a single task which records the time it starts executing, then runs the task
+    ``--repeat`` times with ``airflow tasks run`` in a new process, in a new DAG run every time.
+
+    The start-up latency is the time elapsed between the start of the ``airflow tasks run`` process and
+    the start of the user code of the task. The total time also includes the time taken to finish the
+    task and exit.
+
+    The duration of the individual start-up phases is emitted as ``task.startup.*`` metrics, enable
+    StatsD (``[metrics] statsd_on``) to collect them. Profiles written with ``--profiler`` are stored in
+    ``[core] task_startup_profile_folder``.
+    """
+    from airflow.models.dagbag import DagBag
+    from airflow.utils import timezone
+    from airflow.utils.state import DagRunState
+    from airflow.utils.types import DagRunType
+
+    startup_times = []
+    total_times = []
+    with tempfile.TemporaryDirectory() as dags_folder:
+        dag_file = os.path.join(dags_folder, f"{DAG_ID}.py")
+        timing_file = os.path.join(dags_folder, "timing")
+        with open(dag_file, "w") as f:
+            f.write(DAG_FILE_CONTENT)
+
+        dag = DagBag(dags_folder, include_examples=False).get_dag(DAG_ID)
+        dag.sync_to_db()
+
+        env = {
+            **os.environ,
+            "TASK_STARTUP_TIMING_FILE": timing_file,
+            "AIRFLOW__CORE__TASK_STARTUP_PROFILER": profiler,
+        }
+        for count in range(repeat):
+            logical_date = timezone.utcnow()
+            run_id = f"startup_timing__{logical_date.isoformat()}"
+            dag.create_dagrun(
+                run_id=run_id,
+                state=DagRunState.RUNNING,
+                execution_date=logical_date,
+                data_interval=(logical_date, logical_date),
+                run_type=DagRunType.MANUAL,
+            )
+            command = [
+                sys.executable,
+                "-m",
+                "airflow",
+                "tasks",
+                "run",
+                "--raw" if raw else "--local",
+                DAG_ID,
+                TASK_ID,
+                run_id,
+                "--subdir",
+                dag_file,
+            ]
+
+            start = time.time()
+            subprocess.run(command, env=env, check=True, stdout=subprocess.DEVNULL)
+            total_times.append(time.time() - start)
+            with open(timing_file) as f:
+                startup_times.append(float(f.read()) - start)
+            os.remove(timing_file)
+            print(f"Run {count + 1} start-up time: {startup_times[-1]:.4f}s, total: {total_times[-1]:.4f}s")
+
+    print()
+    _print_stats("Task start-up time", startup_times)
+    _print_stats("Task total time", total_times)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import os
+import time
+
+import rich_click as click
+
+BASH_COMMAND = """
+{% for i in range(params.loops) %}
+echo "{{ ds }} {{ ts_nodash }} {{ run_id }} {{ task.task_id }} {{ params.name | upper }} {{ i }}"
+{% endfor %}
+{% if dag_run.conf.get("debug") %}set -x{% endif %}
+exit {{ params.exit_code }}
+"""
+
+
+def _render(task, context, task_instances: int) -> float:
+    from airflow.templates import _get_compiled_template_cache
+
+    _get_compiled_template_cache.cache_clear()
+    start = time.monotonic()
+    for _ in range(task_instances):
+        # Like TaskInstance.render_templates, which gets a new environment for every task instance
+        jinja_env = task.get_template_env()
+        task.render_template(task.bash_command, context, jinja_env)
+    return time.monotonic() - start
+
+
+@click.command()
+@click.option("--task-instances", default=5000, help="number of task instances whose templates are rendered")
+@click.option("--cache-size", default=1000, help="value of [core] compiled_template_cache_size to test")
+def main(task_instances, cache_size):
+    """
+    This script measures how long rendering the templates of the task instances of a task takes.
+
+    The ``bash_command`` template of a task is rendered for the given number of task instances, like the
+    instances of a mapped task, once with ``[core] compiled_template_cache_size`` set to 0 so that the
+    template is compiled for every task instance, then with the given cache size so that it is compiled
+    once.
+    """
+    from airflow.models.dag import DAG
+    from airflow.operators.bash import BashOperator
+    from airflow.utils import timezone
+
+    with DAG("template_render_benchmark", schedule=None, start_date=timezone.datetime(2024, 1, 1)) as dag:
+        task = BashOperator(task_id="render", bash_command=BASH_COMMAND)
+    logical_date = timezone.datetime(2024, 1, 1)
+    context = {
+        "dag": dag,
+        "task": task,
+        # Not validated like task.params, which would take most of the time
+        "params": {"loops": 3, "name": "x", "exit_code": 0},
+        "ds": logical_date.strftime("%Y-%m-%d"),
+        "ts_nodash": logical_date.strftime("%Y%m%dT%H%M%S"),
+        "run_id": "manual__2024-01-01T00:00:00+00:00",
+        "dag_run": type("DagRun", (), {"conf": {}})(),
+    }
+
+    durations = {}
+    for size in (0, cache_size):
+        os.environ["AIRFLOW__CORE__COMPILED_TEMPLATE_CACHE_SIZE"] = str(size)
+        durations[size] = _render(task, context, task_instances)
+        print(
+            f"cache size {size}: {durations[size]:.3f}s, "
+            f"{durations[size] / task_instances * 1e6:.1f}us per task instance"
+        )
+    if durations[cache_size]:
+        print(f"speed-up: {durations[0] / durations[cache_size]:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import time
+
+import rich_click as click
+from sqlalchemy import delete
+
+DAG_ID = "xcom_bulk_pull_benchmark"
+RUN_ID = "xcom_bulk_pull_benchmark"
+TASK_ID = "mapped"
+
+
+def _delete_xcoms(session) -> None:
+    from airflow.models.dagrun import DagRun
+    from airflow.models.taskinstance import TaskInstance
+    from airflow.models.xcom import XCom
+
+    session.execute(delete(XCom).where(XCom.dag_id == DAG_ID))
+    session.execute(delete(TaskInstance).where(TaskInstance.dag_id == DAG_ID))
+    session.execute(delete(DagRun).where(DagRun.dag_id == DAG_ID))
+    session.commit()
+
+
+def _insert_xcoms(map_indexes: int, session) -> None:
+    from airflow.models.dagrun import DagRun
+    from airflow.models.taskinstance import TaskInstance
+    from airflow.models.xcom import XCom
+    from airflow.utils import timezone
+    from airflow.utils.xcom import XCOM_RETURN_KEY
+
+    _delete_xcoms(session)
+    now = timezone.utcnow()
+    dag_run = DagRun(dag_id=DAG_ID, run_id=RUN_ID, execution_date=now, run_type="manual")
+    session.add(dag_run)
+    session.flush()
+    session.bulk_insert_mappings(
+        TaskInstance,
+        [
+            {
+                "dag_id": DAG_ID,
+                "task_id": TASK_ID,
+                "run_id": RUN_ID,
+                "map_index": i,
+                "state": "success",
+                "pool": "default_pool",
+            }
+            for i in range(map_indexes)
+        ],
+    )
+    value = XCom.serialize_value({"rows": list(range(10)), "path": "s3://bucket/key"})
+    session.bulk_insert_mappings(
+        XCom,
+        [
+            {
+                "dag_run_id": dag_run.id,
+                "dag_id": DAG_ID,
+                "task_id": TASK_ID,
+                "run_id": RUN_ID,
+                "map_index": i,
+                "key": XCOM_RETURN_KEY,
+                "value": value,
+                "timestamp": now,
+            }
+            for i in range(map_indexes)
+        ],
+    )
+    session.commit()
+
+
+def _pull(session):
+    from airflow.models.xcom import LazyXComAccess, XCom
+    from airflow.utils.xcom import XCOM_RETURN_KEY
+
+    query = XCom.get_many(
+        key=XCOM_RETURN_KEY, run_id=RUN_ID, dag_ids=DAG_ID, task_ids=TASK_ID, session=session
+    )
+    return LazyXComAccess.build_from_xcom_query(query.order_by(None).order_by(XCom.map_index.asc()))
+
+
+def _check_count(values, count: int) -> None:
+    pulled = sum(1 for _ in values)
+    if pulled != count:
+        raise RuntimeError(f"Pulled {pulled} XComs instead of {count}")
+
+
+@click.command()
+@click.option("--map-indexes", default="10000,100000", help="comma-separated numbers of map indexes to test")
+@click.option(
+    "--index-access-limit",
+    default=2000,
+    help="maximum number of map indexes accessed one query per item, which takes quadratic time",
+)
+def main(map_indexes, index_access_limit):
+    """
+    This script measures how long pulling the XComs of a mapped task takes in the downstream task.
+
+    It stores the XComs of a mapped task with the given numbers of map indexes in the Airflow metadata
+    database, then times the ways a downstream task reads them:
+
+    * iterating over them, which fetches them all with one streamed query then deserializes them,
+    * iterating over them again and accessing them by index, which reuses the fetched rows,
+    * accessing them by index before they are fetched, which runs one query per item, for up to
+      ``--index-access-limit`` map indexes.
+    """
+    from airflow.settings import Session
+
+    session = Session()
+    for count in (int(n) for n in map_indexes.split(",")):
+        _insert_xcoms(count, session)
+        print(f"{count} map indexes:")
+
+        values = _pull(session)
+        start = time.monotonic()
+        _check_count(values, count)
+        print(f"  first iteration: {time.monotonic() - start:.3f}s")
+
+        start = time.monotonic()
+        _check_count(values, count)
+        for i in range(len(values)):
+            values[i]
+        print(f"  second iteration and index access: {time.monotonic() - start:.3f}s")
+
+        values = _pull(session)
+        items = min(count, index_access_limit)
+        start = time.monotonic()
+        for i in range(items):
+            values[i]
+        print(f"  index access without iterating first ({items} items): {time.monotonic() - start:.3f}s")
+
+    _delete_xcoms(session)
+    session.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import importlib.util
+import json
+import pickle
+import time
+from typing import Any, Callable
+
+import rich_click as click
+from rich.console import Console
+from rich.table import Table
+
+from airflow.exceptions import AirflowConfigException
+
+
+def _payloads(rows: int) -> dict[str, Any]:
+    payloads: dict[str, Any] = {
+        "numbers": [i * 0.5 for i in range(rows)],
+        "records": [{"id": i, "name": f"row {i}", "score": i / 7, "valid": i % 2 == 0} for i in range(rows)],
+    }
+    if importlib.util.find_spec("numpy"):
+        import numpy as np
+
+        payloads["ndarray"] = np.random.default_rng(0).random((rows, 8))
+    if importlib.util.find_spec("pandas"):
+        import pandas as pd
+
+        payloads["dataframe"] = pd.DataFrame(payloads["records"])
+    return payloads
+
+
+def _encoders() -> dict[str, tuple[Callable[[Any], bytes], Callable[[bytes], Any]]]:
+    from airflow.serialization import xcom_codecs
+    from airflow.utils.json import XComDecoder, XComEncoder
+
+    # Same as BaseXCom.serialize_value and BaseXCom.deserialize_value without codecs nor pickling
+    encoders = {
+        "json": (
+            lambda value: json.dumps(value, cls=XComEncoder).encode("UTF-8"),
+            lambda data: json.loads(data.decode("UTF-8"), cls=XComDecoder),
+        ),
+        "pickle": (pickle.dumps, pickle.loads),
+    }
+    for name in sorted(xcom_codecs._codecs):
+        codec = xcom_codecs.get_codec(name)
+        try:
+            codec.check_available()
+        except AirflowConfigException as e:
+            print(f"Skipping the {name} codec: {e}")
+            continue
+        encoders[name] = (
+            lambda value, codec=codec: xcom_codecs.encode_value(value, [codec]),
+            xcom_codecs.decode_value,
+        )
+    return encoders
+
+
+def _best_time(func: Callable[[], Any], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+@click.command()
+@click.option("--rows", default=100_000, help="number of rows in each sample payload")
+@click.option("--repeat", default=5, help="number of times to encode and decode each payload, best is kept")
+def main(rows, repeat):
+    """
+    This script compares the size and speed of the XCom encodings on sample payloads.
+
+    Every payload is encoded as JSON, the default XCom encoding, with pickle and with each XCom codec
+    whose dependencies are installed. The throughputs are given in megabytes of JSON per second, so that
+    they are comparable across encodings. Codecs which do not support a payload are skipped for it, the
+    ``arrow`` codec only supports pandas DataFrames and numpy arrays.
+    """
+    console = Console()
+    encoders = _encoders()
+    for payload_name, payload in _payloads(rows).items():
+        json_encode = encoders["json"][0]
+        try:
+            json_size = len(json_encode(payload))
+        except TypeError:
+            json_size = 0
+
+        table = Table(title=f"{payload_name} ({rows} rows)")
+        for column in ("encoding", "size", "ratio to JSON", "encode MB/s", "decode MB/s"):
+            table.add_column(column, justify="right")
+        for name, (encode, decode) in encoders.items():
+            try:
+                data = encode(payload)
+            except TypeError:
+                data = None
+            if data is None:
+                table.add_row(name, "unsupported", "", "", "")
+                continue
+            reference_size = json_size or len(data)
+            encode_time = _best_time(lambda: encode(payload), repeat)
+            decode_time = _best_time(lambda: decode(data), repeat)
+            table.add_row(
+                name,
+                f"{len(data) / 1e6:.2f} MB",
+                f"{len(data) / json_size:.2f}" if json_size else "",
+                f"{reference_size / 1e6 / encode_time:.1f}",
+                f"{reference_size / 1e6 / decode_time:.1f}",
+            )
+        console.print(table)
+
+
+if __name__ == "__main__":
+    main()
@@ -38,6 +38,7 @@ from airflow.providers_manager import (
     ProviderInfo,
     ProvidersManager,
 )
+from tests.test_utils.config import conf_vars
 
 AIRFLOW_SOURCES_ROOT = Path(__file__).resolve().parents[2]
 
@@ -434,6 +435,80 @@ class TestProviderManager:
                 "Optional provider feature disabled when importing 'HookClass' from 'test_package' package"
             ] == self._caplog.messages
 
+    def test_providers_index(self, tmp_path):
+        index_path = tmp_path / "providers_index.json"
+        with conf_vars({("core", "providers_index_file"): str(index_path)}):
+            providers_manager = ProvidersManager()
+            providers_manager._provider_dict = {}
+            providers_manager._discover_providers()
+            providers = providers_manager._provider_dict
+            assert len(providers) > 65
+            assert json.loads(index_path.read_text())["key"] == providers_manager._get_providers_index_key()
+
+            providers_manager._provider_dict = {}
+            # The schema validator is only created if providers are discovered
+            providers_manager.__dict__.pop("_provider_schema_validator", None)
+            with patch.object(
+                ProvidersManager, "_add_provider_info_from_local_source_file"
+            ) as mock_add_provider_info:
+                providers_manager._discover_providers()
+            mock_add_provider_info.assert_not_called()
+            assert "_provider_schema_validator" not in providers_manager.__dict__
+            assert providers_manager._provider_dict == providers
+            assert list(providers_manager._provider_dict) == sorted(providers)
+
+    def test_providers_index_not_used_when_providers_changed(self, tmp_path):
+        index_path = tmp_path / "providers_index.json"
+        with conf_vars({("core", "providers_index_file"): str(index_path)}):
+            providers_manager = ProvidersManager()
+            providers_manager._provider_dict = {}
+            providers_manager._discover_providers()
+
+            providers_manager._provider_dict = {}
+            with patch.object(
+                ProvidersManager,
+                "_get_providers_index_key",
+                return_value=[*providers_manager._get_providers_index_key(), ["package", "new", "1.0", "x"]],
+            ), patch.object(
+                ProvidersManager,
+                "_add_provider_info_from_local_source_file",
+                wraps=providers_manager._add_provider_info_from_local_source_file,
+            ) as mock_add_provider_info:
+                providers_manager._discover_providers()
+            assert mock_add_provider_info.call_count > 65
+            assert json.loads(index_path.read_text())["key"][-1] == ["package", "new", "1.0", "x"]
+
+    def test_providers_index_invalid(self, tmp_path):
+        index_path = tmp_path / "providers_index.json"
+        index_path.write_text("{")
+        with conf_vars({("core", "providers_index_file"): str(index_path)}):
+            providers_manager = ProvidersManager()
+            providers_manager._provider_dict = {}
+            with self._caplog.at_level(logging.WARNING):
+                providers_manager._discover_providers()
+            assert "Error when loading the providers index" in self._caplog.text
+            assert len(providers_manager._provider_dict) > 65
+            assert json.loads(index_path.read_text())["key"] == providers_manager._get_providers_index_key()
+
+    def test_rebuild_providers_index(self, tmp_path):
+        index_path = tmp_path / "providers_index.json"
+        with conf_vars({("core", "providers_index_file"): str(index_path)}):
+            providers_manager = ProvidersManager()
+            index_path.write_text(
+                json.dumps({"key": providers_manager._get_providers_index_key(), "providers": {}})
+            )
+            assert providers_manager.rebuild_providers_index() == str(index_path)
+            assert len(providers_manager.providers) > 65
+            assert len(json.loads(index_path.read_text())["providers"]) == len(providers_manager.providers)
+
+    def test_providers_index_disabled(self, tmp_path):
+        with conf_vars({("core", "providers_index_file"): ""}):
+            providers_manager = ProvidersManager()
+            with patch.object(ProvidersManager, "_get_providers_index_key") as mock_get_providers_index_key:
+                assert providers_manager.rebuild_providers_index() is None
+            mock_get_providers_index_key.assert_not_called()
+            assert len(providers_manager.providers) > 65
+
 
 @pytest.mark.parametrize(
     "value, expected_outputs,",
@@ -22,12 +22,15 @@ from unittest import mock
 
 import pytest
 import time_machine
+from sqlalchemy import select
 
 from airflow.api_connexion.exceptions import EXCEPTIONS_LINK_MAP
 from airflow.datasets import Dataset
 from airflow.models.dag import DAG, DagModel
 from airflow.models.dagrun import DagRun
 from airflow.models.dataset import DatasetEvent, DatasetModel
+from airflow.models.taskinstance import TaskInstance
+from airflow.operators.bash import BashOperator
 from airflow.operators.empty import EmptyOperator
 from airflow.security import permissions
 from airflow.utils import timezone
@@ -1566,6 +1569,139 @@ class TestPostDagRun(TestDagRunEndpoint):
         assert response.status_code == 403
 
 
+class TestPostDagRuns(TestDagRunEndpoint):
+    def test_should_respond_200(self, session):
+        self._create_test_dag_run()
+        dag = DAG(dag_id="TEST_DAG_ID", schedule=None)
+        self.app.dag_bag.bag_dag(dag, root_dag=dag)
+        request_json = {
+            "dag_runs": [
+                {"dag_run_id": "TEST_DAG_RUN_1", "logical_date": "2021-06-11T18:00:00+00:00", "note": "note"},
+                {"dag_run_id": "TEST_DAG_RUN_ID_1", "logical_date": "2021-06-12T18:00:00+00:00"},
+                {"dag_run_id": "TEST_DAG_RUN_2", "logical_date": self.default_time},
+                {"dag_run_id": "TEST_DAG_RUN_3", "logical_date": "2021-06-11T18:00:00+00:00"},
+                {"dag_run_id": "TEST_DAG_RUN_4", "data_interval_start": "2021-06-13T18:00:00+00:00"},
+                {"dag_run_id": "scheduled__TEST_DAG_RUN_5", "logical_date": "2021-06-14T18:00:00+00:00"},
+                {
+                    "dag_run_id": "TEST_DAG_RUN_6",
+                    "logical_date": "2021-06-15T18:00:00+00:00",
+                    "data_interval_start": "2021-06-14T00:00:00+00:00",
+                    "data_interval_end": "2021-06-15T00:00:00+00:00",
+                    "conf": {"key": "value"},
+                },
+            ]
+        }
+        response = self.client.post(
+            "api/v1/dags/TEST_DAG_ID/triggerDagRuns",
+            json=request_json,
+            environ_overrides={"REMOTE_USER": "test"},
+        )
+
+        assert response.status_code == 200, response.data
+        results = response.json["results"]
+        assert [result["status"] for result in results] == [200, 409, 409, 409, 400, 400, 200]
+        assert results[0]["dag_run"] == {
+            "conf": {},
+            "dag_id": "TEST_DAG_ID",
+            "dag_run_id": "TEST_DAG_RUN_1",
+            "end_date": None,
+            "execution_date": "2021-06-11T18:00:00+00:00",
+            "logical_date": "2021-06-11T18:00:00+00:00",
+            "external_trigger": True,
+            "start_date": None,
+            "state": "queued",
+            "data_interval_end": "2021-06-11T18:00:00+00:00",
+            "data_interval_start": "2021-06-11T18:00:00+00:00",
+            "last_scheduling_decision": None,
+            "run_type": "manual",
+            "note": "note",
+        }
+        assert results[1]["detail"] == (
+            "DAGRun with DAG ID: 'TEST_DAG_ID' and DAGRun ID: 'TEST_DAG_RUN_ID_1' already exists"
+        )
+        assert results[2]["detail"] == (
+            "DAGRun with DAG ID: 'TEST_DAG_ID' and "
+            "DAGRun logical date: '2020-06-11 18:00:00+00:00' already exists"
+        )
+        assert results[3]["detail"] == (
+            "DAGRun with DAG ID: 'TEST_DAG_ID' and "
+            "DAGRun logical date: '2021-06-11 18:00:00+00:00' already exists"
+        )
+        assert results[4]["detail"] == (
+            "{'_schema': [\"Both 'data_interval_start' and 'data_interval_end' must be specified together\"]}"
+        )
+        assert "is reserved for scheduled runs" in results[5]["detail"]
+        assert results[6]["dag_run"]["conf"] == {"key": "value"}
+        assert results[6]["dag_run"]["data_interval_start"] == "2021-06-14T00:00:00+00:00"
+        assert "dag_run" not in results[1]
+        assert session.scalars(
+            select(DagRun.run_id).where(DagRun.dag_id == "TEST_DAG_ID").order_by(DagRun.run_id)
+        ).all() == ["TEST_DAG_RUN_1", "TEST_DAG_RUN_6", "TEST_DAG_RUN_ID_1", "TEST_DAG_RUN_ID_2"]
+        _check_last_log(session, dag_id="TEST_DAG_ID", event="api.post_dag_runs", execution_date=None)
+
+    def test_should_create_task_instances(self, session):
+        self._create_dag("TEST_DAG_ID")
+        dag = self.app.dag_bag.get_dag("TEST_DAG_ID")
+        task_1 = BashOperator(task_id="task_1", bash_command="echo 1", dag=dag)
+        BashOperator.partial(task_id="mapped", dag=dag).expand(bash_command=["echo 1", "echo 2"])
+        BashOperator.partial(task_id="mapped_upstream", dag=dag).expand(bash_command=task_1.output)
+        response = self.client.post(
+            "api/v1/dags/TEST_DAG_ID/triggerDagRuns",
+            json={"dag_runs": [{"dag_run_id": f"TEST_DAG_RUN_{i}"} for i in range(3)]},
+            environ_overrides={"REMOTE_USER": "test"},
+        )
+
+        assert response.status_code == 200, response.data
+        assert [result["status"] for result in response.json["results"]] == [200, 200, 200]
+        tis = session.execute(
+            select(TaskInstance.run_id, TaskInstance.task_id, TaskInstance.map_index).where(
+                TaskInstance.dag_id == "TEST_DAG_ID"
+            )
+        ).all()
+        assert sorted(tis) == [
+            (f"TEST_DAG_RUN_{i}", task_id, map_index)
+            for i in range(3)
+            for task_id, map_index in (("mapped", 0), ("mapped", 1), ("mapped_upstream", -1), ("task_1", -1))
+        ]
+
+    def test_response_400_too_many_dag_runs(self):
+        self._create_dag("TEST_DAG_ID")
+        with conf_vars({("api", "maximum_trigger_dag_runs"): "1"}):
+            response = self.client.post(
+                "api/v1/dags/TEST_DAG_ID/triggerDagRuns",
+                json={"dag_runs": [{"dag_run_id": "TEST_DAG_RUN_1"}, {"dag_run_id": "TEST_DAG_RUN_2"}]},
+                environ_overrides={"REMOTE_USER": "test"},
+            )
+        assert response.status_code == 400
+        assert response.json["detail"] == "At most 1 DAG runs can be triggered at once, got 2"
+
+    def test_response_404(self):
+        response = self.client.post(
+            "api/v1/dags/TEST_DAG_ID/triggerDagRuns",
+            json={"dag_runs": [{"dag_run_id": "TEST_DAG_RUN_1"}]},
+            environ_overrides={"REMOTE_USER": "test"},
+        )
+        assert response.status_code == 404
+
+    def test_should_raises_401_unauthenticated(self):
+        response = self.client.post(
+            "api/v1/dags/TEST_DAG_ID/triggerDagRuns",
+            json={"dag_runs": [{"dag_run_id": "TEST_DAG_RUN_1"}]},
+        )
+
+        assert_401(response)
+
+    @pytest.mark.parametrize("username", ["test_granular_permissions", "test_no_permissions"])
+    def test_should_raises_403_unauthorized(self, username):
+        self._create_dag("TEST_DAG_ID")
+        response = self.client.post(
+            "api/v1/dags/TEST_DAG_ID/triggerDagRuns",
+            json={"dag_runs": [{"dag_run_id": "TEST_DAG_RUN_1"}]},
+            environ_overrides={"REMOTE_USER": username},
+        )
+        assert response.status_code == 403
+
+
 class TestPatchDagRunState(TestDagRunEndpoint):
     @pytest.mark.parametrize("state", ["failed", "success", "queued"])
     @pytest.mark.parametrize("run_type", [state.value for state in DagRunType])
@@ -17,6 +17,7 @@
 from __future__ import annotations
 
 import datetime as dt
+import json
 import urllib
 from unittest import mock
 
@@ -37,6 +38,8 @@ from airflow.utils.state import State
 from airflow.utils.timezone import datetime
 from airflow.utils.types import DagRunType
 from tests.test_utils.api_connexion_utils import assert_401, create_user, delete_roles, delete_user
+from tests.test_utils.asserts import assert_queries_count
+from tests.test_utils.config import conf_vars
 from tests.test_utils.db import clear_db_runs, clear_db_sla_miss, clear_rendered_ti_fields
 from tests.test_utils.www import _check_last_log
 
@@ -734,6 +737,84 @@ class TestGetTaskInstances(TestTaskInstanceEndpoint):
         assert count == response.json["total_entries"]
         assert count == len(response.json["task_instances"])
 
+    def test_cursor_pagination(self, session):
+        self.create_task_instances(session)
+        self.create_task_instances(session, dag_id="example_skip_dag")
+        expected = sorted(
+            (ti.dag_id, ti.run_id, ti.task_id, ti.map_index) for ti in session.query(TaskInstance)
+        )
+
+        keys = []
+        cursor = ""
+        while cursor is not None:
+            response = self.client.get(
+                "/api/v1/dags/~/dagRuns/~/taskInstances",
+                query_string={"limit": 3, "cursor": cursor},
+                environ_overrides={"REMOTE_USER": "test"},
+            )
+            assert response.status_code == 200, response.json
+            assert "total_entries" not in response.json
+            assert len(response.json["task_instances"]) <= 3
+            keys.extend(
+                (ti["dag_id"], ti["dag_run_id"], ti["task_id"], ti["map_index"])
+                for ti in response.json["task_instances"]
+            )
+            cursor = response.json["next_cursor"]
+        assert keys == expected
+
+    def test_cursor_with_offset(self):
+        response = self.client.get(
+            "/api/v1/dags/~/dagRuns/~/taskInstances?cursor=&offset=1",
+            environ_overrides={"REMOTE_USER": "test"},
+        )
+        assert response.status_code == 400
+        assert response.json["detail"] == "The offset and cursor parameters cannot be used together"
+
+    def test_invalid_cursor(self):
+        response = self.client.get(
+            "/api/v1/dags/~/dagRuns/~/taskInstances?cursor=invalid",
+            environ_overrides={"REMOTE_USER": "test"},
+        )
+        assert response.status_code == 400
+        assert response.json["detail"] == "Invalid cursor: 'invalid'"
+
+    @conf_vars({("api", "maximum_page_limit"): "2"})
+    def test_ndjson(self, session):
+        self.create_task_instances(session)
+        expected = sorted(
+            (ti.task_id, ti.state)
+            for ti in session.query(TaskInstance).filter(TaskInstance.dag_id == "example_python_operator")
+        )
+
+        with assert_queries_count(6, margin=2):
+            response = self.client.get(
+                "/api/v1/dags/example_python_operator/dagRuns/~/taskInstances?fields=state,start_date",
+                headers={"Accept": "application/x-ndjson"},
+                environ_overrides={"REMOTE_USER": "test"},
+            )
+            lines = response.data.decode().splitlines()
+        assert response.status_code == 200
+        assert response.mimetype == "application/x-ndjson"
+        rows = [json.loads(line) for line in lines]
+        assert rows[0] == {
+            "dag_id": "example_python_operator",
+            "dag_run_id": "TEST_DAG_RUN_ID",
+            "task_id": rows[0]["task_id"],
+            "map_index": -1,
+            "state": "running",
+            "start_date": "2020-01-02T00:00:00+00:00",
+        }
+        assert [(row["task_id"], row["state"]) for row in rows] == expected
+
+    def test_ndjson_unknown_field(self):
+        response = self.client.get(
+            "/api/v1/dags/~/dagRuns/~/taskInstances?fields=executor_config",
+            headers={"Accept": "application/x-ndjson"},
+            environ_overrides={"REMOTE_USER": "test"},
+        )
+        assert response.status_code == 400
+        assert response.json["detail"] == "Fields cannot be exported: executor_config"
+
     def test_should_raises_401_unauthenticated(self):
         response = self.client.get(
             "/api/v1/dags/example_python_operator/dagRuns/~/taskInstances",
@@ -1046,6 +1127,43 @@ class TestGetTaskInstancesBatch(TestTaskInstanceEndpoint):
         assert response.status_code == 400
         assert expected in response.json["detail"]
 
+    def test_cursor_pagination(self, session):
+        self.create_task_instances(session)
+        self.create_task_instances(session, dag_id="example_skip_dag")
+        expected = sorted((ti.dag_id, ti.task_id) for ti in session.query(TaskInstance))
+
+        keys = []
+        cursor = ""
+        while cursor is not None:
+            response = self.client.post(
+                "/api/v1/dags/~/dagRuns/~/taskInstances/list",
+                environ_overrides={"REMOTE_USER": "test"},
+                json={"page_cursor": cursor, "page_limit": 2},
+            )
+            assert response.status_code == 200, response.json
+            keys.extend((ti["dag_id"], ti["task_id"]) for ti in response.json["task_instances"])
+            cursor = response.json["next_cursor"]
+        assert keys == expected
+
+    def test_ndjson(self, session):
+        self.create_task_instances(session)
+        response = self.client.post(
+            "/api/v1/dags/~/dagRuns/~/taskInstances/list",
+            environ_overrides={"REMOTE_USER": "test"},
+            headers={"Accept": "application/x-ndjson"},
+            json={"fields": ["pool"], "task_ids": ["print_the_context"]},
+        )
+        assert response.status_code == 200
+        assert [json.loads(line) for line in response.data.decode().splitlines()] == [
+            {
+                "dag_id": "example_python_operator",
+                "dag_run_id": "TEST_DAG_RUN_ID",
+                "task_id": "print_the_context",
+                "map_index": -1,
+                "pool": "default_pool",
+            }
+        ]
+
 
 class TestPostClearTaskInstances(TestTaskInstanceEndpoint):
     @pytest.mark.parametrize(
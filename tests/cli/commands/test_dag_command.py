@@ -20,6 +20,7 @@ from __future__ import annotations
 import contextlib
 import json
 import os
+import re
 from datetime import datetime, timedelta
 from io import StringIO
 from unittest import mock
@@ -512,6 +513,33 @@ class TestCliDags:
         assert "airflow/example_dags/example_complex.py" in out
         assert "example_complex" in out
 
+    def test_cli_report_profile(self):
+        file_path = os.path.join(TEST_DAGS_FOLDER, "test_example_bash_operator.py")
+        args = self.parser.parse_args(
+            [
+                "dags",
+                "report",
+                "--subdir",
+                file_path,
+                "--profile",
+                "--top-statements",
+                "2",
+                "--output",
+                "json",
+            ]
+        )
+        with contextlib.redirect_stdout(StringIO()) as temp_stdout:
+            dag_command.dag_report(args)
+            out = temp_stdout.getvalue()
+
+        (row,) = (row for row in json.loads(out) if row["dags"] == ["test_example_bash_operator"])
+        assert float(row["serialization"]) >= 0
+        assert int(row["memory_peak"]) > 0
+        # The statements are sampled, so fast statements may not be
+        assert len(row["slowest_statements"]) <= 2
+        for statement in row["slowest_statements"]:
+            assert re.fullmatch(r"line \d+ \(\d+\.\d{3}s\): .+", statement)
+
     @conf_vars({("core", "load_examples"): "true"})
     def test_cli_get_dag_details(self):
         args = self.parser.parse_args(["dags", "details", "example_complex", "--output", "yaml"])
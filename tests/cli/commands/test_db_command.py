@@ -324,6 +324,9 @@ class TestCLIDBClean:
             verbose=False,
             confirm=False,
             skip_archive=False,
+            batch_size=None,
+            batch_sleep=0,
+            checkpoint_file=None,
         )
 
     @pytest.mark.parametrize("timezone", ["UTC", "Europe/Berlin", "America/Los_Angeles"])
@@ -344,6 +347,9 @@ class TestCLIDBClean:
             verbose=False,
             confirm=False,
             skip_archive=False,
+            batch_size=None,
+            batch_sleep=0,
+            checkpoint_file=None,
         )
 
     @pytest.mark.parametrize("confirm_arg, expected", [(["-y"], False), ([], True)])
@@ -370,6 +376,9 @@ class TestCLIDBClean:
             verbose=False,
             confirm=expected,
             skip_archive=False,
+            batch_size=None,
+            batch_sleep=0,
+            checkpoint_file=None,
         )
 
     @pytest.mark.parametrize("extra_arg, expected", [(["--skip-archive"], True), ([], False)])
@@ -396,6 +405,42 @@ class TestCLIDBClean:
             verbose=False,
             confirm=True,
             skip_archive=expected,
+            batch_size=None,
+            batch_sleep=0,
+            checkpoint_file=None,
+        )
+
+    @patch("airflow.cli.commands.db_command.run_cleanup")
+    def test_batches(self, run_cleanup_mock):
+        """
+        When ``--batch-size`` provided, the batch options should be passed.
+        """
+        args = self.parser.parse_args(
+            [
+                "db",
+                "clean",
+                "--clean-before-timestamp",
+                "2021-01-01",
+                "--batch-size",
+                "1000",
+                "--batch-sleep",
+                "0.5",
+                "--checkpoint-file",
+                "/tmp/checkpoint.json",
+            ]
+        )
+        db_command.cleanup_tables(args)
+
+        run_cleanup_mock.assert_called_once_with(
+            table_names=None,
+            dry_run=False,
+            clean_before_timestamp=pendulum.parse("2021-01-01 00:00:00Z"),
+            verbose=False,
+            confirm=True,
+            skip_archive=False,
+            batch_size=1000,
+            batch_sleep=0.5,
+            checkpoint_file="/tmp/checkpoint.json",
         )
 
     @pytest.mark.parametrize("dry_run_arg, expected", [(["--dry-run"], True), ([], False)])
@@ -422,6 +467,9 @@ class TestCLIDBClean:
             verbose=False,
             confirm=True,
             skip_archive=False,
+            batch_size=None,
+            batch_sleep=0,
+            checkpoint_file=None,
         )
 
     @pytest.mark.parametrize(
@@ -450,6 +498,9 @@ class TestCLIDBClean:
             verbose=False,
             confirm=True,
             skip_archive=False,
+            batch_size=None,
+            batch_sleep=0,
+            checkpoint_file=None,
         )
 
     @pytest.mark.parametrize("extra_args, expected", [(["--verbose"], True), ([], False)])
@@ -476,6 +527,9 @@ class TestCLIDBClean:
             verbose=expected,
             confirm=True,
             skip_archive=False,
+            batch_size=None,
+            batch_sleep=0,
+            checkpoint_file=None,
         )
 
     @patch("airflow.cli.commands.db_command.export_archived_records")
@@ -492,7 +546,36 @@ class TestCLIDBClean:
         db_command.export_archived(args)
 
         export_archived_mock.assert_called_once_with(
-            export_format="csv", output_path="path", table_names=None, drop_archives=False, needs_confirm=True
+            export_format="csv",
+            output_path="path",
+            table_names=None,
+            drop_archives=False,
+            needs_confirm=True,
+            compression=None,
+        )
+
+    @patch("airflow.cli.commands.db_command.export_archived_records")
+    def test_export_format_and_compression_in_export_archived_records_command(self, export_archived_mock):
+        args = self.parser.parse_args(
+            [
+                "db",
+                "export-archived",
+                "--output-path",
+                "s3://bucket/path",
+                "--export-format",
+                "parquet",
+                "--export-compression",
+                "zstd",
+            ]
+        )
+        db_command.export_archived(args)
+        export_archived_mock.assert_called_once_with(
+            export_format="parquet",
+            output_path="s3://bucket/path",
+            table_names=None,
+            drop_archives=False,
+            needs_confirm=True,
+            compression="zstd",
         )
 
     @pytest.mark.parametrize(
@@ -519,6 +602,7 @@ class TestCLIDBClean:
             table_names=expected,
             drop_archives=False,
             needs_confirm=True,
+            compression=None,
         )
 
     @pytest.mark.parametrize("extra_args, expected", [(["--drop-archives"], True), ([], False)])
@@ -543,6 +627,7 @@ class TestCLIDBClean:
             table_names=None,
             drop_archives=expected,
             needs_confirm=True,
+            compression=None,
         )
 
     @pytest.mark.parametrize(
@@ -33,7 +33,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from airflow.cli import cli_config, cli_parser
+from airflow.cli import cli_config, cli_parser, fast_path
 from airflow.cli.cli_config import ActionCommand, core_commands, lazy_load_command
 from airflow.cli.utils import CliConflictError
 from airflow.configuration import AIRFLOW_HOME
@@ -295,6 +295,11 @@ class TestCli:
             "'/non/existing/directory' does not exist!, see help above.\n"
         )
 
+    def test_object_storage_url_accepted_as_output_path_for_db_export_cleaned(self):
+        parser = cli_parser.get_parser()
+        args = parser.parse_args(["db", "export-archived", "--output-path", "s3://bucket/path"])
+        assert args.output_path == "s3://bucket/path"
+
     @pytest.mark.parametrize("export_format", ["json", "yaml", "unknown"])
     @patch("airflow.cli.cli_config.os.path.isdir", return_value=True)
     def test_invalid_choice_raises_for_export_format_in_db_export_archived_command(
@@ -311,7 +316,7 @@ class TestCli:
         assert error_msg == (
             "\nairflow db export-archived command error: argument "
             f"--export-format: invalid choice: '{export_format}' "
-            "(choose from 'csv'), see help above.\n"
+            "(choose from 'csv', 'ndjson', 'parquet'), see help above.\n"
         )
 
     @pytest.mark.parametrize(
@@ -334,6 +339,38 @@ class TestCli:
             )
 
 
+TASKS_RUN_COMMANDS = [
+    ["tasks", "run", "dag_id", "task_id", "manual_run", "--raw", "--job-id", "1", "--subdir", "DAGS_FOLDER"],
+    ["tasks", "run", "dag_id", "task_id", "manual_run", "--local", "--pool", "pool", "--map-index", "3"],
+    ["tasks", "run", "dag_id", "task_id", "manual_run", "-i", "-A", "--cfg-path", "/tmp/cfg"],
+]
+
+
+class TestCliFastPath:
+    @pytest.mark.parametrize("command", TASKS_RUN_COMMANDS)
+    def test_fast_path_parses_like_full_parser(self, command):
+        parser = fast_path.get_parser_for_command(command)
+
+        assert parser is not cli_parser.get_parser()
+        assert vars(parser.parse_args(command)) == vars(cli_parser.get_parser().parse_args(command))
+
+    @pytest.mark.parametrize(
+        "command",
+        [["tasks", "list", "dag_id"], ["tasks", "run", "--help"], ["dags", "list"], ["version"], []],
+    )
+    def test_full_parser_for_other_commands(self, command):
+        assert fast_path.get_parser_for_command(command) is cli_parser.get_parser()
+
+    def test_full_parser_for_shell_completion(self, monkeypatch):
+        monkeypatch.setenv("_ARGCOMPLETE", "1")
+
+        assert fast_path.get_parser_for_command(TASKS_RUN_COMMANDS[0]) is cli_parser.get_parser()
+
+    def test_fast_path_rejects_invalid_arguments(self):
+        with contextlib.redirect_stdout(StringIO()), pytest.raises(SystemExit):
+            fast_path.get_parser_for_command(["tasks", "run"]).parse_args(["tasks", "run", "--unknown"])
+
+
 # We need to run it from sources with PYTHONPATH, not command line tool,
 # because we need to make sure that we have providers configured from source provider.yaml files
 
@@ -360,6 +397,34 @@ class TestCliSubprocess:
         # Average run time of Airflow CLI should at least be within 3.5s
         assert timing_result < threshold
 
+    def test_tasks_run_parsing_does_not_import_all_commands(self):
+        """Test the modules imported to parse the commands run for every task, with ``-X importtime``.
+
+        Parsing all commands imports the CLI commands of the executor and of the auth manager, with their
+        dependencies, which ``airflow tasks run`` must not pay for.
+        """
+        code = (
+            "from airflow.cli.fast_path import get_parser_for_command; "
+            f"args = {TASKS_RUN_COMMANDS[0]!r}; "
+            "get_parser_for_command(args).parse_args(args)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code],
+            env={"PYTHONPATH": os.pathsep.join(sys.path)},
+            check=True,
+            text=True,
+            capture_output=True,
+        )
+        imported_modules = {
+            line.rpartition("|")[2].strip()
+            for line in result.stderr.splitlines()
+            if line.startswith("import time:")
+        }
+        assert "airflow.cli.cli_config" in imported_modules
+        assert "airflow.cli.cli_parser" not in imported_modules
+        assert "airflow.auth.managers.base_auth_manager" not in imported_modules
+        assert "flask_appbuilder" not in imported_modules
+
     def test_cli_parsing_does_not_initialize_providers_manager(self):
         """Test that CLI parsing does not initialize providers manager.
 
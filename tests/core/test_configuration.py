@@ -22,6 +22,7 @@ import datetime
 import os
 import re
 import textwrap
+import time
 import warnings
 from io import StringIO
 from unittest import mock
@@ -922,6 +923,74 @@ key7 =
         assert isinstance(test_conf.gettimedelta("default", "key7"), type(None))
         assert test_conf.gettimedelta("default", "key7") is None
 
+    def test_resolved_values_cached(self):
+        test_conf = AirflowConfigParser(default_config="[test]\nkey = default\n")
+        test_conf.read_string("[test]\nkey = from_file\n")
+        with mock.patch.object(
+            test_conf, "_get_option_from_config_file", wraps=test_conf._get_option_from_config_file
+        ) as mock_get_option_from_config_file:
+            assert test_conf.get("test", "key") == "from_file"
+            call_count = mock_get_option_from_config_file.call_count
+            assert test_conf.get("Test", "KEY") == "from_file"
+            assert test_conf.getboolean("test", "missing", fallback=True) is True
+            assert mock_get_option_from_config_file.call_count == call_count + 1
+            assert test_conf.getboolean("test", "missing", fallback=True) is True
+            assert mock_get_option_from_config_file.call_count == call_count + 1
+        info = test_conf.resolved_values_cache_info()
+        assert (info.hits, info.currsize) == (2, 2)
+
+    def test_resolved_values_cache_invalidated(self):
+        test_conf = AirflowConfigParser(default_config="[test]\nkey = default\n")
+        assert test_conf.get("test", "key") == "default"
+        test_conf.add_section("test")
+        test_conf.set("test", "key", "set")
+        assert test_conf.get("test", "key") == "set"
+        test_conf.read_string("[test]\nkey = from_string\n")
+        assert test_conf.get("test", "key") == "from_string"
+        test_conf.read_dict({"test": {"key": "from_dict"}})
+        assert test_conf.get("test", "key") == "from_dict"
+        test_conf.remove_option("test", "key", remove_default=False)
+        assert test_conf.get("test", "key") == "default"
+        with mock.patch.dict("os.environ", {"AIRFLOW__TEST__KEY": "from_env"}):
+            assert test_conf.get("test", "key") == "from_env"
+        assert test_conf.get("test", "key") == "default"
+        test_conf.remove_option("test", "key")
+        with pytest.raises(AirflowConfigException):
+            test_conf.get("test", "key")
+
+    def test_resolved_values_cache_invalidated_by_load_test_config(self):
+        test_conf = AirflowConfigParser()
+        test_conf.read_dict({"core": {"killed_task_cleanup_time": "1"}})
+        assert test_conf.getint("core", "killed_task_cleanup_time") == 1
+        test_conf.load_test_config()
+        assert test_conf.getint("core", "killed_task_cleanup_time") == 5
+
+    @pytest.mark.parametrize("ttl, expected_runs", [("0", 3), ("60", 1)])
+    def test_resolved_values_from_command_cached_with_ttl(self, ttl, expected_runs):
+        test_conf = AirflowConfigParser()
+        test_conf.sensitive_config_values.add(("testcmdenv", "itsacommand"))
+        with mock.patch.dict(
+            "os.environ",
+            {
+                "AIRFLOW__TESTCMDENV__ITSACOMMAND_CMD": 'echo -n "OK"',
+                "AIRFLOW__CORE__CONFIG_CMD_AND_SECRET_CACHE_TTL": ttl,
+            },
+        ), mock.patch("airflow.configuration.run_command", wraps=run_command) as mock_run_command:
+            for _ in range(3):
+                assert test_conf.get("testcmdenv", "itsacommand") == "OK"
+            assert mock_run_command.call_count == expected_runs
+            if ttl != "0":
+                with mock.patch("airflow.configuration.time.monotonic", return_value=time.monotonic() + 61):
+                    assert test_conf.get("testcmdenv", "itsacommand") == "OK"
+                assert mock_run_command.call_count == expected_runs + 1
+
+    def test_deprecated_options_not_cached(self):
+        with set_deprecated_options(
+            deprecated_options={("celery", "worker_concurrency"): ("celery", "celeryd_concurrency", "2.0.0")}
+        ):
+            conf.get("celery", "worker_concurrency")
+            assert ("celery", "worker_concurrency", configuration._NO_FALLBACK) not in conf._resolved_values
+
 
 @mock.patch.dict(
     "os.environ",
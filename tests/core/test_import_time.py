@@ -0,0 +1,68 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+from airflow import exceptions
+from airflow.exceptions import AirflowException
+
+SCHEDULER = "import airflow.jobs.scheduler_job_runner"
+TASK_RUNNER = "import airflow.cli.commands.task_command"
+DAG_PARSE = "from airflow.models.dag import DAG; from airflow.operators.bash import BashOperator"
+
+PYDANTIC_MODELS = (
+    "airflow.serialization.pydantic.dag",
+    "airflow.serialization.pydantic.dag_run",
+    "airflow.serialization.pydantic.taskinstance",
+)
+
+
+def _imported_modules(script: str) -> set[str]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", script], check=True, text=True, capture_output=True
+    )
+    return {
+        line.split("|")[-1].strip() for line in result.stderr.splitlines() if line.startswith("import time:")
+    }
+
+
+@pytest.mark.parametrize(
+    "script, not_imported",
+    [
+        pytest.param(SCHEDULER, ("kubernetes", "flask", *PYDANTIC_MODELS), id="scheduler"),
+        pytest.param(TASK_RUNNER, ("kubernetes", "flask"), id="task-runner"),
+        pytest.param(DAG_PARSE, ("kubernetes", "flask", *PYDANTIC_MODELS), id="dag-parse"),
+    ],
+)
+def test_heavy_modules_are_imported_lazily(script, not_imported):
+    imported = _imported_modules(script)
+    assert imported.isdisjoint(not_imported), sorted(imported.intersection(not_imported))
+
+
+def test_kubernetes_exceptions_are_lazy():
+    exception = exceptions.PodMutationHookException
+    assert issubclass(exception, AirflowException)
+    assert exceptions.PodMutationHookException is exception
+
+
+def test_unknown_exception_raises_attribute_error():
+    with pytest.raises(AttributeError, match="has no attribute 'UnknownException'"):
+        exceptions.UnknownException
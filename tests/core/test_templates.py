@@ -16,12 +16,15 @@
 # under the License.
 from __future__ import annotations
 
+from unittest import mock
+
 import jinja2
 import jinja2.exceptions
 import pendulum
 import pytest
 
 import airflow.templates
+from tests.test_utils.config import conf_vars
 
 
 @pytest.fixture
@@ -55,3 +58,81 @@ def test_filters(env, name, expected):
     when = pendulum.datetime(2012, 7, 24, 3, 4, 52, tz="UTC")
     result = env.from_string("{{ date |" + name + " }}").render(date=when)
     assert result == expected
+
+
+@pytest.fixture
+def clear_compiled_template_cache():
+    airflow.templates._get_compiled_template_cache.cache_clear()
+    yield
+    airflow.templates._get_compiled_template_cache.cache_clear()
+
+
+@pytest.mark.usefixtures("clear_compiled_template_cache")
+class TestCompiledTemplateCache:
+    @staticmethod
+    def _count_parses():
+        return mock.patch.object(
+            jinja2.Environment, "_parse", autospec=True, side_effect=jinja2.Environment._parse
+        )
+
+    def test_compiled_once_across_environments(self):
+        env_class = airflow.templates.SandboxedEnvironment
+        with self._count_parses() as mock_parse:
+            for i in range(3):
+                env = env_class(cache_size=0)
+                env.globals["value"] = i
+                assert env.from_string("{{ value }} {{ run_id | upper }}").render(run_id="abc") == f"{i} ABC"
+        assert mock_parse.call_count == 1
+
+    def test_compiled_per_environment_options(self):
+        env_class = airflow.templates.SandboxedEnvironment
+        with self._count_parses() as mock_parse:
+            env_class(cache_size=0).from_string("{{ 1 }}")
+            env_class(cache_size=0, trim_blocks=True).from_string("{{ 1 }}")
+            env_class(cache_size=0, variable_start_string="[[", variable_end_string="]]").from_string(
+                "{{ 1 }}"
+            )
+            airflow.templates.NativeEnvironment(cache_size=0).from_string("{{ 1 }}")
+        assert mock_parse.call_count == 4
+
+    def test_compiled_per_filters(self):
+        @jinja2.pass_context
+        def with_context(context, value):
+            return context["suffix"] + value
+
+        def without_context(value):
+            return value
+
+        first_env = airflow.templates.SandboxedEnvironment(cache_size=0)
+        first_env.filters["custom"] = with_context
+        second_env = airflow.templates.SandboxedEnvironment(cache_size=0)
+        second_env.filters["custom"] = without_context
+        template = "{{ value | custom }}"
+        assert first_env.from_string(template).render(value="a", suffix="b") == "ba"
+        assert second_env.from_string(template).render(value="a", suffix="b") == "a"
+
+    def test_file_templates_cached_by_source(self, tmp_path):
+        template_file = tmp_path / "template.sh"
+        template_file.write_text("echo {{ ds }}")
+        env_class = airflow.templates.SandboxedEnvironment
+        with self._count_parses() as mock_parse:
+            for _ in range(2):
+                env = env_class(loader=jinja2.FileSystemLoader(str(tmp_path)), cache_size=0)
+                assert env.get_template("template.sh").render(ds="2024-01-01") == "echo 2024-01-01"
+            template_file.write_text("echo {{ ds_nodash }}")
+            env = env_class(loader=jinja2.FileSystemLoader(str(tmp_path)), cache_size=0)
+            assert env.get_template("template.sh").render(ds_nodash="20240101") == "echo 20240101"
+        assert mock_parse.call_count == 2
+
+    def test_cache_bounded(self):
+        with conf_vars({("core", "compiled_template_cache_size"): "2"}):
+            for i in range(5):
+                airflow.templates.SandboxedEnvironment(cache_size=0).from_string(f"{i} {{{{ value }}}}")
+            assert len(airflow.templates._get_compiled_template_cache()) == 2
+
+    def test_cache_disabled(self):
+        env_class = airflow.templates.SandboxedEnvironment
+        with conf_vars({("core", "compiled_template_cache_size"): "0"}), self._count_parses() as mock_parse:
+            for _ in range(2):
+                env_class(cache_size=0).from_string("{{ value }}")
+        assert mock_parse.call_count == 2
@@ -54,10 +54,13 @@ from airflow.jobs.dag_processor_job_runner import DagProcessorJobRunner
 from airflow.jobs.job import Job
 from airflow.models import DagBag, DagModel, DbCallbackRequest, errors
 from airflow.models.dagcode import DagCode
+from airflow.models.dagrun import DagRun
 from airflow.models.serialized_dag import SerializedDagModel
 from airflow.utils import timezone
 from airflow.utils.net import get_hostname
 from airflow.utils.session import create_session
+from airflow.utils.state import DagRunState
+from airflow.utils.types import DagRunType
 from tests.core.test_logging_config import SETTINGS_FILE_VALID, settings_context
 from tests.models import TEST_DAGS_FOLDER
 from tests.test_utils.config import conf_vars
@@ -575,6 +578,170 @@ class TestDagProcessorJobRunner:
                 > (freezed_base_time - manager.processor.get_last_finish_time("file_1.py")).total_seconds()
             )
 
+    @conf_vars(
+        {
+            ("scheduler", "file_parsing_sort_mode"): "adaptive",
+            ("scheduler", "min_file_process_interval"): "30",
+            ("scheduler", "max_file_process_interval"): "600",
+        }
+    )
+    @mock.patch("zipfile.is_zipfile", return_value=True)
+    @mock.patch("airflow.utils.file.might_contain_dag", return_value=True)
+    @mock.patch("airflow.utils.file.find_path_from_directory", return_value=True)
+    @mock.patch("airflow.utils.file.os.path.isfile", return_value=True)
+    @mock.patch("airflow.utils.file.os.path.getmtime")
+    @mock.patch.object(DagFileProcessorManager, "get_files_with_active_dags", return_value={"file_b.py"})
+    def test_file_paths_in_queue_adaptive(
+        self,
+        mock_get_files_with_active_dags,
+        mock_getmtime,
+        mock_isfile,
+        mock_find_path,
+        mock_might_contain_dag,
+        mock_zipfile,
+    ):
+        """Test files are queued from their changes, parse cost and DAG runs in the adaptive mode"""
+        freezed_base_time = timezone.datetime(2020, 1, 5, 0, 0, 0)
+        dag_files = ["file_a.py", "file_b.py", "file_c.py", "file_d.py", "file_e.py"]
+        file_mtime = (freezed_base_time - timedelta(hours=1)).timestamp()
+        modified_file_mtime = (freezed_base_time - timedelta(seconds=5)).timestamp()
+        mock_getmtime.side_effect = lambda path: modified_file_mtime if path == "file_a.py" else file_mtime
+        mock_find_path.return_value = dag_files
+
+        manager = DagProcessorJobRunner(
+            job=Job(),
+            processor=DagFileProcessorManager(
+                dag_directory="directory",
+                max_runs=10,
+                processor_timeout=timedelta(days=365),
+                signal_conn=MagicMock(),
+                dag_ids=[],
+                pickle_dags=False,
+                async_mode=True,
+            ),
+        )
+
+        def parsed(seconds_ago, duration=1.0):
+            last_finish_time = freezed_base_time - timedelta(seconds=seconds_ago)
+            return DagFileStat(1, 0, last_finish_time, timedelta(seconds=duration), 1)
+
+        manager.processor._file_stats = {
+            # Modified since it was parsed
+            "file_a.py": parsed(10),
+            # DAG with active runs
+            "file_b.py": parsed(150),
+            # Unchanged for 3 parses: every 240 seconds
+            "file_c.py": parsed(200),
+            # Unchanged for 1 parse: every 60 seconds
+            "file_d.py": parsed(200),
+            # 10 times slower than the median: every 300 seconds
+            "file_e.py": parsed(200, duration=10.0),
+        }
+        manager.processor._file_parse_mtimes = {
+            "file_a.py": (file_mtime, 4),
+            "file_b.py": (file_mtime, 5),
+            "file_c.py": (file_mtime, 3),
+            "file_d.py": (file_mtime, 1),
+        }
+        with time_machine.travel(freezed_base_time):
+            manager.processor.set_file_paths(dag_files)
+            assert manager.processor._get_adaptive_process_intervals() == {
+                "file_a.py": 480.0,
+                "file_b.py": 30.0,
+                "file_c.py": 240.0,
+                "file_d.py": 60.0,
+                "file_e.py": 300.0,
+            }
+            manager.processor.prepare_file_path_queue()
+
+        assert manager.processor._file_path_queue == deque(["file_a.py", "file_b.py", "file_d.py"])
+        mock_get_files_with_active_dags.assert_called_once_with(dag_directory="directory", horizon=600)
+
+    @mock.patch("airflow.dag_processing.manager.os.path.getmtime")
+    def test_parses_of_unchanged_file_are_counted(self, mock_getmtime):
+        manager = DagFileProcessorManager(
+            dag_directory="directory",
+            max_runs=1,
+            processor_timeout=timedelta(days=365),
+            signal_conn=MagicMock(),
+            dag_ids=[],
+            pickle_dags=False,
+            async_mode=True,
+        )
+
+        for mtime, unchanged_parses in [(1.0, 0), (1.0, 1), (1.0, 2), (2.0, 0), (2.0, 1)]:
+            mock_getmtime.return_value = mtime
+            manager._record_parse_mtime("file_1.py")
+            assert manager._file_parse_mtimes["file_1.py"] == (mtime, unchanged_parses)
+
+        mock_getmtime.side_effect = FileNotFoundError
+        manager._record_parse_mtime("file_1.py")
+        assert manager._file_parse_mtimes["file_1.py"] == (None, 0)
+
+    def test_get_files_with_active_dags(self):
+        clear_db_runs()
+        clear_db_dags()
+        now = timezone.utcnow()
+        with create_session() as session:
+            for dag_id, is_paused, next_dagrun_create_after in [
+                ("upcoming", False, now + timedelta(minutes=5)),
+                ("paused", True, now + timedelta(minutes=5)),
+                ("later", False, now + timedelta(hours=1)),
+                ("running", False, None),
+            ]:
+                session.add(
+                    DagModel(
+                        dag_id=dag_id,
+                        fileloc=f"/dags/{dag_id}.py",
+                        is_active=True,
+                        is_paused=is_paused,
+                        next_dagrun_create_after=next_dagrun_create_after,
+                    )
+                )
+            session.add(
+                DagRun(
+                    dag_id="running",
+                    run_id="manual",
+                    run_type=DagRunType.MANUAL,
+                    state=DagRunState.RUNNING,
+                    execution_date=DEFAULT_DATE,
+                )
+            )
+        try:
+            assert DagFileProcessorManager.get_files_with_active_dags(dag_directory="/dags", horizon=600) == {
+                "/dags/upcoming.py",
+                "/dags/running.py",
+            }
+        finally:
+            clear_db_runs()
+            clear_db_dags()
+
+    @mock.patch("airflow.dag_processing.manager.Stats")
+    @mock.patch.object(DagFileProcessorManager, "_create_process")
+    def test_file_queue_age_is_sent(self, mock_create_process, mock_stats):
+        manager = DagFileProcessorManager(
+            dag_directory="directory",
+            max_runs=1,
+            processor_timeout=timedelta(days=365),
+            signal_conn=MagicMock(),
+            dag_ids=[],
+            pickle_dags=False,
+            async_mode=True,
+        )
+        manager.set_file_paths(["/dags/file_1.py"])
+        manager._add_paths_to_queue(["/dags/file_1.py"], False)
+        time.sleep(0.01)
+
+        manager.start_new_processes()
+
+        name, queue_age = mock_stats.timing.call_args_list[-2].args
+        assert name == "dag_processing.file_queue_age.file_1"
+        assert queue_age >= timedelta(seconds=0.01)
+        assert mock_stats.timing.call_args_list[-1] == mock.call(
+            "dag_processing.file_queue_age", queue_age, tags={"file_name": "file_1"}
+        )
+        assert manager._file_queued_times == {}
+
     def test_scan_stale_dags(self):
         """
         Ensure that DAGs are marked inactive when the file is parsed but the
@@ -996,6 +1163,71 @@ class TestDagProcessorJobRunner:
             any_order=True,
         )
 
+    @conf_vars({("scheduler", "parsing_warmup_modules"): "1"})
+    @mock.patch("airflow.dag_processing.manager.Stats.timing")
+    def test_warm_up_imports_most_common_modules(self, statsd_timing_mock, tmp_path, monkeypatch):
+        dag_folder = tmp_path / "dags"
+        dag_folder.mkdir()
+        site_packages = tmp_path / "site-packages"
+        site_packages.mkdir()
+        for module in ("warmup_common", "warmup_rare"):
+            (site_packages / f"{module}.py").touch()
+        (dag_folder / "dag_helper.py").touch()
+        monkeypatch.syspath_prepend(os.fspath(site_packages))
+        monkeypatch.syspath_prepend(os.fspath(dag_folder))
+        file_imports = {
+            "first_dag.py": "import dag_helper\nimport warmup_common\n",
+            "second_dag.py": "import dag_helper\nfrom warmup_common import x\nimport warmup_rare\n",
+            "third_dag.py": "import dag_helper\nimport warmup_common\nfrom airflow.models.dag import DAG\n",
+        }
+        for name, code in file_imports.items():
+            (dag_folder / name).write_text(code)
+
+        manager = DagFileProcessorManager(
+            dag_directory=dag_folder,
+            max_runs=1,
+            processor_timeout=timedelta(days=365),
+            signal_conn=MagicMock(),
+            dag_ids=[],
+            pickle_dags=False,
+            async_mode=True,
+        )
+        manager._file_paths = [os.fspath(dag_folder / name) for name in file_imports]
+        try:
+            manager._warm_up()
+
+            # Modules of the DAG folder are imported by every parse, the most common other module is imported
+            assert "warmup_common" in sys.modules
+            assert "warmup_rare" not in sys.modules
+            assert "dag_helper" not in sys.modules
+            assert list(manager._warmup_import_durations) == ["warmup_common"]
+        finally:
+            for module in ("warmup_common", "warmup_rare", "dag_helper"):
+                sys.modules.pop(module, None)
+
+        saved = timedelta(seconds=manager._warmup_import_durations["warmup_common"])
+        statsd_timing_mock.assert_has_calls(
+            [
+                mock.call("dag_processing.warmup_time_saved.second_dag", saved),
+                mock.call("dag_processing.warmup_time_saved", saved, tags={"file_name": "second_dag"}),
+            ],
+            any_order=True,
+        )
+
+    def test_warm_up_is_disabled_by_default(self, tmp_path):
+        manager = DagFileProcessorManager(
+            dag_directory=tmp_path,
+            max_runs=1,
+            processor_timeout=timedelta(days=365),
+            signal_conn=MagicMock(),
+            dag_ids=[],
+            pickle_dags=False,
+            async_mode=True,
+        )
+        with mock.patch.object(manager, "_get_file_imports") as get_file_imports:
+            manager._warm_up()
+        get_file_imports.assert_not_called()
+
     def test_refresh_dags_dir_doesnt_delete_zipped_dags(self, tmp_path):
         """Test DagProcessorJobRunner._refresh_dag_dir method"""
         manager = DagProcessorJobRunner(
@@ -0,0 +1,142 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import time
+from datetime import timedelta
+from unittest import mock
+
+import pytest
+
+from airflow.dag_processing.parse_profiler import (
+    FileParseProfile,
+    ParseProfiler,
+    profile_file,
+    profile_phase,
+    record_lookup,
+)
+from airflow.dag_processing.processor import DagFileProcessor
+from airflow.models.dagbag import DagBag
+from tests.test_utils.db import clear_db_dags, clear_db_serialized_dags
+
+SLOW_DAG = """
+import time
+
+import pendulum
+
+from airflow.hooks.base import BaseHook
+from airflow.models.dag import DAG
+from airflow.models.variable import Variable
+from airflow.operators.empty import EmptyOperator
+
+time.sleep(0.2)
+owner = Variable.get("owner")
+host = BaseHook.get_connection("source").host
+
+with DAG("slow", schedule=None, start_date=pendulum.datetime(2024, 1, 1, tz="UTC")) as dag:
+    EmptyOperator(task_id="task", owner=owner)
+"""
+
+
+@pytest.fixture
+def slow_dag_file(tmp_path, monkeypatch):
+    monkeypatch.setenv("AIRFLOW_VAR_OWNER", "owner")
+    monkeypatch.setenv("AIRFLOW_CONN_SOURCE", "http://source")
+    path = tmp_path / "slow_dag.py"
+    path.write_text(SLOW_DAG)
+    return str(path)
+
+
+def test_profile_dag_file(slow_dag_file):
+    with ParseProfiler() as profiler:
+        DagBag(dag_folder=slow_dag_file, include_examples=False)
+
+    profile = profiler.profiles[slow_dag_file]
+    assert set(profile.durations) <= {"import", "top_level_code", "dag_construction"}
+    assert profile.durations["top_level_code"] >= 0.15
+    (line, duration, source), *_ = profile.slowest_statements(3)
+    assert (line, source) == (11, "time.sleep(0.2)")
+    assert 0.15 <= duration < 0.3
+    assert profile.memory_peak > 0
+    assert profile.variable_lookups == {"owner": 1}
+    assert profile.connection_lookups == {"source": 1}
+
+
+def test_profile_processed_dag_file(slow_dag_file):
+    clear_db_dags()
+    clear_db_serialized_dags()
+    dag_file_processor = DagFileProcessor(dag_ids=[], dag_directory=slow_dag_file, log=mock.MagicMock())
+
+    try:
+        with ParseProfiler(trace_memory=False) as profiler:
+            assert dag_file_processor.process_file(slow_dag_file, []) == (1, 0)
+    finally:
+        clear_db_dags()
+        clear_db_serialized_dags()
+
+    profile = profiler.profiles[slow_dag_file]
+    assert {"top_level_code", "dag_construction", "serialization", "db_write"} <= set(profile.durations)
+    assert profile.memory_peak is None
+
+
+def test_nested_phases_are_not_counted_twice():
+    with ParseProfiler() as profiler, profile_file("dag.py"):
+        with profile_phase("db_write"):
+            time.sleep(0.05)
+            with profile_phase("serialization"):
+                time.sleep(0.1)
+
+    durations = profiler.profiles["dag.py"].durations
+    assert 0.05 <= durations["db_write"] < 0.1
+    assert 0.1 <= durations["serialization"] < 0.15
+
+
+def test_nothing_is_profiled_without_profiler():
+    with profile_file("dag.py"), profile_phase("import"):
+        record_lookup("variable", "key")
+
+
+def test_only_one_profiler_is_active():
+    with ParseProfiler(), pytest.raises(RuntimeError, match="already active"):
+        with ParseProfiler():
+            pass
+
+
+@mock.patch("airflow.dag_processing.parse_profiler.Stats")
+def test_emit_metrics(mock_stats):
+    profile = FileParseProfile("/dags/dag.py", durations={"import": 0.5}, memory_peak=1024)
+    profile.variable_lookups["key"] += 2
+
+    profile.emit_metrics()
+
+    mock_stats.timing.assert_has_calls(
+        [
+            mock.call("dag_processing.import_duration.dag", timedelta(seconds=0.5)),
+            mock.call("dag_processing.import_duration", timedelta(seconds=0.5), tags={"file_name": "dag"}),
+        ]
+    )
+    mock_stats.gauge.assert_has_calls(
+        [
+            mock.call("dag_processing.memory_peak.dag", 1024),
+            mock.call("dag_processing.memory_peak", 1024, tags={"file_name": "dag"}),
+            mock.call("dag_processing.variable_lookups.dag", 2),
+            mock.call("dag_processing.variable_lookups", 2, tags={"file_name": "dag"}),
+            mock.call("dag_processing.connection_lookups.dag", 0),
+            mock.call("dag_processing.connection_lookups", 0, tags={"file_name": "dag"}),
+        ]
+    )
@@ -0,0 +1,188 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import pathlib
+import textwrap
+from unittest import mock
+
+import pytest
+
+import airflow.example_dags
+from airflow.dag_processing.static_parser import parse_static_dags
+from airflow.models.dagbag import DagBag
+from airflow.serialization.serialized_objects import SerializedDAG
+from tests.test_utils.config import conf_vars
+
+EXAMPLE_DAGS_FOLDER = pathlib.Path(airflow.example_dags.__path__[0])  # type: ignore[attr-defined]
+
+# Example DAG files using only the static subset
+STATIC_EXAMPLE_DAGS = {
+    "example_branch_day_of_week_operator.py",
+    "example_branch_labels.py",
+    "example_external_task_marker_dag.py",
+    "example_latest_only.py",
+    "example_latest_only_with_trigger.py",
+    "example_setup_teardown.py",
+    "example_task_group.py",
+    "example_time_delta_sensor_async.py",
+    "example_trigger_controller_dag.py",
+}
+
+STATIC_DAG = """
+\"\"\"Static DAG.\"\"\"
+import pendulum
+
+from airflow.models.baseoperator import chain
+from airflow.models.dag import DAG
+from airflow.operators.empty import EmptyOperator
+from airflow.utils.task_group import TaskGroup
+
+with DAG("static", schedule=None, start_date=pendulum.datetime(2024, 1, 1, tz="UTC")) as dag:
+    start = EmptyOperator(task_id="start")
+    with TaskGroup("group") as group:
+        first = EmptyOperator(task_id="first")
+        second = EmptyOperator(task_id="second")
+        first >> second
+    end = EmptyOperator(task_id="end", priority_weight=-1)
+    chain(start, group, end)
+    dag.doc_md = __doc__
+
+if __name__ == "__main__":
+    dag.test()
+"""
+
+
+@pytest.mark.parametrize(
+    "file_name", sorted(path.name for path in EXAMPLE_DAGS_FOLDER.glob("*.py") if path.name != "__init__.py")
+)
+def test_static_example_dags_are_serialized_like_imported_ones(file_name):
+    file_path = str(EXAMPLE_DAGS_FOLDER / file_name)
+    static_dags = parse_static_dags(file_path)
+    assert (static_dags is not None) == (file_name in STATIC_EXAMPLE_DAGS)
+    if static_dags is None:
+        return
+
+    dagbag = DagBag(dag_folder=file_path, include_examples=False, collect_dags=False)
+    imported_dags = dagbag.process_file(file_path, only_if_updated=False)
+    assert {dag.dag_id: _file_attributes(dag) for dag in static_dags} == {
+        dag.dag_id: _file_attributes(dag) for dag in imported_dags
+    }
+    assert {dag.dag_id: SerializedDAG.serialize_dag(dag) for dag in static_dags} == {
+        dag.dag_id: SerializedDAG.serialize_dag(dag) for dag in imported_dags
+    }
+
+
+def _file_attributes(dag):
+    """The attributes of a DAG which depend on the file it is declared in."""
+    return dag.fileloc, dag.folder, dag.doc_md, dag.template_searchpath
+
+
+def test_static_dag(tmp_path):
+    path = tmp_path / "static_dag.py"
+    path.write_text(STATIC_DAG)
+
+    (dag,) = parse_static_dags(str(path))
+
+    assert dag.dag_id == "static"
+    assert dag.fileloc == str(path)
+    assert dag.doc_md == "Static DAG."
+    assert dag.task_dict["end"].priority_weight == -1
+    assert dag.task_dict["start"].downstream_task_ids == {"group.first"}
+    assert dag.task_dict["group.second"].downstream_task_ids == {"end"}
+
+
+def test_static_dag_doc_md_file_is_rendered_like_imported_one(tmp_path):
+    (tmp_path / "doc.md").write_text("# Hello docs")
+    path = tmp_path / "doc_dag.py"
+    path.write_text(
+        textwrap.dedent(
+            """
+            from airflow.models.dag import DAG
+            from airflow.operators.empty import EmptyOperator
+
+            with DAG("doc", schedule=None, doc_md="doc.md") as dag:
+                EmptyOperator(task_id="task")
+            """
+        )
+    )
+
+    (static_dag,) = parse_static_dags(str(path))
+    dagbag = DagBag(dag_folder=str(path), include_examples=False, collect_dags=False)
+    (imported_dag,) = dagbag.process_file(str(path), only_if_updated=False)
+
+    assert static_dag.doc_md == "# Hello docs"
+    assert _file_attributes(static_dag) == _file_attributes(imported_dag)
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        pytest.param("for i in range(3):\n        EmptyOperator(task_id=f'task_{i}')", id="loop"),
+        pytest.param("def callable():\n        pass", id="function"),
+        pytest.param("EmptyOperator(task_id=str(1))", id="call"),
+        pytest.param("import os", id="import"),
+        pytest.param("EmptyOperator(**{'task_id': 'task'})", id="unpacking"),
+        pytest.param("EmptyOperator(task_id='task').dag.clear()", id="attribute"),
+        pytest.param("EmptyOperator(task_id='task') >> 1", id="dependency"),
+        pytest.param("EmptyOperator(task_id='task', retries=2 * 2)", id="operation"),
+    ],
+)
+def test_dynamic_dag(tmp_path, code):
+    path = tmp_path / "dynamic_dag.py"
+    path.write_text(
+        textwrap.dedent(
+            f"""
+            from airflow.models.dag import DAG
+            from airflow.operators.empty import EmptyOperator
+
+            with DAG("dynamic", schedule=None):
+                {code}
+            """
+        )
+    )
+
+    assert parse_static_dags(str(path)) is None
+
+
+def test_static_dag_with_invalid_arguments_is_imported(tmp_path):
+    path = tmp_path / "invalid_dag.py"
+    path.write_text(STATIC_DAG.replace('task_id="start"', 'task_id="start", unknown_argument=1'))
+
+    assert parse_static_dags(str(path)) is None
+
+    with conf_vars({("core", "static_dag_parsing"): "True"}):
+        dagbag = DagBag(dag_folder=str(path), include_examples=False, collect_dags=False)
+    dagbag.process_file(str(path))
+    assert "unknown_argument" in dagbag.import_errors[str(path)]
+
+
+@pytest.mark.parametrize("static_dag_parsing", [True, False])
+def test_dagbag_parses_static_dags(tmp_path, static_dag_parsing):
+    path = tmp_path / "static_dag.py"
+    path.write_text(STATIC_DAG)
+
+    with conf_vars({("core", "static_dag_parsing"): str(static_dag_parsing)}):
+        dagbag = DagBag(dag_folder=str(path), include_examples=False, collect_dags=False)
+    with mock.patch.object(dagbag, "_load_modules_from_file", wraps=dagbag._load_modules_from_file) as load:
+        found_dags = dagbag.process_file(str(path))
+
+    assert [dag.dag_id for dag in found_dags] == ["static"]
+    assert found_dags[0].fileloc == str(path)
+    assert dagbag.dags["static"] is found_dags[0]
+    assert load.called is not static_dag_parsing
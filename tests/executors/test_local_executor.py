@@ -18,15 +18,18 @@
 from __future__ import annotations
 
 import datetime
+import os
 import subprocess
+import sys
 from unittest import mock
 
 import pytest
 
 from airflow import settings
 from airflow.exceptions import AirflowException
-from airflow.executors.local_executor import LocalExecutor
+from airflow.executors.local_executor import LocalExecutor, LocalWorker
 from airflow.utils.state import State
+from tests.test_utils.config import conf_vars
 
 pytestmark = pytest.mark.db_test
 
@@ -62,13 +65,18 @@ class TestLocalExecutor:
         self._test_execute(parallelism, success_command, fail_command)
 
     @mock.patch("airflow.cli.commands.task_command.task_run")
-    def execution_parallelism_fork(self, mock_run, parallelism=0):
+    def execution_parallelism_fork(self, mock_run, parallelism=0, dag_file=None):
         success_command = ["airflow", "tasks", "run", "success", "some_parameter", "2020-10-07"]
         fail_command = ["airflow", "tasks", "run", "failure", "some_parameter", "2020-10-07"]
+        if dag_file:
+            success_command += ["--subdir", dag_file]
+            fail_command += ["--subdir", dag_file]
 
-        def fake_task_run(args):
+        def fake_task_run(args, dag=None):
             if args.dag_id != "success":
                 raise AirflowException("Simulate failed task")
+            if dag_file and (dag is None or dag.dag_id != "success"):
+                raise AirflowException("The DAG parsed by the warm worker was not passed")
 
         mock_run.side_effect = fake_task_run
 
@@ -127,6 +135,90 @@ class TestLocalExecutor:
     def test_execution_limited_parallelism_fork(self):
         self.execution_parallelism_fork(parallelism=2)
 
+    @mock.patch.object(settings, "EXECUTE_TASKS_NEW_PYTHON_INTERPRETER", False)
+    @conf_vars({("core", "local_executor_warm_workers"): "True"})
+    def test_execution_limited_parallelism_fork_warm_workers(self, tmp_path):
+        executor = LocalExecutor(parallelism=2)
+        assert executor.warm_workers
+        dag_file = tmp_path / "test_warm_dags.py"
+        dag_file.write_text(
+            "import datetime\n"
+            "from airflow.models.dag import DAG\n"
+            "for dag_id in ('success', 'failure'):\n"
+            "    globals()[dag_id] = DAG(dag_id, start_date=datetime.datetime(2024, 1, 1), schedule=None)\n"
+        )
+        self.execution_parallelism_fork(parallelism=2, dag_file=str(dag_file))
+
+    @conf_vars({("core", "local_executor_warm_workers"): "True"})
+    def test_warm_workers_not_used_with_unlimited_parallelism(self):
+        assert not LocalExecutor(parallelism=0).warm_workers
+
+    def test_get_warm_dag(self, tmp_path):
+        dag_file = tmp_path / "test_warm_dag.py"
+        dag_file.write_text(
+            "import datetime\n"
+            "from airflow.models.dag import DAG\n"
+            "from airflow.operators.empty import EmptyOperator\n"
+            "with DAG('warm_dag', start_date=datetime.datetime(2024, 1, 1), schedule=None):\n"
+            "    EmptyOperator(task_id='task')\n"
+        )
+        command = ["airflow", "tasks", "run", "warm_dag", "task", "run_id", "--subdir", str(dag_file)]
+        worker = LocalWorker(result_queue=mock.MagicMock(), key=None, command=command)
+        worker.warm = True
+
+        dag = worker._get_warm_dag(command)
+        assert dag is not None
+        assert dag.dag_id == "warm_dag"
+        # The parsed DAG is reused as long as the file does not change
+        assert worker._get_warm_dag(command) is dag
+
+        stat = dag_file.stat()
+        os.utime(dag_file, (stat.st_atime, stat.st_mtime + 10))
+        reparsed_dag = worker._get_warm_dag(command)
+        assert reparsed_dag is not dag
+        assert reparsed_dag.dag_id == "warm_dag"
+
+    def test_get_warm_dag_reloads_changed_helper_module(self, tmp_path, monkeypatch):
+        monkeypatch.syspath_prepend(str(tmp_path))
+        helper_file = tmp_path / "warm_dag_helper.py"
+        helper_file.write_text("TASK_ID = 'first'\n")
+        dag_file = tmp_path / "test_warm_dag_helper.py"
+        dag_file.write_text(
+            "import datetime\n"
+            "from warm_dag_helper import TASK_ID\n"
+            "from airflow.models.dag import DAG\n"
+            "from airflow.operators.empty import EmptyOperator\n"
+            "with DAG('warm_dag', start_date=datetime.datetime(2024, 1, 1), schedule=None):\n"
+            "    EmptyOperator(task_id=TASK_ID)\n"
+        )
+        command = ["airflow", "tasks", "run", "warm_dag", "task", "run_id", "--subdir", str(dag_file)]
+        worker = LocalWorker(result_queue=mock.MagicMock(), key=None, command=command)
+
+        assert list(worker._get_warm_dag(command).task_dict) == ["first"]
+        assert "warm_dag_helper" not in sys.modules
+
+        helper_file.write_text("TASK_ID = 'second'\n")
+        stat = helper_file.stat()
+        os.utime(helper_file, (stat.st_atime, stat.st_mtime + 10))
+        assert list(worker._get_warm_dag(command).task_dict) == ["second"]
+
+    def test_get_warm_dag_exiting_dag_file(self, tmp_path):
+        dag_file = tmp_path / "test_exit_dag.py"
+        dag_file.write_text("import sys\nsys.exit(1)\n")
+        command = ["airflow", "tasks", "run", "exit", "task", "run_id", "--subdir", str(dag_file)]
+        worker = LocalWorker(result_queue=mock.MagicMock(), key=None, command=command)
+
+        assert worker._get_warm_dag(command) is None
+
+    def test_get_warm_dag_unknown_dag(self, tmp_path):
+        dag_file = tmp_path / "test_no_dag.py"
+        dag_file.write_text("x = 1\n")
+        command = ["airflow", "tasks", "run", "missing", "task", "run_id", "--subdir", str(dag_file)]
+        worker = LocalWorker(result_queue=mock.MagicMock(), key=None, command=command)
+
+        assert worker._get_warm_dag(command) is None
+        assert worker._get_warm_dag(["airflow", "tasks", "run", "--not-an-option"]) is None
+
     @mock.patch("airflow.executors.local_executor.LocalExecutor.sync")
     @mock.patch("airflow.executors.base_executor.BaseExecutor.trigger_tasks")
     @mock.patch("airflow.executors.base_executor.Stats.gauge")
@@ -994,6 +994,46 @@ def test_verify_integrity_task_start_and_end_date(Stats_incr, session, run_type,
     )
 
 
+@pytest.mark.parametrize("is_noop", [True, False])
+def test_bulk_create_task_instances_same_as_verify_integrity(is_noop, session):
+    with mock.patch("airflow.settings.task_instance_mutation_hook") as mock_mut:
+        mock_mut.is_noop = is_noop
+        with DAG("test", start_date=DEFAULT_DATE) as dag:
+            task_1 = EmptyOperator(task_id="task_1")
+            EmptyOperator(task_id="with_start_date", start_date=DEFAULT_DATE + datetime.timedelta(1))
+            MockOperator.partial(task_id="mapped").expand(arg1=[1, 2, 3])
+            MockOperator.partial(task_id="mapped_upstream").expand(arg1=task_1.output)
+
+        dag_runs = []
+        for hours, (run_type, run_id) in enumerate(
+            [
+                (DagRunType.MANUAL, "verify_integrity"),
+                (DagRunType.MANUAL, "bulk_1"),
+                (DagRunType.BACKFILL_JOB, "bulk_2"),
+            ]
+        ):
+            execution_date = DEFAULT_DATE + datetime.timedelta(hours=hours)
+            dag_run = DagRun(
+                dag_id=dag.dag_id, run_type=run_type, execution_date=execution_date, run_id=run_id
+            )
+            dag_run.dag = dag
+            dag_runs.append(dag_run)
+        session.add_all(dag_runs)
+        session.flush()
+        dag_runs[0].verify_integrity(session=session)
+        DagRun.bulk_create_task_instances(dag, dag_runs[1:], session=session)
+
+        tis = session.query(TI.run_id, TI.task_id, TI.map_index).filter_by(dag_id="test").all()
+        expected = [("task_1", -1), ("mapped", 0), ("mapped", 1), ("mapped", 2), ("mapped_upstream", -1)]
+        for run_id in ("verify_integrity", "bulk_1"):
+            assert sorted((task_id, map_index) for r, task_id, map_index in tis if r == run_id) == sorted(
+                expected
+            )
+        assert sorted((task_id, map_index) for r, task_id, map_index in tis if r == "bulk_2") == sorted(
+            [*expected, ("with_start_date", -1)]
+        )
+
+
 @pytest.mark.parametrize("is_noop", [True, False])
 def test_expand_mapped_task_instance_at_create(is_noop, dag_maker, session):
     with mock.patch("airflow.settings.task_instance_mutation_hook") as mock_mut:
@@ -94,6 +94,7 @@ from airflow.utils.types import DagRunType
 from airflow.utils.xcom import XCOM_RETURN_KEY
 from tests.models import DEFAULT_DATE, TEST_DAGS_FOLDER
 from tests.test_utils import db
+from tests.test_utils.asserts import assert_queries_count
 from tests.test_utils.config import conf_vars
 from tests.test_utils.db import clear_db_connections, clear_db_runs
 from tests.test_utils.mock_operators import MockOperator
@@ -2538,6 +2539,35 @@ class TestTaskInstance:
         assert isinstance(template_context["data_interval_start"], pendulum.DateTime)
         assert isinstance(template_context["data_interval_end"], pendulum.DateTime)
 
+    def test_template_context_lazy_values(self, dag_maker, session):
+        with dag_maker("test_template_context_lazy_values", schedule="0 12 * * *", session=session):
+            BashOperator(task_id="task", bash_command="echo {{ prev_ds }}")
+        ti = dag_maker.create_dagrun(run_type=DagRunType.SCHEDULED).task_instances[0]
+
+        with mock.patch.object(
+            DAG, "previous_schedule", return_value=DEFAULT_DATE - datetime.timedelta(days=1)
+        ) as mock_previous_schedule, mock.patch.object(
+            DAG, "next_dagrun_info"
+        ) as mock_next_dagrun_info, mock.patch.object(
+            TaskInstance, "get_previous_execution_date", return_value=DEFAULT_DATE
+        ) as mock_get_previous_execution_date, mock.patch(
+            "airflow.models.taskinstance.Stats.timing"
+        ) as mock_timing:
+            template_context = ti.get_template_context(session=session)
+            # Referenced by the template of the task
+            mock_previous_schedule.assert_called_once()
+            mock_next_dagrun_info.assert_not_called()
+            mock_get_previous_execution_date.assert_not_called()
+            mock_timing.assert_called_once_with("task.template_context_build", mock.ANY, tags=ti.stats_tags)
+
+            with pytest.deprecated_call():
+                assert template_context["prev_execution_date_success"] == DEFAULT_DATE
+                assert template_context["prev_execution_date_success"] == DEFAULT_DATE
+            mock_get_previous_execution_date.assert_called_once()
+            with pytest.deprecated_call():
+                assert ti.task.render_template("{{ prev_ds }}", template_context) == "2015-12-31"
+            mock_previous_schedule.assert_called_once()
+
     def test_template_render(self, create_task_instance):
         ti = create_task_instance(
             dag_id="test_template_render",
@@ -4205,6 +4235,62 @@ def test_ti_xcom_pull_on_mapped_operator_return_lazy_iterable(mock_deserialize_v
         next(it)
 
 
+@pytest.fixture
+def mapped_xcoms(dag_maker, session):
+    """Create a DAG run where task_2 pulls the XComs of the 5 task instances of the mapped task_1."""
+
+    def create(state):
+        with dag_maker(dag_id="test_xcom", session=session):
+            task_1 = EmptyOperator.partial(task_id="task_1")._expand(EXPAND_INPUT_EMPTY, strict=False)
+            EmptyOperator(task_id="task_2")
+
+        dagrun = dag_maker.create_dagrun()
+        ti_1_0 = dagrun.get_task_instance("task_1", session=session)
+        ti_1_0.map_index = 0
+        ti_1_0.state = state
+        for map_index in range(1, 5):
+            session.merge(TaskInstance(task_1, run_id=dagrun.run_id, map_index=map_index, state=state))
+        session.flush()
+        for map_index in range(5):
+            XCom.set(
+                key=XCOM_RETURN_KEY,
+                value=f"value {map_index}",
+                dag_id=dagrun.dag_id,
+                task_id="task_1",
+                run_id=dagrun.run_id,
+                map_index=map_index,
+                session=session,
+            )
+        return dagrun.get_task_instance("task_2", session=session)
+
+    return create
+
+
+@pytest.mark.parametrize("parallelism", [1, 3])
+def test_ti_xcom_pull_on_finished_mapped_operator_fetches_once(mapped_xcoms, session, parallelism):
+    """The XComs of a finished mapped operator are fetched once for the whole task run."""
+    ti_2 = mapped_xcoms(TaskInstanceState.SUCCESS)
+    joined = ti_2.xcom_pull("task_1", session=session)
+    assert ti_2.xcom_pull("task_1", session=session) is joined
+
+    with conf_vars({("core", "xcom_deserialize_parallelism"): str(parallelism)}), mock.patch(
+        "airflow.models.xcom.XCOM_BULK_FETCH_BATCH_SIZE", 2
+    ):
+        assert list(joined) == [f"value {i}" for i in range(5)]
+        with assert_queries_count(0):
+            assert list(joined) == [f"value {i}" for i in range(5)]
+            assert [joined[i] for i in range(len(joined))] == [f"value {i}" for i in range(5)]
+            assert ti_2.xcom_pull("task_1", session=session) == [f"value {i}" for i in range(5)]
+
+
+def test_ti_xcom_pull_on_unfinished_mapped_operator_not_cached(mapped_xcoms, session):
+    """The XComs of a mapped operator which is still running are pulled again every time."""
+    ti_2 = mapped_xcoms(TaskInstanceState.RUNNING)
+    joined = ti_2.xcom_pull("task_1", session=session)
+    assert list(joined) == [f"value {i}" for i in range(5)]
+    assert ti_2.xcom_pull("task_1", session=session) is not joined
+
+
 def test_ti_mapped_depends_on_mapped_xcom_arg(dag_maker, session):
     with dag_maker(session=session) as dag:
 
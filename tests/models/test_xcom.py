@@ -160,6 +160,29 @@ class TestXCom:
                     session=session,
                 )
 
+    def test_xcom_deserialize_codec_when_codecs_are_disabled(self, task_instance, session):
+        pytest.importorskip("msgpack")
+        pytest.importorskip("zstandard")
+        ti_key = TaskInstanceKey(
+            dag_id=task_instance.dag_id,
+            task_id=task_instance.task_id,
+            run_id=task_instance.run_id,
+        )
+        with conf_vars({("core", "enable_xcom_pickling"): "False", ("core", "xcom_codecs"): "msgpack_zstd"}):
+            XCom.set(
+                key="xcom_test4",
+                value={"key": "value", "numbers": [1, 2.5]},
+                dag_id=task_instance.dag_id,
+                task_id=task_instance.task_id,
+                run_id=task_instance.run_id,
+                session=session,
+            )
+        stored_value = session.query(XCom.value).filter(XCom.key == "xcom_test4").scalar()
+        assert stored_value.startswith(b"\x00XC\x0cmsgpack_zstd")
+        with conf_vars({("core", "enable_xcom_pickling"): "True", ("core", "xcom_codecs"): ""}):
+            ret_value = XCom.get_value(key="xcom_test4", ti_key=ti_key, session=session)
+        assert ret_value == {"key": "value", "numbers": [1, 2.5]}
+
     @conf_vars({("core", "xcom_enable_pickling"): "False"})
     def test_xcom_disable_pickle_type_fail_on_non_json(self, task_instance, session):
         class PickleRce:
@@ -307,3 +307,40 @@ def test_xcom_map_zip_nest(dag_maker, session):
         ti.run(session=session)
 
     assert results == {"aa", "bbbb", "cccccc", "dddddddd"}
+
+
+def test_xcom_map_zip_fan_in_iteration(dag_maker, session):
+    results = {}
+
+    with dag_maker(session=session) as dag:
+
+        @dag.task
+        def double(value):
+            return value * 2
+
+        @dag.task
+        def push_letters():
+            return ["a", "b", "c"]
+
+        @dag.task
+        def pull(mapped, zipped):
+            results["mapped"] = list(mapped)
+            results["zipped"] = list(zipped)
+
+        doubled = double.expand(value=[1, 2, 3])
+        pull(doubled.map(lambda v: v + 1), doubled.zip(push_letters(), fillvalue=None))
+
+    dr = dag_maker.create_dagrun(session=session)
+
+    # Run "double" and "push_letters".
+    decision = dr.task_instance_scheduling_decisions(session=session)
+    for ti in decision.schedulable_tis:
+        ti.run(session=session)
+    session.commit()
+
+    # Run "pull".
+    decision = dr.task_instance_scheduling_decisions(session=session)
+    assert [ti.task_id for ti in decision.schedulable_tis] == ["pull"]
+    decision.schedulable_tis[0].run(session=session)
+
+    assert results == {"mapped": [3, 5, 7], "zipped": [(2, "a"), (4, "b"), (6, "c")]}
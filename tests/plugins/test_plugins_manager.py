@@ -19,6 +19,7 @@ from __future__ import annotations
 
 import importlib
 import inspect
+import json
 import logging
 import os
 import sys
@@ -68,6 +69,35 @@ class AirflowTestOnLoadExceptionPlugin(AirflowPlugin):
         raise Exception("oops")
 """
 
+LAZY_MACROS_PLUGIN = """
+from airflow.plugins_manager import AirflowPlugin
+
+
+def custom_macro():
+    return "foo"
+
+
+class LazyMacrosPlugin(AirflowPlugin):
+    name = "lazy_macros"
+    macros = [custom_macro]
+"""
+
+LAZY_TIMETABLE_PLUGIN = """
+from airflow.plugins_manager import AirflowPlugin
+from airflow.timetables.simple import NullTimetable
+
+
+class LazyTimetable(NullTimetable):
+    pass
+
+
+class LazyTimetablePlugin(AirflowPlugin):
+    name = "lazy_timetable"
+    timetables = [LazyTimetable]
+"""
+
+LAZY_PLUGIN_MODULES = ("lazy_macros_plugin", "lazy_timetable_plugin", "lazy_broken_plugin")
+
 
 @pytest.fixture(autouse=True, scope="module")
 def clean_plugins():
@@ -419,6 +449,142 @@ class TestPluginsManager:
             assert len(plugins_manager.plugins) == 2
 
 
+class TestPluginsManifest:
+    @pytest.fixture(autouse=True)
+    def plugins_folder(self, tmp_path, monkeypatch):
+        from airflow import macros
+
+        plugins_folder = tmp_path / "plugins"
+        plugins_folder.mkdir()
+        (plugins_folder / "lazy_macros_plugin.py").write_text(LAZY_MACROS_PLUGIN)
+        (plugins_folder / "lazy_timetable_plugin.py").write_text(LAZY_TIMETABLE_PLUGIN)
+        (plugins_folder / "lazy_broken_plugin.py").write_text("import not_an_installed_module")
+        monkeypatch.setattr("airflow.plugins_manager.entry_points_with_dist", lambda group: iter([]))
+        self.manifest_path = tmp_path / "plugins_manifest.json"
+        self._start_new_process(monkeypatch)
+        with conf_vars(
+            {
+                ("core", "plugins_folder"): os.fspath(plugins_folder),
+                ("core", "plugins_manifest_file"): os.fspath(self.manifest_path),
+            }
+        ):
+            yield plugins_folder
+        for module_name in LAZY_PLUGIN_MODULES:
+            sys.modules.pop(module_name, None)
+        # Reloads the airflow.macros module, to remove the plugin macros registered on it
+        importlib.reload(macros)
+
+    @staticmethod
+    def _start_new_process(monkeypatch):
+        from tests.test_utils.mock_plugins import PLUGINS_MANAGER_NULLABLE_ATTRIBUTES
+
+        for attr in PLUGINS_MANAGER_NULLABLE_ATTRIBUTES:
+            monkeypatch.setattr(f"airflow.plugins_manager.{attr}", None)
+        monkeypatch.setattr("airflow.plugins_manager.registered_ti_dep_classes", None)
+        monkeypatch.setattr("airflow.plugins_manager.import_errors", {})
+        monkeypatch.setattr("airflow.plugins_manager.loaded_plugins", set())
+        monkeypatch.setattr("airflow.plugins_manager._manifest_plugins", {})
+        monkeypatch.setattr("airflow.plugins_manager._manifest_plugin_modules", {})
+        for module_name in LAZY_PLUGIN_MODULES:
+            sys.modules.pop(module_name, None)
+
+    def test_manifest_written_when_plugins_loaded(self, plugins_folder):
+        from airflow import plugins_manager
+
+        plugins_manager.ensure_plugins_loaded()
+
+        manifest = json.loads(self.manifest_path.read_text())
+        assert sorted(manifest["plugins"], key=lambda entry: entry["name"]) == [
+            {
+                "name": "lazy_macros",
+                "class_name": "LazyMacrosPlugin",
+                "source": {"type": "file", "path": os.fspath(plugins_folder / "lazy_macros_plugin.py")},
+                "components": ["macros"],
+            },
+            {
+                "name": "lazy_timetable",
+                "class_name": "LazyTimetablePlugin",
+                "source": {"type": "file", "path": os.fspath(plugins_folder / "lazy_timetable_plugin.py")},
+                "components": ["timetables"],
+            },
+        ]
+        assert list(manifest["import_errors"]) == [os.fspath(plugins_folder / "lazy_broken_plugin.py")]
+
+    def test_plugins_imported_when_components_needed(self, monkeypatch, plugins_folder):
+        from airflow import macros, plugins_manager
+
+        plugins_manager.ensure_plugins_loaded()
+        self._start_new_process(monkeypatch)
+
+        with mock.patch("airflow.stats.Stats.timing") as mock_timing:
+            plugins_manager.initialize_timetables_plugins()
+            assert list(plugins_manager.timetable_classes) == ["lazy_timetable_plugin.LazyTimetable"]
+            assert "lazy_timetable_plugin" in sys.modules
+            assert "lazy_macros_plugin" not in sys.modules
+            mock_timing.assert_any_call(
+                "plugins.import_duration", mock.ANY, tags={"plugin_name": "lazy_timetable"}
+            )
+
+            plugins_manager.integrate_macros_plugins()
+            assert "lazy_macros_plugin" not in sys.modules
+            assert macros.lazy_macros.custom_macro() == "foo"
+            assert "lazy_macros_plugin" in sys.modules
+            mock_timing.assert_any_call("plugins.import_duration.lazy_macros", mock.ANY)
+
+        assert plugins_manager.plugins is None
+        assert list(plugins_manager.import_errors) == [os.fspath(plugins_folder / "lazy_broken_plugin.py")]
+        with pytest.raises(AttributeError):
+            macros.not_a_plugin
+
+        # Plugins imported lazily are not imported again when all plugins are loaded
+        timetable_plugin = plugins_manager._manifest_plugins["lazy_timetable"]
+        plugins_manager.ensure_plugins_loaded()
+        assert sorted(plugin.name for plugin in plugins_manager.plugins) == ["lazy_macros", "lazy_timetable"]
+        assert timetable_plugin in plugins_manager.plugins
+
+    def test_manifest_not_used_when_plugins_changed(self, monkeypatch, plugins_folder):
+        from airflow import plugins_manager
+
+        plugins_manager.ensure_plugins_loaded()
+        self._start_new_process(monkeypatch)
+        (plugins_folder / "lazy_macros_plugin.py").write_text(
+            LAZY_MACROS_PLUGIN.replace("LazyMacrosPlugin", "RenamedMacrosPlugin")
+        )
+
+        plugins_manager.initialize_timetables_plugins()
+
+        # All plugins are loaded, then the manifest is written again
+        assert "lazy_macros_plugin" in sys.modules
+        assert plugins_manager.plugins_manifest is None
+        assert len(plugins_manager.plugins) == 2
+        manifest = json.loads(self.manifest_path.read_text())
+        assert "RenamedMacrosPlugin" in {entry["class_name"] for entry in manifest["plugins"]}
+
+    def test_manifest_not_written_when_plugin_file_removed(self, monkeypatch, plugins_folder, caplog):
+        from airflow import plugins_manager
+
+        plugins_manager.ensure_plugins_loaded()
+        self.manifest_path.unlink()
+        removed_plugin = os.fspath(plugins_folder / "removed_plugin.py")
+        monkeypatch.setattr("airflow.plugins_manager._find_plugin_files", lambda: iter([removed_plugin]))
+
+        plugins_manager._write_plugins_manifest()
+
+        assert not self.manifest_path.exists()
+        assert not list(self.manifest_path.parent.glob("*.tmp"))
+        assert "Error when writing the plugins manifest" in caplog.text
+
+    def test_manifest_not_used_when_disabled(self, monkeypatch):
+        from airflow import plugins_manager
+
+        with conf_vars({("core", "plugins_manifest_file"): ""}):
+            plugins_manager.initialize_timetables_plugins()
+
+        assert not self.manifest_path.exists()
+        assert "lazy_macros_plugin" in sys.modules
+        assert len(plugins_manager.plugins) == 2
+
+
 class TestPluginsDirectorySource:
     def test_should_return_correct_path_name(self):
         from airflow import plugins_manager
@@ -22,6 +22,8 @@ import logging
 import os
 import signal
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
 from unittest import mock
 
@@ -29,11 +31,12 @@ from unittest import mock
 import celery.contrib.testing.tasks  # noqa: F401
 import pytest
 import time_machine
-from celery import Celery
+from celery import Celery, states as celery_states
 from celery.result import AsyncResult
 from kombu.asynchronous import set_event_loop
 
 from airflow.configuration import conf
+from airflow.exceptions import AirflowConfigException, AirflowTaskTimeout
 from airflow.models.baseoperator import BaseOperator
 from airflow.models.dag import DAG
 from airflow.models.taskinstance import TaskInstance, TaskInstanceKey
@@ -366,3 +369,237 @@ def test_celery_task_acks_late_loaded_from_string():
     # reload celery conf to apply the new config
     importlib.reload(default_celery)
     assert default_celery.DEFAULT_CELERY_CONFIG["task_acks_late"] is False
+
+
+@conf_vars({("celery", "send_pool_type"): "thread", ("celery", "persistent_send_pool"): "True"})
+def test_send_tasks_to_celery_persistent_thread_pool():
+    executor = celery_executor.CeleryExecutor()
+    executor._sync_parallelism = 4
+
+    task = MockTask()
+    task_tuples_to_send = [(f"key_{i}", None, None, task) for i in range(26)]
+
+    results = executor._send_tasks_to_celery(task_tuples_to_send)
+    send_pool = executor._send_pool
+    assert results == [(f"key_{i}", None, 1) for i in range(26)]
+    assert send_pool is not None
+
+    # The pool is reused by the following calls, and shut down when the executor ends
+    executor._send_tasks_to_celery(task_tuples_to_send)
+    assert executor._send_pool is send_pool
+    executor.end()
+    assert executor._send_pool is None
+
+
+@conf_vars({("celery", "send_pool_type"): "thread"})
+def test_send_tasks_to_celery_batch_timeout_in_flight():
+    executor = celery_executor.CeleryExecutor()
+    executor._sync_parallelism = 2
+
+    task = MockTask()
+    task_tuples_to_send = [(f"key_{i}", None, None, task) for i in range(4)]
+    published = threading.Event()
+
+    with mock.patch.object(celery_executor_utils, "OPERATION_TIMEOUT", 0.01), mock.patch.object(
+        MockTask, "apply_async", side_effect=lambda *args, **kwargs: published.wait()
+    ):
+        # The batches may still be published, so they are neither failed nor sent again until they complete
+        assert executor._send_tasks_to_celery(task_tuples_to_send) == []
+        assert executor._inflight_send_keys == {f"key_{i}" for i in range(4)}
+        assert executor._collect_inflight_sends() == []
+
+        published.set()
+        for future in list(executor._inflight_sends):
+            future.result()
+        results = executor._collect_inflight_sends()
+
+    assert sorted(key for key, _, _ in results) == [f"key_{i}" for i in range(4)]
+    assert all(result is True for _, _, result in results)
+    assert not executor._inflight_sends
+
+
+@conf_vars({("celery", "send_pool_type"): "thread"})
+def test_send_tasks_to_celery_batch_timeout_not_started():
+    executor = celery_executor.CeleryExecutor()
+    executor._sync_parallelism = 2
+    executor._persistent_send_pool = True
+    executor._send_pool = ThreadPoolExecutor(max_workers=1)
+
+    task = MockTask()
+    task_tuples_to_send = [(f"key_{i}", None, None, task) for i in range(4)]
+    published = threading.Event()
+
+    with mock.patch.object(celery_executor_utils, "OPERATION_TIMEOUT", 0.01), mock.patch.object(
+        MockTask, "apply_async", side_effect=lambda *args, **kwargs: published.wait()
+    ):
+        results = executor._send_tasks_to_celery(task_tuples_to_send)
+        published.set()
+    executor.end()
+
+    # The second batch never started, so it failed and can be retried safely
+    assert [key for key, _, _ in results] == ["key_2", "key_3"]
+    for _, _, result in results:
+        assert isinstance(result, celery_executor_utils.ExceptionWithTraceback)
+        assert isinstance(result.exception, AirflowTaskTimeout)
+    assert executor._inflight_send_keys == {"key_0", "key_1"}
+
+
+@conf_vars({("celery", "send_pool_type"): "thread"})
+def test_process_tasks_skips_in_flight_sends():
+    executor = celery_executor.CeleryExecutor()
+    in_flight = mock.MagicMock(**{"done.return_value": False})
+    executor._inflight_sends[in_flight] = [("key_0", None, None, None)]
+
+    with mock.patch.object(executor, "_send_tasks_to_celery", return_value=[]) as mock_send:
+        executor._process_tasks([("key_0", None, None, None), ("key_1", None, None, None)])
+
+    assert [key for key, *_ in mock_send.call_args.args[0]] == ["key_1"]
+
+
+@conf_vars({("celery", "send_pool_type"): "greenlet"})
+def test_send_pool_type_invalid():
+    with pytest.raises(AirflowConfigException, match="send_pool_type"):
+        celery_executor.CeleryExecutor()
+
+
+def test_send_tasks_batch_to_executor_reuses_producer():
+    test_app = Celery("test_app")
+
+    @test_app.task
+    def test_task(command):
+        pass
+
+    test_task = test_task._get_current_object()
+    task_tuples_to_send = [(f"key_{i}", ["airflow"], None, test_task) for i in range(3)]
+
+    with mock.patch.object(test_app, "producer_or_acquire") as mock_producer_or_acquire, mock.patch.object(
+        test_task, "apply_async", return_value=1
+    ) as mock_apply_async:
+        results = celery_executor_utils.send_tasks_batch_to_executor(task_tuples_to_send)
+
+    mock_producer_or_acquire.assert_called_once()
+    producer = mock_producer_or_acquire.return_value.__enter__.return_value
+    assert mock_apply_async.call_count == 3
+    assert all(call.kwargs["producer"] is producer for call in mock_apply_async.call_args_list)
+    assert results == [(f"key_{i}", ["airflow"], 1) for i in range(3)]
+
+
+class FakeAsyncResult:
+    def __init__(self, task_id):
+        self.task_id = task_id
+
+
+class TestCeleryEventStateTracker:
+    def test_get_many_from_events(self):
+        tracker = celery_executor_utils.CeleryEventStateTracker(fallback_timeout=300)
+        tracker.on_task_event({"type": "task-started", "uuid": "started"})
+        tracker.on_task_event({"type": "task-succeeded", "uuid": "succeeded"})
+        tracker.on_task_event({"type": "task-failed", "uuid": "failed", "exception": "ValueError()"})
+        # Late started event must not override the final state
+        tracker.on_task_event({"type": "task-started", "uuid": "succeeded"})
+        tracker.on_task_event({"type": "task-received", "uuid": "started"})
+
+        state_info, to_poll = tracker.get_many(
+            [FakeAsyncResult(task_id) for task_id in ("started", "succeeded", "failed", "unknown")]
+        )
+
+        assert state_info == {
+            "started": (celery_states.STARTED, None),
+            "succeeded": (celery_states.SUCCESS, None),
+            "failed": (celery_states.FAILURE, "ValueError()"),
+        }
+        assert to_poll == []
+
+    @mock.patch("airflow.providers.celery.executors.celery_executor_utils.time.monotonic")
+    def test_get_many_falls_back_to_polling(self, mock_monotonic):
+        mock_monotonic.return_value = 1000
+        tracker = celery_executor_utils.CeleryEventStateTracker(fallback_timeout=60)
+        tracker.on_task_event({"type": "task-started", "uuid": "started"})
+        tracker.on_task_event({"type": "task-succeeded", "uuid": "succeeded"})
+        async_results = [FakeAsyncResult(task_id) for task_id in ("started", "succeeded", "unknown")]
+
+        _, to_poll = tracker.get_many(async_results)
+        assert to_poll == []
+
+        mock_monotonic.return_value = 1061
+        _, to_poll = tracker.get_many(async_results)
+        assert [r.task_id for r in to_poll] == ["started", "unknown"]
+
+        # Polled tasks are not polled again before the timeout passes another time
+        _, to_poll = tracker.get_many(async_results)
+        assert to_poll == []
+
+    @mock.patch("airflow.providers.celery.executors.celery_executor_utils.time.monotonic")
+    def test_get_many_warns_without_events(self, mock_monotonic, caplog):
+        mock_monotonic.return_value = 1000
+        tracker = celery_executor_utils.CeleryEventStateTracker(fallback_timeout=60)
+        async_results = [FakeAsyncResult("no_event")]
+        tracker.get_many(async_results)
+
+        mock_monotonic.return_value = 1061
+        with caplog.at_level(logging.WARNING):
+            _, to_poll = tracker.get_many(async_results)
+        assert [r.task_id for r in to_poll] == ["no_event"]
+        assert "No Celery task event received for 60s" in caplog.text
+
+        # Not warned while events of other tasks are received
+        caplog.clear()
+        mock_monotonic.return_value = 1100
+        tracker.on_task_event({"type": "task-started", "uuid": "other"})
+        mock_monotonic.return_value = 1122
+        with caplog.at_level(logging.WARNING):
+            _, to_poll = tracker.get_many(async_results)
+        assert [r.task_id for r in to_poll] == ["no_event"]
+        assert "No Celery task event" not in caplog.text
+
+    def test_start_warns_if_events_disabled(self, caplog):
+        test_app = Celery("test_app")
+        test_app.conf.worker_send_task_events = False
+        tracker = celery_executor_utils.CeleryEventStateTracker(fallback_timeout=60, celery_app=test_app)
+        with mock.patch.object(tracker, "_run"), caplog.at_level(logging.WARNING):
+            tracker.start()
+            tracker.stop()
+        assert "worker_send_task_events is disabled" in caplog.text
+
+    def test_get_many_forgets_untracked_tasks(self):
+        tracker = celery_executor_utils.CeleryEventStateTracker(fallback_timeout=300)
+        tracker.on_task_event({"type": "task-succeeded", "uuid": "done"})
+        tracker.on_task_event({"type": "task-succeeded", "uuid": "other"})
+
+        tracker.get_many([FakeAsyncResult("done")])
+        state_info, _ = tracker.get_many([FakeAsyncResult("other")])
+
+        assert state_info == {}
+
+    @conf_vars({("celery", "task_state_events"): "True"})
+    def test_update_all_task_states_from_events(self):
+        executor = celery_executor.CeleryExecutor()
+        assert executor.event_state_tracker is not None
+        key_success = TaskInstanceKey("dag", "success", "run_id", 1)
+        key_running = TaskInstanceKey("dag", "running", "run_id", 1)
+        key_stale = TaskInstanceKey("dag", "stale", "run_id", 1)
+        stale_result = FakeAsyncResult("stale")
+        executor.tasks = {
+            key_success: FakeAsyncResult("success"),
+            key_running: FakeAsyncResult("running"),
+            key_stale: stale_result,
+        }
+        executor.running = set(executor.tasks)
+
+        with mock.patch.object(
+            executor.event_state_tracker,
+            "get_many",
+            return_value=(
+                {"success": (celery_states.SUCCESS, None), "running": (celery_states.STARTED, None)},
+                [stale_result],
+            ),
+        ), mock.patch.object(
+            executor.bulk_state_fetcher, "get_many", return_value={"stale": (celery_states.FAILURE, None)}
+        ) as mock_bulk_get_many:
+            executor.update_all_task_states()
+
+        mock_bulk_get_many.assert_called_once_with([stale_result])
+        assert executor.event_buffer[key_success][0] == State.SUCCESS
+        assert executor.event_buffer[key_stale][0] == State.FAILED
+        assert key_running not in executor.event_buffer
+        assert list(executor.tasks) == [key_running]
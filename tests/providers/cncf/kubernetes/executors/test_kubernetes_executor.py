@@ -21,6 +21,8 @@ import random
 import re
 import string
 import sys
+import threading
+import time
 from datetime import datetime, timedelta
 from unittest import mock
 
@@ -34,6 +36,7 @@ from airflow.exceptions import AirflowException
 from airflow.models.taskinstancekey import TaskInstanceKey
 from airflow.operators.bash import BashOperator
 from airflow.operators.empty import EmptyOperator
+from airflow.stats import Stats
 from airflow.utils import timezone
 from airflow.utils.state import State, TaskInstanceState
 from tests.test_utils.config import conf_vars
@@ -51,10 +54,14 @@ try:
     from airflow.providers.cncf.kubernetes.executors.kubernetes_executor_utils import (
         AirflowKubernetesScheduler,
         KubernetesJobWatcher,
+        KubernetesPodCache,
+        PodCreationDeferredException,
         ResourceVersion,
         create_pod_id,
         get_base_pod_from_template,
+        get_watcher_shard,
     )
+    from airflow.providers.cncf.kubernetes.kube_config import KubeConfig
     from airflow.providers.cncf.kubernetes.kubernetes_helper_functions import (
         annotations_for_logging_task_metadata,
         annotations_to_key,
@@ -460,6 +467,49 @@ class TestKubernetesExecutor:
             finally:
                 kubernetes_executor.end()
 
+    @pytest.mark.db_test
+    @pytest.mark.skipif(
+        AirflowKubernetesScheduler is None, reason="kubernetes python package is not installed"
+    )
+    @mock.patch("airflow.providers.cncf.kubernetes.executors.kubernetes_executor_utils.KubernetesJobWatcher")
+    @mock.patch("airflow.providers.cncf.kubernetes.kube_client.get_kube_client")
+    def test_run_next_throttled_requeue(self, mock_get_kube_client, mock_kubernetes_job_watcher):
+        """Tasks throttled by the Kubernetes API are re-queued without blocking, then failed."""
+        path = sys.path[0] + "/tests/providers/cncf/kubernetes/pod_generator_base_with_secrets.yaml"
+        mock_kube_client = FakeKubernetesApi(throttled_calls=2)
+        mock_get_kube_client.return_value = mock_kube_client
+        with conf_vars({("kubernetes", "pod_template_file"): path}):
+            kubernetes_executor = self.kubernetes_executor
+            kubernetes_executor.kube_config.worker_pods_creation_throttle_retries = 1
+            kubernetes_executor.start()
+            try:
+                task_instance_key = TaskInstanceKey("dag", "task", "run_id", 1)
+                kubernetes_executor.execute_async(
+                    key=task_instance_key,
+                    queue=None,
+                    command=["airflow", "tasks", "run", "true", "some_parameter"],
+                )
+                with mock.patch("time.sleep") as mock_sleep:
+                    kubernetes_executor.sync()
+                    # Pod creations are paused, the task is left in the queue
+                    kubernetes_executor.sync()
+                mock_sleep.assert_not_called()
+
+                assert mock_kube_client.calls == 1
+                assert not kubernetes_executor.task_queue.empty()
+                assert kubernetes_executor.task_publish_retries[task_instance_key] == 1
+                assert kubernetes_executor.event_buffer[task_instance_key][0] == State.QUEUED
+
+                kubernetes_executor.kube_scheduler._throttled_until = 0.0
+                kubernetes_executor.sync()
+
+                assert mock_kube_client.calls == 2
+                assert kubernetes_executor.task_queue.empty()
+                assert kubernetes_executor.event_buffer[task_instance_key][0] == State.FAILED
+                assert task_instance_key not in kubernetes_executor.task_publish_retries
+            finally:
+                kubernetes_executor.end()
+
     @pytest.mark.db_test
     @pytest.mark.skipif(
         AirflowKubernetesScheduler is None, reason="kubernetes python package is not installed"
@@ -1477,6 +1527,143 @@ class TestKubernetesExecutor:
             get_logs_task_metadata.cache_clear()
 
 
+class FakeKubernetesApi:
+    """Thread-safe stand-in for the pod creation endpoint of the Kubernetes API."""
+
+    def __init__(self, throttled_calls=0, retry_after=None, barrier=None):
+        self.api_client = mock.MagicMock()
+        self.api_client.sanitize_for_serialization.side_effect = lambda pod: {
+            "metadata": {"name": pod.metadata.name}
+        }
+        self.throttled_calls = throttled_calls
+        self.retry_after = retry_after
+        self.barrier = barrier
+        self.created_pods = []
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def create_namespaced_pod(self, body, namespace, **kwargs):
+        with self._lock:
+            self.calls += 1
+            throttled = self.calls <= self.throttled_calls
+        if throttled:
+            response = HTTPResponse(
+                body='{"message": "Too many requests"}',
+                status=429,
+                headers={"Retry-After": self.retry_after} if self.retry_after else {},
+            )
+            raise ApiException(http_resp=response)
+        if self.barrier:
+            # Only passes when enough pods are created concurrently
+            self.barrier.wait()
+        with self._lock:
+            self.created_pods.append(body["metadata"]["name"])
+        return body
+
+
+@pytest.mark.db_test
+@pytest.mark.skipif(AirflowKubernetesScheduler is None, reason="kubernetes python package is not installed")
+class TestAirflowKubernetesSchedulerPodLauncher:
+    template_path = sys.path[0] + "/tests/providers/cncf/kubernetes/pod_generator_base_with_secrets.yaml"
+
+    @pytest.fixture
+    def make_scheduler(self):
+        schedulers = []
+
+        def _make_scheduler(kube_client, **config):
+            conf = {("kubernetes_executor", "pod_template_file"): self.template_path}
+            conf.update({("kubernetes_executor", option): value for option, value in config.items()})
+            with conf_vars(conf):
+                kube_config = KubeConfig()
+            with mock.patch(
+                "airflow.providers.cncf.kubernetes.executors.kubernetes_executor_utils.KubernetesJobWatcher"
+            ):
+                scheduler = AirflowKubernetesScheduler(
+                    kube_config=kube_config,
+                    result_queue=mock.MagicMock(),
+                    kube_client=kube_client,
+                    scheduler_job_id="5",
+                )
+            schedulers.append(scheduler)
+            return scheduler
+
+        yield _make_scheduler
+        for scheduler in schedulers:
+            scheduler.terminate()
+
+    @staticmethod
+    def _jobs(count, command=("airflow", "tasks", "run", "true", "some_parameter")):
+        return [
+            (TaskInstanceKey("dag", f"task_{i}", "run_id", 1), list(command), None, None)
+            for i in range(count)
+        ]
+
+    def test_run_next_batch_creates_pods_concurrently(self, make_scheduler):
+        kube_client = FakeKubernetesApi(barrier=threading.Barrier(4, timeout=10))
+        scheduler = make_scheduler(kube_client, worker_pods_creation_parallelism="4")
+
+        with mock.patch.object(Stats, "timer") as mock_timer, mock.patch.object(Stats, "gauge") as mock_gauge:
+            errors = scheduler.run_next_batch(self._jobs(8))
+
+        assert errors == [None] * 8
+        assert len(kube_client.created_pods) == 8
+        mock_gauge.assert_called_once_with("kubernetes_executor.pod_creation_batch.size", 8)
+        mock_timer.assert_called_once_with("kubernetes_executor.pod_creation_batch.duration")
+
+    def test_run_next_batch_sequential_by_default(self, make_scheduler):
+        kube_client = FakeKubernetesApi()
+        scheduler = make_scheduler(kube_client)
+
+        assert scheduler.run_next_batch(self._jobs(3)) == [None, None, None]
+        assert len(kube_client.created_pods) == 3
+        assert scheduler._pod_launcher is None
+
+    def test_run_next_batch_returns_errors_in_order(self, make_scheduler):
+        kube_client = FakeKubernetesApi()
+        scheduler = make_scheduler(kube_client, worker_pods_creation_parallelism="4")
+        jobs = self._jobs(3)
+        jobs[1] = (jobs[1][0], ["airflow", "dags", "list"], None, None)
+
+        errors = scheduler.run_next_batch(jobs)
+
+        assert errors[0] is None
+        assert isinstance(errors[1], ValueError)
+        assert errors[2] is None
+        assert len(kube_client.created_pods) == 2
+
+    def test_throttled_pod_creation_pauses_pod_creations(self, make_scheduler):
+        kube_client = FakeKubernetesApi(throttled_calls=1, retry_after="7")
+        scheduler = make_scheduler(kube_client)
+
+        with mock.patch.object(Stats, "incr") as mock_incr:
+            errors = scheduler.run_next_batch(self._jobs(3))
+
+        assert isinstance(errors[0], ApiException)
+        assert errors[0].status == 429
+        assert all(isinstance(error, PodCreationDeferredException) for error in errors[1:])
+        assert kube_client.calls == 1
+        mock_incr.assert_called_once_with("kubernetes_executor.pod_creation.throttled")
+        assert 6 < scheduler.get_throttle_delay() <= 7
+
+        scheduler._throttled_until = 0.0
+        assert scheduler.run_next_batch(self._jobs(1)) == [None]
+        assert scheduler._consecutive_throttles == 0
+
+    def test_throttled_pod_creation_exponential_backoff(self, make_scheduler):
+        kube_client = FakeKubernetesApi(throttled_calls=10)
+        scheduler = make_scheduler(kube_client, worker_pods_creation_throttle_backoff="0.5")
+
+        delays = []
+        for _ in range(3):
+            scheduler._throttled_until = 0.0
+            [error] = scheduler.run_next_batch(self._jobs(1))
+            assert isinstance(error, ApiException)
+            delays.append(scheduler.get_throttle_delay())
+
+        assert delays == pytest.approx([0.5, 1.0, 2.0], abs=0.1)
+        assert scheduler._get_throttle_backoff(ApiException(status=429), 10) == 60.0
+
+
 class TestKubernetesJobWatcher:
     test_namespace = "airflow"
 
@@ -1860,3 +2047,236 @@ class TestKubernetesJobWatcher:
                 self.watcher.run()
 
             mock_underscore_run.assert_called_once_with(mock.ANY, "0", mock.ANY, mock.ANY)
+
+    def test_sharded_watcher_label_selector(self):
+        self.watcher.shard = 2
+        self.watcher.kube_config.kube_client_request_args = {}
+        with mock.patch(
+            "airflow.providers.cncf.kubernetes.executors.kubernetes_executor_utils.watch"
+        ) as mock_watch:
+            mock_watch.Watch.return_value.stream.return_value = []
+            self.watcher._run(self.kube_client, "0", "123", self.watcher.kube_config)
+
+        mock_watch.Watch.return_value.stream.assert_called_once_with(
+            self.kube_client.list_namespaced_pod,
+            self.test_namespace,
+            label_selector="airflow-worker=123,airflow-watcher-shard=2",
+            resource_version="0",
+        )
+
+
+class TestWatcherSharding:
+    @pytest.mark.db_test
+    @mock.patch("airflow.providers.cncf.kubernetes.executors.kubernetes_executor_utils.KubernetesJobWatcher")
+    @mock.patch("airflow.providers.cncf.kubernetes.kube_client.get_kube_client")
+    def test_watchers_per_shard(self, mock_get_kube_client, mock_kubernetes_job_watcher):
+        executor = KubernetesExecutor()
+        executor.job_id = 5
+        executor.kube_config.watcher_shards = 3
+        executor.start()
+        try:
+            assert list(executor.kube_scheduler.kube_watchers) == [
+                "default/shard-0",
+                "default/shard-1",
+                "default/shard-2",
+            ]
+            assert [call.kwargs["shard"] for call in mock_kubernetes_job_watcher.call_args_list] == [0, 1, 2]
+        finally:
+            executor.end()
+
+    @pytest.mark.db_test
+    @mock.patch("airflow.providers.cncf.kubernetes.executors.kubernetes_executor_utils.KubernetesJobWatcher")
+    @mock.patch("airflow.providers.cncf.kubernetes.kube_client.get_kube_client")
+    def test_run_next_labels_pod_with_shard(self, mock_get_kube_client, mock_kubernetes_job_watcher):
+        path = sys.path[0] + "/tests/providers/cncf/kubernetes/pod_generator_base_with_secrets.yaml"
+        with conf_vars({("kubernetes", "pod_template_file"): path}):
+            executor = KubernetesExecutor()
+        executor.job_id = 5
+        executor.kube_config.watcher_shards = 4
+        executor.start()
+        try:
+            key = TaskInstanceKey("dag", "task", "run_id", 1)
+            with mock.patch.object(executor.kube_scheduler, "run_pod_async") as mock_run_pod_async:
+                executor.kube_scheduler.run_next((key, ["airflow", "tasks", "run", "true"], None, None))
+            pod = mock_run_pod_async.call_args.args[0]
+            assert pod.metadata.labels["airflow-watcher-shard"] == get_watcher_shard(pod.metadata.name, 4)
+            assert executor._get_adoption_labels(pod) == {
+                "airflow-worker": "5",
+                "airflow-watcher-shard": get_watcher_shard(pod.metadata.name, 4),
+            }
+        finally:
+            executor.end()
+
+    def test_get_watcher_shard(self):
+        shards = {get_watcher_shard(f"pod-{i}", 4) for i in range(100)}
+        assert shards == {"0", "1", "2", "3"}
+        assert get_watcher_shard("pod-1", 4) == get_watcher_shard("pod-1", 4)
+
+
+class TestKubernetesPodCache:
+    def setup_method(self):
+        kube_config = mock.MagicMock(kube_client_request_args={})
+        self.cache = KubernetesPodCache(kube_config=kube_config, namespaces=["airflow"])
+        self.kube_client = mock.MagicMock()
+
+    @staticmethod
+    def _pod(name, phase="Running", resource_version="1", namespace="airflow", **labels):
+        return k8s.V1Pod(
+            metadata=k8s.V1ObjectMeta(
+                name=name,
+                namespace=namespace,
+                labels={"kubernetes_executor": "True", "airflow-worker": "1", **labels},
+                annotations={"dag_id": "dag"},
+                resource_version=resource_version,
+            ),
+            spec=k8s.V1PodSpec(containers=[k8s.V1Container(name="base")]),
+            status=k8s.V1PodStatus(phase=phase),
+        )
+
+    def _list(self, *pods, resource_version="10"):
+        self.kube_client.list_namespaced_pod.return_value = k8s.V1PodList(
+            items=list(pods), metadata=k8s.V1ListMeta(resource_version=resource_version)
+        )
+        return self.cache._list(self.kube_client, "airflow")
+
+    def _watch(self, events, resource_version="10"):
+        with mock.patch(
+            "airflow.providers.cncf.kubernetes.executors.kubernetes_executor_utils.watch"
+        ) as mock_watch:
+            mock_watch.Watch.return_value.stream.return_value = events
+            last_resource_version = self.cache._watch(self.kube_client, "airflow", resource_version)
+        return mock_watch, last_resource_version
+
+    def test_list(self):
+        assert self._list(self._pod("a"), self._pod("b")) == "10"
+        self.kube_client.list_namespaced_pod.assert_called_once_with(
+            "airflow", label_selector="kubernetes_executor=True"
+        )
+        pods = self.cache.list_pods()
+        assert sorted(pod.metadata.name for pod in pods) == ["a", "b"]
+        # Only the metadata and phase of the pods are kept
+        assert all(pod.spec is None for pod in pods)
+
+        # Listing again replaces the cached pods
+        self._list(self._pod("c"))
+        assert [pod.metadata.name for pod in self.cache.list_pods()] == ["c"]
+
+    def test_watch(self):
+        self._list(self._pod("a"), self._pod("b"))
+        events = [
+            {"type": "ADDED", "object": self._pod("c", phase="Pending", resource_version="11")},
+            {"type": "MODIFIED", "object": self._pod("a", phase="Succeeded", resource_version="12")},
+            {"type": "DELETED", "object": self._pod("b", resource_version="13")},
+            {"type": "BOOKMARK", "object": k8s.V1Pod(metadata=k8s.V1ObjectMeta(resource_version="20"))},
+        ]
+        mock_watch, last_resource_version = self._watch(events)
+
+        assert last_resource_version == "20"
+        mock_watch.Watch.return_value.stream.assert_called_once_with(
+            self.kube_client.list_namespaced_pod,
+            "airflow",
+            label_selector="kubernetes_executor=True",
+            resource_version="10",
+            allow_watch_bookmarks=True,
+            timeout_seconds=60,
+        )
+        assert {pod.metadata.name: pod.status.phase for pod in self.cache.list_pods()} == {
+            "a": "Succeeded",
+            "c": "Pending",
+        }
+
+    def test_watch_expired_resource_version(self):
+        events = [{"type": "ERROR", "object": None, "raw_object": {"code": 410, "message": "too old"}}]
+        _, last_resource_version = self._watch(events)
+        assert last_resource_version is None
+
+    def test_watch_error(self):
+        events = [{"type": "ERROR", "object": None, "raw_object": {"code": 500, "message": "error"}}]
+        with pytest.raises(AirflowException):
+            self._watch(events)
+
+    def test_list_pods_selectors(self):
+        self._list(
+            self._pod("a", phase="Succeeded"),
+            self._pod("b", **{POD_EXECUTOR_DONE_KEY: "True"}),
+            self._pod("c", **{"airflow-worker": "2"}),
+            self._pod("d", namespace="other"),
+        )
+
+        def names(**kwargs):
+            return sorted(pod.metadata.name for pod in self.cache.list_pods(**kwargs))
+
+        assert names(label_selector="airflow-worker=1") == ["a", "b", "d"]
+        assert names(label_selector=f"airflow-worker=1,{POD_EXECUTOR_DONE_KEY}!=True") == ["a", "d"]
+        assert names(label_selector=f"kubernetes_executor=True,{POD_EXECUTOR_DONE_KEY}") == ["b"]
+        assert names(label_selector=f"!{POD_EXECUTOR_DONE_KEY}") == ["a", "c", "d"]
+        assert names(field_selector="status.phase!=Succeeded") == ["b", "c", "d"]
+        assert names(field_selector="status.phase=Succeeded", label_selector="airflow-worker!=2") == ["a"]
+        assert names(namespace="other") == ["d"]
+        with pytest.raises(ValueError, match="not supported"):
+            self.cache.list_pods(field_selector="spec.nodeName=node")
+
+    def test_relist_on_expired_resource_version(self):
+        self.cache._stopped = mock.MagicMock()
+        self.cache._stopped.is_set.side_effect = [False, False, True]
+        with mock.patch(
+            "airflow.providers.cncf.kubernetes.executors.kubernetes_executor_utils.get_kube_client",
+            return_value=self.kube_client,
+        ), mock.patch.object(self.cache, "_list", return_value="10") as mock_list, mock.patch.object(
+            self.cache, "_watch", side_effect=[None, "30"]
+        ):
+            assert not self.cache.has_synced
+            self.cache._run("airflow")
+
+        assert mock_list.call_count == 2
+        assert self.cache.has_synced
+        assert self.cache.wait_for_sync(timeout=0)
+
+    def test_not_synced_while_watch_fails(self):
+        self.cache._stopped = mock.MagicMock()
+        self.cache._stopped.is_set.side_effect = [False, False, True]
+        synced = []
+        with mock.patch(
+            "airflow.providers.cncf.kubernetes.executors.kubernetes_executor_utils.get_kube_client",
+            return_value=self.kube_client,
+        ), mock.patch.object(self.cache, "_list", return_value="10") as mock_list, mock.patch.object(
+            self.cache, "_watch", side_effect=[AirflowException("watch failed"), "30"]
+        ), mock.patch(
+            "airflow.providers.cncf.kubernetes.executors.kubernetes_executor_utils.time.sleep",
+            side_effect=lambda _: synced.append(self.cache.has_synced),
+        ):
+            self.cache._run("airflow")
+
+        # Not synced after the error until the pods are listed again
+        assert synced == [False]
+        assert mock_list.call_count == 2
+        assert self.cache.has_synced
+
+    def test_not_synced_when_stale(self):
+        self.cache._synced["airflow"].set()
+        self.cache._last_contact["airflow"] = time.monotonic()
+        assert self.cache.has_synced
+
+        self.cache._last_contact["airflow"] -= self.cache.max_staleness_seconds + 1
+        assert not self.cache.has_synced
+
+    @pytest.mark.db_test
+    @mock.patch("airflow.providers.cncf.kubernetes.executors.kubernetes_executor.DynamicClient")
+    def test_executor_lists_pods_from_cache(self, mock_dynamic_client):
+        self._list(self._pod("a", phase="Succeeded"), self._pod("b"))
+        executor = KubernetesExecutor()
+        executor.kube_client = mock.MagicMock()
+
+        executor.pod_cache = self.cache
+        self.cache._synced["airflow"].set()
+        self.cache._last_contact["airflow"] = time.monotonic()
+        pods = executor._list_pods(
+            {"label_selector": "airflow-worker=1", "field_selector": "status.phase!=Succeeded"}
+        )
+        assert [pod.metadata.name for pod in pods] == ["b"]
+        mock_dynamic_client.assert_not_called()
+
+        # Pods are listed from the API until the cache is synced
+        self.cache._synced["airflow"].clear()
+        executor._list_pods({"label_selector": "airflow-worker=1"})
+        mock_dynamic_client.assert_called_once()
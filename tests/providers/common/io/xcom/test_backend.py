@@ -30,7 +30,7 @@ from airflow.models.dagrun import DagRun
 from airflow.models.taskinstance import TaskInstance
 from airflow.models.xcom import BaseXCom, resolve_xcom_backend
 from airflow.operators.empty import EmptyOperator
-from airflow.providers.common.io.xcom.backend import XComObjectStoreBackend
+from airflow.providers.common.io.xcom.backend import ChunkedXComValue, XComObjectStoreBackend
 from airflow.utils import timezone
 from airflow.utils.session import create_session
 from airflow.utils.types import DagRunType
@@ -261,3 +261,119 @@ class TestXcomObjectStoreBackend:
         )
 
         assert value == {"key": "superlargevalue" * 100}
+
+    @pytest.mark.db_test
+    @conf_vars({("common.io", "xcom_objectstore_chunk_size"): "100"})
+    def test_chunked_value(self, task_instance, session):
+        XCom = resolve_xcom_backend()
+        airflow.models.xcom.XCom = XCom
+        value = [{"index": i, "data": "x" * (i % 7)} for i in range(100)]
+
+        XCom.set(
+            key=XCOM_RETURN_KEY,
+            value=value,
+            dag_id=task_instance.dag_id,
+            task_id=task_instance.task_id,
+            run_id=task_instance.run_id,
+            session=session,
+        )
+
+        res = (
+            XCom.get_many(
+                key=XCOM_RETURN_KEY,
+                dag_ids=task_instance.dag_id,
+                task_ids=task_instance.task_id,
+                run_id=task_instance.run_id,
+                session=session,
+            )
+            .with_entities(BaseXCom.value)
+            .first()
+        )
+        reference = BaseXCom.deserialize_value(res)
+        assert reference["length"] == 100
+        assert len(reference["chunks"]) > 1
+        assert all(ObjectStoragePath(chunk).exists() for chunk in reference["chunks"])
+
+        pulled = XCom.get_value(key=XCOM_RETURN_KEY, ti_key=task_instance.key, session=session)
+        assert isinstance(pulled, ChunkedXComValue)
+        assert len(pulled) == 100
+        assert pulled[0] == value[0]
+        assert pulled[57] == value[57]
+        assert pulled[-1] == value[-1]
+        assert pulled[10:40:3] == value[10:40:3]
+        assert list(pulled) == value
+        assert pulled == value
+        with pytest.raises(IndexError):
+            pulled[100]
+
+        XCom.clear(
+            dag_id=task_instance.dag_id,
+            task_id=task_instance.task_id,
+            run_id=task_instance.run_id,
+            session=session,
+        )
+        assert not any(ObjectStoragePath(chunk).exists() for chunk in reference["chunks"])
+
+    @pytest.mark.db_test
+    @conf_vars({("common.io", "xcom_objectstore_chunk_size"): "100"})
+    def test_chunked_value_under_threshold(self, task_instance, session):
+        XCom = resolve_xcom_backend()
+        airflow.models.xcom.XCom = XCom
+
+        XCom.set(
+            key=XCOM_RETURN_KEY,
+            value=[1, 2, 3],
+            dag_id=task_instance.dag_id,
+            task_id=task_instance.task_id,
+            run_id=task_instance.run_id,
+            session=session,
+        )
+
+        value = XCom.get_value(key=XCOM_RETURN_KEY, ti_key=task_instance.key, session=session)
+        assert value == [1, 2, 3]
+        assert not ObjectStoragePath(self.path).exists()
+
+    @pytest.mark.db_test
+    @conf_vars({("common.io", "xcom_objectstore_chunk_size"): "100"})
+    def test_tuple_not_chunked(self, task_instance, session):
+        XCom = resolve_xcom_backend()
+        airflow.models.xcom.XCom = XCom
+        value = tuple(f"item-{i}" for i in range(100))
+
+        XCom.set(
+            key=XCOM_RETURN_KEY,
+            value=value,
+            dag_id=task_instance.dag_id,
+            task_id=task_instance.task_id,
+            run_id=task_instance.run_id,
+            session=session,
+        )
+
+        pulled = XCom.get_value(key=XCOM_RETURN_KEY, ti_key=task_instance.key, session=session)
+        assert not isinstance(pulled, ChunkedXComValue)
+        assert list(pulled) == list(value)
+
+    @pytest.mark.parametrize("threshold, chunk_size", [(0, 1), (50, 20), (500, 30), (10, 10_000)])
+    def test_write_chunks(self, threshold, chunk_size):
+        value = [f"item-{i}" for i in range(200)]
+        directory = ObjectStoragePath(self.path) / "chunks"
+
+        reference = XComObjectStoreBackend._write_chunks(
+            value, directory, threshold=threshold, chunk_size=chunk_size, suffix="", compression=None
+        )
+
+        chunked = ChunkedXComValue(reference)
+        assert list(chunked) == value
+        assert [chunked[i] for i in range(len(value))] == value
+        assert len(reference["offsets"]) == len(reference["chunks"])
+        # All the chunks but the last one are at least as large as the chunk size
+        for chunk in reference["chunks"][:-1]:
+            assert ObjectStoragePath(chunk).stat()["size"] >= chunk_size
+
+    def test_write_chunks_under_threshold(self):
+        directory = ObjectStoragePath(self.path) / "chunks"
+        reference = XComObjectStoreBackend._write_chunks(
+            ["a", "b"], directory, threshold=100, chunk_size=1, suffix="", compression=None
+        )
+        assert reference is None
+        assert not directory.exists()
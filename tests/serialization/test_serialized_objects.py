@@ -376,7 +376,7 @@ def test_all_pydantic_models_round_trip():
             pytest.fail(
                 f"The model object {orm_instance.__class__} came back as a string "
                 f"after round trip. Probably you need to define a DagAttributeType "
-                f"for it and define it in mappings `_orm_to_model` and `_type_to_class` "
+                f"for it and define it in the mappings of `_get_pydantic_mappings` "
                 f"in `serialized_objects.py`"
             )
         assert isinstance(pydantic_instance, c)
@@ -0,0 +1,186 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import datetime
+import json
+from unittest import mock
+
+import pytest
+
+from airflow.exceptions import AirflowConfigException
+from airflow.serialization.xcom_codecs import (
+    HEADER_MAGIC,
+    XComCodec,
+    _get_codecs,
+    decode_value,
+    encode_value,
+    get_codec,
+    get_configured_codecs,
+    is_encoded,
+)
+from airflow.utils import timezone
+from tests.test_utils.config import conf_vars
+
+
+@pytest.fixture(autouse=True)
+def clear_codecs_cache():
+    _get_codecs.cache_clear()
+    yield
+    _get_codecs.cache_clear()
+
+
+class TestXComCodecs:
+    def test_get_configured_codecs(self):
+        with conf_vars({("core", "xcom_codecs"): ""}):
+            assert get_configured_codecs() == []
+
+    def test_get_configured_codecs_cached(self):
+        with conf_vars({("core", "xcom_codecs"): "msgpack_zstd, arrow"}):
+            with mock.patch.object(XComCodec, "check_available") as mock_check_available:
+                assert get_configured_codecs() == [get_codec("msgpack_zstd"), get_codec("arrow")]
+                assert get_configured_codecs() == [get_codec("msgpack_zstd"), get_codec("arrow")]
+        assert mock_check_available.call_count == 2
+        with conf_vars({("core", "xcom_codecs"): "arrow"}):
+            with mock.patch.object(XComCodec, "check_available"):
+                assert get_configured_codecs() == [get_codec("arrow")]
+
+    def test_get_configured_codecs_unknown(self):
+        with conf_vars({("core", "xcom_codecs"): "arrow, unknown"}):
+            with pytest.raises(AirflowConfigException, match="Unknown XCom codec 'unknown'"):
+                get_configured_codecs()
+
+    def test_get_configured_codecs_missing_module(self, monkeypatch):
+        monkeypatch.setattr(get_codec("arrow"), "required_modules", ("not_an_installed_module",))
+        with conf_vars({("core", "xcom_codecs"): "arrow"}):
+            with pytest.raises(AirflowConfigException, match="not_an_installed_module"):
+                get_configured_codecs()
+
+    def test_header_is_not_json_nor_pickle(self):
+        import pickle
+
+        assert not is_encoded(json.dumps({"a": 1}).encode())
+        assert not is_encoded(pickle.dumps({"a": 1}))
+        assert not is_encoded(b"")
+
+    def test_encode_value_no_codec(self):
+        class NeverCodec(XComCodec):
+            name = "never"
+
+            def can_encode(self, value):
+                return False
+
+        assert encode_value([1, 2], [NeverCodec()]) is None
+
+    def test_encode_value_falls_through_on_error(self):
+        class FailingCodec(XComCodec):
+            name = "failing"
+
+            def can_encode(self, value):
+                return True
+
+            def encode(self, value):
+                raise ValueError("cannot encode")
+
+        class BytesCodec(XComCodec):
+            name = "bytes"
+
+            def can_encode(self, value):
+                return True
+
+            def encode(self, value):
+                return b"encoded"
+
+        assert encode_value([1, 2], [FailingCodec()]) is None
+        assert encode_value([1, 2], [FailingCodec(), BytesCodec()]) == HEADER_MAGIC + b"\x05bytesencoded"
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            None,
+            1,
+            "value",
+            [1, 2.5, "3"],
+            (1, "value"),
+            {"key": ["value", 1], "other": {"nested": None}},
+            timezone.datetime(2024, 1, 1),
+            datetime.timedelta(seconds=5),
+        ],
+    )
+    def test_msgpack_zstd_roundtrip(self, value):
+        pytest.importorskip("msgpack")
+        pytest.importorskip("zstandard")
+
+        encoded = encode_value(value, [get_codec("arrow"), get_codec("msgpack_zstd")])
+        assert encoded.startswith(HEADER_MAGIC + b"\x0cmsgpack_zstd")
+        assert is_encoded(encoded)
+        assert decode_value(encoded) == value
+
+    def test_msgpack_zstd_smaller_than_json(self):
+        pytest.importorskip("msgpack")
+        pytest.importorskip("zstandard")
+
+        value = [{"id": i, "score": i / 7, "name": f"row {i}"} for i in range(1000)]
+        encoded = encode_value(value, [get_codec("msgpack_zstd")])
+        assert len(encoded) < len(json.dumps(value).encode()) / 4
+        assert decode_value(encoded) == value
+
+    def test_msgpack_zstd_reserved_key(self):
+        pytest.importorskip("msgpack")
+        pytest.importorskip("zstandard")
+
+        # Left to JSON, which raises the same error
+        assert encode_value({"__classname__": "x"}, [get_codec("msgpack_zstd")]) is None
+
+    def test_msgpack_zstd_large_integer_falls_back_to_json(self):
+        pytest.importorskip("msgpack")
+        pytest.importorskip("zstandard")
+
+        assert encode_value({"n": 2**70}, [get_codec("msgpack_zstd")]) is None
+
+    def test_arrow_dataframe_roundtrip(self):
+        pd = pytest.importorskip("pandas")
+        pytest.importorskip("pyarrow")
+
+        df = pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", None], "c": [0.5, 1.5, 2.5]})
+        encoded = encode_value(df, [get_codec("arrow"), get_codec("msgpack_zstd")])
+        assert encoded.startswith(HEADER_MAGIC + b"\x05arrow")
+        pd.testing.assert_frame_equal(decode_value(encoded), df)
+        assert decode_value(encoded, orm=True) == "pandas.DataFrame (a, b, c)"
+
+    def test_arrow_mixed_column_falls_through(self):
+        pd = pytest.importorskip("pandas")
+        pytest.importorskip("pyarrow")
+
+        df = pd.DataFrame({"a": [1, "x", 2.5]})
+        assert encode_value(df, [get_codec("arrow")]) is None
+
+    def test_arrow_ndarray_roundtrip(self):
+        np = pytest.importorskip("numpy")
+        pytest.importorskip("pyarrow")
+
+        array = np.arange(12, dtype="float64").reshape(3, 4)
+        encoded = encode_value(array, [get_codec("arrow")])
+        np.testing.assert_array_equal(decode_value(encoded), array)
+        assert decode_value(encoded, orm=True) == "numpy.ndarray (3, 4)"
+
+    def test_arrow_skips_other_values(self):
+        np = pytest.importorskip("numpy")
+
+        arrow = get_codec("arrow")
+        assert not arrow.can_encode([1, 2])
+        assert not arrow.can_encode(np.array([object(), object()]))
@@ -0,0 +1,144 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import datetime
+import pstats
+from unittest import mock
+
+import pytest
+
+from airflow.exceptions import AirflowConfigException
+from airflow.task import startup_profiler
+from tests.test_utils.config import conf_vars
+
+
+@pytest.fixture(autouse=True)
+def clear_phases():
+    startup_profiler._phases.clear()
+    yield
+    startup_profiler._phases.clear()
+    if startup_profiler._profiler is not None:
+        startup_profiler._stop_profiler()
+
+
+@pytest.fixture
+def ti():
+    return mock.MagicMock(
+        dag_id="dag",
+        task_id="task",
+        run_id="manual__2024-01-01T00:00:00+00:00",
+        map_index=-1,
+        try_number=1,
+        stats_tags={"dag_id": "dag", "task_id": "task"},
+    )
+
+
+def test_startup_phase():
+    with startup_profiler.startup_phase("dag_parse"):
+        pass
+    with startup_profiler.startup_phase("dag_parse"):
+        pass
+    startup_profiler.record_phase("get_ti", 2.0)
+
+    phases = startup_profiler.get_phases()
+    assert set(phases) == {"dag_parse", "get_ti"}
+    assert phases["dag_parse"] >= 0
+    assert phases["get_ti"] == 2.0
+
+
+def test_startup_phase_recorded_on_error():
+    with pytest.raises(ValueError):
+        with startup_profiler.startup_phase("dag_parse"):
+            raise ValueError()
+    assert "dag_parse" in startup_profiler.get_phases()
+
+
+@mock.patch("airflow.stats.Stats.timing")
+def test_emit_startup_metrics(mock_timing, ti):
+    startup_profiler.record_phase("dag_parse", 1.5)
+
+    startup_profiler.emit_startup_metrics(ti)
+
+    assert mock_timing.call_args_list == [
+        mock.call("task.startup.dag_parse", datetime.timedelta(seconds=1.5), tags=ti.stats_tags),
+        mock.call("task.startup.total", mock.ANY, tags=ti.stats_tags),
+    ]
+    assert startup_profiler.get_phases() == {}
+
+
+def test_profiling_disabled(ti):
+    startup_profiler.start_profiling()
+    assert startup_profiler._profiler is None
+    assert startup_profiler.stop_profiling(ti, "task") is None
+
+
+def test_cprofile(ti, tmp_path):
+    with conf_vars(
+        {
+            ("core", "task_startup_profiler"): "cprofile",
+            ("core", "task_startup_profile_folder"): str(tmp_path),
+        }
+    ):
+        startup_profiler.start_profiling()
+        assert startup_profiler._profiler is not None
+        path = startup_profiler.stop_profiling(ti, "task")
+
+    assert startup_profiler._profiler is None
+    assert path.startswith(str(tmp_path))
+    assert "dag.task.manual__2024-01-01T00_00_00_00_00.-1.1.task." in path
+    assert pstats.Stats(path)
+
+
+@conf_vars({("core", "task_startup_profiler"): "perf"})
+def test_unknown_profiler():
+    with pytest.raises(AirflowConfigException, match="task_startup_profiler"):
+        startup_profiler.start_profiling()
+
+
+@mock.patch("airflow.stats.Stats.timing")
+def test_emit_startup_metrics_without_total(mock_timing, ti):
+    startup_profiler.record_phase("task_runner_start", 0.5)
+
+    startup_profiler.emit_startup_metrics(ti, include_total=False)
+
+    assert mock_timing.call_args_list == [
+        mock.call("task.startup.task_runner_start", datetime.timedelta(seconds=0.5), tags=ti.stats_tags),
+    ]
+
+
+@pytest.mark.parametrize("keep_start_time", [True, False])
+def test_reset_after_fork(monkeypatch, keep_start_time):
+    monkeypatch.setattr(startup_profiler, "_process_start_time", 1.0)
+    monkeypatch.setattr(startup_profiler, "_process_pid", -1)
+    startup_profiler.record_phase("providers_discovery", 1.0)
+
+    startup_profiler.reset_after_fork(keep_start_time=keep_start_time)
+
+    assert startup_profiler.get_phases() == {}
+    assert (startup_profiler._process_start_time == 1.0) is keep_start_time
+
+
+def test_reset_after_fork_not_forked(monkeypatch):
+    monkeypatch.setattr(startup_profiler, "_process_start_time", 1.0)
+    startup_profiler.record_phase("airflow_import", 1.0)
+
+    startup_profiler.reset_after_fork(keep_start_time=False)
+
+    assert startup_profiler.get_phases() == {"airflow_import": 1.0}
+    assert startup_profiler._process_start_time == 1.0
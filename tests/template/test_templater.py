@@ -17,11 +17,13 @@
 
 from __future__ import annotations
 
+from unittest import mock
+
 import jinja2
 
 from airflow.models.dag import DAG
 from airflow.template.templater import LiteralValue, Templater
-from airflow.utils.context import Context
+from airflow.utils.context import Context, LazyContextValue
 
 
 class TestTemplater:
@@ -80,3 +82,40 @@ class TestTemplater:
         rendered_content = templater.render_template(content, context)
 
         assert rendered_content == "template_file.txt"
+
+    def test_render_template_lazy_context_value(self):
+        compute_name = mock.Mock(return_value="world")
+        compute_other = mock.Mock()
+        context = Context(  # type: ignore
+            {"name": LazyContextValue(compute_name), "other": LazyContextValue(compute_other)}
+        )
+        templater = Templater()
+        templater.template_ext = []
+        assert templater.render_template("Hello {{ name }}", context) == "Hello world"
+        assert templater.render_template("Bye {{ name }}", context) == "Bye world"
+        compute_name.assert_called_once()
+        compute_other.assert_not_called()
+
+    def test_get_template_context_keys(self, tmp_path):
+        (tmp_path / "template_file.txt").write_text("{{ ds }} {% for x in values %}{{ x }}{% endfor %}")
+        nested = Templater()
+        nested.template_fields = ["command"]
+        nested.command = "{{ run_id }}"
+        templater = Templater()
+        templater.template_fields = ["message", "file", "items", "nested", "broken", "literal"]
+        templater.template_ext = [".txt"]
+        templater.message = "{{ params.name | upper }} {{ macros.ds_add(ds, 1) }}"
+        templater.file = "template_file.txt"
+        templater.items = {"key": ["{{ prev_ds }}", 1, None]}
+        templater.nested = nested
+        templater.broken = "{{ yesterday_ds "
+        templater.literal = LiteralValue("{{ tomorrow_ds }}")
+        env = jinja2.Environment(loader=jinja2.FileSystemLoader(str(tmp_path)))
+        assert templater.get_template_context_keys(env) == {
+            "params",
+            "macros",
+            "ds",
+            "values",
+            "prev_ds",
+            "run_id",
+        }
@@ -21,6 +21,7 @@ from unittest import mock
 
 PLUGINS_MANAGER_NULLABLE_ATTRIBUTES = [
     "plugins",
+    "plugins_manifest",
     "registered_hooks",
     "macros_modules",
     "executors_modules",
@@ -79,5 +80,7 @@ def mock_plugin_manager(plugins=None, **kwargs):
         exit_stack.enter_context(
             mock.patch("airflow.plugins_manager.import_errors", kwargs.get("import_errors", {}))
         )
+        exit_stack.enter_context(mock.patch("airflow.plugins_manager._manifest_plugins", {}))
+        exit_stack.enter_context(mock.patch("airflow.plugins_manager._manifest_plugin_modules", {}))
 
         yield
@@ -32,12 +32,14 @@ def remove_all_configurations():
     old_sections, old_proxies = (conf._sections, conf._proxies)
     conf._sections = {}
     conf._proxies = {}
+    conf.invalidate_resolved_values_cache()
     return old_sections, old_proxies
 
 
 def restore_all_configurations(sections: dict, proxies: dict):
     conf._sections = sections  # type: ignore
     conf._proxies = proxies  # type: ignore
+    conf.invalidate_resolved_values_cache()
 
 
 @contextmanager
@@ -60,10 +62,12 @@ def set_deprecated_options(deprecated_options: dict[tuple[str, str], tuple[str,
     """
     old_deprecated_options = conf.deprecated_options
     conf.deprecated_options = deprecated_options
+    conf.invalidate_resolved_values_cache()
     try:
         yield
     finally:
         conf.deprecated_options = old_deprecated_options
+        conf.invalidate_resolved_values_cache()
 
 
 @contextmanager
@@ -73,7 +77,9 @@ def set_sensitive_config_values(sensitive_config_values: set[tuple[str, str]]):
     """
     old_sensitive_config_values = conf.sensitive_config_values
     conf.sensitive_config_values = sensitive_config_values
+    conf.invalidate_resolved_values_cache()
     try:
         yield
     finally:
         conf.sensitive_config_values = old_sensitive_config_values
+        conf.invalidate_resolved_values_cache()
@@ -0,0 +1,116 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import pytest
+
+from airflow.exceptions import AirflowDagCycleException, AirflowDagInconsistent, FailStopDagInvalidTriggerRule
+from airflow.models.dag import DAG
+from airflow.operators.empty import EmptyOperator
+from airflow.utils.dag_integrity import DagGraphIndex, check_dag_integrity
+from airflow.utils.task_group import TaskGroup
+from airflow.utils.trigger_rule import TriggerRule
+from tests.models import DEFAULT_DATE
+
+
+class TestDagIntegrity:
+    def test_valid_dag(self):
+        with DAG("dag", start_date=DEFAULT_DATE) as dag:
+            setup = EmptyOperator(task_id="setup").as_setup()
+            with TaskGroup("group"):
+                first = EmptyOperator(task_id="first")
+                second = EmptyOperator(task_id="second")
+            teardown = EmptyOperator(task_id="teardown").as_teardown(setups=setup)
+            setup >> first >> second >> teardown
+
+        check_dag_integrity(dag)
+
+    def test_index(self):
+        with DAG("dag", start_date=DEFAULT_DATE) as dag:
+            first = EmptyOperator(task_id="first")
+            second = EmptyOperator(task_id="second")
+            third = EmptyOperator(task_id="third")
+            first >> [second, third]
+
+        index = DagGraphIndex(dag)
+
+        assert index.tasks == [first, second, third]
+        assert sorted(index.downstream[0]) == [1, 2]
+        assert index.downstream[1:] == [[], []]
+
+    def test_cycle_faulty_task(self):
+        with DAG("dag", start_date=DEFAULT_DATE) as dag:
+            first = EmptyOperator(task_id="first")
+            second = EmptyOperator(task_id="second")
+            third = EmptyOperator(task_id="third")
+            first >> second >> third >> second
+
+        with pytest.raises(AirflowDagCycleException, match="Cycle detected in DAG: dag. Faulty task: third"):
+            check_dag_integrity(dag)
+
+    def test_wide_dag_without_cycle(self):
+        with DAG("dag", start_date=DEFAULT_DATE) as dag:
+            start = EmptyOperator(task_id="start")
+            end = EmptyOperator(task_id="end")
+            for i in range(1000):
+                start >> EmptyOperator(task_id=f"task_{i}") >> end
+
+        check_dag_integrity(dag)
+
+    def test_downstream_task_not_in_dag(self):
+        with DAG("dag", start_date=DEFAULT_DATE) as dag:
+            task = EmptyOperator(task_id="task")
+        task.downstream_task_ids.add("missing")
+
+        with pytest.raises(AirflowDagInconsistent, match="downstream task missing which is not in the DAG"):
+            check_dag_integrity(dag)
+
+    def test_task_not_in_its_task_group(self):
+        with DAG("dag", start_date=DEFAULT_DATE) as dag:
+            with TaskGroup("group") as group:
+                EmptyOperator(task_id="task")
+        del group.children["group.task"]
+
+        with pytest.raises(
+            AirflowDagInconsistent, match="group.task of DAG dag is not in its task group group"
+        ):
+            check_dag_integrity(dag)
+
+    def test_setup_followed_by_invalid_trigger_rule(self):
+        with DAG("dag", start_date=DEFAULT_DATE) as dag:
+            setup = EmptyOperator(task_id="setup").as_setup()
+            setup >> EmptyOperator(task_id="work", trigger_rule=TriggerRule.ONE_FAILED)
+
+        with pytest.raises(ValueError, match="Setup tasks must be followed with trigger rule ALL_SUCCESS."):
+            check_dag_integrity(dag)
+
+    def test_fail_stop_dag_invalid_trigger_rule(self):
+        with DAG("dag", start_date=DEFAULT_DATE, fail_stop=True) as dag:
+            EmptyOperator(task_id="task")
+        dag.task_dict["task"].trigger_rule = TriggerRule.ALL_DONE
+
+        with pytest.raises(FailStopDagInvalidTriggerRule):
+            check_dag_integrity(dag)
+
+    def test_dag_validate_checks_cycles(self):
+        with DAG("dag", start_date=DEFAULT_DATE, schedule=None) as dag:
+            task = EmptyOperator(task_id="task")
+            task >> task
+
+        with pytest.raises(AirflowDagCycleException):
+            dag.validate()
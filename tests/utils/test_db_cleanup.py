@@ -17,6 +17,9 @@
 # under the License.
 from __future__ import annotations
 
+import csv
+import gzip
+import json
 from contextlib import suppress
 from importlib import import_module
 from io import StringIO
@@ -41,6 +44,7 @@ from airflow.utils.db_cleanup import (
     _cleanup_table,
     _confirm_drop_archives,
     _dump_table_to_file,
+    _encode_key,
     _get_archived_table_names,
     config_dict,
     drop_archived_tables,
@@ -297,6 +301,109 @@ class TestDBCleanup:
             assert len(session.query(model).all()) == 5
             assert len(_get_archived_table_names(["dag_run"], session)) == expected_archives
 
+    @pytest.mark.parametrize(
+        "table_name, expected_to_delete, external_trigger",
+        [
+            pytest.param("task_instance", 10, False, id="task_instance"),
+            pytest.param("dag_run", 9, False, id="dag_run"),
+            pytest.param("dag_run", 10, True, id="dag_run_external"),
+        ],
+    )
+    @pytest.mark.parametrize("skip_archive", [True, False])
+    @patch("airflow.utils.db_cleanup.Stats")
+    def test__cleanup_table_batched(
+        self, stats_mock, table_name, expected_to_delete, external_trigger, skip_archive
+    ):
+        base_date = pendulum.DateTime(2022, 1, 1, tzinfo=pendulum.timezone("UTC"))
+        num_tis = 10
+        create_tis(base_date=base_date, num_tis=num_tis, external_trigger=external_trigger)
+        with create_session() as session:
+            _cleanup_table(
+                **config_dict[table_name].__dict__,
+                clean_before_timestamp=base_date.add(days=20),
+                dry_run=False,
+                skip_archive=skip_archive,
+                batch_size=3,
+                session=session,
+            )
+            model = config_dict[table_name].orm_model
+            assert len(session.query(model).all()) == num_tis - expected_to_delete
+            archived_table_names = _get_archived_table_names([table_name], session)
+            if skip_archive:
+                assert archived_table_names == []
+            else:
+                assert len(archived_table_names) == 1
+                archived = session.execute(text(f"SELECT COUNT(1) FROM {archived_table_names[0]}")).scalar()
+                assert archived == expected_to_delete
+        stats_mock.incr.assert_any_call(f"db_clean.deleted_rows.{table_name}", 3)
+        assert stats_mock.incr.call_count == 2 * -(-expected_to_delete // 3)
+
+    def test_run_cleanup_batched_resumes_from_checkpoint(self, tmp_path):
+        base_date = pendulum.DateTime(2022, 1, 1, tzinfo=pendulum.timezone("UTC"))
+        clean_before_date = base_date.add(days=20)
+        create_tis(base_date=base_date, num_tis=10)
+        checkpoint_file = tmp_path / "checkpoint.json"
+        with create_session() as session:
+            archive_table_name = f"{ARCHIVE_TABLE_PREFIX}task_instance__20240101000000"
+            session.execute(text(f"CREATE TABLE {archive_table_name} AS SELECT * FROM task_instance"))
+            # The first 4 rows were archived and deleted by an interrupted cleanup
+            key_columns = [
+                TaskInstance.start_date,
+                TaskInstance.dag_id,
+                TaskInstance.task_id,
+                TaskInstance.run_id,
+                TaskInstance.map_index,
+            ]
+            last_key = session.query(*key_columns).order_by(*key_columns).offset(3).first()
+            session.execute(
+                text(f"DELETE FROM {archive_table_name} WHERE run_id > :run_id"),
+                {"run_id": last_key.run_id},
+            )
+            session.query(TaskInstance).filter(TaskInstance.run_id <= last_key.run_id).delete()
+            session.commit()
+        checkpoint_file.write_text(
+            json.dumps(
+                {
+                    "clean_before_timestamp": clean_before_date.isoformat(),
+                    "tables": {
+                        "dag_run": {"done": True},
+                        "task_instance": {
+                            "archive_table": archive_table_name,
+                            "last_key": _encode_key(last_key),
+                            "rows": 4,
+                        },
+                    },
+                }
+            )
+        )
+
+        run_cleanup(
+            clean_before_timestamp=clean_before_date,
+            table_names=["dag_run", "task_instance"],
+            confirm=False,
+            batch_size=4,
+            checkpoint_file=str(checkpoint_file),
+        )
+
+        with create_session() as session:
+            assert session.query(TaskInstance).count() == 0
+            assert session.query(DagRun).count() == 10
+            assert _get_archived_table_names(["task_instance"], session) == [archive_table_name]
+            assert session.execute(text(f"SELECT COUNT(1) FROM {archive_table_name}")).scalar() == 10
+        assert not checkpoint_file.exists()
+
+    def test_run_cleanup_batched_checkpoint_other_timestamp(self, tmp_path):
+        checkpoint_file = tmp_path / "checkpoint.json"
+        checkpoint_file.write_text(json.dumps({"clean_before_timestamp": "2020-01-01T00:00:00+00:00"}))
+        with pytest.raises(SystemExit, match="not 2022-01-01T00:00:00\\+00:00"):
+            run_cleanup(
+                clean_before_timestamp=pendulum.datetime(2022, 1, 1),
+                table_names=["task_instance"],
+                confirm=False,
+                batch_size=4,
+                checkpoint_file=str(checkpoint_file),
+            )
+
     def test_no_models_missing(self):
         """
         1. Verify that for all tables in `airflow.models`, we either have them enabled in db cleanup,
@@ -443,6 +550,7 @@ class TestDBCleanup:
             file_path=f"path/{ARCHIVE_TABLE_PREFIX}dag_run__233.csv",
             export_format="csv",
             session=session_mock,
+            compression=None,
         )
         assert f"Exporting table {ARCHIVE_TABLE_PREFIX}dag_run__233" in caplog.text
 
@@ -484,6 +592,81 @@ class TestDBCleanup:
             writer.return_value.writerow.assert_called_once()
             writer.return_value.writerows.assert_called_once()
 
+    @pytest.mark.parametrize(
+        "export_format, compression, extension",
+        [
+            pytest.param("csv", None, "csv", id="csv"),
+            pytest.param("csv", "gzip", "csv.gz", id="csv-gzip"),
+            pytest.param("ndjson", None, "ndjson", id="ndjson"),
+            pytest.param("ndjson", "gzip", "ndjson.gz", id="ndjson-gzip"),
+        ],
+    )
+    @pytest.mark.parametrize("url", [True, False])
+    def test_export_archived_records_text(self, tmp_path, export_format, compression, extension, url):
+        base_date = pendulum.DateTime(2022, 1, 1, tzinfo=pendulum.timezone("UTC"))
+        create_tis(base_date=base_date, num_tis=10)
+        with create_session() as session:
+            _cleanup_table(
+                **config_dict["task_instance"].__dict__,
+                clean_before_timestamp=base_date.add(days=5),
+                dry_run=False,
+                session=session,
+            )
+            (archive_table_name,) = _get_archived_table_names(["task_instance"], session)
+            export_archived_records(
+                export_format=export_format,
+                output_path=f"file://{tmp_path}" if url else str(tmp_path),
+                table_names=["task_instance"],
+                compression=compression,
+                session=session,
+            )
+
+        file_path = tmp_path / f"{archive_table_name}.{extension}"
+        with gzip.open(file_path, "rt") if compression else open(file_path) as f:
+            if export_format == "csv":
+                rows = list(csv.DictReader(f))
+            else:
+                rows = [json.loads(line) for line in f]
+        assert sorted(row["run_id"] for row in rows) == [f"abc_{i}" for i in range(5)]
+        assert rows[0]["task_id"] == "dummy-task"
+
+    @pytest.mark.parametrize("compression", [None, "zstd"])
+    def test_export_archived_records_parquet(self, tmp_path, compression):
+        pq = pytest.importorskip("pyarrow.parquet")
+        base_date = pendulum.DateTime(2022, 1, 1, tzinfo=pendulum.timezone("UTC"))
+        create_tis(base_date=base_date, num_tis=10)
+        with create_session() as session:
+            _cleanup_table(
+                **config_dict["task_instance"].__dict__,
+                clean_before_timestamp=base_date.add(days=5),
+                dry_run=False,
+                session=session,
+            )
+            (archive_table_name,) = _get_archived_table_names(["task_instance"], session)
+            export_archived_records(
+                export_format="parquet",
+                output_path=str(tmp_path),
+                table_names=["task_instance"],
+                compression=compression,
+                session=session,
+            )
+
+        parquet_file = pq.ParquetFile(tmp_path / f"{archive_table_name}.parquet")
+        assert parquet_file.metadata.row_group(0).column(0).compression == (compression or "snappy").upper()
+        table = parquet_file.read()
+        assert sorted(table.column("run_id").to_pylist()) == [f"abc_{i}" for i in range(5)]
+        assert sorted(table.column("start_date").to_pylist()) == [base_date.add(days=i) for i in range(5)]
+
+    def test_dump_table_to_file_raises_if_compression_not_supported(self):
+        with pytest.raises(AirflowException, match="Compression zstd is not supported for the csv format"):
+            _dump_table_to_file(
+                target_table="mytable",
+                file_path="dags/myfile.csv",
+                export_format="csv",
+                session=MagicMock(),
+                compression="zstd",
+            )
+
     def test_dump_table_to_file_raises_if_format_not_supported(self):
         with pytest.raises(AirflowException) as exc_info:
             _dump_table_to_file(
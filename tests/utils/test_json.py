@@ -134,3 +134,9 @@ class TestXComEncoder:
         i = frozenset({6, 7})
         e = json.loads(json.dumps(i, cls=utils_json.XComEncoder), cls=utils_json.XComDecoder)
         assert i == e
+
+
+def test_json_provider_is_importable_from_utils():
+    from airflow.www.json_provider import AirflowJsonProvider
+
+    assert utils_json.AirflowJsonProvider is AirflowJsonProvider